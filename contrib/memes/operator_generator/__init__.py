@@ -64,4 +64,5 @@ add_meme(
     keywords=["合成大干员"],
     date_created=datetime(2023, 3, 28),
     date_modified=datetime(2023, 3, 28),
+    cacheable=False,
 )
@@ -17,11 +17,14 @@ from meme_generator.meme import ParserArg as ParserArg
 from meme_generator.meme import ParserOption as ParserOption
 from meme_generator.version import __version__ as __version__
 
+# 是否在导入时加载表情，生成清单时只需要表情的定义，不需要加载
+_autoload = os.getenv("MEME_AUTOLOAD", "true").lower() in ("true", "1", "yes")
+
 # 检查是否启用快速加载模式
 _fast_loading_enabled = False
 _use_fast_loading = os.getenv("MEME_FAST_LOADING", "true").lower() in ("true", "1", "yes")
 
-if _use_fast_loading:
+if _autoload and _use_fast_loading:
     try:
         from meme_generator.fast_loader import enable_fast_loading, is_fast_loading_available
         
@@ -32,7 +35,7 @@ if _use_fast_loading:
         pass  # 快速加载器不可用
 
 # 如果快速加载失败或未启用，使用标准加载方式
-if not _fast_loading_enabled:
+if _autoload and not _fast_loading_enabled:
     if config.meme.load_builtin_memes:
         builtin_dir = Path(__file__).parent / "memes"
         for path in builtin_dir.iterdir():
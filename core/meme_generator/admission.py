@@ -0,0 +1,246 @@
+"""制作请求的准入控制
+
+渲染线程 / 进程有限，大量 gif 请求同时到达时会在执行器中无限排队，
+连带静态表情的延迟也升到几十秒。准入控制在请求提交给执行器之前：
+
+* 估算制作开销：输入图片的帧数 × 像素数（百万像素），乘以表情自身的帧数。
+  表情的帧数在输入均为静态图片时从输出的 gif 中学习，未制作过的表情视为 1 帧
+* 开销低于 ``heavy_render_cost`` 的请求进入轻量通道，否则进入重量通道；
+  默认各占一半的渲染线程，两个通道合计不超过执行器的容量，静态表情不会排在 gif 后面
+* 每个通道的排队数量有上限，超出时立即以 503 拒绝，并根据排队长度和平均耗时给出
+  ``Retry-After``；``meme_concurrency`` 限制单个表情同时制作的数量
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from io import BytesIO
+from typing import Any, Optional
+
+from PIL import Image
+
+from .config import meme_config
+from .exception import ServerOverloaded
+from .executor import render_executor
+
+TEXT_ONLY_COST = 0.25
+"""没有输入图片时的开销，约为一张 500×500 的静态图片"""
+
+
+def gif_frame_count(data: bytes) -> int:
+    """遍历 gif 的数据块统计帧数，不解码图像数据"""
+
+    def skip_sub_blocks(pos: int) -> int:
+        while pos < len(data) and (size := data[pos]):
+            pos += size + 1
+        return pos + 1
+
+    flags = data[10]
+    pos = 13
+    if flags & 0x80:
+        pos += 3 * (2 << (flags & 0x07))
+    frames = 0
+    while pos < len(data):
+        block = data[pos]
+        if block == 0x2C:  # 图像描述符
+            frames += 1
+            flags = data[pos + 9]
+            pos += 10
+            if flags & 0x80:
+                pos += 3 * (2 << (flags & 0x07))
+            pos = skip_sub_blocks(pos + 1)
+        elif block == 0x21:  # 扩展块
+            pos = skip_sub_blocks(pos + 2)
+        else:  # 结束标记或数据损坏
+            break
+    return max(frames, 1)
+
+
+def image_cost(data: bytes) -> float:
+    """图片的帧数 × 百万像素，只读取文件头"""
+    try:
+        image = Image.open(BytesIO(data))
+        if data[:6] in (b"GIF87a", b"GIF89a"):
+            frames = gif_frame_count(data)
+        else:
+            frames = getattr(image, "n_frames", 1)
+        return frames * image.width * image.height / 10**6
+    except Exception:
+        # 无法识别的图片在制作时报错，不在此处拒绝
+        return 0
+
+
+def is_animated(data: bytes) -> bool:
+    try:
+        return getattr(Image.open(BytesIO(data)), "is_animated", False)
+    except Exception:
+        return False
+
+
+@dataclass
+class LaneStats:
+    admitted: int = 0
+    rejected: int = 0
+    active: int = 0
+    waiting: int = 0
+    avg_duration: float = 0
+    """平均制作耗时（秒），指数加权平均"""
+
+
+class Lane:
+    """限制并发数和排队长度的通道，只在事件循环所在的线程中使用"""
+
+    def __init__(self, name: str, concurrency: int, max_queue: int):
+        self.name = name
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.stats = LaneStats()
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    def retry_after(self) -> int:
+        duration = self.stats.avg_duration or 1
+        return max(1, math.ceil((len(self._waiters) + 1) / self.concurrency * duration))
+
+    async def acquire(self):
+        if self.stats.active < self.concurrency and not self._waiters:
+            self.stats.active += 1
+            self.stats.admitted += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.stats.rejected += 1
+            raise ServerOverloaded(self.retry_after())
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.stats.waiting = len(self._waiters)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 已经分到名额后被取消，转交给下一个请求
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            self.stats.waiting = len(self._waiters)
+        self.stats.admitted += 1
+
+    def release(self, duration: Optional[float] = None):
+        if duration is not None:
+            self.stats.avg_duration += (duration - self.stats.avg_duration) * 0.2
+        # 名额直接转交给排在最前面的请求
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self.stats.waiting = len(self._waiters)
+                return
+        self.stats.active -= 1
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        workers: int,
+        *,
+        max_queue: int,
+        heavy_cost: float,
+        heavy_concurrency: int = 0,
+        meme_concurrency: int = 0,
+    ):
+        self.max_queue = max_queue
+        self.heavy_cost = heavy_cost
+        self.meme_concurrency = meme_concurrency
+        # 两个通道合计不超过执行器的线程 / 进程数，进入轻量通道的请求在执行器中不会排在
+        # 重量请求后面；只有一个渲染线程时两个通道各占一个名额
+        heavy = min(heavy_concurrency or workers // 2, workers - 1)
+        self.heavy = Lane("heavy", max(1, heavy), max_queue)
+        self.light = Lane("light", max(1, workers - heavy), max_queue)
+        self._meme_lanes: dict[str, Lane] = {}
+        self._meme_frames: dict[str, float] = {}
+        """表情自身的帧数（输入为静态图片时输出的帧数）"""
+
+    def estimate_cost(self, meme_key: str, images: list[bytes]) -> float:
+        cost = sum(image_cost(image) for image in images) if images else TEXT_ONLY_COST
+        return cost * self._meme_frames.get(meme_key, 1)
+
+    def learn(self, meme_key: str, images: list[bytes], headers: dict[str, str]):
+        """根据输出的帧数更新表情自身的帧数"""
+        if any(is_animated(image) for image in images):
+            return
+        frames = 1
+        if gif_frames := headers.get("X-Gif-Frames"):
+            frames = int(gif_frames.split("/")[1])
+        self._meme_frames[meme_key] = frames
+
+    def _meme_lane(self, meme_key: str) -> Optional[Lane]:
+        if self.meme_concurrency <= 0:
+            return None
+        if (lane := self._meme_lanes.get(meme_key)) is None:
+            lane = Lane(meme_key, self.meme_concurrency, self.max_queue)
+            self._meme_lanes[meme_key] = lane
+        return lane
+
+    @asynccontextmanager
+    async def admit(self, meme_key: str, cost: float) -> AsyncIterator[None]:
+        """
+        等待制作名额，排队已满时抛出 ``ServerOverloaded``
+        :params
+          * ``cost``: ``estimate_cost`` 估算的开销
+        """
+        lane = self.heavy if cost >= self.heavy_cost else self.light
+        meme_lane = self._meme_lane(meme_key)
+        if meme_lane:
+            await meme_lane.acquire()
+        try:
+            await lane.acquire()
+        except BaseException:
+            if meme_lane:
+                meme_lane.release()
+            raise
+
+        start = time.perf_counter()
+        duration = None
+        try:
+            yield
+            duration = time.perf_counter() - start
+        finally:
+            lane.release(duration)
+            if meme_lane:
+                meme_lane.release()
+
+    def dump_stats(self) -> dict[str, Any]:
+        return {
+            "light": asdict(self.light.stats),
+            "heavy": asdict(self.heavy.stats),
+            "memes": {
+                key: asdict(lane.stats)
+                for key, lane in self._meme_lanes.items()
+                if lane.stats.active or lane.stats.waiting
+            },
+        }
+
+
+def _create_admission_controller() -> Optional[AdmissionController]:
+    config = meme_config.server
+    if not config.admission_enabled:
+        return None
+    if config.render_backend == "process":
+        workers = render_executor.process_workers
+    else:
+        workers = render_executor.thread_workers
+    return AdmissionController(
+        workers,
+        max_queue=config.render_queue_size,
+        heavy_cost=config.heavy_render_cost,
+        heavy_concurrency=config.heavy_render_concurrency,
+        meme_concurrency=config.meme_concurrency,
+    )
+
+
+admission_controller = _create_admission_controller()
@@ -1,25 +1,65 @@
+import asyncio
+import gzip
+import hashlib
 import json
+import os
+import time
+import uuid
+import zipfile
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Literal, Optional
+from io import BytesIO
+from typing import Any, Callable, Literal, Optional
 
 import filetype
-from fastapi import Depends, FastAPI, Form, HTTPException, Response, UploadFile
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.openapi.utils import get_openapi
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ValidationError
+from starlette.datastructures import FormData
+from starlette.datastructures import UploadFile as StarletteUploadFile
 
-from meme_generator.compat import model_dump, model_json_schema, type_validate_python
+from meme_generator.admission import admission_controller
+from meme_generator.cache import make_cache_key, result_cache
+from meme_generator.compat import model_dump, model_json_schema, type_validator
 from meme_generator.config import meme_config
 from meme_generator.exception import (
     ArgModelMismatch,
     MemeGeneratorException,
     NoSuchMeme,
+    ServerOverloaded,
+)
+from meme_generator.executor import RenderResult, render_executor
+from meme_generator.frame_pool import frame_pool
+from meme_generator.image_store import image_store
+from meme_generator.log import LOGGING_CONFIG, logger, setup_logger
+from meme_generator.manager import (
+    LazyArgsType,
+    LazyMeme,
+    get_meme,
+    get_meme_keys,
+    get_memes,
 )
-from meme_generator.log import LOGGING_CONFIG, setup_logger
-from meme_generator.manager import get_meme, get_meme_keys, get_memes
 from meme_generator.meme import CommandShortcut, Meme, MemeArgsModel, ParserOption
-from meme_generator.utils import MemeProperties, render_meme_list, run_sync
+from meme_generator.prefork import PreforkServer, preload_memes, worker_stats
+from meme_generator.singleflight import render_flight
+from meme_generator.utils import (
+    MemeProperties,
+    SharedImage,
+    render_meme_list,
+    template_cache,
+)
 from meme_generator.version import __version__
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 app = FastAPI()
 
 # 添加CORS中间件支持跨域请求
@@ -29,6 +69,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # 允许所有HTTP方法
     allow_headers=["*"],  # 允许所有请求头
+    expose_headers=["ETag", "X-Gif-Frames", "X-Gif-Scale", "X-Gif-Encodes"],
 )
 
 # 确保JSON响应使用UTF-8编码
@@ -48,6 +89,24 @@ class UTF8JSONResponse(JSONResponse):
 app.default_response_class = UTF8JSONResponse
 
 
+@app.on_event("startup")
+def _():
+    if meme_config.server.hot_reload:
+        from meme_generator.reloader import meme_reloader
+
+        meme_reloader.on_reload(on_memes_reloaded)
+        meme_reloader.start()
+
+
+@app.on_event("shutdown")
+def _():
+    if meme_config.server.hot_reload:
+        from meme_generator.reloader import meme_reloader
+
+        meme_reloader.stop()
+    render_executor.shutdown()
+
+
 class MemeArgsResponse(BaseModel):
     args_model: dict[str, Any]
     args_examples: list[dict[str, Any]]
@@ -68,53 +127,645 @@ class MemeInfoResponse(BaseModel):
     params_type: MemeParamsResponse
     keywords: list[str]
     shortcuts: list[CommandShortcut]
-    tags: set[str]
+    tags: list[str]
     date_created: datetime
     date_modified: datetime
 
 
-def register_router(meme: Meme):
+def build_meme_info(meme: Meme) -> MemeInfoResponse:
+    args_type_response = None
+    if isinstance(args_type := meme.params_type.args_type, LazyArgsType):
+        # 延迟加载的表情直接使用清单中的信息，不导入模块
+        args_type_response = MemeArgsResponse(
+            args_model=args_type.args_schema,
+            args_examples=args_type.args_examples_data,
+            parser_options=args_type.parser_options,
+        )
+    elif args_type:
+        args_model = args_type.args_model
+        args_type_response = MemeArgsResponse(
+            args_model=model_json_schema(args_model),
+            args_examples=[model_dump(example) for example in args_type.args_examples],
+            parser_options=args_type.parser_options,
+        )
+
+    return MemeInfoResponse(
+        key=meme.key,
+        params_type=MemeParamsResponse(
+            min_images=meme.params_type.min_images,
+            max_images=meme.params_type.max_images,
+            min_texts=meme.params_type.min_texts,
+            max_texts=meme.params_type.max_texts,
+            default_texts=meme.params_type.default_texts,
+            args_type=args_type_response,
+        ),
+        keywords=meme.keywords,
+        shortcuts=meme.shortcuts,
+        # 排序以保证各进程生成的 ETag 一致
+        tags=sorted(meme.tags),
+        date_created=meme.date_created,
+        date_modified=meme.date_modified,
+    )
+
+
+def _parse_etags(header: str) -> set[str]:
+    return {
+        etag.strip().removeprefix("W/") for etag in header.split(",") if etag.strip()
+    }
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    encodings: set[str] = set()
+    for item in header.split(","):
+        encoding, _, params = item.strip().partition(";")
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        encodings.add(encoding.strip().lower())
+    return encodings
+
+
+@dataclass
+class PrecomputedResponse:
+    """预先编码好的 JSON 响应，带强 ETag 及压缩版本"""
+
+    body: bytes
+    etag: str
+    encoded: dict[str, bytes]
+
+    @classmethod
+    def from_content(cls, content: Any) -> "PrecomputedResponse":
+        return cls.from_body(UTF8JSONResponse(jsonable_encoder(content)).body)
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "PrecomputedResponse":
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        encoded: dict[str, bytes] = {}
+        if len(body) >= 1024:
+            encoded["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+            if brotli:
+                encoded["br"] = brotli.compress(body)
+        return cls(body=body, etag=etag, encoded=encoded)
+
+    def response(self, request: Request) -> Response:
+        headers = {"ETag": self.etag}
+        if self.encoded:
+            headers["Vary"] = "Accept-Encoding"
+
+        if if_none_match := request.headers.get("if-none-match"):
+            etags = _parse_etags(if_none_match)
+            if "*" in etags or self.etag in etags:
+                return Response(status_code=304, headers=headers)
+
+        content = self.body
+        if self.encoded:
+            accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+            for encoding in ("br", "gzip"):
+                if encoding in accepted and encoding in self.encoded:
+                    content = self.encoded[encoding]
+                    headers["Content-Encoding"] = encoding
+                    break
+        return Response(
+            content=content, media_type="application/json", headers=headers
+        )
+
+
+metadata_responses: dict[str, PrecomputedResponse] = {}
+meme_info_responses: dict[str, PrecomputedResponse] = {}
+
+
+def refresh_meme_info(meme: Meme) -> PrecomputedResponse:
+    info = PrecomputedResponse.from_content(build_meme_info(meme))
+    meme_info_responses[meme.key] = info
+    return info
+
+
+def refresh_metadata(keys: Optional[list[str]] = None):
+    """
+    重新生成元数据响应，在加载表情后或表情热重载后调用
+    :params
+      * ``keys``: 发生变化的表情，为 None 时重新生成所有表情的信息
+    """
+    memes = sorted(get_memes(), key=lambda meme: meme.key)
+    current_keys = {meme.key for meme in memes}
+    for key in list(meme_info_responses):
+        if key not in current_keys:
+            meme_info_responses.pop(key)
+    for meme in memes:
+        if keys is None or meme.key in keys or meme.key not in meme_info_responses:
+            refresh_meme_info(meme)
+
+    memes_body = b"[" + b",".join(
+        meme_info_responses[meme.key].body for meme in memes
+    ) + b"]"
+    metadata_responses["memes"] = PrecomputedResponse.from_body(memes_body)
+    metadata_responses["keys"] = PrecomputedResponse.from_content(get_meme_keys())
+    metadata_responses["version"] = PrecomputedResponse.from_content(__version__)
+
+
+@dataclass
+class MemeRoute:
+    args_model: type[MemeArgsModel]
+    validate_args: Callable[[Any], MemeArgsModel]
+    default_args: dict[str, Any]
+
+
+_meme_routes: dict[str, MemeRoute] = {}
+
+
+def register_router(meme: Meme) -> MemeRoute:
+    """登记表情的参数校验器，所有表情共用 ``/memes/{key}/`` 路由"""
     if args_type := meme.params_type.args_type:
         args_model = args_type.args_model
     else:
         args_model = MemeArgsModel
 
-    def args_checker(
-        args: Optional[str] = Form(default=json.dumps(model_dump(args_model()))),
-    ):
-        if not args:
-            return MemeArgsModel()
+    route = MemeRoute(
+        args_model=args_model,
+        validate_args=type_validator(args_model),
+        default_args=model_dump(args_model()),
+    )
+    _meme_routes[meme.key] = route
+    app.openapi_schema = None
+    return route
+
+
+def on_memes_reloaded(keys: list[str]):
+    """表情热重载后重新登记参数校验器并重新生成元数据"""
+    for key in keys:
+        _meme_routes.pop(key, None)
         try:
-            model = type_validate_python(args_model, json.loads(args))
-        except ValidationError as e:
-            e = ArgModelMismatch(str(e))
-            raise HTTPException(status_code=552, detail=e.message)
-        return model
-
-    @app.post(f"/memes/{meme.key}/")
-    async def _(
-        images: list[UploadFile] = [],
-        texts: list[str] = meme.params_type.default_texts,
-        args: args_model = Depends(args_checker),  # type: ignore
+            meme = get_meme(key)
+        except NoSuchMeme:
+            continue  # 表情已被移除
+        if not isinstance(meme, LazyMeme):
+            register_router(meme)
+    app.openapi_schema = None
+    refresh_metadata(keys)
+
+
+def error_headers(e: MemeGeneratorException) -> Optional[dict[str, str]]:
+    if isinstance(e, ServerOverloaded):
+        return {"Retry-After": str(e.retry_after)}
+    return None
+
+
+async def read_images(
+    form: FormData,
+) -> tuple[list[bytes], Optional[list[SharedImage]]]:
+    """
+    读取请求中的图片：先是上传的 ``images``，然后是 ``image_ids`` 引用的已存储图片
+    :return
+      * 图片字节，以及引用了已存储图片时与之对应的 ``SharedImage``
+    """
+    images: list[bytes] = []
+    for image in form.getlist("images"):
+        if isinstance(image, StarletteUploadFile):
+            images.append(await image.read())
+
+    image_ids = [value for value in form.getlist("image_ids") if isinstance(value, str)]
+    if not image_ids:
+        return images, None
+    if image_store is None:
+        raise HTTPException(status_code=400, detail="Image store is disabled")
+    shared_images = [SharedImage(image) for image in images]
+    for image_id in image_ids:
+        if (image := image_store.get(image_id)) is None:
+            raise HTTPException(status_code=404, detail=f'Image "{image_id}" not found')
+        images.append(image.data)
+        shared_images.append(image)
+    return images, shared_images
+
+
+def render_deadline() -> Optional[float]:
+    if (timeout := meme_config.server.render_timeout) > 0:
+        return time.time() + timeout
+    return None
+
+
+async def render_meme(
+    meme: Meme,
+    images: list[bytes],
+    texts: list[str],
+    args: dict[str, Any],
+    shared_images: Optional[list[SharedImage]] = None,
+) -> RenderResult:
+    """
+    制作表情，优先使用结果缓存，并合并内容相同的并发请求
+    :params
+      * ``images``: 图片字节，用于计算缓存键
+      * ``shared_images``: 与 ``images`` 对应的已解码图片，批量制作时多个表情共用
+    """
+    cache_key = None
+    if meme.cacheable and (result_cache or render_flight):
+        cache_key = make_cache_key(meme.key, images, texts, args)
+        if result_cache and (content := result_cache.get(cache_key)) is not None:
+            return RenderResult(content=content)
+
+    async def _render() -> RenderResult:
+        inputs = shared_images or images
+        # 排队等待的时间也计入制作期限
+        deadline = render_deadline()
+        if admission_controller is None:
+            result = await render_executor.render(
+                meme, images=inputs, texts=texts, args=args, deadline=deadline
+            )
+        else:
+            cost = admission_controller.estimate_cost(meme.key, images)
+            async with admission_controller.admit(meme.key, cost):
+                result = await render_executor.render(
+                    meme, images=inputs, texts=texts, args=args, deadline=deadline
+                )
+            admission_controller.learn(meme.key, images, result.headers)
+        if result_cache and cache_key:
+            result_cache.set(cache_key, result.content)
+        return result
+
+    if render_flight and cache_key:
+        # 内容相同的请求正在制作时等待其结果
+        return await render_flight.do(cache_key, _render)
+    return await _render()
+
+
+class GifStreamingResponse(StreamingResponse):
+    """
+    流式输出的 gif
+    客户端在开始读取前断开时 ``body`` 不会执行，由 ``on_close`` 中止制作并释放准入名额
+    """
+
+    def __init__(
+        self,
+        content: AsyncIterator[bytes],
+        *,
+        on_close: Callable[[], Awaitable[None]],
+        **kwargs,
     ):
-        imgs: list[bytes] = []
-        for image in images:
-            imgs.append(await image.read())
+        super().__init__(content, **kwargs)
+        self.on_close = on_close
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.on_close()
+
+
+async def stream_meme(
+    meme: Meme,
+    images: list[bytes],
+    texts: list[str],
+    args: dict[str, Any],
+    shared_images: Optional[list[SharedImage]] = None,
+) -> Response:
+    """
+    制作表情，输出 gif 时边编码边发送
+    优先使用结果缓存，制作结果同样写入缓存；流式输出无法共享，不与其他请求合并
+    """
+    cache_key = None
+    if meme.cacheable and result_cache:
+        cache_key = make_cache_key(meme.key, images, texts, args)
+        if (content := result_cache.get(cache_key)) is not None:
+            return meme_response(RenderResult(content=content))
+
+    deadline = render_deadline()
+    # 准入名额在 gif 发送完毕后才释放
+    admission = AsyncExitStack()
+    if admission_controller:
+        cost = admission_controller.estimate_cost(meme.key, images)
+        await admission.enter_async_context(admission_controller.admit(meme.key, cost))
+    try:
+        result = await render_executor.render_stream(
+            meme,
+            images=shared_images or images,
+            texts=texts,
+            args=args,
+            deadline=deadline,
+        )
+    except BaseException:
+        await admission.aclose()
+        raise
+
+    def _finish(content: bytes, headers: dict[str, str]):
+        if admission_controller:
+            admission_controller.learn(meme.key, images, headers)
+        if result_cache and cache_key:
+            result_cache.set(cache_key, content)
 
-        texts = [text for text in texts if text]
+    if isinstance(result, RenderResult):
+        await admission.aclose()
+        _finish(result.content, result.headers)
+        return meme_response(result)
 
-        assert isinstance(args, args_model)
+    streamed = result
 
+    async def body() -> AsyncIterator[bytes]:
+        chunks: list[bytes] = []
         try:
-            result = await run_sync(meme)(
-                images=imgs, texts=texts, args=model_dump(args)
-            )
+            async for chunk in streamed.chunks:
+                if cache_key:
+                    chunks.append(chunk)
+                yield chunk
         except MemeGeneratorException as e:
-            raise HTTPException(status_code=e.status_code, detail=e.message)
+            # 响应头已经发出，只能中断连接
+            logger.warning(f"Streaming meme {meme.key} aborted: {e.message}")
+            raise
+        finally:
+            await admission.aclose()
+        _finish(b"".join(chunks), streamed.headers)
+
+    async def close():
+        streamed.close()
+        await admission.aclose()
+
+    return GifStreamingResponse(
+        body(), on_close=close, media_type="image/gif", headers=streamed.headers
+    )
+
+
+def meme_response(result: RenderResult) -> Response:
+    content = result.content
+    media_type = str(filetype.guess_mime(content)) or "text/plain"
+    return Response(content=content, media_type=media_type, headers=result.headers)
+
+
+async def generate_meme(key: str, request: Request):
+    try:
+        meme = get_meme(key)
+    except NoSuchMeme as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    route = _meme_routes.get(key) or register_router(meme)
+
+    form = await request.form()
+    imgs, shared_images = await read_images(form)
+
+    # texts 为表单字段，兼容通过查询参数传递
+    if "texts" in form:
+        texts = [text for text in form.getlist("texts") if isinstance(text, str)]
+    elif "texts" in request.query_params:
+        texts = request.query_params.getlist("texts")
+    else:
+        texts = meme.params_type.default_texts
+    texts = [text for text in texts if text]
+
+    args = form.get("args")
+    try:
+        model = route.validate_args(
+            json.loads(args) if isinstance(args, str) and args else route.default_args
+        )
+    except (ValidationError, ValueError) as e:
+        e = ArgModelMismatch(str(e))
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    args_dict = model_dump(model)
+
+    # ?stream=true 时输出 gif 的表情边编码边发送
+    stream = request.query_params.get("stream", "").lower() in ("true", "1", "yes")
+    try:
+        if stream:
+            return await stream_meme(meme, imgs, texts, args_dict, shared_images)
+        result = await render_meme(meme, imgs, texts, args_dict, shared_images)
+    except MemeGeneratorException as e:
+        raise HTTPException(
+            status_code=e.status_code, detail=e.message, headers=error_headers(e)
+        )
+    return meme_response(result)
+
+
+class BatchJob(BaseModel):
+    key: str
+    images: list[int] = []
+    """使用的图片在请求中 ``images`` 里的序号"""
+    texts: Optional[list[str]] = None
+    """为 None 时使用表情的默认文字"""
+    args: dict[str, Any] = {}
+
+
+_validate_batch_jobs = type_validator(list[BatchJob])
+
+
+@dataclass
+class BatchResult:
+    index: int
+    key: str
+    status_code: int
+    content: bytes
+    media_type: str
+    headers: dict[str, str]
+
+    @classmethod
+    def error(
+        cls,
+        index: int,
+        key: str,
+        status_code: int,
+        detail: str,
+        headers: Optional[dict[str, str]] = None,
+    ) -> "BatchResult":
+        content = json.dumps({"detail": detail}, ensure_ascii=False).encode("utf-8")
+        return cls(index, key, status_code, content, "application/json", headers or {})
+
+
+async def run_batch_job(
+    index: int, job: BatchJob, images: list[bytes], shared_images: list[SharedImage]
+) -> BatchResult:
+    try:
+        meme = get_meme(job.key)
+    except NoSuchMeme as e:
+        return BatchResult.error(index, job.key, e.status_code, e.message)
+    route = _meme_routes.get(job.key) or register_router(meme)
+
+    if any(not 0 <= i < len(images) for i in job.images):
+        return BatchResult.error(index, job.key, 400, "Image index out of range")
+    texts = meme.params_type.default_texts if job.texts is None else job.texts
+    texts = [text for text in texts if text]
+
+    try:
+        args = model_dump(route.validate_args(job.args or route.default_args))
+        result = await render_meme(
+            meme,
+            [images[i] for i in job.images],
+            texts,
+            args,
+            [shared_images[i] for i in job.images],
+        )
+    except ValidationError as e:
+        e = ArgModelMismatch(str(e))
+        return BatchResult.error(index, job.key, e.status_code, e.message)
+    except MemeGeneratorException as e:
+        return BatchResult.error(
+            index, job.key, e.status_code, e.message, error_headers(e)
+        )
+    except Exception as e:
+        logger.opt(exception=e).error(f"Batch job {index} ({job.key}) failed")
+        return BatchResult.error(index, job.key, 500, "Internal Server Error")
+
+    content = result.content
+    media_type = str(filetype.guess_mime(content)) or "text/plain"
+    return BatchResult(index, job.key, 200, content, media_type, result.headers)
+
+
+def batch_part(boundary: str, result: BatchResult) -> bytes:
+    headers = {
+        "Content-Type": result.media_type,
+        "Content-Length": str(len(result.content)),
+        "X-Job-Index": str(result.index),
+        "X-Meme-Key": result.key,
+        "X-Status-Code": str(result.status_code),
+        **result.headers,
+    }
+    head = "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+    return f"--{boundary}\r\n{head}\r\n".encode() + result.content + b"\r\n"
+
+
+def batch_zip(results: list[BatchResult]) -> bytes:
+    """打包制作结果，``results.json`` 中记录每个任务的状态码和文件名或错误信息"""
+    output = BytesIO()
+    summary: list[dict[str, Any]] = []
+    # 图片已经过压缩，不再压缩
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_STORED) as zf:
+        for result in sorted(results, key=lambda result: result.index):
+            item: dict[str, Any] = {
+                "index": result.index,
+                "key": result.key,
+                "status_code": result.status_code,
+            }
+            if result.status_code == 200:
+                ext = filetype.guess_extension(result.content) or "bin"
+                item["filename"] = f"{result.index}-{result.key}.{ext}"
+                zf.writestr(item["filename"], result.content)
+            else:
+                item["detail"] = json.loads(result.content)["detail"]
+            summary.append(item)
+        zf.writestr("results.json", json.dumps(summary, ensure_ascii=False, indent=2))
+    return output.getvalue()
+
+
+async def generate_memes_batch(request: Request):
+    """
+    批量制作表情
+
+    请求为 multipart 表单：``images``、``image_ids`` 为所有任务共用的图片，
+    ``jobs`` 为任务列表的 JSON。
+    每张图片只读取、解码一次。``format=multipart``（默认）时以 multipart/mixed 流式返回，
+    先完成的任务先返回，每部分的 ``X-Job-Index``、``X-Status-Code`` 为任务序号和状态码；
+    ``format=zip`` 时返回 zip 文件
+    """
+    output_format = request.query_params.get("format", "multipart")
+    if output_format not in ("multipart", "zip"):
+        raise HTTPException(status_code=400, detail="format must be multipart or zip")
+
+    form = await request.form()
+    images, shared_images = await read_images(form)
+
+    jobs_data = form.get("jobs")
+    try:
+        jobs = _validate_batch_jobs(
+            json.loads(jobs_data) if isinstance(jobs_data, str) else None
+        )
+    except (ValidationError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid jobs: {e}")
+    if not 0 < len(jobs) <= meme_config.server.batch_max_jobs:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Number of jobs must be 1 ~ {meme_config.server.batch_max_jobs}",
+        )
+
+    if shared_images is None:
+        shared_images = [SharedImage(image) for image in images]
+    tasks = [
+        asyncio.create_task(run_batch_job(index, job, images, shared_images))
+        for index, job in enumerate(jobs)
+    ]
+
+    if output_format == "zip":
+        results = await asyncio.gather(*tasks)
+        return Response(
+            content=batch_zip(results),
+            media_type="application/zip",
+            headers={"Content-Disposition": 'attachment; filename="memes.zip"'},
+        )
+
+    boundary = uuid.uuid4().hex
+
+    async def stream() -> AsyncIterator[bytes]:
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield batch_part(boundary, await task)
+            yield f"--{boundary}--\r\n".encode()
+        finally:
+            # 客户端断开时取消未完成的任务
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(
+        stream(), media_type=f"multipart/mixed; boundary={boundary}"
+    )
+
+
+def meme_default_args(meme: Meme) -> dict[str, Any]:
+    if route := _meme_routes.get(meme.key):
+        return route.default_args
+    if isinstance(args_type := meme.params_type.args_type, LazyArgsType):
+        return args_type.default_args
+    return register_router(meme).default_args
+
+
+def meme_openapi_path(meme: Meme, default_args: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "post": {
+            "summary": "/".join(meme.keywords) or meme.key,
+            "operationId": f"generate_meme_{meme.key}",
+            "tags": ["memes"],
+            "requestBody": {
+                "content": {
+                    "multipart/form-data": {
+                        "schema": {
+                            "type": "object",
+                            "properties": {
+                                "images": {
+                                    "type": "array",
+                                    "items": {"type": "string", "format": "binary"},
+                                    "minItems": meme.params_type.min_images,
+                                    "maxItems": meme.params_type.max_images,
+                                },
+                                "texts": {
+                                    "type": "array",
+                                    "items": {"type": "string"},
+                                    "minItems": meme.params_type.min_texts,
+                                    "maxItems": meme.params_type.max_texts,
+                                    "default": meme.params_type.default_texts,
+                                },
+                                "args": {
+                                    "type": "string",
+                                    "default": json.dumps(
+                                        default_args, ensure_ascii=False
+                                    ),
+                                },
+                            },
+                        }
+                    }
+                }
+            },
+            "responses": {"200": {"description": "生成的表情图片"}},
+        }
+    }
+
+
+def custom_openapi() -> dict[str, Any]:
+    if app.openapi_schema:
+        return app.openapi_schema
+    schema = get_openapi(title=app.title, version=app.version, routes=app.routes)
+    paths = schema.setdefault("paths", {})
+    for meme in sorted(get_memes(), key=lambda meme: meme.key):
+        paths[f"/memes/{meme.key}/"] = meme_openapi_path(meme, meme_default_args(meme))
+    app.openapi_schema = schema
+    return schema
 
-        content = result.getvalue()
-        media_type = str(filetype.guess_mime(content)) or "text/plain"
-        return Response(content=content, media_type=media_type)
+
+app.openapi = custom_openapi
 
 
 class MemeKeyWithProperties(BaseModel):
@@ -159,108 +810,141 @@ def register_routers():
         return Response(content=content, media_type=media_type)
 
     @app.get("/meme/version")
+    def _(request: Request):
+        return metadata_responses["version"].response(request)
+
+    @app.get("/meme/stats")
     def _():
-        return __version__
+        return {
+            "result_cache": result_cache.dump_stats() if result_cache else None,
+            "template_cache": template_cache.dump_stats(),
+            "image_store": image_store.dump_stats() if image_store else None,
+            "coalescing": render_flight.dump_stats() if render_flight else None,
+            "admission": (
+                admission_controller.dump_stats() if admission_controller else None
+            ),
+            "frame_pool": frame_pool.dump_stats(),
+            "workers": worker_stats(),
+        }
+
+    if image_store is not None:
+
+        @app.post("/images")
+        async def _(request: Request):
+            """保存图片，返回图片 id，之后可通过 ``image_ids`` 引用"""
+            form = await request.form()
+            image = form.get("image")
+            if not isinstance(image, StarletteUploadFile):
+                raise HTTPException(status_code=400, detail="Missing image")
+            data = await image.read()
+            if not str(filetype.guess_mime(data)).startswith("image/"):
+                raise HTTPException(status_code=400, detail="Not an image")
+            return {"image_id": image_store.put(data)}
+
+        @app.head("/images/{image_id}")
+        def _(image_id: str):
+            """图片是否已保存，已保存时无需重新上传"""
+            status_code = 200 if image_store.contains(image_id) else 404
+            return Response(status_code=status_code)
 
     @app.get("/memes/keys")
-    def _():
-        return get_meme_keys()
+    def _(request: Request):
+        return metadata_responses["keys"].response(request)
 
     @app.get("/memes")
-    def _():
+    def _(request: Request):
         """返回所有meme的完整信息，包括关键词"""
-        memes = []
-        for meme in sorted(get_memes(), key=lambda meme: meme.key):
-            args_type_response = None
-            if args_type := meme.params_type.args_type:
-                args_model = args_type.args_model
-                args_type_response = MemeArgsResponse(
-                    args_model=model_json_schema(args_model),
-                    args_examples=[
-                        model_dump(example) for example in args_type.args_examples
-                    ],
-                    parser_options=args_type.parser_options,
-                )
-
-            meme_info = MemeInfoResponse(
-                key=meme.key,
-                params_type=MemeParamsResponse(
-                    min_images=meme.params_type.min_images,
-                    max_images=meme.params_type.max_images,
-                    min_texts=meme.params_type.min_texts,
-                    max_texts=meme.params_type.max_texts,
-                    default_texts=meme.params_type.default_texts,
-                    args_type=args_type_response,
-                ),
-                keywords=meme.keywords,
-                shortcuts=meme.shortcuts,
-                tags=meme.tags,
-                date_created=meme.date_created,
-                date_modified=meme.date_modified,
-            )
-            memes.append(meme_info)
-        return memes
+        return metadata_responses["memes"].response(request)
 
     @app.get("/memes/{key}/info")
-    def _(key: str):
-        try:
-            meme = get_meme(key)
-        except NoSuchMeme as e:
-            raise HTTPException(status_code=e.status_code, detail=e.message)
-
-        args_type_response = None
-        if args_type := meme.params_type.args_type:
-            args_model = args_type.args_model
-            args_type_response = MemeArgsResponse(
-                args_model=model_json_schema(args_model),
-                args_examples=[
-                    model_dump(example) for example in args_type.args_examples
-                ],
-                parser_options=args_type.parser_options,
-            )
-
-        return MemeInfoResponse(
-            key=meme.key,
-            params_type=MemeParamsResponse(
-                min_images=meme.params_type.min_images,
-                max_images=meme.params_type.max_images,
-                min_texts=meme.params_type.min_texts,
-                max_texts=meme.params_type.max_texts,
-                default_texts=meme.params_type.default_texts,
-                args_type=args_type_response,
-            ),
-            keywords=meme.keywords,
-            shortcuts=meme.shortcuts,
-            tags=meme.tags,
-            date_created=meme.date_created,
-            date_modified=meme.date_modified,
-        )
+    def _(key: str, request: Request):
+        # 已生成的信息直接返回，延迟加载的表情无需导入模块
+        if (info := meme_info_responses.get(key)) is None:
+            try:
+                meme = get_meme(key)
+            except NoSuchMeme as e:
+                raise HTTPException(status_code=e.status_code, detail=e.message)
+            info = refresh_meme_info(meme)
+        return info.response(request)
 
     @app.get("/memes/{key}/preview")
     async def _(key: str):
         try:
             meme = get_meme(key)
-            result = await run_sync(meme.generate_preview)()
+            result = await render_executor.preview(meme)
         except MemeGeneratorException as e:
             raise HTTPException(status_code=e.status_code, detail=e.message)
 
-        content = result.getvalue()
+        content = result.content
         media_type = str(filetype.guess_mime(content)) or "text/plain"
         return Response(content=content, media_type=media_type)
 
+    # 延迟加载的表情在第一次请求时再登记，避免启动时导入模块
     for meme in sorted(get_memes(), key=lambda meme: meme.key):
-        register_router(meme)
+        if not isinstance(meme, LazyMeme):
+            register_router(meme)
 
+    refresh_metadata()
 
-def run_server():
+    app.add_api_route(
+        "/memes/batch",
+        generate_memes_batch,
+        methods=["POST"],
+        summary="批量制作表情",
+    )
+    app.add_api_route(
+        "/memes/{key}/",
+        generate_meme,
+        methods=["POST"],
+        include_in_schema=False,
+    )
+
+
+def run_server(
+    workers: Optional[int] = None,
+    preload: Optional[bool] = None,
+    max_requests: Optional[int] = None,
+):
+    """
+    启动 web server
+    :params
+      * ``workers``: 工作进程数，大于 1 时由主进程 fork 出工作进程
+      * ``preload``: 是否在 fork 前导入所有表情并预热模板和字体
+      * ``max_requests``: 工作进程处理多少个请求后重启，0 表示不重启
+    未指定的参数使用 ``[server]`` 中的配置
+    """
     import uvicorn
 
+    config = meme_config.server
+    workers = config.workers if workers is None else workers
+    preload = config.preload if preload is None else preload
+    max_requests = config.max_requests if max_requests is None else max_requests
+
+    if (workers > 1 or preload) and not hasattr(os, "fork"):
+        logger.warning("Prefork mode requires os.fork, running a single process")
+        workers, preload = 1, False
+
+    if preload:
+        preload_memes(config.preload_memes)
     register_routers()
+
+    if workers > 1 or preload:
+        PreforkServer(
+            app,
+            host=config.host,
+            port=config.port,
+            workers=workers,
+            max_requests=max_requests,
+            log_config=LOGGING_CONFIG,
+        ).run()
+        return
+
     uvicorn.run(
         app,
-        host=meme_config.server.host,
-        port=meme_config.server.port,
+        host=config.host,
+        port=config.port,
         log_config=LOGGING_CONFIG,
+        limit_max_requests=max_requests or None,
     )
 
 
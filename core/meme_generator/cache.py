@@ -0,0 +1,243 @@
+"""表情制作结果缓存
+
+以表情名、输入图片内容哈希、文字和参数作为键，缓存制作结果。
+内存中使用按字节数限制大小的 LRU，可选启用按大小淘汰的磁盘缓存。
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from .config import meme_config
+from .dirs import get_cache_dir
+from .log import logger
+from .version import __version__
+
+CacheKey = tuple[str, str]
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def make_cache_key(
+    meme_key: str, images: list[bytes], texts: list[str], args: dict[str, Any]
+) -> CacheKey:
+    """
+    生成缓存键
+    :params
+      * ``meme_key``: 表情名
+      * ``images``: 输入图片的原始字节
+      * ``texts``: 输入文字（已去除空字符串）
+      * ``args``: 参数模型 dump 之后的字典
+    :return
+      * 表情名和内容摘要
+    """
+    payload = json.dumps(
+        {
+            "version": __version__,
+            "images": [hash_bytes(image) for image in images],
+            "texts": texts,
+            "args": args,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return meme_key, hash_bytes(payload.encode("utf-8"))
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    memory_size: int = 0
+    memory_items: int = 0
+    disk_size: int = 0
+
+
+class ResultCache:
+    """两级结果缓存：内存 LRU + 磁盘"""
+
+    def __init__(
+        self,
+        memory_max_size: int,
+        disk_dir: Optional[Path] = None,
+        disk_max_size: int = 0,
+    ):
+        self.memory_max_size = memory_max_size
+        self.disk_dir = disk_dir
+        self.disk_max_size = disk_max_size
+        self.stats = CacheStats()
+        self._memory: OrderedDict[CacheKey, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._scan_lock = threading.Lock()
+        self._disk_scanned = False
+
+    def _disk_path(self, key: CacheKey) -> Path:
+        assert self.disk_dir
+        meme_key, digest = key
+        return self.disk_dir / meme_key / digest
+
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        with self._lock:
+            if (content := self._memory.get(key)) is not None:
+                self._memory.move_to_end(key)
+                self.stats.hits += 1
+                self.stats.memory_hits += 1
+                return content
+
+        if content := self._disk_get(key):
+            with self._lock:
+                self.stats.hits += 1
+                self.stats.disk_hits += 1
+            self._memory_set(key, content)
+            return content
+
+        with self._lock:
+            self.stats.misses += 1
+        return None
+
+    def contains(self, key: CacheKey) -> bool:
+        """是否已缓存，不计入命中统计"""
+        with self._lock:
+            if key in self._memory:
+                return True
+        return bool(self.disk_dir) and self._disk_path(key).is_file()
+
+    def set(self, key: CacheKey, content: bytes):
+        self._memory_set(key, content)
+        self._disk_set(key, content)
+
+    def invalidate(self, meme_key: str):
+        """清除某个表情的所有缓存结果"""
+        with self._lock:
+            for key in [key for key in self._memory if key[0] == meme_key]:
+                self.stats.memory_size -= len(self._memory.pop(key))
+            self.stats.memory_items = len(self._memory)
+        if self.disk_dir and (meme_dir := self.disk_dir / meme_key).exists():
+            for _, path in self._disk_files(meme_dir):
+                self._disk_remove(path)
+
+    def _memory_set(self, key: CacheKey, content: bytes):
+        size = len(content)
+        if size > self.memory_max_size:
+            return
+        with self._lock:
+            if (old := self._memory.pop(key, None)) is not None:
+                self.stats.memory_size -= len(old)
+            self._memory[key] = content
+            self.stats.memory_size += size
+            while self.stats.memory_size > self.memory_max_size:
+                _, evicted = self._memory.popitem(last=False)
+                self.stats.memory_size -= len(evicted)
+            self.stats.memory_items = len(self._memory)
+
+    def _disk_get(self, key: CacheKey) -> Optional[bytes]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            content = path.read_bytes()
+            os.utime(path)
+            return content
+        except OSError:
+            return None
+
+    def _disk_set(self, key: CacheKey, content: bytes):
+        if not self.disk_dir or len(content) > self.disk_max_size:
+            return
+        self._scan_disk()
+        path = self._disk_path(key)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(content)
+            old_size = path.stat().st_size if path.exists() else 0
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to write result cache {path}: {e}")
+            return
+        with self._lock:
+            self.stats.disk_size += len(content) - old_size
+            over_size = self.stats.disk_size > self.disk_max_size
+        if over_size:
+            self._evict_disk()
+
+    def _disk_remove(self, path: Path):
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            self.stats.disk_size -= size
+
+    @staticmethod
+    def _disk_files(directory: Path) -> list[tuple[os.stat_result, Path]]:
+        """已写入的缓存文件，跳过其他线程正在写入的临时文件"""
+        files: list[tuple[os.stat_result, Path]] = []
+        for path in directory.rglob("*"):
+            if path.suffix == ".tmp":
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                # 扫描期间被其他线程淘汰
+                continue
+            if path.is_file():
+                files.append((stat, path))
+        return files
+
+    def _scan_disk(self):
+        if self._disk_scanned or not self.disk_dir:
+            return
+        with self._scan_lock:
+            if self._disk_scanned:
+                return
+            size = sum(stat.st_size for stat, _ in self._disk_files(self.disk_dir))
+            with self._lock:
+                self.stats.disk_size = size
+            self._disk_scanned = True
+
+    def _evict_disk(self):
+        """按最近访问时间淘汰，直到磁盘缓存低于上限的 90%"""
+        assert self.disk_dir
+        files = sorted(
+            self._disk_files(self.disk_dir), key=lambda file: file[0].st_mtime
+        )
+        target_size = self.disk_max_size * 0.9
+        for _, path in files:
+            if self.stats.disk_size <= target_size:
+                break
+            self._disk_remove(path)
+
+    def dump_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return asdict(self.stats)
+
+
+def _create_result_cache() -> Optional[ResultCache]:
+    config = meme_config.cache
+    if not config.result_cache_enabled:
+        return None
+    disk_dir = None
+    if config.disk_cache_enabled:
+        disk_dir = get_cache_dir() / "results"
+        disk_dir.mkdir(parents=True, exist_ok=True)
+    return ResultCache(
+        memory_max_size=int(config.memory_cache_size * 10**6),
+        disk_dir=disk_dir,
+        disk_max_size=int(config.disk_cache_size * 10**6),
+    )
+
+
+result_cache = _create_result_cache()
@@ -1,6 +1,9 @@
 import asyncio
+import hashlib
+import json
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 import filetype
 from arclet.alconna import (
@@ -15,33 +18,47 @@ from arclet.alconna import (
 from arclet.alconna.exceptions import SpecialOptionTriggered
 from arclet.alconna.tools import RichConsoleFormatter
 
-from meme_generator.app import run_server
 from meme_generator.config import meme_config
-from meme_generator.download import check_resources
+from meme_generator.dirs import get_cache_file
 from meme_generator.exception import MemeGeneratorException, NoSuchMeme
 from meme_generator.log import setup_logger
 from meme_generator.manager import get_meme, get_memes
+from meme_generator.meme import Meme
+from meme_generator.version import __version__
 
+GENERATE_ALIASES = ("generate", "make")
+HELP_OPTIONS = ("-h", "--help")
+HELP_INDEX_FILE = "cli_help.json"
+
+
+def meme_subcommand(meme: Meme) -> Subcommand:
+    options: list[Option] = []
+    if args_type := meme.params_type.args_type:
+        for option in args_type.parser_options:
+            options.append(option.option())
+    return Subcommand(
+        meme.key,
+        *options,
+        Option(
+            "--images",
+            Args["images", MultiVar(str, "+")],
+            help_text="输入图片路径",
+        ),
+        Option("--texts", Args["texts", MultiVar(str, "+")], help_text="输入文字"),
+        help_text="/".join(meme.keywords),
+    )
 
-def construct_parser() -> Alconna:
-    sub_commands: list[Subcommand] = []
-    for meme in get_memes():
-        options: list[Option] = []
-        if args_type := meme.params_type.args_type:
-            for option in args_type.parser_options:
-                options.append(option.option())
-        sub_command = Subcommand(
-            meme.key,
-            *options,
-            Option(
-                "--images",
-                Args["images", MultiVar(str, "+")],
-                help_text="输入图片路径",
-            ),
-            Option("--texts", Args["texts", MultiVar(str, "+")], help_text="输入文字"),
-            help_text="/".join(meme.keywords),
-        )
-        sub_commands.append(sub_command)
+
+def construct_parser(memes: Optional[list[Meme]] = None) -> Alconna:
+    """
+    构建命令解析器
+    :params
+      * ``memes``: 在 ``generate`` 下构建子命令的表情，默认为所有表情；
+        命令行入口只构建所选表情的子命令
+    """
+    if memes is None:
+        memes = get_memes()
+    sub_commands = [meme_subcommand(meme) for meme in memes]
 
     parser = Alconna(
         "meme",
@@ -51,7 +68,18 @@ def construct_parser() -> Alconna:
         ),
         Subcommand("preview", Args["key#表情名", str], help_text="生成表情预览"),
         Subcommand("generate", *sub_commands, alias=["make"], help_text="制作表情"),
-        Subcommand("run", alias=["start"], help_text="启动 web server"),
+        Subcommand(
+            "run",
+            Option("--workers", Args["workers", int], help_text="工作进程数"),
+            Option("--preload", help_text="fork 工作进程前导入所有表情"),
+            Option(
+                "--max-requests",
+                Args["max_requests", int],
+                help_text="工作进程处理多少个请求后重启",
+            ),
+            alias=["start"],
+            help_text="启动 web server",
+        ),
         Subcommand(
             "download",
             Option("--url", Args["url", str], help_text="指定资源链接"),
@@ -66,6 +94,41 @@ def construct_parser() -> Alconna:
     return parser
 
 
+def generate_help() -> str:
+    """
+    ``meme generate --help`` 的帮助信息
+
+    列出所有表情需要构建完整的命令解析器，因此把生成的帮助信息缓存在缓存目录中，
+    表情名或关键词变化后重新生成
+    """
+    memes = sorted(get_memes(), key=lambda meme: meme.key)
+    index = [__version__, [[meme.key, meme.keywords] for meme in memes]]
+    fingerprint = hashlib.sha1(
+        json.dumps(index, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+    path = get_cache_file(HELP_INDEX_FILE)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data["fingerprint"] == fingerprint:
+            return data["help"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    help_text = construct_parser(memes).formatter.format_node(["meme", "generate"])
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(
+                {"fingerprint": fingerprint, "help": help_text}, ensure_ascii=False
+            ),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
+    return help_text
+
+
 def list_memes() -> str:
     memes = sorted(get_memes(), key=lambda meme: meme.key)
     return "\n".join(
@@ -167,7 +230,21 @@ def generate_meme(
 
 def main():
     setup_logger()
-    parser = construct_parser()
+
+    # 先根据命令行确定所选的表情，只为该表情构建子命令
+    argv = sys.argv[1:]
+    memes: list[Meme] = []
+    if argv and argv[0] in GENERATE_ALIASES:
+        if len(argv) == 1 or argv[1] in HELP_OPTIONS:
+            print(generate_help())  # noqa: T201
+            return
+        try:
+            memes.append(get_meme(argv[1]))
+        except NoSuchMeme:
+            print(f'表情 "{argv[1]}" 不存在！')  # noqa: T201
+            return
+
+    parser = construct_parser(memes)
     result = parser()
 
     if not result.matched:
@@ -214,9 +291,24 @@ def main():
                 print(generate_meme(key, images, texts, args))  # noqa: T201
 
         elif subcommand == "run":
-            run_server()
+            from meme_generator.app import run_server
+
+            options = sub_result.options
+            run_server(
+                workers=(
+                    options["workers"].args["workers"] if "workers" in options else None
+                ),
+                preload=True if "preload" in options else None,
+                max_requests=(
+                    options["max-requests"].args["max_requests"]
+                    if "max-requests" in options
+                    else None
+                ),
+            )
 
         elif subcommand == "download":
+            from meme_generator.download import check_resources
+
             if "url" in sub_result.options:
                 url = sub_result.options["url"].args["url"]
                 meme_config.resource.resource_url = url
@@ -3,7 +3,7 @@
 为兼容 Pydantic V1 与 V2 版本，定义了一系列兼容函数与类供使用。
 """
 
-from typing import Any, Optional, TypeVar, Union
+from typing import Any, Callable, Optional, TypeVar, Union
 
 from pydantic import VERSION, BaseModel
 
@@ -17,6 +17,7 @@ __all__ = (
     "model_json_schema",
     "type_validate_python",
     "type_validate_json",
+    "type_validator",
 )
 
 
@@ -57,6 +58,10 @@ if PYDANTIC_V2:  # pragma: pydantic-v2
         """Validate JSON with given type."""
         return TypeAdapter(type_).validate_json(data)
 
+    def type_validator(type_: type[T]) -> Callable[[Any], T]:
+        """Create a reusable validator for given type."""
+        return TypeAdapter(type_).validate_python
+
 
 else:  # pragma: pydantic-v1
     from pydantic import parse_obj_as, parse_raw_as
@@ -94,3 +99,11 @@ else:  # pragma: pydantic-v1
     def type_validate_json(type_: type[T], data: Union[str, bytes]) -> T:
         """Validate JSON with given type."""
         return parse_raw_as(type_, data)
+
+    def type_validator(type_: type[T]) -> Callable[[Any], T]:
+        """Create a reusable validator for given type."""
+
+        def _validate(data: Any) -> T:
+            return parse_obj_as(type_, data)
+
+        return _validate
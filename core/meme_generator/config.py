@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Optional, Union
+from typing import Literal, Optional, Union
 
 import toml
 from pydantic import BaseModel
@@ -46,6 +46,33 @@ class ResourceConfig(BaseModel):
 class GifConfig(BaseModel):
     gif_max_size: float = 10
     gif_max_frames: int = 100
+    # 调色板模式：frame 为每帧单独量化，global 为所有帧共用一个全局调色板
+    gif_palette: Literal["frame", "global"] = "frame"
+
+
+class CacheConfig(BaseModel):
+    # 是否缓存表情制作结果
+    result_cache_enabled: bool = True
+    # 内存缓存上限（MB）
+    memory_cache_size: float = 64
+    # 是否启用磁盘缓存，缓存文件位于缓存目录下的 results 文件夹
+    disk_cache_enabled: bool = False
+    # 磁盘缓存上限（MB）
+    disk_cache_size: float = 512
+    # 解码后的模板图片缓存上限（MB），为 0 时不缓存
+    template_cache_size: float = 256
+    # 位移表、蒙版等逐像素数据（``cache_map``）的缓存上限（MB）
+    map_cache_size: float = 64
+    # 是否启用图片存储（POST /images），上传后可通过 image_ids 引用图片
+    image_store_enabled: bool = True
+    # 图片存储的内存上限（MB）
+    image_store_memory_size: float = 64
+    # 是否把图片存储到磁盘，文件位于缓存目录下的 images 文件夹
+    image_store_disk_enabled: bool = False
+    # 图片存储的磁盘上限（MB）
+    image_store_disk_size: float = 512
+    # 缓存多少张常用图片的解码结果
+    image_store_decoded_items: int = 32
 
 
 class TranslatorConfig(BaseModel):
@@ -66,6 +93,56 @@ class TranslatorConfig(BaseModel):
 class ServerConfig(BaseModel):
     host: str = "127.0.0.1"
     port: int = 2233
+    # 表情制作后端: "thread" 线程池, "process" 进程池, "hybrid" 按表情分流
+    render_backend: Literal["thread", "process", "hybrid"] = "thread"
+    # 工作线程/进程数，0 表示根据 CPU 核数自动设置
+    render_workers: int = 0
+    # 每个工作进程处理多少个任务后重启，0 表示不重启（需要 Python 3.11+）
+    render_max_tasks_per_worker: int = 0
+    # hybrid 模式下交给进程池制作的表情
+    process_memes: list[str] = [
+        "wave",
+        "lost_dog",
+        "charpic",
+        "fade_away",
+        "dont_touch",
+    ]
+    # 监视表情目录，修改表情后无需重启即可生效
+    hot_reload: bool = False
+    # 未安装 watchfiles 时轮询表情文件的间隔（秒）
+    hot_reload_interval: float = 1.0
+    # web server 工作进程数，大于 1 时由主进程 fork 出工作进程
+    workers: int = 1
+    # fork 前导入所有表情并预热模板和字体，工作进程以写时复制的方式共享
+    preload: bool = False
+    # 预加载时生成预览的表情，用于预先解码模板图片和字体
+    preload_memes: list[str] = []
+    # 工作进程处理多少个请求后重启，0 表示不重启
+    max_requests: int = 0
+    # 批量制作接口每次请求最多的任务数
+    batch_max_jobs: int = 32
+    # 合并内容相同的并发制作请求，只制作一次
+    coalesce_renders: bool = True
+    # 是否启用准入控制，排队已满时立即返回 503
+    admission_enabled: bool = True
+    # 轻量、重量通道各自最多排队的请求数
+    render_queue_size: int = 64
+    # 开销（输入帧数 × 百万像素 × 表情帧数）不低于该值的请求进入重量通道
+    heavy_render_cost: float = 10.0
+    # 重量通道同时制作的数量，0 表示渲染线程/进程数的一半；轻量通道使用其余的线程/进程
+    heavy_render_concurrency: int = 0
+    # 单个表情同时制作的数量，0 表示不限制
+    meme_concurrency: int = 0
+    # 单次制作的期限（秒，包括排队时间），超时后在帧之间中止并返回 504，0 表示不限制
+    render_timeout: float = 60.0
+    # 逐帧并行制作的表情，各帧在共用的线程池中制作，制作函数需可在多个线程中同时调用，
+    # 且结果只取决于帧序号；依赖制作顺序的帧（sequential=True）仍按顺序制作
+    parallel_frame_memes: list[str] = []
+    # 并行制作帧的线程总数（所有请求共用），0 表示 CPU 核数减 1（至少为 1），
+    # -1 表示不并行制作
+    frame_workers: int = 0
+    # 单个动图最多使用的帧线程数，0 表示不限制
+    frame_workers_per_request: int = 0
 
 
 class LogConfig(BaseModel):
@@ -76,6 +153,7 @@ class Config(BaseModel):
     meme: MemeConfig = MemeConfig()
     resource: ResourceConfig = ResourceConfig()
     gif: GifConfig = GifConfig()
+    cache: CacheConfig = CacheConfig()
     translate: TranslatorConfig = TranslatorConfig()
     server: ServerConfig = ServerConfig()
     log: LogConfig = LogConfig()
@@ -107,6 +185,8 @@ class Config(BaseModel):
             config_data["meme"] = {}
         if "gif" not in config_data:
             config_data["gif"] = {}
+        if "cache" not in config_data:
+            config_data["cache"] = {}
         
         # Meme配置
         if meme_dirs := os.getenv("MEME_DIRS"):
@@ -157,6 +237,51 @@ class Config(BaseModel):
                 config_data["server"]["port"] = int(port)
             except ValueError:
                 pass
+        if render_backend := os.getenv("RENDER_BACKEND"):
+            config_data["server"]["render_backend"] = render_backend
+        if render_workers := os.getenv("RENDER_WORKERS"):
+            try:
+                config_data["server"]["render_workers"] = int(render_workers)
+            except ValueError:
+                pass
+        if workers := os.getenv("WORKERS"):
+            try:
+                config_data["server"]["workers"] = int(workers)
+            except ValueError:
+                pass
+        if preload := os.getenv("PRELOAD"):
+            config_data["server"]["preload"] = preload.lower() in ("true", "1", "yes")
+        if max_requests := os.getenv("MAX_REQUESTS"):
+            try:
+                config_data["server"]["max_requests"] = int(max_requests)
+            except ValueError:
+                pass
+        if render_timeout := os.getenv("RENDER_TIMEOUT"):
+            try:
+                config_data["server"]["render_timeout"] = float(render_timeout)
+            except ValueError:
+                pass
+        if frame_workers := os.getenv("FRAME_WORKERS"):
+            try:
+                config_data["server"]["frame_workers"] = int(frame_workers)
+            except ValueError:
+                pass
+        if coalesce_renders := os.getenv("COALESCE_RENDERS"):
+            config_data["server"]["coalesce_renders"] = coalesce_renders.lower() in ("true", "1", "yes")
+        if admission_enabled := os.getenv("ADMISSION_ENABLED"):
+            config_data["server"]["admission_enabled"] = admission_enabled.lower() in ("true", "1", "yes")
+        if render_queue_size := os.getenv("RENDER_QUEUE_SIZE"):
+            try:
+                config_data["server"]["render_queue_size"] = int(render_queue_size)
+            except ValueError:
+                pass
+        if hot_reload := os.getenv("HOT_RELOAD"):
+            config_data["server"]["hot_reload"] = hot_reload.lower() in ("true", "1", "yes")
+        if hot_reload_interval := os.getenv("HOT_RELOAD_INTERVAL"):
+            try:
+                config_data["server"]["hot_reload_interval"] = float(hot_reload_interval)
+            except ValueError:
+                pass
         
         # 日志配置
         if log_level := os.getenv("LOG_LEVEL"):
@@ -173,6 +298,43 @@ class Config(BaseModel):
                 config_data["gif"]["gif_max_frames"] = int(gif_max_frames)
             except ValueError:
                 pass
+        if gif_palette := os.getenv("GIF_PALETTE"):
+            config_data["gif"]["gif_palette"] = gif_palette
+
+        # 缓存配置
+        if result_cache_enabled := os.getenv("RESULT_CACHE_ENABLED"):
+            config_data["cache"]["result_cache_enabled"] = result_cache_enabled.lower() in ("true", "1", "yes")
+        if memory_cache_size := os.getenv("MEMORY_CACHE_SIZE"):
+            try:
+                config_data["cache"]["memory_cache_size"] = float(memory_cache_size)
+            except ValueError:
+                pass
+        if disk_cache_enabled := os.getenv("DISK_CACHE_ENABLED"):
+            config_data["cache"]["disk_cache_enabled"] = disk_cache_enabled.lower() in ("true", "1", "yes")
+        if disk_cache_size := os.getenv("DISK_CACHE_SIZE"):
+            try:
+                config_data["cache"]["disk_cache_size"] = float(disk_cache_size)
+            except ValueError:
+                pass
+        if template_cache_size := os.getenv("TEMPLATE_CACHE_SIZE"):
+            try:
+                config_data["cache"]["template_cache_size"] = float(template_cache_size)
+            except ValueError:
+                pass
+        if map_cache_size := os.getenv("MAP_CACHE_SIZE"):
+            try:
+                config_data["cache"]["map_cache_size"] = float(map_cache_size)
+            except ValueError:
+                pass
+        if image_store_enabled := os.getenv("IMAGE_STORE_ENABLED"):
+            config_data["cache"]["image_store_enabled"] = image_store_enabled.lower() in ("true", "1", "yes")
+        if image_store_memory_size := os.getenv("IMAGE_STORE_MEMORY_SIZE"):
+            try:
+                config_data["cache"]["image_store_memory_size"] = float(image_store_memory_size)
+            except ValueError:
+                pass
+        if image_store_disk_enabled := os.getenv("IMAGE_STORE_DISK_ENABLED"):
+            config_data["cache"]["image_store_disk_enabled"] = image_store_disk_enabled.lower() in ("true", "1", "yes")
 
     def dump(self):
         with open(config_file_path, "w", encoding="utf-8") as f:
@@ -102,3 +102,19 @@ class ArgModelMismatch(ArgMismatch):
 
 class MemeFeedback(MemeGeneratorException):
     status_code: int = 560
+
+
+class RenderTimeout(MemeGeneratorException):
+    status_code: int = 504
+
+    def __init__(self):
+        super().__init__("表情制作超时，已中止")
+
+
+class ServerOverloaded(MemeGeneratorException):
+    status_code: int = 503
+
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+        message = f"服务器繁忙，请 {retry_after} 秒后重试"
+        super().__init__(message)
@@ -0,0 +1,298 @@
+"""表情制作执行器
+
+根据 ``[server]`` 配置选择制作后端：
+
+* ``thread``: 线程池，适合主要调用 Pillow / skia 等会释放 GIL 的表情
+* ``process``: 进程池，工作进程在 fork 时预先加载所有表情
+* ``hybrid``: ``process_memes`` 中的表情交给进程池，其余交给线程池
+
+进程间只传递原始字节：输入为图片字节，输出为 ``BytesIO`` 中的字节
+（及少量响应头），避免序列化整张 PIL 图片。
+"""
+
+import asyncio
+import multiprocessing
+import sys
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from functools import partial
+from io import BytesIO
+from typing import Any, Callable, Optional, Union
+
+from .config import meme_config
+from .frame_pool import cpu_count, frame_pool, parallel_frames
+from .gif_writer import GifStream
+from .log import logger
+from .manager import MemeSource, reload_source, unload_source
+from .meme import Meme
+from .utils import GifOutput, SharedImage, gif_stream
+
+
+@dataclass
+class RenderResult:
+    content: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+    """需要附加到响应上的头，如 gif 编码参数"""
+
+    @classmethod
+    def from_output(cls, output: BytesIO) -> "RenderResult":
+        headers = output.info.headers() if isinstance(output, GifOutput) else {}
+        return cls(content=output.getvalue(), headers=headers)
+
+
+@dataclass
+class StreamedRender:
+    """边编码边输出的 gif"""
+
+    headers: dict[str, str]
+    chunks: AsyncIterator[bytes]
+    close: Callable[[], None]
+    """不再读取时调用，中止仍在进行的制作"""
+
+
+def _render_in_worker(
+    key: str,
+    images: list[bytes],
+    texts: list[str],
+    args: dict[str, Any],
+    deadline: Optional[float] = None,
+) -> RenderResult:
+    from .manager import get_meme
+
+    with parallel_frames(key):
+        output = get_meme(key)(images=images, texts=texts, args=args, deadline=deadline)
+    return RenderResult.from_output(output)
+
+
+def _preview_in_worker(key: str, args: dict[str, Any]) -> RenderResult:
+    from .manager import get_meme
+
+    return RenderResult.from_output(get_meme(key).generate_preview(args=args))
+
+
+def _init_worker(reloaded: dict[MemeSource, bool] = {}):
+    # 使用 forkserver 时表情已在 fork 前加载，此处为 spawn 方式兜底
+    import meme_generator.worker_preload  # noqa: F401
+
+    # forkserver 中预先加载的是热重载前的表情，需要重新导入发生变化的模块
+    for source, exists in reloaded.items():
+        if exists:
+            reload_source(source)
+        else:
+            unload_source(source)
+
+
+class RenderExecutor:
+    def __init__(
+        self,
+        backend: str = "thread",
+        workers: int = 0,
+        max_tasks_per_worker: int = 0,
+        process_memes: list[str] = [],
+    ):
+        self.backend = backend
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.process_memes = set(process_memes)
+        cpus = cpu_count()
+        self.process_workers = workers or cpus
+        self.thread_workers = workers or min(32, cpus + 4)
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._reloaded: dict[MemeSource, bool] = {}
+        """热重载过的模块，值为模块是否仍然存在"""
+
+    @property
+    def thread_pool(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.thread_workers, thread_name_prefix="meme-render"
+            )
+        return self._thread_pool
+
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = self._create_process_pool()
+        return self._process_pool
+
+    def _create_process_pool(self) -> ProcessPoolExecutor:
+        methods = multiprocessing.get_all_start_methods()
+        if "forkserver" in methods:
+            ctx = multiprocessing.get_context("forkserver")
+            ctx.set_forkserver_preload(["meme_generator.worker_preload"])
+        else:
+            ctx = multiprocessing.get_context("spawn")
+
+        kwargs: dict[str, Any] = {}
+        if self.max_tasks_per_worker > 0:
+            if sys.version_info >= (3, 11):
+                kwargs["max_tasks_per_child"] = self.max_tasks_per_worker
+            else:
+                logger.warning(
+                    "render_max_tasks_per_worker requires Python 3.11+, ignored"
+                )
+
+        logger.info(
+            f"Starting render process pool with {self.process_workers} workers"
+        )
+        return ProcessPoolExecutor(
+            max_workers=self.process_workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(dict(self._reloaded),),
+            **kwargs,
+        )
+
+    def use_process(self, meme: Meme) -> bool:
+        if self.backend == "process":
+            return True
+        if self.backend == "hybrid":
+            return meme.key in self.process_memes
+        return False
+
+    async def _run_thread(
+        self, func: Callable[..., RenderResult], *args
+    ) -> RenderResult:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.thread_pool, partial(func, *args))
+
+    async def _run_process(
+        self, func: Callable[..., RenderResult], *args
+    ) -> RenderResult:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self.process_pool, partial(func, *args))
+        except BrokenProcessPool:
+            logger.warning("Render process pool is broken, restarting")
+            self._shutdown_process_pool()
+            raise
+
+    async def render(
+        self,
+        meme: Meme,
+        *,
+        images: list[Union[bytes, SharedImage]] = [],
+        texts: list[str] = [],
+        args: dict[str, Any] = {},
+        deadline: Optional[float] = None,
+    ) -> RenderResult:
+        """
+        制作表情
+        :params
+          * ``images``: 图片字节，或多个表情共用的已解码图片；
+            进程池无法共享解码结果，仍传递原始字节
+          * ``deadline``: ``time.time()`` 形式的截止时间，超时后制作在下一帧之前中止，
+            立即释放线程 / 进程
+        """
+        if self.use_process(meme):
+            data = [
+                image.data if isinstance(image, SharedImage) else image
+                for image in images
+            ]
+            return await self._run_process(
+                _render_in_worker, meme.key, data, texts, args, deadline
+            )
+
+        def _render() -> RenderResult:
+            imgs = [
+                image.open() if isinstance(image, SharedImage) else image
+                for image in images
+            ]
+            with parallel_frames(meme.key):
+                output = meme(images=imgs, texts=texts, args=args, deadline=deadline)
+            return RenderResult.from_output(output)
+
+        return await self._run_thread(_render)
+
+    async def render_stream(
+        self,
+        meme: Meme,
+        *,
+        images: list[Union[bytes, SharedImage]] = [],
+        texts: list[str] = [],
+        args: dict[str, Any] = {},
+        deadline: Optional[float] = None,
+    ) -> Union[RenderResult, StreamedRender]:
+        """
+        制作表情，输出 gif 时在编码第一帧后即返回，其余数据逐帧读取
+        :return
+          * 输出 gif 时返回 ``StreamedRender``；输出静图，
+            或由进程池制作（数据无法逐帧传回）时返回 ``RenderResult``
+        """
+        if self.use_process(meme):
+            return await self.render(
+                meme, images=images, texts=texts, args=args, deadline=deadline
+            )
+
+        stream = GifStream(asyncio.get_running_loop())
+
+        def _render():
+            try:
+                imgs = [
+                    image.open() if isinstance(image, SharedImage) else image
+                    for image in images
+                ]
+                with gif_stream(stream), parallel_frames(meme.key):
+                    output = meme(
+                        images=imgs, texts=texts, args=args, deadline=deadline
+                    )
+                result = None if stream.started else RenderResult.from_output(output)
+                stream.finish(result)
+            except Exception as e:
+                stream.finish(error=e)
+
+        self.thread_pool.submit(_render)
+        try:
+            kind, value = await stream.get()
+        except asyncio.CancelledError:
+            stream.close()
+            raise
+        if kind == "error":
+            raise value
+        if kind == "result":
+            return value
+        return StreamedRender(headers=value, chunks=stream.chunks(), close=stream.close)
+
+    async def preview(self, meme: Meme, *, args: dict[str, Any] = {}) -> RenderResult:
+        """生成表情预览"""
+        if self.use_process(meme):
+            return await self._run_process(_preview_in_worker, meme.key, args)
+
+        def _preview() -> RenderResult:
+            return RenderResult.from_output(meme.generate_preview(args=args))
+
+        return await self._run_thread(_preview)
+
+    def reload_sources(self, sources: dict[MemeSource, bool]):
+        """
+        表情模块热重载后重启进程池，新的工作进程会重新导入这些模块
+        :params
+          * ``sources``: 发生变化的模块，值为模块是否仍然存在
+        """
+        self._reloaded.update(sources)
+        if self._process_pool is not None:
+            # 不取消已提交的任务，正在制作的表情由旧的工作进程完成
+            self._process_pool.shutdown(wait=False)
+            self._process_pool = None
+
+    def _shutdown_process_pool(self):
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+    def shutdown(self):
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+        self._shutdown_process_pool()
+        frame_pool.shutdown()
+
+
+render_executor = RenderExecutor(
+    backend=meme_config.server.render_backend,
+    workers=meme_config.server.render_workers,
+    max_tasks_per_worker=meme_config.server.render_max_tasks_per_worker,
+    process_memes=meme_config.server.process_memes,
+)
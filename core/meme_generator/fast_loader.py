@@ -1,244 +1,381 @@
 """
 快速加载器
-使用预生成的静态缓存快速加载meme信息，避免重复扫描和加载
+
+根据 ``static_generator.py`` 生成的清单注册延迟加载的表情：启动时只读取清单，
+不导入任何表情模块，表情所在的模块在第一次使用时才导入（见 ``manager.LazyMeme``）。
+
+清单 ``meme_info.json`` 中每个表情记录了所在模块、参数数量、
+参数模型的 JSON Schema、示例、命令行选项和默认参数，
+列出表情信息时无需导入模块；参数校验仍由导入后的参数模型完成，与直接加载时一致。
+
+清单同时写入二进制缓存 ``memes.bin``（见 ``manifest_cache``），启动时优先读取，
+只解析索引，各表情的字段在第一次访问时才解码（见 ``CachedLazyMeme``）；
+二进制缓存不存在、版本不符或校验失败时回退到 JSON 文件。
 """
 
 import json
 import time
-from pathlib import Path
-from typing import Dict, List, Any, Optional
 from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
 
+from .compat import model_dump, model_json_schema, type_validator
 from .config import meme_config
+from .exception import NoSuchMeme
 from .log import logger
-from .manager import _memes, add_meme
-from .meme import Meme, MemeParamsType, MemeArgsType, CommandShortcut
+from .manager import (
+    LazyArgsType,
+    LazyMeme,
+    MemeSource,
+    _memes,
+    add_lazy_meme,
+    get_meme_source,
+    get_memes,
+)
+from .manifest_cache import CACHE_FILE, ManifestCache, write_manifest_cache
+from .meme import CommandShortcut, Meme, MemeParamsType, ParserOption
+
+MANIFEST_VERSION = 2
+"""清单格式版本，旧版本的缓存中没有模块信息，无法用于延迟加载"""
+
+_validate_shortcuts = type_validator(list[CommandShortcut])
+_validate_parser_options = type_validator(list[ParserOption])
+
+
+def dump_meme_info(meme: Meme, source: MemeSource) -> dict[str, Any]:
+    """生成表情在清单中的信息"""
+    info: dict[str, Any] = {
+        "key": meme.key,
+        "module": {"module": source.module, "path": source.path},
+        "keywords": meme.keywords,
+        "shortcuts": [model_dump(shortcut) for shortcut in meme.shortcuts],
+        "tags": sorted(meme.tags),
+        "date_created": meme.date_created.isoformat(),
+        "date_modified": meme.date_modified.isoformat(),
+        "cacheable": meme.cacheable,
+        "params": {
+            "min_images": meme.params_type.min_images,
+            "max_images": meme.params_type.max_images,
+            "min_texts": meme.params_type.min_texts,
+            "max_texts": meme.params_type.max_texts,
+            "default_texts": meme.params_type.default_texts,
+        },
+        "args_type": None,
+    }
+    if args_type := meme.params_type.args_type:
+        from fastapi.encoders import jsonable_encoder
+
+        args_model = args_type.args_model
+        info["args_type"] = jsonable_encoder(
+            {
+                "args_model": model_json_schema(args_model),
+                "args_examples": [
+                    model_dump(example) for example in args_type.args_examples
+                ],
+                "parser_options": args_type.parser_options,
+                "default_args": model_dump(args_model()),
+            }
+        )
+    return info
+
+
+def meme_fields(meme: LazyMeme, info: dict[str, Any]) -> dict[str, Any]:
+    """根据清单中的信息得到表情的各个字段"""
+    params = info["params"]
+    params_type = MemeParamsType(
+        min_images=params["min_images"],
+        max_images=params["max_images"],
+        min_texts=params["min_texts"],
+        max_texts=params["max_texts"],
+        default_texts=params["default_texts"],
+    )
+    if args_type := info["args_type"]:
+        params_type.args_type = LazyArgsType(
+            meme,
+            args_schema=args_type["args_model"],
+            args_examples=args_type["args_examples"],
+            parser_options=_validate_parser_options(args_type["parser_options"]),
+            default_args=args_type["default_args"],
+        )
+    return {
+        "params_type": params_type,
+        "keywords": info["keywords"],
+        "shortcuts": _validate_shortcuts(info["shortcuts"]),
+        "tags": set(info["tags"]),
+        "date_created": datetime.fromisoformat(info["date_created"]),
+        "date_modified": datetime.fromisoformat(info["date_modified"]),
+        "cacheable": info["cacheable"],
+    }
+
+
+def create_lazy_meme(info: dict[str, Any]) -> LazyMeme:
+    """根据清单中的信息创建延迟加载的表情"""
+    meme = LazyMeme(
+        info["key"], MemeSource(**info["module"]), params_type=MemeParamsType()
+    )
+    for name, value in meme_fields(meme, info).items():
+        setattr(meme, name, value)
+    return meme
+
+
+def _cached_field(name: str) -> property:
+    def fget(self: "CachedLazyMeme") -> Any:
+        if name not in self.__dict__:
+            self._materialize()
+        return self.__dict__[name]
+
+    def fset(self: "CachedLazyMeme", value: Any):
+        self.__dict__[name] = value
+
+    return property(fget, fset)
+
+
+class CachedLazyMeme(LazyMeme):
+    """
+    根据二进制清单缓存创建的延迟加载表情
+
+    启动时只记录表情名和所在模块，其余字段在第一次访问时才从缓存中解码
+    """
+
+    params_type = _cached_field("params_type")
+    keywords = _cached_field("keywords")
+    shortcuts = _cached_field("shortcuts")
+    tags = _cached_field("tags")
+    date_created = _cached_field("date_created")
+    date_modified = _cached_field("date_modified")
+    cacheable = _cached_field("cacheable")
+
+    def __init__(self, key: str, source: MemeSource, cache: ManifestCache):
+        # 不调用 Meme.__init__，避免为所有字段赋值
+        self.key = key
+        self.function = self._call_function
+        self.source = source
+        self._error = None
+        self._cache = cache
+
+    def _materialize(self):
+        if (info := self._cache.get(self.key)) is None:
+            raise NoSuchMeme(self.key)
+        for name, value in meme_fields(self, info).items():
+            # 多个线程同时解码时保留先写入的值
+            self.__dict__.setdefault(name, value)
 
 
 class FastMemeLoader:
     """快速meme加载器"""
-    
+
     def __init__(self, cache_dir: str = "static_cache"):
         self.cache_dir = Path(cache_dir)
-        self.cache_data: Dict[str, Any] = {}
+        self.cache_file = self.cache_dir / CACHE_FILE
+        self.cache: Optional[ManifestCache] = None
+        """二进制清单缓存，不可用时使用 JSON 文件"""
+        self.cache_data: dict[str, Any] = {}
         self.loaded = False
-    
-    def is_cache_available(self) -> bool:
-        """检查缓存是否可用"""
+
+    def is_json_cache_available(self) -> bool:
         required_files = [
             self.cache_dir / "meme_list.json",
-            self.cache_dir / "meme_info.json", 
+            self.cache_dir / "meme_info.json",
             self.cache_dir / "meme_keywords.json",
-            self.cache_dir / "cache_meta.json"
+            self.cache_dir / "cache_meta.json",
         ]
         return all(f.exists() for f in required_files)
-    
+
+    def is_cache_available(self) -> bool:
+        """检查缓存是否可用"""
+        return self.cache_file.exists() or self.is_json_cache_available()
+
     def load_cache(self) -> bool:
-        """加载静态缓存"""
+        """加载静态缓存，优先使用二进制缓存"""
         if not self.is_cache_available():
             logger.warning("静态缓存不可用，将使用标准加载方式")
             return False
-        
+
+        start_time = time.time()
+        if self.cache_file.exists():
+            self.cache = ManifestCache.open(self.cache_file, MANIFEST_VERSION)
+            if self.cache is None:
+                logger.warning("二进制缓存版本不符或已损坏，尝试使用 JSON 缓存")
+
+        if self.cache is None and not self.load_json_cache():
+            return False
+
+        elapsed_time = time.time() - start_time
+        logger.info(f"⚡ 静态缓存加载完成，耗时 {elapsed_time:.3f}秒")
+        logger.info(f"📊 加载了 {len(self.get_meme_list())} 个meme")
+
+        self.loaded = True
+        return True
+
+    def load_json_cache(self) -> bool:
+        if not self.is_json_cache_available():
+            logger.warning("静态缓存不可用，将使用标准加载方式")
+            return False
+
         try:
-            start_time = time.time()
-            
-            # 加载meme列表
-            with open(self.cache_dir / "meme_list.json", 'r', encoding='utf-8') as f:
-                self.cache_data["meme_list"] = json.load(f)
-            
-            # 加载meme详细信息
-            with open(self.cache_dir / "meme_info.json", 'r', encoding='utf-8') as f:
-                self.cache_data["meme_info"] = json.load(f)
-            
-            # 加载关键词映射
-            with open(self.cache_dir / "meme_keywords.json", 'r', encoding='utf-8') as f:
-                self.cache_data["meme_keywords"] = json.load(f)
-            
-            # 加载元数据
-            with open(self.cache_dir / "cache_meta.json", 'r', encoding='utf-8') as f:
+            for name in ("meme_list", "meme_info", "meme_keywords"):
+                with open(self.cache_dir / f"{name}.json", encoding="utf-8") as f:
+                    self.cache_data[name] = json.load(f)
+            with open(self.cache_dir / "cache_meta.json", encoding="utf-8") as f:
                 self.cache_data["meta"] = json.load(f)
-            
-            elapsed_time = time.time() - start_time
-            logger.info(f"⚡ 静态缓存加载完成，耗时 {elapsed_time:.3f}秒")
-            logger.info(f"📊 加载了 {len(self.cache_data['meme_list'])} 个meme")
-            
-            self.loaded = True
-            return True
-            
         except Exception as e:
             logger.error(f"加载静态缓存失败: {e}")
             return False
-    
-    def get_meme_list(self) -> List[str]:
+
+        if self.cache_data["meta"].get("manifest_version") != MANIFEST_VERSION:
+            logger.warning("静态缓存版本过旧，请重新运行 static_generator.py")
+            return False
+        return True
+
+    def get_meme_list(self) -> list[str]:
         """获取meme列表"""
-        if not self.loaded:
-            return []
+        if self.cache is not None:
+            return self.cache.keys
         return self.cache_data.get("meme_list", [])
-    
-    def get_meme_info(self, meme_key: str) -> Optional[Dict[str, Any]]:
+
+    def get_meme_info(self, meme_key: str) -> Optional[dict[str, Any]]:
         """获取meme详细信息"""
-        if not self.loaded:
-            return None
+        if self.cache is not None:
+            return self.cache.get(meme_key)
         return self.cache_data.get("meme_info", {}).get(meme_key)
-    
-    def get_meme_keywords(self) -> Dict[str, List[str]]:
+
+    def get_meme_keywords(self) -> dict[str, list[str]]:
         """获取关键词映射"""
-        if not self.loaded:
-            return {}
+        if self.cache is not None:
+            return self.cache.keywords
         return self.cache_data.get("meme_keywords", {})
-    
-    def search_meme_by_keyword(self, keyword: str) -> List[str]:
+
+    def search_meme_by_keyword(self, keyword: str) -> list[str]:
         """通过关键词搜索meme"""
         keywords_map = self.get_meme_keywords()
         return keywords_map.get(keyword, [])
-    
-    def get_cache_meta(self) -> Dict[str, Any]:
+
+    def get_cache_meta(self) -> dict[str, Any]:
         """获取缓存元数据"""
-        if not self.loaded:
-            return {}
+        if self.cache is not None:
+            return self.cache.meta
         return self.cache_data.get("meta", {})
-    
+
+    def create_lazy_meme(self, meme_key: str) -> Optional[LazyMeme]:
+        if self.cache is not None:
+            module, path = self.cache.source(meme_key)
+            return CachedLazyMeme(meme_key, MemeSource(module, path), self.cache)
+        if info := self.get_meme_info(meme_key):
+            return create_lazy_meme(info)
+        return None
+
     def create_lazy_meme_objects(self):
         """创建延迟加载的meme对象"""
         if not self.loaded:
             return
-        
+
         logger.info("🔄 创建延迟加载的meme对象...")
-        
+
+        # 与标准加载方式一致，只加载配置中启用的表情目录
+        meme_dirs = {Path(path).resolve() for path in meme_config.meme.meme_dirs}
+
+        def is_enabled(source: MemeSource) -> bool:
+            if source.path is None:
+                return meme_config.meme.load_builtin_memes
+            return any(parent in meme_dirs for parent in Path(source.path).parents)
+
         for meme_key in self.get_meme_list():
             if meme_key in _memes:
                 continue  # 已存在，跳过
-            
-            info = self.get_meme_info(meme_key)
-            if not info:
-                continue
-            
+
             try:
-                # 创建延迟加载的meme对象
-                lazy_meme = LazyMeme(meme_key, info, self.cache_dir)
-                _memes[meme_key] = lazy_meme
-                
+                lazy_meme = self.create_lazy_meme(meme_key)
             except Exception as e:
                 logger.warning(f"创建延迟meme对象 {meme_key} 失败: {e}")
-        
-        logger.info(f"✅ 创建了 {len(_memes)} 个延迟加载的meme对象")
+                continue
+            if lazy_meme is not None and is_enabled(lazy_meme.source):
+                add_lazy_meme(lazy_meme)
 
+        logger.info(f"✅ 创建了 {len(_memes)} 个延迟加载的meme对象")
 
-class LazyMeme(Meme):
-    """延迟加载的meme对象"""
-    
-    def __init__(self, key: str, info: Dict[str, Any], cache_dir: Path):
-        self.key = key
-        self.info = info
-        self.cache_dir = cache_dir
-        self._actual_meme: Optional[Meme] = None
-        self._loaded = False
-        
-        # 从缓存信息构建基本属性
-        self.keywords = info.get("keywords", [])
-        self.tags = set(info.get("tags", []))
-        
-        # 构建shortcuts
-        self.shortcuts = []
-        for shortcut_info in info.get("shortcuts", []):
-            self.shortcuts.append(CommandShortcut(
-                key=shortcut_info["key"],
-                humanized=shortcut_info.get("humanized"),
-                args=shortcut_info.get("args", [])
-            ))
-        
-        # 构建日期
-        try:
-            self.date_created = datetime.fromisoformat(info["date_created"])
-            self.date_modified = datetime.fromisoformat(info["date_modified"])
-        except:
-            self.date_created = datetime.now()
-            self.date_modified = datetime.now()
-        
-        # 构建参数类型
-        params = info.get("params", {})
-        args_type = None
-        if "args_type" in info:
-            # 这里可以进一步实现args_type的延迟加载
-            # 暂时设为None，在实际需要时再加载
-            pass
-        
-        self.params_type = MemeParamsType(
-            min_images=params.get("min_images", 0),
-            max_images=params.get("max_images", 0),
-            min_texts=params.get("min_texts", 0),
-            max_texts=params.get("max_texts", 0),
-            default_texts=params.get("default_texts", []),
-            args_type=args_type
-        )
-        
-        # 延迟加载的函数
-        self.function = self._lazy_function
-    
-    def _load_actual_meme(self):
-        """加载实际的meme对象"""
-        if self._loaded:
+    def update_sources(self, sources: dict[MemeSource, bool]):
+        """
+        表情模块热重载后更新磁盘上的静态缓存，下次启动时不会读到旧的清单
+        :params
+          * ``sources``: 重新导入（``True``）或移除（``False``）的模块，
+            重新导入的模块按注册表中的表情重新生成清单
+        被更新的表情的预览图会被删除，下次运行 ``static_generator.py`` 时重新生成
+        """
+        binary = self.cache_file.exists()
+        json_cache = self.is_json_cache_available()
+        if not binary and not json_cache:
             return
-        
-        try:
-            # 这里需要动态导入实际的meme模块
-            # 由于我们无法确定模块路径，这里使用标准的加载方式
-            from .manager import load_meme, load_memes
-            
-            # 尝试从内置memes加载
-            builtin_path = Path(__file__).parent / "memes" / self.key
-            if builtin_path.exists():
-                load_meme(f"meme_generator.memes.{self.key}")
-            else:
-                # 从额外目录加载
-                for meme_dir in meme_config.meme.meme_dirs:
-                    meme_path = Path(meme_dir) / self.key
-                    if meme_path.exists():
-                        load_memes(meme_dir)
-                        break
-            
-            # 获取实际加载的meme对象
-            from .manager import get_meme
-            self._actual_meme = get_meme(self.key)
-            self._loaded = True
-            
-        except Exception as e:
-            logger.error(f"延迟加载meme {self.key} 失败: {e}")
-            raise
-    
-    def _lazy_function(self, images, texts, args):
-        """延迟加载的函数包装器"""
-        self._load_actual_meme()
-        if self._actual_meme:
-            return self._actual_meme.function(images, texts, args)
-        else:
-            raise RuntimeError(f"无法加载meme {self.key}")
-    
-    def generate_preview(self):
-        """生成预览图"""
-        # 首先尝试从缓存加载预览图
-        preview_path = self.cache_dir / "previews" / f"{self.key}.jpg"
-        if not preview_path.exists():
-            preview_path = self.cache_dir / "previews" / f"{self.key}.png"
-        if not preview_path.exists():
-            preview_path = self.cache_dir / "previews" / f"{self.key}.gif"
-        
-        if preview_path.exists():
-            # 返回缓存的预览图
-            with open(preview_path, 'rb') as f:
-                from io import BytesIO
-                return BytesIO(f.read())
-        
-        # 如果没有缓存，则动态生成
-        self._load_actual_meme()
-        if self._actual_meme:
-            return self._actual_meme.generate_preview()
+
+        cache = ManifestCache.open(self.cache_file, MANIFEST_VERSION)
+        if cache is not None:
+            meme_info = {key: cache.get(key) or {} for key in cache.keys}
+            meta = cache.meta
         else:
-            raise RuntimeError(f"无法生成meme {self.key} 的预览图")
-    
-    def __call__(self, images, texts, args):
-        """调用meme生成函数"""
-        return self._lazy_function(images, texts, args)
+            if not self.load_json_cache():
+                return
+            meme_info = self.cache_data["meme_info"]
+            meta = self.cache_data["meta"]
+        if json_cache:
+            with open(self.cache_dir / "cache_meta.json", encoding="utf-8") as f:
+                meta = json.load(f)
+
+        modules = [{"module": s.module, "path": s.path} for s in sources]
+        changed = {
+            key for key, info in meme_info.items() if info.get("module") in modules
+        }
+        meme_info = {k: v for k, v in meme_info.items() if k not in changed}
+        for meme in get_memes():
+            source = get_meme_source(meme.key)
+            if sources.get(source) and not isinstance(meme, LazyMeme):
+                meme_info[meme.key] = dump_meme_info(meme, source)
+                changed.add(meme.key)
+        if not changed:
+            return
+
+        previews = dict(meta.get("previews", {}))
+        for key in changed & set(previews):
+            (self.cache_dir / previews.pop(key)).unlink(missing_ok=True)
+        meme_keywords: dict[str, list[str]] = {}
+        for key, info in meme_info.items():
+            for keyword in info["keywords"]:
+                meme_keywords.setdefault(keyword, []).append(key)
+        meta = {
+            **meta,
+            "meme_count": len(meme_info),
+            "preview_count": len(previews),
+            "previews": previews,
+        }
+
+        if json_cache:
+            for name, data in [
+                ("meme_list", sorted(meme_info)),
+                ("meme_info", meme_info),
+                ("meme_keywords", meme_keywords),
+                ("cache_meta", meta),
+            ]:
+                with open(self.cache_dir / f"{name}.json", "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+        if binary:
+            # 生成时使用的文件哈希保留在 JSON 元数据中，
+            # 模块内容与记录的哈希不符，``static_generator.py`` 会重新解析
+            write_manifest_cache(
+                self.cache_file,
+                MANIFEST_VERSION,
+                meme_info,
+                meme_keywords,
+                {k: v for k, v in meta.items() if k not in ("shared", "modules")},
+            )
+
+        if self.cache is not None:
+            self.cache = ManifestCache.open(self.cache_file, MANIFEST_VERSION)
+        elif self.cache_data:
+            self.cache_data = {
+                "meme_list": sorted(meme_info),
+                "meme_info": meme_info,
+                "meme_keywords": meme_keywords,
+                "meta": meta,
+            }
+        logger.info(f"Updated static cache for memes: {', '.join(sorted(changed))}")
 
 
 # 全局快速加载器实例
@@ -251,28 +388,28 @@ def get_fast_loader() -> FastMemeLoader:
     if _fast_loader is None:
         # 查找缓存目录
         cache_dir = "static_cache"
-        
+
         # 尝试在不同位置查找缓存
         possible_paths = [
             Path.cwd() / cache_dir,
             Path(__file__).parent.parent / cache_dir,
             Path(__file__).parent.parent.parent / cache_dir,
         ]
-        
+
         for path in possible_paths:
-            if path.exists() and (path / "cache_meta.json").exists():
+            if (path / CACHE_FILE).exists() or (path / "cache_meta.json").exists():
                 cache_dir = str(path)
                 break
-        
+
         _fast_loader = FastMemeLoader(cache_dir)
-    
+
     return _fast_loader
 
 
 def enable_fast_loading() -> bool:
     """启用快速加载模式"""
     loader = get_fast_loader()
-    
+
     if loader.load_cache():
         # 创建延迟加载的meme对象
         loader.create_lazy_meme_objects()
@@ -286,4 +423,4 @@ def enable_fast_loading() -> bool:
 def is_fast_loading_available() -> bool:
     """检查快速加载是否可用"""
     loader = get_fast_loader()
-    return loader.is_cache_available()
\ No newline at end of file
+    return loader.is_cache_available()
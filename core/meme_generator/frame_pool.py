@@ -0,0 +1,161 @@
+"""逐帧并行制作
+
+动图的各帧相互独立，``parallel_frame_memes`` 中的表情制作时，``LazyFrames`` 把各帧
+交给共用的线程池制作，再按顺序交给编码器；读取输入动图的帧等准备工作仍在渲染线程中
+按顺序执行。Pillow、skia 和 numpy 的耗时操作会释放 GIL，多线程即可利用多核；
+帧制作函数通常是闭包，无法交给进程池，需要多进程时使用 ``render_backend = "process"``。
+
+所有请求共用 ``frame_workers`` 个线程名额：请求开始逐帧制作时只取当前空闲的名额，
+取不到时在自身的渲染线程中逐帧制作，不会等待，也不会挤占其他请求。
+
+只有结果只取决于帧序号的帧会交给线程池；以 ``sequential=True`` 制作的帧
+（依赖制作顺序，见 ``merge_gif``）总是在渲染线程中按顺序制作，
+即使表情在 ``parallel_frame_memes`` 中。
+"""
+
+import os
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+from .config import meme_config
+
+T = TypeVar("T")
+
+_parallel_frames: ContextVar[bool] = ContextVar("_parallel_frames", default=False)
+
+
+@contextmanager
+def parallel_frames(meme_key: str) -> Iterator[None]:
+    """在当前线程中制作表情 ``meme_key``，表情在 ``parallel_frame_memes`` 中时并行制作帧"""
+    token = _parallel_frames.set(meme_key in frame_pool.memes)
+    try:
+        yield
+    finally:
+        _parallel_frames.reset(token)
+
+
+@dataclass
+class FramePoolStats:
+    in_use: int = 0
+    """正在使用的线程名额"""
+    parallel: int = 0
+    """并行制作的动图数"""
+    serial: int = 0
+    """没有空闲名额、逐帧制作的动图数"""
+
+
+class FramePool:
+    def __init__(self, workers: int, per_request: int = 0, memes: list[str] = []):
+        """
+        :params
+          * ``workers``: 所有请求共用的线程名额，0 表示不并行制作
+          * ``per_request``: 单个动图最多使用的名额，0 表示不限制
+          * ``memes``: 并行制作帧的表情
+        """
+        self.workers = workers
+        self.per_request = per_request or workers
+        self.memes = set(memes)
+        self.stats = FramePoolStats()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="meme-frame"
+                )
+            return self._executor
+
+    def _acquire(self, n: int) -> int:
+        with self._lock:
+            n = max(0, min(n, self.per_request, self.workers - self.stats.in_use))
+            self.stats.in_use += n
+            if n:
+                self.stats.parallel += 1
+            else:
+                self.stats.serial += 1
+            return n
+
+    def _release(self, n: int):
+        with self._lock:
+            self.stats.in_use -= n
+
+    def imap(self, tasks: Iterable[Callable[[], T]], length: int) -> Iterator[T]:
+        """
+        按顺序返回各任务的结果
+        当前线程启用了并行制作且有空闲名额时，第一个之后的任务在线程池中执行，
+        最多同时执行名额数个；否则在当前线程中逐个执行
+        """
+        tasks = iter(tasks)
+        if not _parallel_frames.get() or length <= 1:
+            for task in tasks:
+                yield task()
+            return
+
+        # 第一帧在当前线程中制作，表情共用的模板、字体等在此时完成延迟加载，
+        # 之后各线程只读取已加载的数据
+        for task in tasks:
+            yield task()
+            break
+        workers = self._acquire(length - 1)
+        if workers == 0:
+            for task in tasks:
+                yield task()
+            return
+
+        pending: deque[Future[T]] = deque()
+        try:
+            for task in tasks:
+                if len(pending) >= workers:
+                    yield pending.popleft().result()
+                pending.append(self.executor.submit(task))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # 提前结束（出错、超时或客户端断开）时取消未开始的帧，等待正在制作的帧后归还名额
+            for future in pending:
+                future.cancel()
+            wait(pending)
+            self._release(workers)
+
+    def dump_stats(self) -> dict[str, Any]:
+        with self._lock:
+            stats = asdict(self.stats)
+        stats["workers"] = self.workers
+        return stats
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+def cpu_count() -> int:
+    """当前进程可用的 CPU 核数"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _frame_workers(workers: int) -> int:
+    """``frame_workers`` 配置对应的线程名额，负数表示不并行制作"""
+    if workers < 0:
+        return 0
+    # 渲染线程本身占用一个核，单核时也保留一个名额
+    return workers or max(1, cpu_count() - 1)
+
+
+frame_pool = FramePool(
+    _frame_workers(meme_config.server.frame_workers),
+    meme_config.server.frame_workers_per_request,
+    meme_config.server.parallel_frame_memes,
+)
@@ -0,0 +1,251 @@
+"""逐帧写出 gif
+
+``save_gif`` 默认把整个 gif 编码到 ``BytesIO`` 中再返回，客户端要等全部帧编码完成
+才能收到第一个字节。流式制作时 ``save_gif`` 改用 ``GifWriter``：先写出文件头和
+全局调色板，之后每编码一帧就写出一个图像块，数据经 ``GifStream`` 从渲染线程
+交给事件循环，由 ``StreamingResponse`` 分块发送。
+``GifStream`` 最多暂存 ``max_chunks`` 块数据，客户端读取较慢时渲染线程等待，
+服务器不会替慢速客户端缓存整个 gif。
+"""
+
+import asyncio
+import struct
+import threading
+from collections.abc import AsyncIterator
+from concurrent.futures import CancelledError, Future
+from io import BytesIO
+from typing import Any, Callable, Optional
+
+from PIL import Image
+from PIL.Image import Image as IMG
+
+_NETSCAPE_LOOP = b"\x21\xff\x0bNETSCAPE2.0\x03\x01"
+_TRAILER = b"\x3b"
+
+
+def _skip_sub_blocks(data: bytes, pos: int) -> int:
+    while pos < len(data) and (size := data[pos]):
+        pos += size + 1
+    return pos + 1
+
+
+def _visible_bbox(
+    frame: IMG, transparency: Optional[int]
+) -> Optional[tuple[int, int, int, int]]:
+    """帧中不透明部分的范围，没有透明信息时返回整帧"""
+    if frame.mode in ("RGBA", "LA"):
+        return frame.getchannel("A").getbbox()
+    if frame.mode == "P" and isinstance(transparency, int):
+        lut = [255] * 256
+        lut[transparency] = 0
+        return Image.frombytes("L", frame.size, frame.tobytes()).point(lut).getbbox()
+    return (0, 0, frame.width, frame.height)
+
+
+class GifWriter:
+    """
+    逐帧写出 gif
+
+    每一帧单独用 Pillow 编码，再从中取出图像块，因此不需要同时持有所有帧和整个输出。
+    第一帧的调色板作为全局调色板，调色板与之相同的帧（如使用 ``GifPalette`` 时）
+    不再附带局部调色板。
+
+    与 Pillow 的 ``save_all`` 一样，与上一帧相同的帧只延长上一帧的显示时间，
+    因此每一帧在下一帧到来或 ``close`` 时才写出；
+    带透明度的帧只编码不透明部分所在的区域，其余部分按 disposal 2 的约定显示为透明。
+    """
+
+    def __init__(
+        self, write: Callable[[bytes], Any], duration: float, loop: int = 0
+    ):
+        """
+        :params
+          * ``write``: 写出数据的函数
+          * ``duration``: 相邻帧之间的时间间隔，单位为秒
+          * ``loop``: 循环次数，0 表示无限循环
+        """
+        self.write = write
+        self.delay = max(round(duration * 100), 0)
+        self.loop = loop
+        self.frames = 0
+        self._global_table: Optional[tuple[int, bytes]] = None
+        self._last_frame: Optional[tuple[Any, ...]] = None
+        self._pending: Optional[tuple[Optional[int], bytes]] = None
+        self._pending_delay = 0
+
+    def add_frame(self, frame: IMG, **kwargs):
+        """
+        写出一帧
+        :params
+          * ``kwargs``: 传给 ``Image.save`` 的参数，如 ``palette``、``transparency``
+        """
+        key = (frame.mode, frame.size, frame.getpalette(), frame.tobytes())
+        if self._pending is not None and key == self._last_frame:
+            self._pending_delay += self.delay
+            return
+        self._last_frame = key
+
+        size = frame.size
+        bbox = _visible_bbox(
+            frame, kwargs.get("transparency", frame.info.get("transparency"))
+        )
+        if bbox is None:
+            # 完全透明的帧，只编码一个像素
+            bbox = (0, 0, 1, 1)
+        if bbox != (0, 0) + size:
+            frame = frame.crop(bbox)
+
+        buffer = BytesIO()
+        # Pillow 编码单帧 gif 时默认隔行扫描，压缩率不如 ``save_all`` 使用的逐行扫描
+        kwargs.setdefault("interlace", False)
+        frame.save(buffer, format="GIF", optimize=False, **kwargs)
+        data = buffer.getvalue()
+
+        flags = data[10]
+        pos = 13
+        table: Optional[tuple[int, bytes]] = None
+        if flags & 0x80:
+            end = pos + 3 * (2 << (flags & 0x07))
+            table = (flags & 0x07, data[pos:end])
+            pos = end
+
+        transparency: Optional[int] = None
+        while pos < len(data) and data[pos] != 0x2C:
+            if data[pos] != 0x21:
+                raise ValueError("Invalid GIF data")
+            if data[pos + 1] == 0xF9 and data[pos + 3] & 0x01:
+                transparency = data[pos + 6]
+            pos = _skip_sub_blocks(data, pos + 2)
+
+        descriptor = bytearray(data[pos : pos + 10])
+        pos += 10
+        if descriptor[9] & 0x80:
+            end = pos + 3 * (2 << (descriptor[9] & 0x07))
+            table = (descriptor[9] & 0x07, data[pos:end])
+            pos = end
+        image_data = data[pos : _skip_sub_blocks(data, pos + 1)]
+
+        self._flush()
+        if self.frames == 0:
+            self._write_header(size, table)
+        struct.pack_into("<HH", descriptor, 1, bbox[0], bbox[1])
+        # 保留隔行扫描标记，按需改为使用局部调色板
+        local_table = b""
+        descriptor[9] &= 0x40
+        if table is not None and table != self._global_table:
+            descriptor[9] |= 0x80 | table[0]
+            local_table = table[1]
+
+        self._pending = (transparency, bytes(descriptor) + local_table + image_data)
+        self._pending_delay = self.delay
+        self.frames += 1
+
+    def _flush(self):
+        if self._pending is None:
+            return
+        transparency, data = self._pending
+        self._pending = None
+        # 图形控制扩展：disposal 为 2（恢复为背景色），与 ``save_gif`` 一致
+        packed = 2 << 2 | (transparency is not None)
+        control = b"\x21\xf9\x04" + struct.pack(
+            "<BHBB", packed, min(self._pending_delay, 0xFFFF), transparency or 0, 0
+        )
+        self.write(control + data)
+
+    def _write_header(self, size: tuple[int, int], table: Optional[tuple[int, bytes]]):
+        flags = 0x70
+        if table is not None:
+            flags |= 0x80 | table[0]
+            self._global_table = table
+        header = b"GIF89a" + struct.pack("<HHBBB", size[0], size[1], flags, 0, 0)
+        if table is not None:
+            header += table[1]
+        header += _NETSCAPE_LOOP + struct.pack("<H", self.loop) + b"\x00"
+        self.write(header)
+
+    def close(self):
+        self._flush()
+        if self.frames:
+            self.write(_TRAILER)
+
+
+class StreamClosed(Exception):
+    """客户端已断开，停止制作"""
+
+
+class GifStream:
+    """
+    把渲染线程中逐帧编码的 gif 数据交给事件循环
+
+    渲染线程调用 ``start``、``write`` 和 ``finish``，事件循环中通过 ``get`` 和
+    ``chunks`` 读取。队列已满时 ``write`` 阻塞渲染线程，直到读取方取走数据；
+    读取方关闭后，正在等待的和之后的 ``write`` 抛出 ``StreamClosed`` 中止制作。
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_chunks: int = 16):
+        """
+        :params
+          * ``max_chunks``: 最多暂存的数据块数，每块通常为一帧
+        """
+        self._loop = loop
+        self._queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue(max_chunks)
+        self._lock = threading.Lock()
+        self._pending: Optional[Future[None]] = None
+        self.started = False
+        self.closed = False
+
+    def _put(self, kind: str, value: Any):
+        """在渲染线程中调用，等待队列有空位"""
+        with self._lock:
+            if self.closed:
+                raise StreamClosed
+            future = asyncio.run_coroutine_threadsafe(
+                self._queue.put((kind, value)), self._loop
+            )
+            self._pending = future
+        try:
+            future.result()
+        except CancelledError:
+            raise StreamClosed from None
+
+    def start(self, headers: dict[str, str]):
+        """开始输出 gif，``headers`` 为编码参数对应的响应头"""
+        self.started = True
+        self._put("start", headers)
+
+    def write(self, data: bytes):
+        self._put("data", data)
+
+    def finish(self, result: Any = None, error: Optional[BaseException] = None):
+        """制作结束，``result`` 为没有输出 gif 时的制作结果"""
+        try:
+            if error is not None:
+                self._put("error", error)
+            else:
+                self._put("result", result)
+        except StreamClosed:
+            pass
+
+    async def get(self) -> tuple[str, Any]:
+        return await self._queue.get()
+
+    def close(self):
+        """停止读取，唤醒等待队列空位的渲染线程"""
+        with self._lock:
+            self.closed = True
+            if self._pending is not None:
+                self._pending.cancel()
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """``start`` 之后的 gif 数据"""
+        try:
+            while True:
+                kind, value = await self._queue.get()
+                if kind == "data":
+                    yield value
+                elif kind == "error":
+                    raise value
+                else:
+                    return
+        finally:
+            self.close()
@@ -0,0 +1,95 @@
+"""图片存储
+
+客户端通过 ``POST /images`` 上传图片，以内容的 sha256 作为图片 id，之后制作表情时
+通过 ``image_ids`` 引用，无需在每次请求中重新上传同一张头像。
+
+图片字节保存在与结果缓存相同的两级存储（内存 LRU + 可选的磁盘）中；
+最近使用的图片同时缓存解码结果（``SharedImage``），多个请求共用同一份解码后的图片。
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from .cache import ResultCache, hash_bytes
+from .config import meme_config
+from .dirs import get_cache_dir
+from .utils import SharedImage
+
+IMAGE_ID_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+def is_image_id(image_id: str) -> bool:
+    return IMAGE_ID_PATTERN.fullmatch(image_id) is not None
+
+
+class ImageStore:
+    def __init__(self, storage: ResultCache, decoded_items: int):
+        self.storage = storage
+        self.decoded_items = decoded_items
+        self._decoded: OrderedDict[str, SharedImage] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(image_id: str) -> tuple[str, str]:
+        # 磁盘上按 id 的前两位分目录
+        return image_id[:2], image_id
+
+    def put(self, data: bytes) -> str:
+        """保存图片，返回图片 id"""
+        image_id = hash_bytes(data)
+        if not self.storage.contains(self._key(image_id)):
+            self.storage.set(self._key(image_id), data)
+        return image_id
+
+    def contains(self, image_id: str) -> bool:
+        return is_image_id(image_id) and self.storage.contains(self._key(image_id))
+
+    def get(self, image_id: str) -> Optional[SharedImage]:
+        """
+        获取图片，常用图片的解码结果会被缓存
+        :return
+          * 图片不存在或已被淘汰时返回 ``None``
+        """
+        if not is_image_id(image_id):
+            return None
+        with self._lock:
+            if (image := self._decoded.get(image_id)) is not None:
+                self._decoded.move_to_end(image_id)
+                return image
+        if (data := self.storage.get(self._key(image_id))) is None:
+            return None
+        image = SharedImage(data)
+        if self.decoded_items > 0:
+            with self._lock:
+                image = self._decoded.setdefault(image_id, image)
+                self._decoded.move_to_end(image_id)
+                while len(self._decoded) > self.decoded_items:
+                    self._decoded.popitem(last=False)
+        return image
+
+    def dump_stats(self) -> dict[str, Any]:
+        stats = self.storage.dump_stats()
+        with self._lock:
+            stats["decoded_items"] = len(self._decoded)
+        return stats
+
+
+def _create_image_store() -> Optional[ImageStore]:
+    config = meme_config.cache
+    if not config.image_store_enabled:
+        return None
+    disk_dir = None
+    if config.image_store_disk_enabled:
+        disk_dir = get_cache_dir() / "images"
+        disk_dir.mkdir(parents=True, exist_ok=True)
+    storage = ResultCache(
+        memory_max_size=int(config.image_store_memory_size * 10**6),
+        disk_dir=disk_dir,
+        disk_max_size=int(config.image_store_disk_size * 10**6),
+    )
+    return ImageStore(storage, config.image_store_decoded_items)
+
+
+image_store = _create_image_store()
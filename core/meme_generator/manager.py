@@ -1,18 +1,52 @@
 import importlib
 import importlib.util
 import pkgutil
+import sys
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime
+from importlib.machinery import ModuleSpec
+from io import BytesIO
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
+
+from pil_utils import BuildImage
 
 from .config import meme_config
 from .exception import NoSuchMeme
 from .log import logger
-from .meme import CommandShortcut, Meme, MemeArgsType, MemeFunction, MemeParamsType
+from .meme import (
+    CommandShortcut,
+    Meme,
+    MemeArgsModel,
+    MemeArgsType,
+    MemeFunction,
+    MemeParamsType,
+    ParserOption,
+)
 
 _memes: dict[str, Meme] = {}
 
 
+@dataclass(frozen=True)
+class MemeSource:
+    """表情所在的模块"""
+
+    module: str
+    path: Optional[str] = None
+    """模块文件路径，``meme_dirs`` 中的表情不在 ``sys.path`` 中，需要按路径导入"""
+
+
+_meme_sources: dict[str, MemeSource] = {}
+_loading_source: ContextVar[Optional[MemeSource]] = ContextVar(
+    "_loading_source", default=None
+)
+_loading_registry: ContextVar[Optional[dict[str, Meme]]] = ContextVar(
+    "_loading_registry", default=None
+)
+
+
 def path_to_module_name(path: Path) -> str:
     rel_path = path.resolve().relative_to(Path.cwd().resolve())
     if rel_path.stem == "__init__":
@@ -21,16 +55,38 @@ def path_to_module_name(path: Path) -> str:
         return ".".join(rel_path.parts[:-1] + (rel_path.stem,))
 
 
-def load_meme(module_path: Union[str, Path]):
+def load_meme(module_path: Union[str, Path]) -> bool:
     module_name = (
         path_to_module_name(module_path)
         if isinstance(module_path, Path)
         else module_path
     )
+    token = _loading_source.set(MemeSource(module_name))
     try:
         importlib.import_module(module_name)
+        return True
+    except Exception as e:
+        logger.opt(colors=True, exception=e).error(f"Failed to import {module_path}!")
+        return False
+    finally:
+        _loading_source.reset(token)
+
+
+def _exec_module(module_name: str, module_spec: ModuleSpec) -> bool:
+    if not (module_path := module_spec.origin) or not (
+        module_loader := module_spec.loader
+    ):
+        return False
+    token = _loading_source.set(MemeSource(module_name, module_path))
+    try:
+        module = importlib.util.module_from_spec(module_spec)
+        module_loader.exec_module(module)
+        return True
     except Exception as e:
         logger.opt(colors=True, exception=e).error(f"Failed to import {module_path}!")
+        return False
+    finally:
+        _loading_source.reset(token)
 
 
 def load_memes(dir_path: Union[str, Path]):
@@ -49,24 +105,186 @@ def load_memes(dir_path: Union[str, Path]):
                 module_spec := module_info.module_finder.find_spec(module_info.name, None)
             ):
                 continue
-                
-            if not (module_path := module_spec.origin):
-                continue
-                
-            if not (module_loader := module_spec.loader):
-                continue
-                
-            try:
-                module = importlib.util.module_from_spec(module_spec)
-                module_loader.exec_module(module)
-            except Exception as e:
-                logger.opt(colors=True, exception=e).error(
-                    f"Failed to import {module_path}!"
-                )
+
+            _exec_module(module_info.name, module_spec)
     except Exception:
         pass
 
 
+def load_source(source: MemeSource) -> bool:
+    """导入 ``source`` 所指的模块，模块中的表情会在导入时注册"""
+    if source.path is None:
+        return load_meme(source.module)
+    path = Path(source.path)
+    module_spec = importlib.util.spec_from_file_location(
+        source.module,
+        path,
+        submodule_search_locations=(
+            [str(path.parent)] if path.name == "__init__.py" else None
+        ),
+    )
+    if module_spec is None:
+        logger.error(f"Failed to import {source.path}!")
+        return False
+    return _exec_module(source.module, module_spec)
+
+
+def _drop_modules(module: str) -> dict[str, Any]:
+    """从 ``sys.modules`` 中移除模块及其子模块，使下次导入时重新执行"""
+    names = [
+        name
+        for name in list(sys.modules)
+        if name == module or name.startswith(f"{module}.")
+    ]
+    return {name: sys.modules.pop(name) for name in names}
+
+
+def reload_source(source: MemeSource) -> Optional[list[str]]:
+    """
+    重新导入表情模块，并替换注册表中该模块的表情
+    替换前已经取得旧表情对象的调用（如正在制作的请求）继续使用旧的表情
+    :return
+      * 新增、更新或移除的表情名，导入失败时返回 ``None`` 并保留原有的表情
+    """
+    registry: dict[str, Meme] = {}
+    with _source_lock(source):
+        token = _loading_registry.set(registry)
+        try:
+            if source.path is None:
+                old_modules = _drop_modules(source.module)
+                if not (success := load_meme(source.module)):
+                    sys.modules.update(old_modules)
+            else:
+                success = load_source(source)
+        finally:
+            _loading_registry.reset(token)
+        if not success:
+            return None
+
+        old_keys = [key for key, s in list(_meme_sources.items()) if s == source]
+        for key, meme in registry.items():
+            _memes[key] = meme
+            _meme_sources[key] = source
+        for key in old_keys:
+            if key not in registry:
+                _memes.pop(key, None)
+                _meme_sources.pop(key, None)
+    return sorted(set(old_keys) | set(registry))
+
+
+def unload_source(source: MemeSource) -> list[str]:
+    """
+    移除表情模块注册的所有表情
+    :return
+      * 移除的表情名
+    """
+    with _source_lock(source):
+        keys = [key for key, s in list(_meme_sources.items()) if s == source]
+        for key in keys:
+            _memes.pop(key, None)
+            _meme_sources.pop(key, None)
+        if source.path is None:
+            _drop_modules(source.module)
+    return keys
+
+
+class LazyArgsType(MemeArgsType):
+    """
+    延迟加载的表情参数类型
+
+    ``parser_options`` 等可以直接从清单中读取，
+    访问 ``args_model`` 和 ``args_examples`` 时才导入表情模块
+    """
+
+    def __init__(
+        self,
+        meme: "LazyMeme",
+        args_schema: dict[str, Any],
+        args_examples: list[dict[str, Any]],
+        parser_options: list[ParserOption],
+        default_args: dict[str, Any],
+    ):
+        self._meme = meme
+        self.args_schema = args_schema
+        """参数模型的 JSON Schema"""
+        self.args_examples_data = args_examples
+        """参数示例 dump 之后的字典"""
+        self.parser_options = parser_options
+        self.default_args = default_args
+        """参数模型默认值 dump 之后的字典"""
+
+    @property
+    def _args_type(self) -> MemeArgsType:
+        if args_type := self._meme.load().params_type.args_type:
+            return args_type
+        raise NoSuchMeme(self._meme.key)
+
+    @property
+    def args_model(self) -> type[MemeArgsModel]:  # type: ignore[override]
+        return self._args_type.args_model
+
+    @property
+    def args_examples(self) -> list[MemeArgsModel]:  # type: ignore[override]
+        return self._args_type.args_examples
+
+
+class LazyMeme(Meme):
+    """
+    根据清单创建的延迟加载表情
+
+    第一次使用时导入表情所在的模块，模块中的 ``add_meme`` 会替换注册表中的占位对象，
+    此后 ``get_meme`` 返回的都是实际的表情，参数校验等行为与直接加载时完全一致
+    """
+
+    def __init__(self, key: str, source: MemeSource, **kwargs):
+        super().__init__(key, self._call_function, **kwargs)
+        self.source = source
+        self._error: Optional[Exception] = None
+
+    def _call_function(self, images, texts, args) -> BytesIO:
+        return self.load().function(images, texts, args)
+
+    def load(self) -> Meme:
+        if (meme := _memes.get(self.key)) is not self and meme is not None:
+            return meme
+        with _source_lock(self.source):
+            if (meme := _memes.get(self.key)) is self and self._error is None:
+                load_source(self.source)
+                meme = _memes.get(self.key)
+                if meme is self or meme is None:
+                    self._error = NoSuchMeme(self.key)
+                    logger.error(
+                        f'Meme "{self.key}" is not registered by {self.source.module}'
+                    )
+        if self._error is not None or meme is None:
+            raise self._error or NoSuchMeme(self.key)
+        return meme
+
+    def __call__(
+        self,
+        *,
+        images: Union[
+            list[str], list[Path], list[bytes], list[BytesIO], list[BuildImage]
+        ] = [],
+        texts: list[str] = [],
+        args: dict[str, Any] = {},
+        deadline: Optional[float] = None,
+    ) -> BytesIO:
+        return self.load()(images=images, texts=texts, args=args, deadline=deadline)
+
+    def generate_preview(self, *, args: dict[str, Any] = {}) -> BytesIO:
+        return self.load().generate_preview(args=args)
+
+
+_source_locks: dict[MemeSource, threading.Lock] = {}
+_source_locks_lock = threading.Lock()
+
+
+def _source_lock(source: MemeSource) -> threading.Lock:
+    with _source_locks_lock:
+        return _source_locks.setdefault(source, threading.Lock())
+
+
 def add_meme(
     key: str,
     function: MemeFunction,
@@ -82,8 +300,19 @@ def add_meme(
     tags: set[str] = set(),
     date_created: datetime = datetime(2021, 5, 4),
     date_modified: datetime = datetime.now(),
+    cacheable: bool = True,
 ):
-    if key in _memes:
+    source = _loading_source.get()
+    registry = _loading_registry.get()
+    if registry is not None:
+        # 热重载时先登记到临时的注册表中，模块导入成功后再整体替换
+        duplicated = key in registry or (
+            key in _memes and _meme_sources.get(key) != source
+        )
+    else:
+        # 延迟加载的占位对象在模块导入时被实际的表情替换
+        duplicated = key in _memes and not isinstance(_memes[key], LazyMeme)
+    if duplicated:
         logger.warning(f'Meme with key "{key}" already exists!')
         return
 
@@ -102,15 +331,34 @@ def add_meme(
         tags=tags,
         date_created=date_created,
         date_modified=date_modified,
+        cacheable=cacheable,
     )
 
+    if registry is not None:
+        registry[key] = meme
+        return
     _memes[key] = meme
+    if source:
+        _meme_sources[key] = source
+
+
+def add_lazy_meme(meme: LazyMeme):
+    """注册延迟加载的表情，已存在同名表情时忽略"""
+    if meme.key in _memes or meme.key in meme_config.meme.meme_disabled_list:
+        return
+    _memes[meme.key] = meme
+    _meme_sources[meme.key] = meme.source
 
 
 def get_meme(key: str) -> Meme:
+    """获取表情，延迟加载的表情会在此时导入所在的模块"""
     if key not in _memes:
         raise NoSuchMeme(key)
-    return _memes[key]
+    return _memes[key].load()
+
+
+def get_meme_source(key: str) -> Optional[MemeSource]:
+    return _meme_sources.get(key)
 
 
 def get_memes() -> list[Meme]:
@@ -0,0 +1,465 @@
+"""
+静态生成表情清单
+
+表情模块通常会在顶层导入 skia、dateparser、qrcode 等较重的依赖，
+而清单只需要 ``add_meme(...)`` 的参数。这里用 ``ast`` 解析模块，
+只执行 ``add_meme`` 调用所依赖的顶层语句（字面量赋值、参数模型定义、
+``MemeArgsType`` 等），其中只能引用 ``SAFE_MODULES`` 中的模块和少量内置函数，
+不会导入模块本身。
+
+通过 ``add_gif_meme`` 这类包装函数注册的表情，会按调用参数执行包装函数中的
+赋值语句和 ``add_meme`` 调用。
+
+无法静态解析的模块（如在循环中调用 ``add_meme``、使用相对导入、
+参数引用了其他模块的对象）会在独立的子进程中实际导入，
+子进程只导入这一个模块，其副作用不会影响当前进程。
+
+生成的清单与 ``fast_loader.dump_meme_info`` 的格式一致。
+"""
+
+import ast
+import builtins
+import copy
+import importlib
+import inspect
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from .config import meme_config
+from .fast_loader import dump_meme_info
+from .log import logger
+from .manager import MemeSource, add_meme, get_meme_source, get_memes, load_source
+from .meme import Meme, MemeParamsType
+
+SAFE_MODULES = (
+    "dataclasses",
+    "datetime",
+    "typing",
+    "pathlib",
+    "pydantic",
+    "arclet.alconna",
+    "meme_generator",
+    "meme_generator.meme",
+    "meme_generator.tags",
+)
+"""静态解析时允许导入的模块，导入这些模块没有副作用，且已被 ``meme_generator`` 导入"""
+
+SAFE_BUILTINS = (
+    "abs all any bool dict enumerate filter float frozenset int isinstance len list "
+    "map max min range reversed round set sorted str sum tuple zip"
+).split()
+
+SANDBOX_TIMEOUT = 120
+
+_add_meme_signature = inspect.signature(add_meme)
+
+
+class StaticFunction:
+    """模块中定义的函数，静态解析时不执行函数体"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __call__(self, *args, **kwargs):
+        raise RuntimeError(f"{self.name} is not available in static manifests")
+
+
+class NotStatic(Exception):
+    """模块无法静态解析"""
+
+
+def iter_meme_sources() -> list[MemeSource]:
+    """按加载顺序列出配置中所有表情模块，与 ``meme_generator`` 的加载方式一致"""
+    sources: list[MemeSource] = []
+    if meme_config.meme.load_builtin_memes:
+        builtin_dir = Path(__file__).parent / "memes"
+        for path in sorted(builtin_dir.iterdir()):
+            if path.is_dir() and not path.name.startswith("_"):
+                sources.append(MemeSource(f"meme_generator.memes.{path.name}"))
+
+    for meme_dir in meme_config.meme.meme_dirs:
+        meme_dir = Path(meme_dir).resolve()
+        if not meme_dir.exists():
+            continue
+        for path in sorted(meme_dir.iterdir()):
+            if path.name.startswith(("_", ".")):
+                continue
+            if path.is_dir() and (path / "__init__.py").exists():
+                sources.append(MemeSource(path.name, str(path / "__init__.py")))
+            elif path.suffix == ".py":
+                sources.append(MemeSource(path.stem, str(path)))
+    return sources
+
+
+def source_file(source: MemeSource) -> Path:
+    """表情模块的源文件"""
+    if source.path is not None:
+        return Path(source.path)
+    package_dir = Path(__file__).parent.parent
+    path = package_dir.joinpath(*source.module.split("."))
+    if (init_file := path / "__init__.py").exists():
+        return init_file
+    return path.with_suffix(".py")
+
+
+def module_files(source: MemeSource) -> tuple[Path, list[Path]]:
+    """模块的代码和图片等资源文件，以及计算相对路径的根目录"""
+    path = source_file(source)
+    if path.name != "__init__.py":
+        return path.parent, [path]
+    files = [
+        file
+        for file in path.parent.rglob("*")
+        if file.is_file()
+        and "__pycache__" not in file.parts
+        and file.suffix not in (".pyc", ".pyo")
+    ]
+    return path.parent, sorted(files)
+
+
+def _is_add_meme(node: ast.AST, names: set[str]) -> bool:
+    return (isinstance(node, ast.Name) and node.id in names) or (
+        isinstance(node, ast.Attribute) and node.attr == "add_meme"
+    )
+
+
+class StaticExtractor:
+    """解析单个表情模块，得到其中注册的表情"""
+
+    def __init__(self, source: MemeSource, path: Path):
+        self.source = source
+        self.path = path
+        self.add_meme_names: set[str] = set()
+        self.namespace: dict[str, Any] = {
+            "__builtins__": {name: getattr(builtins, name) for name in SAFE_BUILTINS}
+            | {"__build_class__": builtins.__build_class__},
+            "__name__": source.module,
+            "__file__": str(path),
+        }
+        self.wrappers: dict[str, ast.FunctionDef] = {}
+        """在函数体中调用 ``add_meme`` 的函数，如 ``add_gif_meme``"""
+        self.memes: list[Meme] = []
+        self.calls: dict[int, ast.Call] = {}
+        """已解析的 ``add_meme`` 调用"""
+        self.imports = 0
+        """``add_meme`` 的导入次数"""
+
+    def extract(self) -> list[Meme]:
+        source = self.path.read_bytes()
+        tree = ast.parse(source, str(self.path))
+        for stmt in tree.body:
+            if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+                self._import(stmt)
+            elif isinstance(stmt, ast.FunctionDef) and self._calls_add_meme(stmt):
+                self.wrappers[stmt.name] = stmt
+            elif (
+                isinstance(stmt, ast.Expr)
+                and isinstance(stmt.value, ast.Call)
+                and isinstance(stmt.value.func, ast.Name)
+                and stmt.value.func.id in self.wrappers
+            ):
+                self._call_wrapper(stmt.value)
+            else:
+                self._run(stmt, self.namespace)
+        self._check_calls(tree, source)
+        return self.memes
+
+    def _calls_add_meme(self, func: ast.FunctionDef) -> bool:
+        return any(self._is_add_meme_call(stmt) for stmt in func.body)
+
+    def _is_add_meme_call(self, stmt: ast.stmt) -> bool:
+        return (
+            isinstance(stmt, ast.Expr)
+            and isinstance(stmt.value, ast.Call)
+            and _is_add_meme(stmt.value.func, self.add_meme_names)
+        )
+
+    def _run(self, stmt: ast.stmt, namespace: dict[str, Any]):
+        if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            namespace[stmt.name] = StaticFunction(stmt.name)
+        elif self._is_add_meme_call(stmt):
+            self._add_meme(stmt.value, namespace)  # type: ignore
+        elif isinstance(stmt, (ast.Assign, ast.AnnAssign, ast.AugAssign, ast.ClassDef)):
+            self._exec(stmt, namespace)
+
+    def _call_wrapper(self, call: ast.Call):
+        """按调用参数执行函数体中的赋值语句和 ``add_meme`` 调用"""
+        func = self.wrappers[call.func.id]  # type: ignore
+        args = copy.deepcopy(func.args)
+        for arg in args.posonlyargs + args.args + args.kwonlyargs:
+            arg.annotation = None
+        for arg in (args.vararg, args.kwarg):
+            if arg is not None:
+                arg.annotation = None
+        # 用只返回参数的同名函数绑定参数，参数默认值在模块命名空间中求值
+        stub = ast.FunctionDef(
+            name=func.name,
+            args=args,
+            body=[ast.Return(ast.Call(ast.Name("locals", ast.Load()), [], []))],
+            decorator_list=[],
+            returns=None,
+        )
+        stub = ast.fix_missing_locations(ast.copy_location(stub, func))
+        stub_namespace = self.namespace | {"locals": locals}
+        self._exec(stub, stub_namespace)
+        if func.name not in stub_namespace:
+            raise NotStatic(f"cannot evaluate {func.name} at line {func.lineno}")
+        namespace = self.namespace | self._call(
+            stub_namespace[func.name], call, self.namespace
+        )
+        for stmt in func.body:
+            self._run(stmt, namespace)
+
+    def _check_calls(self, tree: ast.Module, source: bytes):
+        """``add_meme`` 只能在模块或函数的顶层直接调用，否则无法得知实际注册了哪些表情"""
+        # 大部分模块中 add_meme 只出现在导入和顶层调用中，无需遍历语法树
+        if self.add_meme_names <= {"add_meme"} and len(
+            re.findall(rb"\badd_meme\b", source)
+        ) == self.imports + len(self.calls):
+            return
+        calls = {id(call.func) for call in self.calls.values()}
+        for node in ast.walk(tree):
+            if _is_add_meme(node, self.add_meme_names) and id(node) not in calls:
+                raise NotStatic(f"add_meme is used at line {node.lineno}")
+
+    def _import(self, stmt: Union[ast.Import, ast.ImportFrom]):
+        if isinstance(stmt, ast.Import):
+            for alias in stmt.names:
+                if alias.name in SAFE_MODULES:
+                    name = alias.asname or alias.name.split(".")[0]
+                    module = alias.name if alias.asname else name
+                    self.namespace[name] = importlib.import_module(module)
+            return
+
+        if stmt.level:
+            raise NotStatic("relative imports are not supported")
+        if stmt.module not in SAFE_MODULES:
+            return
+        module = importlib.import_module(stmt.module)
+        for alias in stmt.names:
+            if alias.name == "*":
+                raise NotStatic("star imports are not supported")
+            name = alias.asname or alias.name
+            if alias.name == "add_meme":
+                self.add_meme_names.add(name)
+                self.imports += 1
+            elif hasattr(module, alias.name):
+                self.namespace[name] = getattr(module, alias.name)
+
+    def _exec(self, stmt: ast.stmt, namespace: dict[str, Any]):
+        code = compile(ast.Module(body=[stmt], type_ignores=[]), str(self.path), "exec")
+        try:
+            exec(code, namespace)
+        except Exception:
+            # 依赖了不能静态执行的对象，若 add_meme 用到这些名字会在求值时失败
+            for node in ast.walk(stmt):
+                if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+                    namespace.pop(node.id, None)
+            if isinstance(stmt, (ast.ClassDef, ast.FunctionDef)):
+                namespace.pop(stmt.name, None)
+
+    def _eval(self, node: ast.expr, namespace: dict[str, Any]) -> Any:
+        code = compile(ast.Expression(body=node), str(self.path), "eval")
+        try:
+            return eval(code, namespace)
+        except Exception as e:
+            raise NotStatic(
+                f"cannot evaluate line {node.lineno}: {type(e).__name__}: {e}"
+            )
+
+    def _call(self, func: Callable, call: ast.Call, namespace: dict[str, Any]) -> Any:
+        if any(isinstance(arg, ast.Starred) for arg in call.args) or any(
+            keyword.arg is None for keyword in call.keywords
+        ):
+            raise NotStatic(f"unpacked arguments at line {call.lineno}")
+        args = [self._eval(arg, namespace) for arg in call.args]
+        kwargs = {
+            keyword.arg: self._eval(keyword.value, namespace)
+            for keyword in call.keywords
+        }
+        try:
+            return func(*args, **kwargs)
+        except TypeError as e:
+            raise NotStatic(f"invalid call at line {call.lineno}: {e}")
+
+    def _add_meme(self, call: ast.Call, namespace: dict[str, Any]):
+        bound = self._call(_add_meme_signature.bind, call, namespace)
+        bound.apply_defaults()
+        params = bound.arguments
+        self.calls[id(call)] = call
+        self.memes.append(
+            Meme(
+                params["key"],
+                params["function"],
+                MemeParamsType(
+                    params["min_images"],
+                    params["max_images"],
+                    params["min_texts"],
+                    params["max_texts"],
+                    params["default_texts"],
+                    params["args_type"],
+                ),
+                keywords=params["keywords"],
+                shortcuts=params["shortcuts"],
+                tags=params["tags"],
+                date_created=params["date_created"],
+                date_modified=params["date_modified"],
+                cacheable=params["cacheable"],
+            )
+        )
+
+
+def extract_static(source: MemeSource) -> Optional[list[dict[str, Any]]]:
+    """
+    静态解析表情模块
+    :return
+      * 模块中表情的清单信息，无法静态解析时返回 ``None``
+    """
+    path = source_file(source)
+    try:
+        memes = StaticExtractor(source, path).extract()
+        return [dump_meme_info(meme, source) for meme in memes]
+    except NotStatic as e:
+        logger.debug(f"{path} cannot be parsed statically: {e}")
+    except Exception as e:
+        logger.warning(f"Failed to parse {path}: {e}")
+    return None
+
+
+def extract_sandboxed(source: MemeSource) -> list[dict[str, Any]]:
+    """在子进程中导入表情模块，得到其中表情的清单信息"""
+    env = dict(os.environ, MEME_AUTOLOAD="false", MEME_FAST_LOADING="false")
+    package_dir = str(Path(__file__).parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [package_dir, os.environ.get("PYTHONPATH")])
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output = Path(tmp_dir) / "memes.json"
+        command = [sys.executable, "-m", "meme_generator.manifest", str(output)]
+        command += [source.module, source.path or ""]
+        try:
+            subprocess.run(
+                command,
+                env=env,
+                cwd=package_dir,
+                timeout=SANDBOX_TIMEOUT,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+            with open(output, encoding="utf-8") as f:
+                return json.load(f)
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode("utf-8", "replace").strip()
+            logger.warning(f"Failed to import {source.module}: {stderr}")
+        except (OSError, ValueError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Failed to import {source.module}: {e}")
+    return []
+
+
+def _extract_static_batch(
+    sources: list[MemeSource],
+) -> list[Optional[list[dict[str, Any]]]]:
+    return [extract_static(source) for source in sources]
+
+
+def extract_manifests(
+    sources: list[MemeSource], workers: int = 0
+) -> dict[MemeSource, list[dict[str, Any]]]:
+    """
+    解析表情模块
+    :params
+      * ``sources``: 要解析的表情模块
+      * ``workers``: 并行解析的进程数，默认为 CPU 核数
+    :return
+      * 每个模块中表情的清单信息
+    """
+    workers = workers or os.cpu_count() or 1
+    start_time = time.time()
+
+    if workers > 1 and len(sources) > 1:
+        chunk_size = -(-len(sources) // workers)
+        chunks = [
+            sources[i : i + chunk_size] for i in range(0, len(sources), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            results = [
+                result
+                for batch in executor.map(_extract_static_batch, chunks)
+                for result in batch
+            ]
+    else:
+        results = _extract_static_batch(sources)
+
+    fallbacks = [source for source, result in zip(sources, results) if result is None]
+    if fallbacks:
+        logger.info(f"Importing {len(fallbacks)} modules in sandboxes")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            imported = dict(zip(fallbacks, executor.map(extract_sandboxed, fallbacks)))
+    else:
+        imported = {}
+
+    logger.info(
+        f"Parsed {len(sources)} modules "
+        f"({len(sources) - len(fallbacks)} static, {len(fallbacks)} imported) "
+        f"in {time.time() - start_time:.2f}s"
+    )
+    return {
+        source: imported[source] if result is None else result
+        for source, result in zip(sources, results)
+    }
+
+
+def merge_manifests(
+    manifests: Iterable[tuple[MemeSource, list[dict[str, Any]]]],
+) -> dict[str, dict[str, Any]]:
+    """按模块的加载顺序合并清单，同名表情以先加载的为准"""
+    manifest: dict[str, dict[str, Any]] = {}
+    for _, infos in manifests:
+        for info in infos:
+            if info["key"] in manifest:
+                logger.warning(f'Meme with key "{info["key"]}" already exists!')
+                continue
+            manifest[info["key"]] = info
+    return manifest
+
+
+def build_manifest(
+    sources: Optional[list[MemeSource]] = None, workers: int = 0
+) -> dict[str, dict[str, Any]]:
+    """
+    生成表情清单
+    :params
+      * ``sources``: 要解析的表情模块，默认为配置中的所有表情模块
+      * ``workers``: 并行解析的进程数，默认为 CPU 核数
+    :return
+      * 表情名到清单信息的字典，同名表情以先加载的为准
+    """
+    if sources is None:
+        sources = iter_meme_sources()
+    return merge_manifests(extract_manifests(sources, workers).items())
+
+
+def _sandbox_main(output: str, module: str, path: str):
+    source = MemeSource(module, path or None)
+    load_source(source)
+    infos = [
+        dump_meme_info(meme, source)
+        for meme in get_memes()
+        if get_meme_source(meme.key) == source
+    ]
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(infos, f, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    _sandbox_main(*sys.argv[1:4])
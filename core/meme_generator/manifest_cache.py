@@ -0,0 +1,125 @@
+"""二进制表情清单缓存
+
+把 ``static_generator.py`` 生成的清单写入单个文件，启动时通过 mmap 读取，
+只需解析索引，每个表情的信息在第一次访问时才解码。
+
+文件格式::
+
+    MAGIC (8 字节) | 格式版本 (uint32) | 清单版本 (uint32) | 校验和 (uint32)
+    | 索引长度 (uint32) | 索引 (JSON) | 表情信息
+
+索引中记录每个表情所在的模块、信息在文件中的位置，以及关键词映射和缓存元数据；
+每个表情的信息为紧凑的 JSON。校验和为索引和表情信息的 CRC32。
+格式版本、清单版本不符或校验失败时 ``ManifestCache.open`` 返回 ``None``，
+由调用方回退到 JSON 文件。
+"""
+
+import json
+import mmap
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Optional
+
+MAGIC = b"MEMEMETA"
+VERSION = 1
+HEADER = struct.Struct("<8sIIII")
+CACHE_FILE = "memes.bin"
+
+
+def _dumps(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_manifest_cache(
+    output: Path,
+    manifest_version: int,
+    meme_info: dict[str, dict[str, Any]],
+    meme_keywords: dict[str, list[str]],
+    meta: dict[str, Any],
+):
+    """
+    写入二进制清单缓存
+    :params
+      * ``manifest_version``: 清单格式版本，读取时版本不符则视为无效
+      * ``meme_info``: 表情名到清单信息的字典
+      * ``meme_keywords``: 关键词到表情名的映射
+      * ``meta``: 缓存元数据
+    """
+    entries: list[list[Any]] = []
+    chunks: list[bytes] = []
+    offset = 0
+    for key in sorted(meme_info):
+        info = meme_info[key]
+        data = _dumps(info)
+        module = info["module"]
+        entries.append([key, module["module"], module["path"], offset, len(data)])
+        chunks.append(data)
+        offset += len(data)
+
+    index = _dumps({"memes": entries, "keywords": meme_keywords, "meta": meta})
+    body = index + b"".join(chunks)
+    header = HEADER.pack(MAGIC, VERSION, manifest_version, zlib.crc32(body), len(index))
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(body)
+    tmp_path.replace(output)
+
+
+class ManifestCache:
+    def __init__(self, buffer: memoryview, index: dict[str, Any], data_offset: int):
+        self._buffer = buffer
+        self._entries: dict[str, list[Any]] = {
+            entry[0]: entry for entry in index["memes"]
+        }
+        self.keywords: dict[str, list[str]] = index["keywords"]
+        self.meta: dict[str, Any] = index["meta"]
+        self.data_offset = data_offset
+
+    @classmethod
+    def open(cls, path: Path, manifest_version: int) -> Optional["ManifestCache"]:
+        """打开缓存文件，格式不符或校验失败时返回 ``None``"""
+        try:
+            with open(path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        buffer = memoryview(mm)
+        try:
+            magic, version, file_manifest_version, checksum, index_size = (
+                HEADER.unpack_from(buffer)
+            )
+        except struct.error:
+            return None
+        if (
+            magic != MAGIC
+            or version != VERSION
+            or file_manifest_version != manifest_version
+            or zlib.crc32(buffer[HEADER.size :]) != checksum
+        ):
+            return None
+        data_offset = HEADER.size + index_size
+        try:
+            index = json.loads(bytes(buffer[HEADER.size : data_offset]))
+        except ValueError:
+            return None
+        return cls(buffer, index, data_offset)
+
+    @property
+    def keys(self) -> list[str]:
+        return list(self._entries)
+
+    def source(self, key: str) -> tuple[str, Optional[str]]:
+        """表情所在的模块名和文件路径"""
+        entry = self._entries[key]
+        return entry[1], entry[2]
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """解码表情的清单信息"""
+        if (entry := self._entries.get(key)) is None:
+            return None
+        start = self.data_offset + entry[3]
+        return json.loads(bytes(self._buffer[start : start + entry[4]]))
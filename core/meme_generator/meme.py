@@ -17,7 +17,7 @@ from .exception import (
     TextNumberMismatch,
     TextOrNameNotEnough,
 )
-from .utils import random_image, random_text
+from .utils import check_deadline, random_image, random_text, render_deadline
 
 
 class UserInfo(BaseModel):
@@ -104,14 +104,29 @@ class Meme:
     tags: set[str] = field(default_factory=set)
     date_created: datetime = datetime(2021, 5, 4)
     date_modified: datetime = datetime.now()
+    cacheable: bool = True
+    """制作结果是否只取决于输入，含随机或时间因素的表情应设为 False"""
+
+    def load(self) -> "Meme":
+        """返回实际的表情对象，延迟加载的表情会在此时导入所在的模块"""
+        return self
 
     def __call__(
         self,
         *,
-        images: Union[list[str], list[Path], list[bytes], list[BytesIO]] = [],
+        images: Union[
+            list[str], list[Path], list[bytes], list[BytesIO], list[BuildImage]
+        ] = [],
         texts: list[str] = [],
         args: dict[str, Any] = {},
+        deadline: Optional[float] = None,
     ) -> BytesIO:
+        """
+        制作表情
+        :params
+          * ``deadline``: ``time.time()`` 形式的截止时间，超出时在帧之间抛出
+            ``RenderTimeout`` 中止制作；``None`` 表示不限制
+        """
         if not (
             self.params_type.min_images <= len(images) <= self.params_type.max_images
         ):
@@ -137,13 +152,20 @@ class Meme:
         imgs: list[BuildImage] = []
         try:
             for image in images:
+                if isinstance(image, BuildImage):
+                    # 已解码的图片，如批量制作时多个表情共用的图片
+                    imgs.append(image)
+                    continue
                 if isinstance(image, bytes):
                     image = BytesIO(image)
                 imgs.append(BuildImage.open(image))
         except Exception as e:
             raise OpenImageFailed(str(e))
 
-        return self.function(imgs, texts, model)
+        with render_deadline(deadline):
+            # 在执行器中排队时可能已经超时
+            check_deadline()
+            return self.function(imgs, texts, model)
 
     def generate_preview(self, *, args: dict[str, Any] = {}) -> BytesIO:
         default_images = [random_image() for _ in range(self.params_type.min_images)]
@@ -13,6 +13,7 @@ from meme_generator import (
     add_meme,
 )
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -51,7 +52,7 @@ def abstinence(images: list[BuildImage], texts: list[str], args: Model):
         .resize((300, 300), keep_ratio=True, inside=True, bg_color="white")
     )
 
-    frame = BuildImage.open(img_dir / "base.png").convert("RGBA")
+    frame = open_template(img_dir / "base.png").convert("RGBA")
 
     try:
         frame.paste(img, (80, 400))
@@ -72,7 +73,7 @@ def abstinence(images: list[BuildImage], texts: list[str], args: Model):
         halign="center",
     )
 
-    stamp = BuildImage.open(img_dir / "stamp.png").convert("RGBA")
+    stamp = open_template(img_dir / "stamp.png").convert("RGBA")
     stamp = stamp.resize((200, 200))
     frame.paste(stamp, (350, 650), alpha=True)
 
@@ -90,4 +91,5 @@ add_meme(
     keywords=["戒导"],
     date_created=datetime(2024, 12, 13),
     date_modified=datetime(2024, 12, 14),
+    cacheable=False,
 )
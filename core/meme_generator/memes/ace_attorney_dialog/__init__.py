@@ -6,6 +6,7 @@ from pil_utils import BuildImage, Text2Image
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -61,8 +62,8 @@ def ace_attorney_dialog(images, texts: list[str], args):
             x += img.width - round(img.width * ratio)
         return text_img
 
-    frame = BuildImage.open(img_dir / "bubble.png")
-    mark = BuildImage.open(img_dir / "mark.png")
+    frame = open_template(img_dir / "bubble.png")
+    mark = open_template(img_dir / "mark.png")
 
     if total_width <= 2000:
         text_img = combine_text(text_imgs)
@@ -5,7 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -14,7 +14,7 @@ default_text = "走，跟我去二次元吧"
 
 def acg_entrance(images: list[BuildImage], texts: list[str], args):
     text = texts[0] if texts else default_text
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     try:
         frame.draw_text(
             (30, 720, frame.width - 30, 810),
@@ -4,13 +4,13 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def add_chaos(images: list[BuildImage], texts, args):
-    banner = BuildImage.open(img_dir / "0.png")
+    banner = open_template(img_dir / "0.png")
 
     def make(imgs: list[BuildImage]) -> BuildImage:
         return imgs[0].convert("RGBA").resize_width(240).paste(banner)
@@ -5,13 +5,13 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def addiction(images: list[BuildImage], texts: list[str], args):
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
 
     if texts:
         text = texts[0]
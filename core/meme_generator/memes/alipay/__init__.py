@@ -14,6 +14,7 @@ from meme_generator import (
     add_meme,
 )
 from meme_generator.exception import TextOrNameNotEnough, TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -45,7 +46,7 @@ def alipay(images: list[BuildImage], texts: list[str], args: Model):
     name = texts[0] if texts else args.user_infos[0].name
     avatar = images[0]
 
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
 
     qr = qrcode.QRCode(version=5, border=0, error_correction=qrcode.ERROR_CORRECT_Q)
     qr.add_data(message)
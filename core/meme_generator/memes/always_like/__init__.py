@@ -6,6 +6,7 @@ from pil_utils import BuildImage, Text2Image
 
 from meme_generator import MemeArgsModel, add_meme
 from meme_generator.exception import TextOrNameNotEnough, TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -21,7 +22,7 @@ def always_like(images: list[BuildImage], texts: list[str], args: MemeArgsModel)
     name = texts[0]
     text = "我永远喜欢" + name
 
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(
         img.resize((350, 400), keep_ratio=True, inside=True), (25, 35), alpha=True
     )
@@ -93,4 +94,5 @@ add_meme(
     keywords=["我永远喜欢"],
     date_created=datetime(2022, 3, 14),
     date_modified=datetime(2023, 2, 14),
+    cacheable=False,
 )
@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
 from meme_generator.tags import MemeTags
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -15,7 +15,7 @@ default_text = "阿尼亚喜欢这个"
 
 def anya_suki(images: list[BuildImage], texts: list[str], args):
     text = texts[0] if texts else default_text
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     try:
         frame.draw_text(
             (5, frame.height - 60, frame.width - 5, frame.height - 10),
@@ -5,7 +5,12 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -41,7 +46,7 @@ def arona_throw(images: list[BuildImage], texts, args):
             pyroxenes = (
                 imgs[0].convert("RGBA").resize((120, 120), keep_ratio=True).circle()
             )
-            arona = BuildImage.open(img_dir / f"{i}.png").convert("RGBA")
+            arona = open_template(img_dir / f"{i}.png").convert("RGBA")
             arona.paste(pyroxenes, position_list[i], alpha=True)
             if i in [6, 7, 8, 9]:
                 arona.paste(pyroxenes, position_list2[i - 6], alpha=True)
@@ -1,16 +1,15 @@
 from datetime import datetime
 from pathlib import Path
 
-from pil_utils import BuildImage
-
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def ascension(images, texts: list[str], args):
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     text = f"你原本应该要去地狱的，但因为你生前{texts[0]}，我们就当作你已经服完刑期了"
     try:
         frame.draw_text(
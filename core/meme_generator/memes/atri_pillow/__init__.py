@@ -10,6 +10,7 @@ from pydantic import Field
 from meme_generator import MemeArgsModel, MemeArgsType, ParserOption, add_meme
 from meme_generator.exception import TextOverLength
 from meme_generator.tags import MemeTags
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -40,7 +41,7 @@ def atri_pillow(images, texts: list[str], args: Model):
         text_color = (255, 0, 0, 80)
     else:
         text_color = (0, 80, 255, 80)
-    frame = BuildImage.open(img_dir / f"{mode}.png")
+    frame = open_template(img_dir / f"{mode}.png")
     text_img = BuildImage.new("RGBA", (300, 150))
     try:
         text_img.draw_text(
@@ -56,7 +57,7 @@ def atri_pillow(images, texts: list[str], args: Model):
     except ValueError:
         raise TextOverLength(text)
     frame.alpha_composite(text_img.rotate(-4, expand=True), (302, 288))
-    border = BuildImage.open(img_dir / "border.png")
+    border = open_template(img_dir / "border.png")
     frame.paste(border, (0, 416))
     return frame.save_png()
 
@@ -72,4 +73,5 @@ add_meme(
     tags=MemeTags.atri,
     date_created=datetime(2024, 8, 12),
     date_modified=datetime(2024, 8, 15),
+    cacheable=False,
 )
@@ -7,13 +7,14 @@ from pil_utils import BuildImage
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
 from meme_generator.tags import MemeTags
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def ayachi_holdsign(images, texts: list[str], args):
     text = texts[0]
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     text_img = BuildImage.new("RGBA", (600, 350))
     try:
         text_img.draw_text(
@@ -6,7 +6,6 @@ from typing import Literal
 
 from arclet.alconna import store_value
 from PIL.Image import Transpose
-from pil_utils import BuildImage
 from pydantic import Field
 
 from meme_generator import (
@@ -19,6 +18,7 @@ from meme_generator import (
 )
 from meme_generator.exception import MemeFeedback, TextOverLength
 from meme_generator.tags import MemeTags
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -98,7 +98,7 @@ def ba_say(images, texts: list[str], args: Model):
 
     xy = (60, 0, 580, 200) if position == "left" else (500, 0, 1020, 200)
 
-    frame = BuildImage.open(img_dir / f"{character.name_en}.png")
+    frame = open_template(img_dir / f"{character.name_en}.png")
     if position == "left":
         frame = frame.transpose(Transpose.FLIP_LEFT_RIGHT)
 
@@ -141,4 +141,5 @@ add_meme(
     | MemeTags.yuuka,
     date_created=datetime(2024, 12, 12),
     date_modified=datetime(2025, 1, 19),
+    cacheable=False,
 )
@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -21,7 +21,7 @@ def beat_head(images: list[BuildImage], texts: list[str], args):
     for i in range(3):
         x, y, w, h = locs[i]
         head = img.resize((w, h), keep_ratio=True).circle()
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         frame.paste(head, (x, y), below=True)
         try:
             frame.draw_text(
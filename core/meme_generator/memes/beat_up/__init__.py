@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -18,7 +18,7 @@ def beat_up(images: list[BuildImage], texts, args):
     user_locs = [(99, 136), (99, 136), (89, 140)]
     frames: list[IMG] = []
     for i in range(3):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         frame.paste(user_head, user_locs[i], alpha=True)
         frame.paste(self_head, self_locs[i], alpha=True)
         frames.append(frame.image)
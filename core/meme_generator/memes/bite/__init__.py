@@ -5,7 +5,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -20,12 +20,12 @@ def bite(images: list[BuildImage], texts, args):
     ]
     # fmt: on
     for i in range(6):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         w, h, x, y = locs[i]
         frame.paste(img.resize((w, h)), (x, y), below=True)
         frames.append(frame.image)
     for i in range(6, 16):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         frames.append(frame.image)
     return save_gif(frames, 0.07)
 
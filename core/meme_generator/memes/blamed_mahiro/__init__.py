@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -57,7 +57,7 @@ def blamed_mahiro(images, texts: list[str], args):
     except ValueError:
         raise TextOverLength(text)
     for i, param in enumerate(params):
-        bg = BuildImage.open(img_dir / f"{i}.png")
+        bg = open_template(img_dir / f"{i}.png")
         if i > 1:
             frame = text_frame.perspective(param[0])
             bg.paste(frame, param[1], alpha=True)
@@ -4,13 +4,13 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def blood_pressure(images: list[BuildImage], texts, args):
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
 
     def make(imgs: list[BuildImage]) -> BuildImage:
         img = imgs[0].convert("RGBA").resize((414, 450), keep_ratio=True)
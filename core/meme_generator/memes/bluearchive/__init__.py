@@ -7,6 +7,7 @@ from pil_utils import BuildImage, Text2Image
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -44,8 +45,8 @@ def bluearchive(images, texts: list[str], args):
         texts[0], fontsize, font_families=font_families
     ).longest_line
     logo_x = round(padding_x + left_x - 100)
-    halo = BuildImage.open(img_dir / "halo.png").convert("RGBA")
-    cross = BuildImage.open(img_dir / "cross.png").convert("RGBA")
+    halo = open_template(img_dir / "halo.png").convert("RGBA")
+    cross = open_template(img_dir / "cross.png").convert("RGBA")
 
     frame = BuildImage.new("RGBA", (img_w, img_h), (255, 255, 255, 0))
     frame.paste(halo, (logo_x, logo_y), alpha=True)
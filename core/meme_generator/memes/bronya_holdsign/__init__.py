@@ -1,18 +1,17 @@
 from datetime import datetime
 from pathlib import Path
 
-from pil_utils import BuildImage
-
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
 from meme_generator.tags import MemeTags
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def bronya_holdsign(images, texts: list[str], args):
     text = texts[0]
-    frame = BuildImage.open(img_dir / "0.jpg")
+    frame = open_template(img_dir / "0.jpg")
     try:
         frame.draw_text(
             (190, 675, 640, 930),
@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -17,7 +17,7 @@ def capoo_draw(images: list[BuildImage], texts, args):
         (((27, 0), (207, 12), (179, 142), (0, 117)), (30, 16)),
         (((28, 0), (207, 13), (180, 137), (0, 117)), (34, 17)),
     )
-    raw_frames = [BuildImage.open(img_dir / f"{i}.png") for i in range(6)]
+    raw_frames = [open_template(img_dir / f"{i}.png") for i in range(6)]
     for i in range(2):
         points, pos = params[i]
         raw_frames[4 + i].paste(img.perspective(points), pos, below=True)
@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -21,7 +21,7 @@ def capoo_point(images: list[BuildImage], texts, args):
         (165, 167, 56, 290),
     ]
     for i in range(4):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         w, h, x, y = locs[i]
         frame.paste(img.resize((w, h)), (x, y), below=True)
         frames.append(frame.image)
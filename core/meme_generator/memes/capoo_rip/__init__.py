@@ -5,7 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -32,7 +32,7 @@ def capoo_rip(images: list[BuildImage], texts, args):
             [(192, 151), ((0, 7), (79, 3), (82, 107), (11, 112))],
         ),
     ]
-    raw_frames = [BuildImage.open(img_dir / f"{i}.png") for i in range(8)]
+    raw_frames = [open_template(img_dir / f"{i}.png") for i in range(8)]
     for i in range(6):
         pos, points = params1[i]
         raw_frames[i].paste(img.perspective(points), pos, below=True)
@@ -7,7 +7,7 @@ from pil_utils import BuildImage
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -42,7 +42,7 @@ def capoo_say_one_loop(text: str) -> list[IMG]:
 
     frames: list[IMG] = []
     for i in range(10):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         param = params[i]
         if param:
             x, y, w, h, angle = param
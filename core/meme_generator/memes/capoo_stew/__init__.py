@@ -5,7 +5,12 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -14,7 +19,7 @@ def capoo_stew(images: list[BuildImage], texts, args):
     def maker(i: int) -> Maker:
         def make(imgs: list[BuildImage]) -> BuildImage:
             img = imgs[0].convert("RGBA").resize((80, 80), keep_ratio=True).circle()
-            bg = BuildImage.open(img_dir / f"{i}.png")
+            bg = open_template(img_dir / f"{i}.png")
             if i in [2, 3, 5]:
                 y = 45
             else:
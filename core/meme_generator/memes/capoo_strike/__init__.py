@@ -5,7 +5,12 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -25,7 +30,7 @@ def capoo_strike(images: list[BuildImage], texts, args):
         def make(imgs: list[BuildImage]) -> BuildImage:
             img = imgs[0].convert("RGBA").resize((200, 160), keep_ratio=True)
             points, pos = params[i]
-            frame = BuildImage.open(img_dir / f"{i}.png")
+            frame = open_template(img_dir / f"{i}.png")
             frame.paste(img.perspective(points), pos, below=True)
             return frame
 
@@ -5,6 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -13,9 +14,9 @@ def captain(images: list[BuildImage], texts, args):
     if len(images) == 2:
         images.append(images[-1])
 
-    bg0 = BuildImage.open(img_dir / "0.png")
-    bg1 = BuildImage.open(img_dir / "1.png")
-    bg2 = BuildImage.open(img_dir / "2.png")
+    bg0 = open_template(img_dir / "0.png")
+    bg1 = open_template(img_dir / "1.png")
+    bg2 = open_template(img_dir / "2.png")
 
     frame = BuildImage.new("RGBA", (640, 440 * len(images)), "white")
     for i in range(len(images)):
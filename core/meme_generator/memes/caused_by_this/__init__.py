@@ -5,7 +5,7 @@ from pil_utils import BuildImage, Text2Image
 
 from meme_generator import CommandShortcut, add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import make_png_or_gif
+from meme_generator.utils import make_png_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -13,7 +13,7 @@ default_text = "心脏病 高血压 心律不齐 心肌梗塞 失眠 脱发 呼
 
 
 def caused_by_this(images: list[BuildImage], texts: list[str], args):
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     text = texts[0] if texts else default_text
 
     text_img1 = Text2Image.from_text("你的", 55).to_image()
@@ -2,7 +2,6 @@ from datetime import datetime
 from pathlib import Path
 
 import dateparser
-from pil_utils import BuildImage
 from pydantic import Field
 
 from meme_generator import (
@@ -13,6 +12,7 @@ from meme_generator import (
     add_meme,
 )
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 
 class Model(MemeArgsModel):
@@ -39,7 +39,7 @@ def certificate(images, texts: list[str], args: Model):
     if args.time and (parsed_time := dateparser.parse(args.time)):
         time = parsed_time
 
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
 
     try:
         frame.draw_text(
@@ -122,4 +122,5 @@ add_meme(
     keywords=["奖状", "证书"],
     date_created=datetime(2023, 12, 3),
     date_modified=datetime(2023, 12, 3),
+    cacheable=False,
 )
@@ -1,30 +1,146 @@
+import math
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 
+import numpy as np
+from PIL import Image
 from pil_utils import BuildImage, Text2Image
 
 from meme_generator import add_meme
 from meme_generator.utils import make_jpg_or_gif
 
+str_map = "@@$$&B88QMMGW##EE93SPPDOOU**==()+^,\"--''.  "
+num = len(str_map)
+font_size = 15
+font_families = ["Consolas", "DejaVu Sans Mono"]
+
+# 灰度值到字符的映射，灰度为 0 时为空格
+gray_map = [str_map[num * gray // 256] if gray != 0 else " " for gray in range(256)]
+
+
+class GlyphAtlas:
+    """
+    等宽字体的字形图集
+
+    skia 绘制文字时把字形的水平位置量化到 1/4 像素，因此每个字符只需预先渲染
+    4 个水平偏移下的透射率（1 - 覆盖率）图块。合成时把相互重叠的图块相乘，
+    等价于在白底上逐个绘制黑色字形
+    """
+
+    subpixels = 4
+
+    def __init__(self, chars: str, advance: float, line_height: int):
+        self.chars = chars
+        self.advance = advance
+        self.line_height = line_height
+
+        lh = line_height
+        pad = math.ceil(advance)
+        tile_w = math.ceil(advance) + 2 * pad
+        # 字符之间空两行，每个图块包含上下各一行，可容纳超出行框的部分
+        t2m = Text2Image.from_text(
+            "\n\n\n".join(chars), font_size, font_families=font_families
+        )
+        tiles = []
+        for i in range(self.subpixels):
+            image = Image.new("RGBA", (tile_w, lh * 3 * len(chars)), "white")
+            t2m.draw_on_image(image, (pad + i / self.subpixels, lh))
+            gray = np.asarray(image.convert("L"), dtype=np.float32) / 255
+            tiles.append(gray.reshape(len(chars), lh * 3, tile_w))
+        stack = np.stack(tiles)
+
+        # 裁掉没有笔画的部分，减少合成时的计算量
+        ink = (stack < 1).any(axis=(0, 1))
+        ys, xs = np.nonzero(ink)
+        if len(xs) == 0:
+            ys, xs = np.array([lh]), np.array([pad])
+        top, bottom = int(ys.min()) // lh, int(ys.max()) // lh + 1
+        self.first_row = top - 1
+        """图块第一行相对于当前行的偏移，-1 为上一行"""
+        self.offset_x = int(xs.min()) - pad
+        """图块左边缘相对于字符起点的偏移"""
+        self.tiles = stack[..., top * lh : bottom * lh, xs.min() : xs.max() + 1]
+        """形状为 (水平偏移数, 字符数, 覆盖的行数 * 行高, 图块宽度) 的数组"""
+        self.tiles.flags.writeable = False
+
+    @classmethod
+    @lru_cache
+    def create(cls) -> Optional["GlyphAtlas"]:
+        """字体不是等宽字体或行高不为整数时返回 ``None``"""
+        chars = "".join(sorted(set(gray_map)))
+        advances = {
+            Text2Image.from_text(c, font_size, font_families=font_families).longest_line
+            for c in chars.replace(" ", "")
+        }
+        t2m = Text2Image.from_text("@\n@", font_size, font_families=font_families)
+        line_height = t2m.height / 2
+        if len(advances) != 1 or not line_height.is_integer():
+            return None
+        return cls(chars, advances.pop(), int(line_height))
+
+    def render(self, text: np.ndarray) -> Image.Image:
+        """
+        把字符索引数组合成为字符画
+        :params
+          * ``text``: 二维数组，值为 ``self.chars`` 中的索引
+        :return
+          * 白底黑字的图片，尺寸与 `Text2Image` 排版结果一致
+        """
+        rows, cols = text.shape
+        space = self.chars.index(" ")
+        # 行尾的空格不计入行宽，但全为空格的行计入，其中最后一个空格后有换行时不计入
+        blank = text == space
+        line_len = 0
+        if not blank.all():
+            line_len = int(np.nonzero(~blank.all(axis=0))[0][-1]) + 1
+        if len(blank_rows := np.nonzero(blank.all(axis=1))[0]):
+            line_len = max(line_len, cols if blank_rows[-1] == rows - 1 else cols - 1)
+        width = math.ceil(line_len * self.advance)
+        lh = self.line_height
+        tile_w = self.tiles.shape[-1]
+        margin = max(-self.offset_x, 0)
+
+        # 画布按行分块，第 r 行文字位于第 r + 1 块，首尾各多一块
+        canvas = np.ones(
+            (rows + 2, lh, margin + width + tile_w + self.offset_x), dtype=np.float32
+        )
+        for col in range(line_len):
+            if blank[:, col].all():
+                continue
+            # 与 skia 相同，先加上 1/8 像素再向下取整到 1/4 像素
+            x = math.floor((col * self.advance + 0.125) * self.subpixels)
+            x0, subpixel = divmod(x, self.subpixels)
+            x0 += margin + self.offset_x
+            tiles = self.tiles[subpixel][text[:, col]]
+            for i in range(self.tiles.shape[2] // lh):
+                row = self.first_row + i + 1
+                canvas[row : row + rows, :, x0 : x0 + tile_w] *= tiles[
+                    :, i * lh : (i + 1) * lh
+                ]
+        canvas = canvas[1 : rows + 1].reshape(rows * lh, -1)
+        canvas = canvas[:, margin : margin + width]
+        gray = np.rint(canvas * 255).astype(np.uint8)
+        return Image.fromarray(gray, "L").convert("RGBA")
+
 
 def charpic(images: list[BuildImage], texts, args):
-    str_map = "@@$$&B88QMMGW##EE93SPPDOOU**==()+^,\"--''.  "
-    num = len(str_map)
-    t2m = Text2Image.from_text("@", 15, font_families=["Consolas"])
+    t2m = Text2Image.from_text("@", font_size, font_families=font_families)
     ratio = t2m.longest_line / t2m.height
+    atlas = GlyphAtlas.create()
+    if atlas is not None:
+        char_lut = np.array([atlas.chars.index(c) for c in gray_map], dtype=np.intp)
 
     def make(imgs: list[BuildImage]) -> BuildImage:
         img = imgs[0].convert("RGBA").resize_width(150).convert("L")
         img = img.resize((img.width, round(img.height * ratio)))
-        lines = []
-        for y in range(img.height):
-            line = ""
-            for x in range(img.width):
-                gray = img.image.getpixel((x, y))
-                line += str_map[int(num * gray / 256)] if gray != 0 else " "  # type: ignore
-            lines.append(line)
-        text = "\n".join(lines)
+        if atlas is not None:
+            return BuildImage(atlas.render(char_lut[np.asarray(img.image)]))
+
+        pixels = np.asarray(img.image).tolist()
+        text = "\n".join("".join(gray_map[gray] for gray in row) for row in pixels)
         return BuildImage(
-            Text2Image.from_text(text, 15, font_families=["Consolas"]).to_image(
+            Text2Image.from_text(text, font_size, font_families=font_families).to_image(
                 bg_color="white"
             )
         )
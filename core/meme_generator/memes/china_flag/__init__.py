@@ -4,13 +4,14 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def china_flag(images: list[BuildImage], texts, args):
     img = images[0].convert("RGBA")
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img.resize(frame.size, keep_ratio=True), below=True)
     return frame.save_jpg()
 
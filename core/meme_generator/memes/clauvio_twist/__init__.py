@@ -4,7 +4,12 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -37,7 +42,7 @@ def clauvio_twist(images: list[BuildImage], texts, args):
         def make(imgs: list[BuildImage]) -> BuildImage:
             img = imgs[0].convert("RGBA").resize((100, 100), keep_ratio=True).circle()
             angle, pos = params[i % 20]
-            bg = BuildImage.open(img_dir / f"{i}.png")
+            bg = open_template(img_dir / f"{i}.png")
             return bg.paste(img.rotate(angle), pos, alpha=True)
 
         return make
@@ -13,7 +13,7 @@ from meme_generator import (
     ParserOption,
     add_meme,
 )
-from meme_generator.utils import make_png_or_gif
+from meme_generator.utils import make_png_or_gif, open_template
 
 help_text = "小丑在前/后，front/behind"
 
@@ -52,13 +52,13 @@ img_dir = Path(__file__).parent / "images"
 
 def clown_mask(images: list[BuildImage], texts: list[str], args: Model):
     def make_front(imgs: list[BuildImage]) -> BuildImage:
-        frame = BuildImage.open(img_dir / "0.png")
+        frame = open_template(img_dir / "0.png")
         img = imgs[0].convert("RGBA").circle().resize((440, 440)).rotate(15)
         return frame.copy().paste(img, (16, 104), below=True)
 
     def make_behind(imgs: list[BuildImage]) -> BuildImage:
-        frame1 = BuildImage.open(img_dir / "1.png")
-        frame2 = BuildImage.open(img_dir / "2.png")
+        frame1 = open_template(img_dir / "1.png")
+        frame2 = open_template(img_dir / "2.png")
         img = (
             imgs[0]
             .convert("RGBA")
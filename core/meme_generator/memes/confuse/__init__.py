@@ -4,7 +4,12 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -15,7 +20,7 @@ def confuse(images: list[BuildImage], texts, args):
     def maker(i: int) -> Maker:
         def make(imgs: list[BuildImage]) -> BuildImage:
             img = imgs[0].convert("RGBA").resize_width(img_w)
-            frame = BuildImage.open(img_dir / f"{i}.png").resize(
+            frame = open_template(img_dir / f"{i}.png").resize(
                 img.size, keep_ratio=True
             )
             bg = BuildImage.new("RGB", img.size, "white")
@@ -5,6 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import MemeArgsModel, add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -26,7 +27,7 @@ def coupon(images: list[BuildImage], texts: list[str], args: MemeArgsModel):
     except ValueError:
         raise TextOverLength(text)
 
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img.rotate(22, expand=True), (164, 85), alpha=True)
     frame.paste(text_img.rotate(22, expand=True), (94, 108), alpha=True)
     return frame.save_jpg()
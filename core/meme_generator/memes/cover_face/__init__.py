@@ -4,6 +4,7 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -11,7 +12,7 @@ img_dir = Path(__file__).parent / "images"
 def cover_face(images: list[BuildImage], texts, args):
     points = ((15, 15), (448, 0), (445, 456), (0, 465))
     img = images[0].convert("RGBA").square().resize((450, 450)).perspective(points)
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img, (120, 150), below=True)
     return frame.save_jpg()
 
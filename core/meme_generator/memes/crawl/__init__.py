@@ -13,6 +13,7 @@ from meme_generator import (
     add_meme,
 )
 from meme_generator.exception import MemeFeedback
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -46,7 +47,7 @@ def crawl(images: list[BuildImage], texts: list[str], args: Model):
         raise MemeFeedback(f"图片编号错误，请选择 1~{total_num}")
 
     img = images[0].convert("RGBA").circle().resize((100, 100))
-    frame = BuildImage.open(img_dir / f"{num:02d}.jpg")
+    frame = open_template(img_dir / f"{num:02d}.jpg")
     frame.paste(img, (0, 400), alpha=True)
     return frame.save_jpg()
 
@@ -60,4 +61,5 @@ add_meme(
     keywords=["爬"],
     date_created=datetime(2021, 5, 5),
     date_modified=datetime(2023, 2, 14),
+    cacheable=False,
 )
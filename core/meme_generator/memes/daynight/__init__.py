@@ -4,6 +4,7 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -11,7 +12,7 @@ img_dir = Path(__file__).parent / "images"
 def daynight(images: list[BuildImage], texts, args):
     img = images[0].convert("RGBA").resize((333, 360), keep_ratio=True)
     img_ = images[1].convert("RGBA").resize((333, 360), keep_ratio=True)
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img, (349, 0))
     frame.paste(img_, (349, 361))
     return frame.save_jpg()
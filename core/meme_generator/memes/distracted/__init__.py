@@ -5,14 +5,14 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def distracted(images: list[BuildImage], texts, args):
-    frame = BuildImage.open(img_dir / "1.png")
-    label = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "1.png")
+    label = open_template(img_dir / "0.png")
 
     def make(imgs: list[BuildImage]) -> BuildImage:
         img = imgs[0].convert("RGBA").square().resize((500, 500))
@@ -7,7 +7,7 @@ from pil_utils import BuildImage
 from pydantic import Field
 
 from meme_generator import MemeArgsModel, MemeArgsType, ParserOption, add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -74,7 +74,7 @@ def dog_dislike(images: list[BuildImage], texts: list[str], args: Model):
         head = head.circle()
     frames: list[IMG] = []
     for i in range(34):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         frame.paste(head, location[i], alpha=True)
         frames.append(frame.image)
     return save_gif(frames, 0.08)
@@ -4,13 +4,13 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def dog_of_vtb(images: list[BuildImage], texts, args):
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
 
     def make(imgs: list[BuildImage]) -> BuildImage:
         points = ((0, 0), (579, 0), (584, 430), (5, 440))
@@ -2,12 +2,13 @@ import random
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 from PIL.Image import Image as IMG
 from PIL.Image import Palette
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import cache_map, make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -24,9 +25,14 @@ def get_dominant_colors(img: IMG) -> list[tuple[int, int, int]]:
     return colors  # type: ignore
 
 
+@cache_map
+def block_mask() -> np.ndarray:
+    return np.asarray(open_template(img_dir / "mask.png").convert("L").image)
+
+
 def dont_touch(images: list[BuildImage], texts, args):
-    frame = BuildImage.open(img_dir / "0.png")
-    mask = BuildImage.open(img_dir / "mask.png").convert("L")
+    frame = open_template(img_dir / "0.png")
+    mask = block_mask()
 
     def paste_random_blocks(img: BuildImage, colors: list[tuple[int, int, int]]):
         x1, y1, x2, y2 = 200, 300, 400, 650
@@ -34,7 +40,7 @@ def dont_touch(images: list[BuildImage], texts, args):
         for _ in range(150):
             x = random.randint(x1, x2)
             y = random.randint(y1, y2)
-            if mask.image.getpixel((x, y)) == 0:
+            if mask[y, x] == 0:
                 continue
             if any(abs(x - x_) < 13 and abs(y - y_) < 13 for x_, y_ in block_locs):
                 continue
@@ -52,7 +58,7 @@ def dont_touch(images: list[BuildImage], texts, args):
         img = img.convert("RGBA").resize((250, 250), keep_ratio=True, inside=True)
         return img_frame.paste(img, (25, 460), alpha=True)
 
-    return make_jpg_or_gif(images, make)
+    return make_jpg_or_gif(images, make, sequential=True)
 
 
 add_meme(
@@ -63,4 +69,5 @@ add_meme(
     keywords=["别碰"],
     date_created=datetime(2023, 4, 27),
     date_modified=datetime(2023, 4, 27),
+    cacheable=False,
 )
@@ -77,4 +77,5 @@ add_meme(
     keywords=["douyin"],
     date_created=datetime(2022, 10, 29),
     date_modified=datetime(2023, 2, 14),
+    cacheable=False,
 )
@@ -1,11 +1,12 @@
 import datetime
 import random
 
+import numpy as np
 from PIL import Image, ImageDraw
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import Maker, make_gif_or_combined_gif
+from meme_generator.utils import Maker, cache_map, make_gif_or_combined_gif
 
 
 class Dot:
@@ -65,6 +66,18 @@ def make_dust(dusts: list[Dot], step: int, size: tuple[int, int]) -> Image.Image
     return dust_mask
 
 
+@cache_map
+def distance_map(width: int, height: int) -> np.ndarray:
+    """每个像素到消散中心的距离"""
+    o = (width * 2 // 3, height * 3 // 2)
+    x = np.arange(width)[None, :] - o[0]
+    y = np.arange(height)[:, None] - o[1]
+    squares, inverse = np.unique(x**2 + y**2, return_inverse=True)
+    # 用 Python 的幂运算开方，np.sqrt 在个别值上与之相差 1 ulp
+    roots = np.array([square**0.5 for square in squares.tolist()])
+    return roots[inverse].reshape(height, width)
+
+
 def fade_away(images: list[BuildImage], texts, args):
     image = images[0]
     width, height = image.size
@@ -82,36 +95,42 @@ def fade_away(images: list[BuildImage], texts, args):
             if i <= 9:
                 return BuildImage(img)
             elif 9 < i < 28:
-                new_img = img.copy()
-                for x in range(width):
-                    for y in range(
-                        max(0, min(height, height - round(step * (i + 11)))), height
-                    ):
-                        pixel = (x, y)
-                        if img.getpixel(pixel)[3] == 0:  # type: ignore
-                            continue
-                        distance = ((x - o[0]) ** 2 + (y - o[1]) ** 2) ** 0.5
-                        if distance <= step * (i - 5):
-                            new_img.putpixel(pixel, (0, 0, 0, 0))
-                        elif distance <= step * (i - 4):
-                            new_img.putpixel(pixel, (0, 0, 0, 255))
-                            if random.random() <= 0.06:
-                                direction = (
-                                    (x - o[0]) / distance,
-                                    (y - o[1] * 1.5) / distance,
-                                )
-                                dusts.append(Dot((x, y), direction))
-                        elif distance <= step * (i + 2):
-                            factor = (distance - step * (i - 11)) / (step * 12)
-                            factor = max(0, min(1, factor))
-                            factor *= 0.9 + 0.2 * random.random()
-                            value = img.getpixel(pixel)
-                            gray = (value[0] + value[1] + value[2]) / 3  # type: ignore
-                            gray = round(gray * factor)
-                            new_color = (gray, gray, gray, value[3])  # type: ignore
-                            new_img.putpixel(pixel, new_color)
-                        else:
-                            continue
+                pixels = np.asarray(img)
+                new_pixels = pixels.copy()
+                distance = distance_map(width, height)
+                y_start = max(0, min(height, height - round(step * (i + 11))))
+                active = np.zeros((height, width), dtype=bool)
+                active[y_start:] = pixels[y_start:, :, 3] != 0
+                clear = active & (distance <= step * (i - 5))
+                edge = active & ~clear & (distance <= step * (i - 4))
+                fade = active & ~clear & ~edge & (distance <= step * (i + 2))
+                new_pixels[clear] = (0, 0, 0, 0)
+                new_pixels[edge] = (0, 0, 0, 255)
+
+                # 随机数按逐列、逐行的像素顺序生成，保证同样的随机种子得到同样的结果
+                xs, ys = np.nonzero((edge | fade).T)
+                is_edge = edge[ys, xs]
+                randoms = np.zeros(len(xs))
+                for n, (x, y, e) in enumerate(
+                    zip(xs.tolist(), ys.tolist(), is_edge.tolist())
+                ):
+                    randoms[n] = random.random()
+                    if e and randoms[n] <= 0.06:
+                        d = distance[y, x]
+                        direction = ((x - o[0]) / d, (y - o[1] * 1.5) / d)
+                        dusts.append(Dot((x, y), direction))
+
+                is_fade = ~is_edge
+                xs, ys = xs[is_fade], ys[is_fade]
+                factor = (distance[ys, xs] - step * (i - 11)) / (step * 12)
+                factor = np.clip(factor, 0, 1)
+                factor *= 0.9 + 0.2 * randoms[is_fade]
+                value = pixels[ys, xs].astype(int)
+                gray = (value[:, 0] + value[:, 1] + value[:, 2]) / 3
+                gray = np.clip(np.rint(gray * factor), 0, 255).astype(np.uint8)
+                new_pixels[ys, xs] = np.stack([gray, gray, gray, value[:, 3]], axis=1)
+
+                new_img = Image.fromarray(new_pixels, "RGBA")
                 dust_mask = make_dust(dusts, step, img.size)
                 new_img.paste(dust_mask, (0, 0), dust_mask)
                 return BuildImage(new_img)
@@ -120,7 +139,8 @@ def fade_away(images: list[BuildImage], texts, args):
 
         return make
 
-    return make_gif_or_combined_gif(images, maker, 35, 0.08)
+    # 尘埃在各帧之间共用，每帧都会移动之前生成的尘埃
+    return make_gif_or_combined_gif(images, maker, 35, 0.08, sequential=True)
 
 
 add_meme(
@@ -131,4 +151,5 @@ add_meme(
     keywords=["灰飞烟灭"],
     date_created=datetime.datetime(2024, 8, 20),
     date_modified=datetime.datetime(2024, 8, 21),
+    cacheable=False,
 )
@@ -5,7 +5,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -27,7 +27,7 @@ def fencing(images: list[BuildImage], texts, args):
     # fmt: on
     frames: list[IMG] = []
     for i in range(19):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         frame.paste(user_head, user_locs[i], alpha=True)
         frame.paste(self_head, self_locs[i], alpha=True)
         frames.append(frame.image)
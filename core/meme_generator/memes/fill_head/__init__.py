@@ -5,7 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import CommandShortcut, MemeArgsModel, add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -13,7 +13,7 @@ img_dir = Path(__file__).parent / "images"
 def fill_head(images: list[BuildImage], texts: list[str], args: MemeArgsModel):
     name = texts[0] if texts else (args.user_infos[0].name if args.user_infos else "它")
     text = f"满脑子都是{name}"
-    frame = BuildImage.open(img_dir / "0.jpg")
+    frame = open_template(img_dir / "0.jpg")
     try:
         frame.draw_text(
             (20, 458, frame.width - 20, 550), text, max_fontsize=65, min_fontsize=30
@@ -1,16 +1,15 @@
 from datetime import datetime
 from pathlib import Path
 
-from pil_utils import BuildImage
-
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def find_chips(images, texts: list[str], args):
-    frame = BuildImage.open(img_dir / "0.jpg")
+    frame = open_template(img_dir / "0.jpg")
 
     def draw(pos: tuple[float, float, float, float], text: str):
         try:
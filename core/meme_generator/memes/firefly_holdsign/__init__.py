@@ -14,6 +14,7 @@ from meme_generator import (
 )
 from meme_generator.exception import MemeFeedback, TextOverLength
 from meme_generator.tags import MemeTags
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -71,7 +72,7 @@ def firefly_holdsign(images, texts: list[str], args: Model):
         ((255, 106), (50, 254), ((2, 4), (256, 0), (257, 106), (0, 106))),
     ]
     size, loc, points = params[num - 1]
-    frame = BuildImage.open(img_dir / f"{num:02d}.png")
+    frame = open_template(img_dir / f"{num:02d}.png")
     text_img = BuildImage.new("RGBA", size)
     padding = 10
     try:
@@ -102,4 +103,5 @@ add_meme(
     tags=MemeTags.firefly,
     date_created=datetime(2024, 5, 5),
     date_modified=datetime(2024, 5, 6),
+    cacheable=False,
 )
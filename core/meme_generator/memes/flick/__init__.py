@@ -12,6 +12,7 @@ from meme_generator.utils import (
     from_skia_image,
     make_gif_or_combined_gif,
     new_skia_surface,
+    open_template,
     skia_sampling_options,
     to_skia_image,
 )
@@ -53,7 +54,7 @@ def flick(images: list[BuildImage], texts, args):
             if i < 3:
                 return img
             elif i < 12:
-                hand = BuildImage.open(img_dir / f"{i - 3}.png")
+                hand = open_template(img_dir / f"{i - 3}.png")
                 return img.paste(hand, (0, 0), alpha=True)
             else:
                 width, height = img.size
@@ -89,7 +90,7 @@ def flick(images: list[BuildImage], texts, args):
                 canvas.drawPaint(paint)
                 frame = BuildImage(from_skia_image(surface.makeImageSnapshot()))
                 if i == 12:
-                    hand = BuildImage.open(img_dir / f"{i - 3}.png")
+                    hand = open_template(img_dir / f"{i - 3}.png")
                     frame.paste(hand, (0, 0), alpha=True)
                 return frame
 
@@ -5,7 +5,7 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import Maker, make_gif_or_combined_gif
+from meme_generator.utils import Maker, make_gif_or_combined_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -20,7 +20,7 @@ def flush(images: list[BuildImage], texts, args):
             w, h = img.size
 
             if i >= 18:
-                frame = BuildImage.open(img_dir / f"{i - 18}.png")
+                frame = open_template(img_dir / f"{i - 18}.png")
                 return frame.resize((w, h))
 
             j = 0.2 * (2 * random.random() - 1)  # 抖动
@@ -41,7 +41,7 @@ def flush(images: list[BuildImage], texts, args):
 
         return make
 
-    return make_gif_or_combined_gif(images, maker, 30, 0.08)
+    return make_gif_or_combined_gif(images, maker, 30, 0.08, sequential=True)
 
 
 add_meme(
@@ -52,4 +52,5 @@ add_meme(
     keywords=["红温"],
     date_created=datetime(2024, 9, 3),
     date_modified=datetime(2024, 9, 3),
+    cacheable=False,
 )
@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 
 from meme_generator import MemeArgsModel, add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import make_png_or_gif
+from meme_generator.utils import make_png_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -17,7 +17,7 @@ default_text = "兄弟，回南了"
 def fogging(images: list[BuildImage], texts: list[str], args: MemeArgsModel):
     img_w = min(images[0].width, 500)
     img_h = int(images[0].height * img_w / images[0].width)
-    mask = BuildImage.open(img_dir / "0.png").resize((img_w, img_h), keep_ratio=True)
+    mask = open_template(img_dir / "0.png").resize((img_w, img_h), keep_ratio=True)
     text = texts[0] if texts else default_text
     try:
         mask.draw_text((10, 10, mask.width - 10, 80), text, max_fontsize=40)
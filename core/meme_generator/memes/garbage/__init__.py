@@ -5,7 +5,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -21,7 +21,7 @@ def garbage(images: list[BuildImage], texts, args):
     # fmt: on
     frames: list[IMG] = []
     for i in range(25):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         frame.paste(img, locs[i], below=True)
         frames.append(frame.image)
     return save_gif(frames, 0.04)
@@ -15,7 +15,12 @@ from meme_generator import (
 )
 from meme_generator.exception import MemeFeedback
 from meme_generator.tags import MemeTags
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -52,7 +57,7 @@ def genshin_eat(images: list[BuildImage], texts, args: Model):
 
     def maker(i: int) -> Maker:
         def make(imgs: list[BuildImage]) -> BuildImage:
-            chara = BuildImage.open(img_dir / name / f"{i:02d}.png")
+            chara = open_template(img_dir / name / f"{i:02d}.png")
             if i in range(4, 9):
                 food = (
                     imgs[0].convert("RGBA").circle().resize((44, 44), keep_ratio=True)
@@ -96,4 +101,5 @@ add_meme(
     | MemeTags.zhongli,
     date_created=datetime(2024, 8, 6),
     date_modified=datetime(2024, 8, 10),
+    cacheable=False,
 )
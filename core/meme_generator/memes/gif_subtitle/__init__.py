@@ -1,14 +1,15 @@
 from datetime import datetime
 from pathlib import Path
 
-from pil_utils import BuildImage
-
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template_gif, save_gif, template_palette
 
 img_dir = Path(__file__).parent / "images"
 
+# 白字黑边的字幕，保留灰阶以免文字边缘失真
+subtitle_colors = [(i, i, i) for i in range(0, 256, 17)]
+
 
 def make_gif(
     key: str,
@@ -18,12 +19,7 @@ def make_gif(
     padding_x: int = 5,
     padding_y: int = 5,
 ):
-    img = BuildImage.open(img_dir / f"{key}.gif").image
-    frames: list[BuildImage] = []
-    n_frames = getattr(img, "n_frames", 1)
-    for i in range(n_frames):
-        img.seek(i)
-        frames.append(BuildImage(img.convert("RGB")))
+    frames, duration = open_template_gif(img_dir / f"{key}.gif", mode="RGB")
 
     parts = [frames[start:end] for start, end in pieces]
     for part, text in zip(parts, texts):
@@ -42,7 +38,8 @@ def make_gif(
             except ValueError:
                 raise TextOverLength(text)
 
-    return save_gif([frame.image for frame in frames], img.info["duration"] / 1000)
+    palette = template_palette(img_dir / f"{key}.gif", extra_colors=subtitle_colors)
+    return save_gif([frame.image for frame in frames], duration, palette)
 
 
 def add_gif_meme(
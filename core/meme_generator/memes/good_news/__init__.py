@@ -1,17 +1,16 @@
 from datetime import datetime
 from pathlib import Path
 
-from pil_utils import BuildImage
-
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def good_news(images, texts: list[str], args):
     text = texts[0]
-    frame = BuildImage.open(img_dir / "0.jpg")
+    frame = open_template(img_dir / "0.jpg")
     try:
         frame.draw_text(
             (50, 100, frame.width - 50, frame.height - 100),
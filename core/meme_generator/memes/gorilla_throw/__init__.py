@@ -4,7 +4,12 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -29,7 +34,7 @@ def gorilla_throw(images: list[BuildImage], texts, args):
 
     def maker(i: int) -> Maker:
         def make(imgs: list[BuildImage]) -> BuildImage:
-            frame = BuildImage.open(img_dir / f"{i:02d}.png")
+            frame = open_template(img_dir / f"{i:02d}.png")
             if i < 28:
                 return frame
             x, y, w, h, a = params[i - 28]
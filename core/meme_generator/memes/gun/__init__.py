@@ -14,6 +14,7 @@ from meme_generator import (
     ParserOption,
     add_meme,
 )
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -53,7 +54,7 @@ args_type = MemeArgsType(
 
 def gun(images: list[BuildImage], texts, args: Model):
     frame = images[0].convert("RGBA").resize((500, 500), keep_ratio=True)
-    gun = BuildImage.open(img_dir / "0.png")
+    gun = open_template(img_dir / "0.png")
     position = args.position
     left = position in ["left", "both"]
     right = position in ["right", "both"]
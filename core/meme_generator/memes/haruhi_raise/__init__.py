@@ -5,13 +5,13 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import make_png_or_gif
+from meme_generator.utils import make_png_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def haruhi_raise(images: list[BuildImage], texts: list[str], args):
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
 
     def make(imgs: list[BuildImage]) -> BuildImage:
         img = imgs[0].convert("RGBA").resize((250, 180), keep_ratio=True)
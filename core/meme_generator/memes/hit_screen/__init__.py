@@ -4,7 +4,12 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -32,7 +37,7 @@ def hit_screen(images: list[BuildImage], texts, args):
     def maker(i: int) -> Maker:
         def make(imgs: list[BuildImage]) -> BuildImage:
             img = imgs[0].convert("RGBA").resize((140, 120), keep_ratio=True)
-            frame = BuildImage.open(img_dir / f"{i}.png")
+            frame = open_template(img_dir / f"{i}.png")
             if 6 <= i < 22:
                 points, pos = params[i - 6]
                 frame.paste(img.perspective(points), pos, below=True)
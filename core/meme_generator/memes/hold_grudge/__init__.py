@@ -5,6 +5,7 @@ from pil_utils import BuildImage, Text2Image
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -17,7 +18,7 @@ def hold_grudge(images, texts: list[str], args):
         raise TextOverLength(texts[0])
     text_img = text2image.to_image()
 
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     bg = BuildImage.new(
         "RGB", (frame.width, frame.height + text_img.height + 20), "white"
     )
@@ -5,7 +5,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -26,7 +26,7 @@ def hug(images: list[BuildImage], texts, args):
     # fmt: on
     frames: list[IMG] = []
     for i in range(10):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         frame.paste(user_head, user_locs[i], below=True)
         img = self_head.rotate(rotate_num[i], expand=True)
         frame.paste(img, self_locs[i], below=True)
@@ -6,6 +6,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -13,7 +14,7 @@ defalut_text = "你刚才说的话不是很礼貌！"
 
 
 def incivilization(images: list[BuildImage], texts: list[str], args):
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     points = ((0, 20), (154, 0), (164, 153), (22, 180))
     img = images[0].convert("RGBA").circle().resize((150, 150)).perspective(points)
     image = ImageEnhance.Brightness(img.image).enhance(0.8)
@@ -5,6 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -16,7 +17,7 @@ def interview(images: list[BuildImage], texts: list[str], args):
         self_img = images[0]
         user_img = images[1]
     else:
-        self_img = BuildImage.open(img_dir / "huaji.png")
+        self_img = open_template(img_dir / "huaji.png")
         user_img = images[0]
     self_img = self_img.convert("RGBA").square().resize((124, 124))
     user_img = user_img.convert("RGBA").square().resize((124, 124))
@@ -24,7 +25,7 @@ def interview(images: list[BuildImage], texts: list[str], args):
     text = texts[0] if texts else defalut_text
 
     frame = BuildImage.new("RGBA", (600, 310), "white")
-    microphone = BuildImage.open(img_dir / "microphone.png")
+    microphone = open_template(img_dir / "microphone.png")
     frame.paste(microphone, (330, 103), alpha=True)
     frame.paste(self_img, (419, 40), alpha=True)
     frame.paste(user_img, (57, 40), alpha=True)
@@ -5,13 +5,13 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import make_png_or_gif
+from meme_generator.utils import make_png_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def jerry_stare(images: list[BuildImage], texts, args):
-    jerry = BuildImage.open(img_dir / "0.png").convert("RGBA")
+    jerry = open_template(img_dir / "0.png").convert("RGBA")
 
     def make(imgs: list[BuildImage]) -> BuildImage:
         img = imgs[0].convert("RGBA").circle().resize((150, 150), keep_ratio=True)
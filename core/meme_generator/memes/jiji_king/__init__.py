@@ -8,6 +8,7 @@ from pydantic import Field
 
 from meme_generator import MemeArgsModel, MemeArgsType, ParserOption, add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -56,7 +57,7 @@ def jiji_king(images: list[BuildImage], texts: list[str], args: Model):
         text = texts[-1]
 
     frame = BuildImage.new("RGBA", (10 + 100 * block_num, 400), "white")
-    king = BuildImage.open(img_dir / "0.png")
+    king = open_template(img_dir / "0.png")
     head = images[0].convert("RGBA").square().resize((125, 125))
     if args.circle:
         head = head.circle()
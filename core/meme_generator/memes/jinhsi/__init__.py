@@ -2,7 +2,6 @@ import random
 from datetime import datetime
 from pathlib import Path
 
-from pil_utils import BuildImage
 from pydantic import Field
 
 from meme_generator import (
@@ -14,6 +13,7 @@ from meme_generator import (
 )
 from meme_generator.exception import MemeFeedback, TextOverLength
 from meme_generator.tags import MemeTags
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -48,7 +48,7 @@ def jinhsi(images, texts: list[str], args: Model):
         raise MemeFeedback(f"图片编号错误，请选择 1~{total_num}")
 
     paddings = (55, 43, 50, 36, 40, 33, 36, 38, 33, 46, 26, 33, 28)
-    frame = BuildImage.open(img_dir / f"{num:02d}.png")
+    frame = open_template(img_dir / f"{num:02d}.png")
     padding = paddings[num - 1]
 
     try:
@@ -78,4 +78,5 @@ add_meme(
     tags=MemeTags.jinhsi,
     date_created=datetime(2024, 12, 7),
     date_modified=datetime(2024, 12, 7),
+    cacheable=False,
 )
@@ -5,7 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import Maker, make_gif_or_combined_gif
+from meme_generator.utils import Maker, make_gif_or_combined_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -17,7 +17,7 @@ def jiubingfufa(images: list[BuildImage], texts: list[str], args):
 
     def maker(i: int) -> Maker:
         def make(imgs: list[BuildImage]) -> BuildImage:
-            frame = BuildImage.open(img_dir / f"{i}.jpg").convert("RGBA")
+            frame = open_template(img_dir / f"{i}.jpg").convert("RGBA")
             img = imgs[0].convert("RGBA").circle().resize((120, 120))
             frame.paste(img, (32, frame.height - 162), alpha=True)
             if i > 9:
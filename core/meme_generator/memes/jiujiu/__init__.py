@@ -5,7 +5,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -14,7 +14,7 @@ def jiujiu(images: list[BuildImage], texts, args):
     img = images[0].convert("RGBA").resize((75, 51), keep_ratio=True)
     frames: list[IMG] = []
     for i in range(8):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         frame.paste(img, below=True)
         frames.append(frame.image)
     return save_gif(frames, 0.06)
@@ -5,13 +5,14 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def karyl_point(images: list[BuildImage], texts, args):
     img = images[0].convert("RGBA").rotate(7.5, expand=True).resize((225, 225))
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img, (87, 790), alpha=True)
     return frame.save_png()
 
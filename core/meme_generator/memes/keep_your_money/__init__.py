@@ -14,7 +14,7 @@ from meme_generator import (
 )
 from meme_generator.exception import MemeFeedback
 from meme_generator.tags import MemeTags
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -44,7 +44,7 @@ def keep_your_money(images: list[BuildImage], texts: list[str], args: Model):
         number = args.number
     else:
         raise MemeFeedback("图片编号错误，请输入1或2")
-    frame = BuildImage.open(img_dir / f"{number}.png")
+    frame = open_template(img_dir / f"{number}.png")
 
     def make(imgs: list[BuildImage]) -> BuildImage:
         img = (
@@ -67,4 +67,5 @@ add_meme(
     tags=MemeTags.arona | MemeTags.plana,
     date_created=datetime(2024, 12, 29),
     date_modified=datetime(2024, 12, 31),
+    cacheable=False,
 )
@@ -7,7 +7,12 @@ from pydantic import Field
 
 from meme_generator import MemeArgsModel, MemeArgsType, ParserOption, add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -49,7 +54,7 @@ def kirby_hammer(images: list[BuildImage], texts, args: Model):
             img = img.resize_height(80)
             if img.width < 80:
                 img = img.resize((80, 80), keep_ratio=True)
-            frame = BuildImage.open(img_dir / f"{i}.png")
+            frame = open_template(img_dir / f"{i}.png")
             if i <= 18:
                 x, y = positions[i]
                 x = x + 40 - img.width // 2
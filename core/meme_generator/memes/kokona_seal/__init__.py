@@ -14,6 +14,7 @@ from meme_generator import (
 )
 from meme_generator.exception import MemeFeedback, TextOverLength
 from meme_generator.tags import MemeTags
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -47,7 +48,7 @@ def kokona_seal(images, texts: list[str], args: Model):
         raise MemeFeedback("图片编号错误，请选择 1~12")
     size = (320, 155)
     loc = (75, 25)
-    frame = BuildImage.open(img_dir / f"{num}.png")
+    frame = open_template(img_dir / f"{num}.png")
     text_img = BuildImage.new("RGBA", size)
     padding = 10
     try:
@@ -78,4 +79,5 @@ add_meme(
     tags=MemeTags.kokona,
     date_created=datetime(2024, 11, 5),
     date_modified=datetime(2024, 11, 22),
+    cacheable=False,
 )
@@ -5,7 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -14,7 +14,7 @@ default_text = "偷学群友数理基础"
 
 def learn(images: list[BuildImage], texts: list[str], args):
     text = texts[0] if texts else default_text
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     try:
         frame.draw_text(
             (100, 1360, frame.width - 100, 1730),
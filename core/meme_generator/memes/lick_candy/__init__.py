@@ -4,7 +4,12 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -107,7 +112,7 @@ def lick_candy(images: list[BuildImage], texts, args):
     def maker(i: int) -> Maker:
         def make(imgs: list[BuildImage]) -> BuildImage:
             img = imgs[0].convert("RGBA").resize((76, 76)).circle().rotate(90)
-            bg = BuildImage.open(img_dir / f"{i}.png")
+            bg = open_template(img_dir / f"{i}.png")
             if i not in [19, 20, 27, 28]:
                 points, pos = params[i]
                 bg.paste(img.perspective(points), pos, alpha=True)
@@ -4,13 +4,14 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def lim_x_0(images: list[BuildImage], texts, args):
     img = images[0]
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     img_c = img.convert("RGBA").circle().resize((72, 72))
     img_tp = img.convert("RGBA").circle().resize((51, 51))
     frame.paste(img_tp, (948, 247), alpha=True)
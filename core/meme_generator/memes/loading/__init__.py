@@ -5,7 +5,7 @@ from PIL import ImageFilter
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -15,7 +15,7 @@ def loading(images: list[BuildImage], texts, args):
     img_big = img_big.filter(ImageFilter.GaussianBlur(radius=3))
     h1 = img_big.height
     mask = BuildImage.new("RGBA", img_big.size, (0, 0, 0, 32))
-    icon = BuildImage.open(img_dir / "icon.png")
+    icon = open_template(img_dir / "icon.png")
     img_big.paste(mask, alpha=True).paste(icon, (200, int(h1 / 2) - 50), alpha=True)
 
     def make(imgs: list[BuildImage]) -> BuildImage:
@@ -5,7 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -14,7 +14,7 @@ default_text = "朋友\n先看看这个图标再说话"
 
 def look_this_icon(images: list[BuildImage], texts: list[str], args):
     text = texts[0] if texts else default_text
-    frame = BuildImage.open(img_dir / "nmsl.png")
+    frame = open_template(img_dir / "nmsl.png")
     try:
         frame.draw_text(
             (0, 933, 1170, 1143),
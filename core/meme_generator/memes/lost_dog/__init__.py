@@ -2,31 +2,39 @@ import math
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
+from meme_generator.utils import cache_map, open_template, remap_image
 
 img_dir = Path(__file__).parent / "images"
 
 
+k = 2
+w_ = 663 * k
+w = 540 * k
+h = 540 * k
+r = 466 * k
+
+
+@cache_map
+def lens_map() -> tuple[np.ndarray, np.ndarray]:
+    # cos 用 math 逐列计算，保证与逐像素计算的结果一致
+    cos = np.array([math.cos(math.asin(abs(x - w / 2) / r)) for x in range(w)])
+    x = np.arange(w)[None, :]
+    y = np.arange(h)[:, None]
+    map_x = np.rint(w_ / 2 + (x - w / 2) / cos[None, :]).astype(int)
+    map_y = np.rint(h / 2 + (y - h / 2) / cos[None, :]).astype(int)
+    return np.broadcast_to(map_x, (h, w)), map_y
+
+
 def lost_dog(images: list[BuildImage], texts, args):
-    k = 2
-    w_ = 663 * k
-    w = 540 * k
-    h = 540 * k
-    r = 466 * k
     img = images[0].convert("RGBA").resize((w_, h), keep_ratio=True)
-    img_new = BuildImage.new("RGBA", (w, h))
-    for x in range(w):
-        for y in range(h):
-            theta = math.asin(abs(x - w / 2) / r)
-            x_ = round(w_ / 2 + (x - w / 2) / math.cos(theta))
-            y_ = round(h / 2 + (y - h / 2) / math.cos(theta))
-            if 0 <= x_ < w_ and 0 <= y_ < h:
-                img_new.image.putpixel((x, y), img.image.getpixel((x_, y_)))  # type: ignore
+    img_new = BuildImage(remap_image(img.image, *lens_map()))
     img_new = img_new.resize((w // k, h // k))
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img_new, (295, 165), below=True)
     return frame.save_jpg()
 
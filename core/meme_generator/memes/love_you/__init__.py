@@ -5,7 +5,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -15,7 +15,7 @@ def love_you(images: list[BuildImage], texts, args):
     frames: list[IMG] = []
     locs = [(68, 65, 70, 70), (63, 59, 80, 80)]
     for i in range(2):
-        heart = BuildImage.open(img_dir / f"{i}.png")
+        heart = open_template(img_dir / f"{i}.png")
         frame = BuildImage.new("RGBA", heart.size, "white")
         x, y, w, h = locs[i]
         frame.paste(img.resize((w, h)), (x, y), alpha=True).paste(heart, alpha=True)
@@ -5,7 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -24,7 +24,7 @@ def mahiro_readbook(images: list[BuildImage], texts, args):
 
     frames = []
     for i in range(48):
-        bg = BuildImage.open(img_dir / f"{i}.png")
+        bg = open_template(img_dir / f"{i}.png")
         frame = BuildImage.new("RGBA", (240, 240), "white")
         frame.paste(img, positions[min(max(i - 16, 0), 5)], alpha=True).paste(
             bg, alpha=True
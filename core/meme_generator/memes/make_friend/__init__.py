@@ -5,6 +5,7 @@ from pil_utils import BuildImage, Text2Image
 
 from meme_generator import MemeArgsModel, add_meme
 from meme_generator.exception import TextOrNameNotEnough, TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -16,7 +17,7 @@ def make_friend(images: list[BuildImage], texts: list[str], args: MemeArgsModel)
         raise TextOrNameNotEnough()
     name = texts[0] if texts else args.user_infos[0].name
 
-    bg = BuildImage.open(img_dir / "0.png")
+    bg = open_template(img_dir / "0.png")
     frame = img.resize_width(1000)
     frame.paste(
         img.resize_width(250).rotate(9, expand=True),
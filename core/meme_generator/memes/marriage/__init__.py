@@ -4,6 +4,7 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -16,8 +17,8 @@ def marriage(images: list[BuildImage], texts, args):
     elif img_w < 800:
         img_h = int(img_h * img_w / 800)
     frame = img.resize_canvas((img_w, img_h)).resize_height(1080)
-    left = BuildImage.open(img_dir / "0.png")
-    right = BuildImage.open(img_dir / "1.png")
+    left = open_template(img_dir / "0.png")
+    right = open_template(img_dir / "1.png")
     frame.paste(left, alpha=True).paste(
         right, (frame.width - right.width, 0), alpha=True
     )
@@ -4,14 +4,14 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import make_png_or_gif
+from meme_generator.utils import make_png_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def mihoyo(images: list[BuildImage], texts, args):
     mask = BuildImage.new("RGBA", (500, 60), (53, 49, 65, 230))
-    logo = BuildImage.open(img_dir / "logo.png").resize_height(50)
+    logo = open_template(img_dir / "logo.png").resize_height(50)
 
     def make(imgs: list[BuildImage]) -> BuildImage:
         img = imgs[0].convert("RGBA").resize((500, 500), keep_ratio=True)
@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 from pydantic import Field
 
 from meme_generator import MemeArgsModel, MemeArgsType, ParserOption, add_meme
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -32,7 +32,7 @@ args_type = MemeArgsType(
 
 
 def mourning(images: list[BuildImage], texts, args: Model):
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
 
     def make(imgs: list[BuildImage]) -> BuildImage:
         img = imgs[0]
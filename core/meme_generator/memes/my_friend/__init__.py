@@ -12,6 +12,7 @@ from meme_generator import (
     add_meme,
 )
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -43,11 +44,11 @@ def my_friend(images: list[BuildImage], texts: list[str], args: Model):
     if name_w >= 600:
         raise TextOverLength(name)
 
-    corner1 = BuildImage.open(img_dir / "corner1.png")
-    corner2 = BuildImage.open(img_dir / "corner2.png")
-    corner3 = BuildImage.open(img_dir / "corner3.png")
-    corner4 = BuildImage.open(img_dir / "corner4.png")
-    label = BuildImage.open(img_dir / "label.png")
+    corner1 = open_template(img_dir / "corner1.png")
+    corner2 = open_template(img_dir / "corner2.png")
+    corner3 = open_template(img_dir / "corner3.png")
+    corner4 = open_template(img_dir / "corner4.png")
+    label = open_template(img_dir / "label.png")
 
     def make_dialog(text: str) -> BuildImage:
         text_img = Text2Image.from_text(text, 40).wrap(600).to_image()
@@ -12,6 +12,7 @@ from meme_generator import (
     add_meme,
 )
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -84,7 +85,7 @@ def my_wife(images: list[BuildImage], texts, args: Model):
     except ValueError:
         raise TextOverLength(name)
 
-    img_point = BuildImage.open(img_dir / "point.png").resize_width(200)
+    img_point = open_template(img_dir / "point.png").resize_width(200)
     frame.paste(img_point, (421, img_h + 270))
 
     return frame.save_jpg()
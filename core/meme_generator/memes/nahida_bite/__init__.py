@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -25,7 +25,7 @@ def nahida_bite(images: list[BuildImage], texts, args):
     # fmt: on
     frames: list[IMG] = []
     for i in range(38):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         x, y, w, h = locs[i % len(locs)]
         frame.paste(img.resize((w, h)), (x, y), below=True)
         frames.append(frame.image)
@@ -5,6 +5,7 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -19,7 +20,7 @@ def name_generator(images: list[BuildImage], texts, args):
     color = random.choice(colors)
     name = random.choice(el1) + random.choice(el2) + random.choice(el3)
     frame = BuildImage.new("RGB", (900, 900), (225, 225, 225))
-    title = BuildImage.open(img_dir / "title.png").resize((700, 200))
+    title = open_template(img_dir / "title.png").resize((700, 200))
     frame.paste(title, (100, 0), alpha=True)
     img = images[0].convert("RGBA").resize((490, 490), keep_ratio=True)
     frame.paste(img, (310, 235), alpha=True)
@@ -45,4 +46,5 @@ add_meme(
     keywords=["亚文化取名机", "亚名"],
     date_created=datetime(2023, 2, 4),
     date_modified=datetime(2023, 2, 14),
+    cacheable=False,
 )
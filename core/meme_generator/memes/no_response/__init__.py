@@ -4,13 +4,14 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def no_response(images: list[BuildImage], texts, args):
     img = images[0].convert("RGBA").resize((1050, 783), keep_ratio=True)
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img, (0, 581), below=True)
     return frame.save_jpg()
 
@@ -4,6 +4,7 @@ from pathlib import Path
 from pil_utils import BuildImage, Text2Image
 
 from meme_generator import add_meme
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -26,7 +27,7 @@ def nokia(images, texts: list[str], args):
     ).to_image()
     head_img = BuildImage(head_img).rotate(-9.3, expand=True)
 
-    frame = BuildImage.open(img_dir / "0.jpg")
+    frame = open_template(img_dir / "0.jpg")
     frame.paste(text_img, (205, 330), alpha=True)
     frame.paste(head_img, (790, 320), alpha=True)
     return frame.save_jpg()
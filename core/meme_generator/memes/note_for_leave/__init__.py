@@ -104,4 +104,5 @@ add_meme(
     keywords=["请假条"],
     date_created=datetime(2023, 4, 27),
     date_modified=datetime(2023, 4, 27),
+    cacheable=False,
 )
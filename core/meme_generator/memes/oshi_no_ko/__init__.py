@@ -6,7 +6,7 @@ from pil_utils import BuildImage, Text2Image
 from meme_generator import CommandShortcut, add_meme
 from meme_generator.exception import TextOverLength
 from meme_generator.tags import MemeTags
-from meme_generator.utils import make_png_or_gif
+from meme_generator.utils import make_png_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -14,8 +14,8 @@ img_dir = Path(__file__).parent / "images"
 def oshi_no_ko(images: list[BuildImage], texts: list[str], args):
     name = texts[0] if texts else "网友"
 
-    text_frame1 = BuildImage.open(img_dir / "text1.png")
-    text_frame2 = BuildImage.open(img_dir / "text2.png")
+    text_frame1 = open_template(img_dir / "text1.png")
+    text_frame2 = open_template(img_dir / "text2.png")
 
     text_frame3 = BuildImage(
         Text2Image.from_text(
@@ -38,8 +38,8 @@ def oshi_no_ko(images: list[BuildImage], texts: list[str], args):
     ).paste(text_frame2, (text_frame1.width + text_frame3.width, 0), alpha=True)
     text_frame = text_frame.resize_width(663)
 
-    background = BuildImage.open(img_dir / "background.png")
-    foreground = BuildImage.open(img_dir / "foreground.png")
+    background = open_template(img_dir / "background.png")
+    foreground = open_template(img_dir / "foreground.png")
 
     def make(imgs: list[BuildImage]) -> BuildImage:
         img = imgs[0].convert("RGBA").resize((681, 692), keep_ratio=True)
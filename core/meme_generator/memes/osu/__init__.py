@@ -2,17 +2,16 @@ from datetime import datetime
 from io import BytesIO
 from pathlib import Path
 
-from pil_utils import BuildImage
-
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def osu(images, texts: list[str], args) -> BytesIO:
     text = texts[0]
-    frame = BuildImage.open(img_dir / "osu.png")
+    frame = open_template(img_dir / "osu.png")
     try:
         frame.draw_text(
             (80, 80, 432, 432),
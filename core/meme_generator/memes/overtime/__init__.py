@@ -4,12 +4,13 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def overtime(images: list[BuildImage], texts, args):
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     img = images[0].convert("RGBA").resize((250, 250), keep_ratio=True)
     frame.paste(img.rotate(-25, expand=True), (165, 220), below=True)
     return frame.save_jpg()
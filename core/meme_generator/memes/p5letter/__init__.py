@@ -7,6 +7,7 @@ from pil_utils import BuildImage, Text2Image
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -136,7 +137,7 @@ def p5letter(images, texts: list[str], args):
             x += box_char.width
         line_images.append(line_image)
 
-    frame = BuildImage.open(img_dir / "background.png")
+    frame = open_template(img_dir / "background.png")
     total_height = sum(line_image.height for line_image in line_images)
     y = (frame.height - total_height) // 2
     for line_image in line_images:
@@ -155,4 +156,5 @@ add_meme(
     keywords=["女神异闻录5预告信", "P5预告信"],
     date_created=datetime(2024, 11, 13),
     date_modified=datetime(2024, 11, 13),
+    cacheable=False,
 )
@@ -5,6 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -13,7 +14,7 @@ def painter(images: list[BuildImage], texts, args):
     img = (
         images[0].convert("RGBA").resize((240, 345), keep_ratio=True, direction="north")
     )
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img, (125, 91), below=True)
     return frame.save_jpg()
 
@@ -1,7 +1,6 @@
 from datetime import datetime
 from pathlib import Path
 
-from pil_utils import BuildImage
 from pydantic import Field
 
 from meme_generator import (
@@ -13,6 +12,7 @@ from meme_generator import (
     add_meme,
 )
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -38,7 +38,7 @@ args_type = MemeArgsType(
 def panda_dragon_figure(images, texts: list[str], args: Model):
     name = args.name or "责怪龙"
     text = texts[0]
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
 
     try:
         frame.draw_text(
@@ -5,7 +5,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -15,7 +15,7 @@ def pat(images: list[BuildImage], texts, args):
     locs = [(11, 73, 106, 100), (8, 79, 112, 96)]
     img_frames: list[IMG] = []
     for i in range(10):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         x, y, w, h = locs[1] if i == 2 else locs[0]
         frame.paste(img.resize((w, h)), (x, y), below=True)
         img_frames.append(frame.image)
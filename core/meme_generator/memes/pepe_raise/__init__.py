@@ -5,7 +5,12 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -25,7 +30,7 @@ def pepe_raise(images: list[BuildImage], texts, args):
 
     def maker(i: int) -> Maker:
         def make(imgs: list[BuildImage]) -> BuildImage:
-            frame = BuildImage.open(img_dir / f"{i}.png")
+            frame = open_template(img_dir / f"{i}.png")
             left_img = imgs[0].convert("RGBA").circle().resize((100, 100))
             right_img = imgs[1].convert("RGBA").circle().resize((100, 100))
             frame.paste(left_img, left_locs[i], alpha=True)
@@ -4,12 +4,13 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def perfect(images: list[BuildImage], texts, args):
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     img = images[0].convert("RGBA").resize((310, 460), keep_ratio=True, inside=True)
     frame.paste(img, (313, 64), alpha=True)
     return frame.save_jpg()
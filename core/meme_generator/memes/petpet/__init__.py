@@ -7,7 +7,7 @@ from pil_utils import BuildImage
 from pydantic import Field
 
 from meme_generator import MemeArgsModel, MemeArgsType, ParserOption, add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -46,7 +46,7 @@ def petpet(images: list[BuildImage], texts, args: Model):
         (12, 20, 98, 98),
     ]
     for i in range(5):
-        hand = BuildImage.open(img_dir / f"{i}.png")
+        hand = open_template(img_dir / f"{i}.png")
         frame = BuildImage.new("RGBA", hand.size, (255, 255, 255, 0))
         x, y, w, h = locs[i]
         frame.paste(img.resize((w, h)), (x, y), alpha=True)
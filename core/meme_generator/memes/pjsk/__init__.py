@@ -16,6 +16,7 @@ from meme_generator import (
 )
 from meme_generator.exception import MemeFeedback, TextOverLength
 from meme_generator.tags import MemeTags
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -106,7 +107,7 @@ def pjsk(images, texts: list[str], args: Model):
             f"角色{character.name_cn}的图片编号错误，请输入1-{character.img_num}"
         )
 
-    img = BuildImage.open(img_dir / character.name_en / f"{n:02d}.png")
+    img = open_template(img_dir / character.name_en / f"{n:02d}.png")
     color = character.color
     w, h = img.size
 
@@ -151,4 +152,5 @@ add_meme(
     tags=MemeTags.project_sekai,
     date_created=datetime(2024, 12, 19),
     date_modified=datetime(2024, 12, 19),
+    cacheable=False,
 )
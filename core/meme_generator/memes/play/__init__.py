@@ -5,7 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -23,7 +23,7 @@ def play(images: list[BuildImage], texts, args):
     ]
     # fmt: on
     raw_frames: list[BuildImage] = [
-        BuildImage.open(img_dir / f"{i}.png") for i in range(38)
+        open_template(img_dir / f"{i}.png") for i in range(38)
     ]
     img_frames: list[BuildImage] = []
     for i in range(len(locs)):
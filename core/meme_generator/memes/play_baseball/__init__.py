@@ -7,7 +7,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -31,8 +31,8 @@ def play_baseball(images: list[BuildImage], texts, args):
         frame.paste(img.rotate(ball_angle), (425 + ball_x, 120), alpha=True)
         right_index = i - 2 if i in [3, 4, 5, 6, 7] else 0
         left_index = i - 12 if i in [13, 14, 15, 16, 17] else 0
-        right = BuildImage.open(img_dir / f"{right_index}.png")
-        left = BuildImage.open(img_dir / f"{left_index}.png").transpose(
+        right = open_template(img_dir / f"{right_index}.png")
+        left = open_template(img_dir / f"{left_index}.png").transpose(
             Transpose.FLIP_LEFT_RIGHT
         )
         frame.paste(right, (630, 6), alpha=True)
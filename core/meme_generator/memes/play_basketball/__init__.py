@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -57,7 +57,7 @@ def play_basketball(images: list[BuildImage], texts, args):
 
     frames: list[IMG] = []
     for loc, rotation in frames_info:
-        frame = BuildImage.open(img_dir / f"{len(frames)}.png")
+        frame = open_template(img_dir / f"{len(frames)}.png")
         if loc is not None:
             x, y = loc
             current_img = img.copy()
@@ -5,7 +5,12 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -38,7 +43,7 @@ def play_together(images: list[BuildImage], texts, args):
         def make(imgs: list[BuildImage]) -> BuildImage:
             x, y, w, h = params[i]
             screen = imgs[0].convert("RGBA").resize((w, h), keep_ratio=True)
-            frame = BuildImage.open(img_dir / f"{i}.png")
+            frame = open_template(img_dir / f"{i}.png")
             frame.paste(screen, (x, y), below=True)
             return frame
 
@@ -5,6 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -26,7 +27,7 @@ def police(images: list[BuildImage], texts: list[str], args):
         raise TextOverLength(text)
     img = images[0].convert("RGBA").square().resize((245, 245))
 
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img, (224, 46), below=True)
     frame.paste(text_frame, (220, 395), alpha=True)
     return frame.save_jpg()
@@ -39,7 +40,7 @@ def police1(images: list[BuildImage], texts, args):
         .resize((60, 75), keep_ratio=True)
         .rotate(16, expand=True)
     )
-    frame = BuildImage.open(img_dir / "1.png")
+    frame = open_template(img_dir / "1.png")
     frame.paste(img, (37, 291), below=True)
     return frame.save_jpg()
 
@@ -4,7 +4,7 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -21,7 +21,7 @@ def printing(images: list[BuildImage], texts, args):
             direction="south",
         )
     )
-    frames = [BuildImage.open(img_dir / f"{i}.png") for i in range(115)]
+    frames = [open_template(img_dir / f"{i}.png") for i in range(115)]
     for i in range(50, 115):
         frames[i].paste(img, (146, 164), below=True)
     frames = [frame.image for frame in frames]
@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -54,7 +54,7 @@ def psyduck(images, texts: list[str], args):
 
     frames: list[IMG] = []
     for i in range(18):
-        frame = BuildImage.open(img_dir / f"{i}.jpg")
+        frame = open_template(img_dir / f"{i}.jpg")
         param = params[i]
         if param:
             side, points, pos = param
@@ -5,7 +5,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -20,7 +20,7 @@ def punch(images: list[BuildImage], texts, args):
     ]
     # fmt: on
     for i in range(13):
-        fist = BuildImage.open(img_dir / f"{i}.png")
+        fist = open_template(img_dir / f"{i}.png")
         frame = BuildImage.new("RGBA", fist.size, "white")
         x, y = locs[i]
         frame.paste(img, (x, y - 15), alpha=True).paste(fist, alpha=True)
@@ -5,7 +5,7 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -14,7 +14,7 @@ def raise_image(images: list[BuildImage], texts, args) -> BytesIO:
     inner_size = (599, 386)
     paste_pos = (134, 91)
 
-    bg = BuildImage.open(img_dir / "raise_image.png")
+    bg = open_template(img_dir / "raise_image.png")
 
     def make_frame(imgs: list[BuildImage]) -> BuildImage:
         inner_frame = BuildImage.new("RGBA", inner_size, "white")
@@ -6,6 +6,7 @@ from pil_utils import BuildImage, Text2Image
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -13,7 +14,7 @@ default_text = "エロ本"
 
 
 def read_book(images: list[BuildImage], texts: list[str], args):
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     points = ((0, 108), (1092, 0), (1023, 1134), (29, 1134))
     img = (
         images[0]
@@ -5,7 +5,12 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -26,7 +31,7 @@ def remote_control(images: list[BuildImage], texts, args):
                 dy = int(img_h * (random.random() - 0.5) / 30)
                 pos = (dx, dy)
             frame.paste(img, pos, alpha=True)
-            overlay = BuildImage.open(img_dir / f"{i}.png")
+            overlay = open_template(img_dir / f"{i}.png")
             overlay = overlay.resize_height(int(img_h / 1.5))
             x = img_w - overlay.width
             y = img_h - overlay.height
@@ -37,7 +42,7 @@ def remote_control(images: list[BuildImage], texts, args):
         return make
 
     return make_gif_or_combined_gif(
-        images, maker, 17, 0.07, FrameAlignPolicy.extend_loop
+        images, maker, 17, 0.07, FrameAlignPolicy.extend_loop, sequential=True
     )
 
 
@@ -49,4 +54,5 @@ add_meme(
     keywords=["遥控", "控制"],
     date_created=datetime(2025, 3, 4),
     date_modified=datetime(2025, 3, 24),
+    cacheable=False,
 )
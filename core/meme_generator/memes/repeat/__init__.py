@@ -6,7 +6,7 @@ from pil_utils import BuildImage, Text2Image
 
 from meme_generator import MemeArgsModel, add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import random_text, save_gif
+from meme_generator.utils import open_template, random_text, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -42,7 +42,7 @@ def repeat(images: list[BuildImage], texts: list[str], args: MemeArgsModel):
     msg_img_twice = BuildImage.new("RGB", (msg_img.width, msg_img.height * 2))
     msg_img_twice.paste(msg_img).paste(msg_img, (0, msg_img.height))
 
-    input_img = BuildImage.open(img_dir / "0.jpg")
+    input_img = open_template(img_dir / "0.jpg")
     self_img = images[0].convert("RGBA").circle().resize((75, 75))
     input_img.paste(self_img, (15, 40), alpha=True)
 
@@ -67,4 +67,5 @@ add_meme(
     keywords=["复读"],
     date_created=datetime(2022, 6, 8),
     date_modified=datetime(2023, 2, 14),
+    cacheable=False,
 )
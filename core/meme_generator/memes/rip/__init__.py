@@ -4,17 +4,18 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def rip(images: list[BuildImage], texts, args):
     if len(images) >= 2:
-        frame = BuildImage.open(img_dir / "1.png")
+        frame = open_template(img_dir / "1.png")
         self_img = images[0]
         user_img = images[1]
     else:
-        frame = BuildImage.open(img_dir / "0.png")
+        frame = open_template(img_dir / "0.png")
         self_img = None
         user_img = images[0]
 
@@ -4,13 +4,14 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def rip_angrily(images: list[BuildImage], texts, args):
     img = images[0].convert("RGBA").square().resize((105, 105))
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img.rotate(-24, expand=True), (18, 170), below=True)
     frame.paste(img.rotate(24, expand=True), (163, 65), below=True)
     return frame.save_jpg()
@@ -4,7 +4,12 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -14,7 +19,7 @@ def rip_clothes(images: list[BuildImage], texts, args):
         def make(imgs: list[BuildImage]) -> BuildImage:
             img = imgs[0].convert("RGBA").resize((480, 270), keep_ratio=True)
             if i <= 15:
-                frame = BuildImage.open(img_dir / f"{i}.png")
+                frame = open_template(img_dir / f"{i}.png")
                 frame.paste(img, (0, 0), below=True)
                 return frame
             else:
@@ -5,7 +5,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -21,7 +21,7 @@ def rise_dead(images: list[BuildImage], texts, args):
     imgs = [img.perspective(points) for _, points in locs]
     frames: list[IMG] = []
     for i in range(34):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         if i <= 28:
             idx = 0 if i <= 25 else i - 25
             x, y = locs[idx][0]
@@ -5,13 +5,18 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
 
 def run_away(images: list[BuildImage], texts, args):
-    miku_w, miku_h = BuildImage.open(img_dir / "0.png").size
+    miku_w, miku_h = open_template(img_dir / "0.png").size
     img_w, img_h = images[0].size
     ratio = 1.2
     if img_w > img_h:
@@ -24,7 +29,7 @@ def run_away(images: list[BuildImage], texts, args):
     def maker(i: int) -> Maker:
         def make(imgs: list[BuildImage]) -> BuildImage:
             frame = imgs[0].convert("RGBA").resize((frame_w, frame_h), keep_ratio=True)
-            miku = BuildImage.open(img_dir / f"{i}.png")
+            miku = open_template(img_dir / f"{i}.png")
             frame.paste(miku, (frame_w - miku_w, frame_h - miku_h), alpha=True)
             return frame
 
@@ -5,6 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import MemeArgsModel, add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -13,7 +14,7 @@ default_text = "你给我的安全感\n远不及{ta}的万分之一"
 
 def safe_sense(images: list[BuildImage], texts: list[str], args: MemeArgsModel):
     img = images[0].convert("RGBA").resize((215, 343), keep_ratio=True)
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img, (215, 135))
 
     ta = "它"
@@ -4,13 +4,18 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
 
 def saimin_app(images: list[BuildImage], texts, args):
-    app_w, app_h = BuildImage.open(img_dir / "0.png").size
+    app_w, app_h = open_template(img_dir / "0.png").size
     img_w, img_h = images[0].size
     ratio = 1
     if img_w > img_h:
@@ -23,7 +28,7 @@ def saimin_app(images: list[BuildImage], texts, args):
     def maker(i: int) -> Maker:
         def make(imgs: list[BuildImage]) -> BuildImage:
             frame = imgs[0].convert("RGBA").resize((frame_w, frame_h), keep_ratio=True)
-            app = BuildImage.open(img_dir / f"{i}.png")
+            app = open_template(img_dir / f"{i}.png")
             frame.paste(app, (0, frame_h - app_h), alpha=True)
             return frame
 
@@ -1,17 +1,16 @@
 from datetime import datetime
 from pathlib import Path
 
-from pil_utils import BuildImage
-
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def scratchcard(images, texts: list[str], args):
     text = texts[0]
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     try:
         frame.draw_text(
             (80, 160, 360, 290),
@@ -24,7 +23,7 @@ def scratchcard(images, texts: list[str], args):
         )
     except ValueError:
         raise TextOverLength(text)
-    mask = BuildImage.open(img_dir / "1.png")
+    mask = open_template(img_dir / "1.png")
     frame.paste(mask, alpha=True)
     return frame.save_jpg()
 
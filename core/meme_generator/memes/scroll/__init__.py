@@ -6,7 +6,7 @@ from pil_utils import BuildImage, Text2Image
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -22,10 +22,10 @@ def scroll(images, texts: list[str], args):
     box_w = text_w + 140
     box_h = max(text_h + 103, 150)
     box = BuildImage.new("RGBA", (box_w, box_h), "#eaedf4")
-    corner1 = BuildImage.open(img_dir / "corner1.png")
-    corner2 = BuildImage.open(img_dir / "corner2.png")
-    corner3 = BuildImage.open(img_dir / "corner3.png")
-    corner4 = BuildImage.open(img_dir / "corner4.png")
+    corner1 = open_template(img_dir / "corner1.png")
+    corner2 = open_template(img_dir / "corner2.png")
+    corner3 = open_template(img_dir / "corner3.png")
+    corner4 = open_template(img_dir / "corner4.png")
     box.paste(corner1, (0, 0))
     box.paste(corner2, (0, box_h - 75))
     box.paste(corner3, (text_w + 70, 0))
@@ -5,14 +5,14 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import make_png_or_gif
+from meme_generator.utils import make_png_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def seal(images: list[BuildImage], texts, args):
     img = images[0]
-    mask = BuildImage.open(img_dir / "0.png").resize(
+    mask = open_template(img_dir / "0.png").resize(
         (img.width, img.height), keep_ratio=True, inside=True
     )
 
@@ -5,7 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -13,10 +13,10 @@ img_dir = Path(__file__).parent / "images"
 def sekaiichi_kawaii(images: list[BuildImage], texts: list[str], args):
     w, h = images[0].size
     if (w / h) > 1.155:
-        fg = BuildImage.open(img_dir / "0.png")
+        fg = open_template(img_dir / "0.png")
         size = (810, 416)
     else:
-        fg = BuildImage.open(img_dir / "1.png")
+        fg = open_template(img_dir / "1.png")
         size = (585, 810)
     white = BuildImage.new("RGBA", size, color=(255, 255, 255, 255))
 
@@ -41,7 +41,12 @@ def shake_head(images: list[BuildImage], texts, args):
         return make
 
     return make_gif_or_combined_gif(
-        images, maker, frame_num, 0.02, FrameAlignPolicy.extend_loop
+        images,
+        maker,
+        frame_num,
+        0.02,
+        FrameAlignPolicy.extend_loop,
+        sequential=True,
     )
 
 
@@ -53,4 +58,5 @@ add_meme(
     keywords=["晃脑"],
     date_created=datetime(2024, 10, 31),
     date_modified=datetime(2024, 10, 31),
+    cacheable=False,
 )
@@ -5,18 +5,23 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
 
 def shiroko_pero(images: list[BuildImage], texts, args):
-    mask = BuildImage.open(img_dir / "mask.png").convert("RGBA")
+    mask = open_template(img_dir / "mask.png").convert("RGBA")
 
     def maker(i) -> Maker:
         def make(imgs: list[BuildImage]) -> BuildImage:
             suika = imgs[0].convert("RGBA").resize((245, 245), keep_ratio=True)
-            frame = BuildImage.open(img_dir / f"{i}.png").convert("RGBA")
+            frame = open_template(img_dir / f"{i}.png").convert("RGBA")
             suika_mask = BuildImage.new("RGBA", (245, 245), (0, 0, 0, 0))
             suika_mask.image.paste(suika.image, (0, 0), mask.image)
             frame.paste(suika_mask, (105, 178), below=True)
@@ -28,4 +28,5 @@ add_meme(
     keywords=["震惊"],
     date_created=datetime(2022, 3, 12),
     date_modified=datetime(2023, 2, 14),
+    cacheable=False,
 )
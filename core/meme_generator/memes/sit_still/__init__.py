@@ -5,13 +5,14 @@ from pil_utils import BuildImage
 
 from meme_generator import MemeArgsModel, add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def sit_still(images: list[BuildImage], texts: list[str], args: MemeArgsModel):
     name = texts[0] if texts else args.user_infos[0].name if args.user_infos else ""
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     if name:
         try:
             frame.draw_text(
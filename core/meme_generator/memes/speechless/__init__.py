@@ -4,7 +4,7 @@ from pathlib import Path
 from pil_utils import BuildImage, Text2Image
 
 from meme_generator import CommandShortcut, add_meme
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -13,7 +13,7 @@ def speechless(images: list[BuildImage], texts: list[str], args):
     text = "无语，和你说不下去"
     if texts:
         text += "\n" + texts[0]
-    sweat = BuildImage.open(img_dir / "sweat.png").resize((80, 80))
+    sweat = open_template(img_dir / "sweat.png").resize((80, 80))
 
     def make(imgs: list[BuildImage]) -> BuildImage:
         img = imgs[0].convert("RGBA").resize_width(500)
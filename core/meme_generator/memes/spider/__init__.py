@@ -6,7 +6,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -33,7 +33,7 @@ def spider(images: list[BuildImage], texts, args):
     frames: list[IMG] = []
     for i in range(52):
         pos = (Xs[i], 24 + random.randint(-1, 1))
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         frame.paste(head, pos, alpha=True)
         frames.append(frame.image)
     return save_gif(frames, 0.04)
@@ -47,4 +47,5 @@ add_meme(
     keywords=["蜘蛛", "蜘蛛爬"],
     date_created=datetime(2025, 4, 27),
     date_modified=datetime(2025, 4, 27),
+    cacheable=False,
 )
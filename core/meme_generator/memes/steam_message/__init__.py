@@ -12,6 +12,7 @@ from meme_generator import (
     ParserOption,
     add_meme,
 )
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -66,7 +67,7 @@ def steam_message(images: list[BuildImage], texts: list[str], args: Model):
     frame.draw_rectangle(
         (rec_x, padding_v, rec_x + rec_w, frame_h - padding_v), fill="#6cbe48"
     )
-    logo = BuildImage.open(img_dir / "logo.png")
+    logo = open_template(img_dir / "logo.png")
     frame.alpha_composite(logo, (frame_w - 870, -370))
     text_play.draw_on_image(frame.image, (text_x, (frame_h - text_play.height) // 2))
     text_name.draw_on_image(
@@ -5,7 +5,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -21,7 +21,7 @@ def step_on(images: list[BuildImage], texts, args):
         (88, 86, 49, 197, 0),
     ]
     for i in range(5):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         w, h, x, y, angle = locs[i]
         frame.paste(img.resize((w, h)).rotate(angle, expand=True), (x, y), below=True)
         frames.append(frame.image)
@@ -5,7 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import MemeArgsModel, add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -14,7 +14,7 @@ def stew(images: list[BuildImage], texts: list[str], args: MemeArgsModel):
     name = texts[0] if texts else args.user_infos[0].name if args.user_infos else "群友"
     text = f"生活不易,炖{name}出气"
 
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     try:
         frame.draw_text(
             (2, frame.height - 30, frame.width - 2, frame.height),
@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -43,7 +43,7 @@ def stickman_dancing(images: list[BuildImage], texts, args):
 
     frames: list[IMG] = []
     for i in range(len(locs)):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         frame.paste(self_head, locs[i], alpha=True)
         frames.append(frame.image)
 
@@ -5,7 +5,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -35,7 +35,7 @@ def subject3(images: list[BuildImage], texts, args):
     # fmt: on
     frames: list[IMG] = []
     for i in range(85):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         frame.paste(self_head, locs[i], alpha=True)
         frames.append(frame.image)
 
@@ -5,7 +5,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -19,7 +19,7 @@ def suck(images: list[BuildImage], texts, args):
     # fmt: on
     frames: list[IMG] = []
     for i in range(12):
-        bg = BuildImage.open(img_dir / f"{i}.png")
+        bg = open_template(img_dir / f"{i}.png")
         frame = BuildImage.new("RGBA", bg.size, "white")
         x, y, w, h = locs[i]
         frame.paste(img.resize((w, h)), (x, y), alpha=True).paste(bg, alpha=True)
@@ -4,13 +4,14 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def support(images: list[BuildImage], texts, args):
     img = images[0].convert("RGBA").square().resize((815, 815)).rotate(23, expand=True)
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img, (-172, -17), below=True)
     return frame.save_jpg()
 
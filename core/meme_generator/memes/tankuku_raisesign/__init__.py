@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -33,7 +33,7 @@ def tankuku_raisesign(images: list[BuildImage], texts, args):
     frames: list[IMG] = []
     for i in range(15):
         points, pos = params[i]
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         frame.paste(img.perspective(points), pos, below=True)
         frames.append(frame.image)
     return save_gif(frames, 0.2)
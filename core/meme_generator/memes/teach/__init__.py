@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
 from meme_generator.tags import MemeTags
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -14,7 +14,7 @@ default_text = "我老婆"
 
 
 def teach(images: list[BuildImage], texts: list[str], args):
-    frame = BuildImage.open(img_dir / "0.png").resize_width(960).convert("RGBA")
+    frame = open_template(img_dir / "0.png").resize_width(960).convert("RGBA")
     text = texts[0] if texts else default_text
     try:
         frame.draw_text(
@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -41,7 +41,7 @@ def tease(images: list[BuildImage], texts, args):
         ((0, 29), ((118, 3), (201, 48), (111, 220), (1, 168))),
     ]
     for i in range(24):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         pos, points = params[i]
         frame.paste(img.perspective(points), pos, below=True)
         frames.append(frame.image)
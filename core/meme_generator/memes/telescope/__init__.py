@@ -4,7 +4,12 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -15,7 +20,7 @@ def telescope(images: list[BuildImage], texts, args):
             img = imgs[0].convert("RGBA").square()
             img_big = img.resize((600, 600))
             img_small = img.resize((230, 230))
-            frame = BuildImage.open(img_dir / f"{i}.png")
+            frame = open_template(img_dir / f"{i}.png")
             if 4 <= i < 18:
                 x = -167 + (i - 4) * 4
                 y = -361 + (i - 4) * 7
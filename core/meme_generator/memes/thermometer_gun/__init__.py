@@ -5,7 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import make_png_or_gif
+from meme_generator.utils import make_png_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -35,7 +35,7 @@ def thermometer_gun(images: list[BuildImage], texts: list[str], args):
         size = (round(img_w), round(img_w))
         pos = (0, round(img_h - img_w))
     frame = (
-        BuildImage.open(img_dir / "0.png")
+        open_template(img_dir / "0.png")
         .paste(text_frame, (555, 240), alpha=True)
         .resize(size)
     )
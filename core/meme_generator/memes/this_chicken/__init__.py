@@ -5,6 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -15,7 +16,7 @@ def this_chicken(images: list[BuildImage], texts, args):
     text = texts[0] if texts else default_text
     img = images[0].convert("RGBA").resize((640, 640), keep_ratio=True)
 
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     try:
         frame.draw_text(
             (0, 900, 1440, 1080),
@@ -6,6 +6,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -18,7 +19,7 @@ def throw(images: list[BuildImage], texts, args):
         .rotate(random.randint(1, 360))
         .resize((143, 143))
     )
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img, (15, 178), alpha=True)
     return frame.save_jpg()
 
@@ -32,4 +33,5 @@ add_meme(
     tags=MemeTags.touhou,
     date_created=datetime(2021, 5, 5),
     date_modified=datetime(2023, 3, 30),
+    cacheable=False,
 )
@@ -5,14 +5,14 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
 
 def thump_wildly(images: list[BuildImage], texts, args):
     img = images[0].convert("RGBA").resize((122, 122), keep_ratio=True)
-    raw_frames = [BuildImage.open(img_dir / f"{i}.png") for i in range(31)]
+    raw_frames = [open_template(img_dir / f"{i}.png") for i in range(31)]
     for i in range(14):
         raw_frames[i].paste(img, (203, 196), below=True)
     raw_frames[14].paste(img, (207, 239), below=True)
@@ -5,6 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -13,7 +14,7 @@ default_text = "说完了吗？该走了"
 
 def time_to_go(images: list[BuildImage], texts: list[str], args):
     img = images[0].resize((105, 105), keep_ratio=True)
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img, (230, 82), below=True)
     text = texts[0] if texts else default_text
     try:
@@ -5,7 +5,12 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    make_gif_or_combined_gif,
+    open_template,
+)
 
 img_dir = Path(__file__).parent / "images"
 
@@ -15,7 +20,7 @@ def tom_tease(images: list[BuildImage], texts, args):
         def make(imgs: list[BuildImage]) -> BuildImage:
             img = imgs[0].convert("RGBA").resize((400, 350), keep_ratio=True)
             img = img.perspective(((0, 100), (290, 0), (290, 370), (0, 335)))
-            bg = BuildImage.open(img_dir / f"{i}.png")
+            bg = open_template(img_dir / f"{i}.png")
             frame = BuildImage.new("RGBA", bg.size, "white")
             frame.paste(bg).paste(img, (258, -12), below=True)
             return frame
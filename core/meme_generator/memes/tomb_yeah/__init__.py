@@ -4,12 +4,13 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def tomb_yeah(images: list[BuildImage], texts, args):
-    frame = BuildImage.open(img_dir / "0.jpg").convert("RGBA")
+    frame = open_template(img_dir / "0.jpg").convert("RGBA")
     frame.paste(
         images[0].convert("RGBA").circle().resize((145, 145)), (138, 265), alpha=True
     )
@@ -5,7 +5,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -14,7 +14,7 @@ def trolley(images: list[BuildImage], texts, args):
     img = images[0].convert("RGBA").circle()
     frames: list[IMG] = []
     for i in range(50):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         angle = 0
         if i < 25:
             w, h, x, y = (65, 65, 21, 101)
@@ -28,4 +28,5 @@ add_meme(
     keywords=["转"],
     date_created=datetime(2022, 1, 1),
     date_modified=datetime(2024, 9, 30),
+    cacheable=False,
 )
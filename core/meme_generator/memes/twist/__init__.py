@@ -5,7 +5,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -20,7 +20,7 @@ def twist(images: list[BuildImage], texts, args):
     # fmt: on
     frames: list[IMG] = []
     for i in range(5):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         x, y, a = locs[i]
         frame.paste(img.rotate(a), (x, y), below=True)
         frames.append(frame.image)
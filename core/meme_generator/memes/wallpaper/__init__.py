@@ -6,7 +6,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -15,9 +15,9 @@ def wallpaper(images: list[BuildImage], texts, args):
     img = images[0].convert("RGBA").resize((515, 383), keep_ratio=True)
     frames: list[IMG] = []
     for i in range(8):
-        frames.append(BuildImage.open(img_dir / f"{i}.png").image)
+        frames.append(open_template(img_dir / f"{i}.png").image)
     for i in range(8, 20):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         frame.paste(img, (176, -9), below=True)
         frames.append(frame.image)
     return save_gif(frames, 0.07)
@@ -5,14 +5,14 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
 
 def washer(images: list[BuildImage], texts, args):
     img = images[0].convert("RGBA")
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frames: list[IMG] = []
     for i in range(0, 360, 30):
         frames.append(
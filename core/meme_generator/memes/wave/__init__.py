@@ -1,38 +1,51 @@
 import math
 from datetime import datetime
 
+import numpy as np
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import FrameAlignPolicy, Maker, make_gif_or_combined_gif
+from meme_generator.utils import (
+    FrameAlignPolicy,
+    Maker,
+    cache_map,
+    make_gif_or_combined_gif,
+    remap_image,
+)
+
+frame_num = 8
+
+
+@cache_map
+def wave_map(img_w: int, img_h: int, index: int) -> tuple[np.ndarray, np.ndarray]:
+    period = img_w / 6
+    amp = img_w / 60
+
+    def sin(x):
+        return (
+            amp * math.sin(2 * math.pi / period * (x + index * period / frame_num)) / 2
+        )
+
+    # 与逐像素计算保持一致：sin 用 math 计算，再按相同的运算顺序得到偏移
+    sin_x = np.array([sin(i) for i in range(img_w)])
+    sin_y = np.array([sin(j) for j in range(img_h)])
+    i = np.arange(img_w)[None, :]
+    j = np.arange(img_h)[:, None]
+    dx = (sin_x[None, :] * (img_h - j) / img_h).astype(int)
+    dy = (sin_y[:, None] * j / img_h).astype(int)
+    return i + dx, np.broadcast_to(j + dy, (img_h, img_w))
 
 
 def wave(images: list[BuildImage], texts, args):
     img_w = min(max(images[0].width, 360), 720)
-    period = img_w / 6
     amp = img_w / 60
-    frame_num = 8
 
     def maker(i: int) -> Maker:
-        def sin(x):
-            return (
-                amp * math.sin(2 * math.pi / period * (x + i * period / frame_num)) / 2
-            )
-
         def make(imgs: list[BuildImage]) -> BuildImage:
             img = imgs[0].convert("RGBA").resize_width(img_w)
             img_h = img.height
-            frame = img.copy()
-            for i in range(img_w):
-                for j in range(img_h):
-                    dx = int(sin(i) * (img_h - j) / img_h)
-                    dy = int(sin(j) * j / img_h)
-                    if 0 <= i + dx < img_w and 0 <= j + dy < img_h:
-                        frame.image.putpixel(
-                            (i, j),
-                            img.image.getpixel((i + dx, j + dy)),  # type: ignore
-                        )
-
+            map_x, map_y = wave_map(img_w, img_h, i)
+            frame = BuildImage(remap_image(img.image, map_x, map_y, img.image))
             frame = frame.resize_canvas((int(img_w - amp), int(img_h - amp)))
             return frame
 
@@ -14,6 +14,7 @@ from meme_generator import (
     add_meme,
 )
 from meme_generator.exception import TextOrNameNotEnough, TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -45,7 +46,7 @@ def wechat_pay(images: list[BuildImage], texts: list[str], args: Model):
     name = texts[0] if texts else args.user_infos[0].name
     avatar = images[0]
 
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
 
     qr = qrcode.QRCode(version=5, border=0, error_correction=qrcode.ERROR_CORRECT_Q)
     qr.add_data(message)
@@ -60,7 +61,7 @@ def wechat_pay(images: list[BuildImage], texts: list[str], args: Model):
     avatar = avatar.convert("RGBA").resize((166, 166), keep_ratio=True).circle_corner(8)
     frame.paste(avatar, (538, 621), alpha=True)
 
-    logo = BuildImage.open(img_dir / "logo.png")
+    logo = open_template(img_dir / "logo.png")
     frame.paste(logo, (649, 734), alpha=True)
 
     try:
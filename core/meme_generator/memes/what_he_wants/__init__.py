@@ -5,7 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.exception import TextOverLength
-from meme_generator.utils import make_jpg_or_gif
+from meme_generator.utils import make_jpg_or_gif, open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -13,7 +13,7 @@ img_dir = Path(__file__).parent / "images"
 def what_he_wants(images: list[BuildImage], texts: list[str], args):
     date = texts[0] if texts else "今年520"
     text = f"{date}我会给你每个男人都最想要的东西···"
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
 
     def make(imgs: list[BuildImage]) -> BuildImage:
         img = imgs[0].convert("RGBA").resize((538, 538), keep_ratio=True, inside=True)
@@ -5,13 +5,14 @@ from pil_utils import BuildImage
 
 from meme_generator import add_meme
 from meme_generator.tags import MemeTags
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
 
 def why_at_me(images: list[BuildImage], texts, args):
     img = images[0].convert("RGBA").resize((265, 265), keep_ratio=True)
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img.rotate(19), (42, 13), below=True)
     return frame.save_jpg()
 
@@ -5,6 +5,7 @@ from pil_utils import BuildImage
 
 from meme_generator import MemeArgsModel, add_meme
 from meme_generator.exception import TextOrNameNotEnough, TextOverLength
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -16,7 +17,7 @@ def why_have_hands(images: list[BuildImage], texts: list[str], args: MemeArgsMod
         raise TextOrNameNotEnough()
     name = texts[0] if texts else args.user_infos[0].name
 
-    frame = BuildImage.open(img_dir / "0.png")
+    frame = open_template(img_dir / "0.png")
     frame.paste(img.circle().resize((250, 250)), (350, 670), alpha=True)
     frame.paste(
         img.resize((250, 250), keep_ratio=True).rotate(15), (1001, 668), below=True
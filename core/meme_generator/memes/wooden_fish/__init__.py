@@ -4,7 +4,7 @@ from pathlib import Path
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -12,7 +12,7 @@ img_dir = Path(__file__).parent / "images"
 def wooden_fish(images: list[BuildImage], texts, args):
     img = images[0].convert("RGBA").resize((85, 85))
     frames = [
-        BuildImage.open(img_dir / f"{i}.png").paste(img, (116, 153), below=True).image
+        open_template(img_dir / f"{i}.png").paste(img, (116, 153), below=True).image
         for i in range(66)
     ]
     return save_gif(frames, 0.1)
@@ -5,7 +5,7 @@ from PIL.Image import Image as IMG
 from pil_utils import BuildImage
 
 from meme_generator import add_meme
-from meme_generator.utils import save_gif
+from meme_generator.utils import open_template, save_gif
 
 img_dir = Path(__file__).parent / "images"
 
@@ -16,7 +16,7 @@ def worship(images: list[BuildImage], texts, args):
     paint = img.square().resize((150, 150)).perspective(points)
     frames: list[IMG] = []
     for i in range(10):
-        frame = BuildImage.open(img_dir / f"{i}.png")
+        frame = open_template(img_dir / f"{i}.png")
         frame.paste(paint, below=True)
         frames.append(frame.image)
     return save_gif(frames, 0.04)
@@ -5,6 +5,7 @@ from PIL.Image import Transpose
 from pil_utils import BuildImage, Text2Image
 
 from meme_generator import add_meme
+from meme_generator.utils import open_template
 
 img_dir = Path(__file__).parent / "images"
 
@@ -32,7 +33,7 @@ def youtube(images, texts: list[str], args):
         (frame.width + 100, frame.height + 100), bg_color="white"
     )
 
-    corner = BuildImage.open(img_dir / "corner.png")
+    corner = open_template(img_dir / "corner.png")
     ratio = right_img.height / 2 / corner.height
     corner = corner.resize((int(corner.width * ratio), int(corner.height * ratio)))
     x0 = left_img.width + 50
@@ -0,0 +1,259 @@
+"""预先 fork 的多进程服务
+
+``meme run --workers N --preload`` 时由主进程监听端口并 fork 出 N 个工作进程：
+
+* 预加载模式下主进程在 fork 前导入所有表情，生成 ``preload_memes`` 中表情的预览
+  以预先解码模板图片和字体，然后调用 ``gc.freeze()``，使这些对象在工作进程间
+  以写时复制的方式共享，不会因垃圾回收写入引用信息而被复制
+* 工作进程处理 ``max_requests`` 个请求后退出（加上最多 10% 的随机抖动，避免同时重启），
+  由主进程重新 fork，用于回收内存碎片
+* 各工作进程的请求数记录在 fork 前创建的共享内存中，``GET /meme/stats`` 会列出
+  每个工作进程的请求数和 RSS / PSS 等内存占用
+
+仅支持提供 ``os.fork`` 的平台。
+"""
+
+import gc
+import mmap
+import os
+import random
+import signal
+import socket
+import struct
+import time
+from typing import Any, Optional
+
+from .log import logger
+
+_SLOT = struct.Struct("<iIQd")
+"""工作进程槽位：进程号、重启次数、已处理请求数、启动时间"""
+
+_MEMORY_FIELDS = {
+    "Rss": "rss",
+    "Pss": "pss",
+    "Shared_Clean": "shared",
+    "Shared_Dirty": "shared",
+    "Private_Clean": "private",
+    "Private_Dirty": "private",
+}
+
+
+class WorkerSlots:
+    """fork 前创建的共享内存，记录各工作进程的状态"""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._buffer = mmap.mmap(-1, _SLOT.size * workers)
+
+    def get(self, index: int) -> tuple[int, int, int, float]:
+        return _SLOT.unpack_from(self._buffer, index * _SLOT.size)
+
+    def reset(self, index: int, pid: int):
+        _, generation, _, _ = self.get(index)
+        _SLOT.pack_into(
+            self._buffer, index * _SLOT.size, pid, generation + 1, 0, time.time()
+        )
+
+    def add_request(self, index: int):
+        # 每个槽位只由对应的工作进程写入
+        pid, generation, requests, started = self.get(index)
+        _SLOT.pack_into(
+            self._buffer,
+            index * _SLOT.size,
+            pid,
+            generation,
+            requests + 1,
+            started,
+        )
+
+
+_slots: Optional[WorkerSlots] = None
+_worker_index: Optional[int] = None
+
+
+def read_memory(pid: int) -> Optional[dict[str, int]]:
+    """
+    读取进程的内存占用（字节），仅支持 Linux
+    :return
+      * ``rss``、``pss``、``shared``、``private``，无法读取时返回 ``None``
+    """
+    memory = {"rss": 0, "pss": 0, "shared": 0, "private": 0}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if field := _MEMORY_FIELDS.get(name):
+                    memory[field] += int(value.split()[0]) * 1024
+    except (OSError, ValueError):
+        return None
+    return memory
+
+
+def worker_stats() -> Optional[list[dict[str, Any]]]:
+    """各工作进程的状态，未使用多进程模式时返回 ``None``"""
+    if _slots is None:
+        return None
+    stats: list[dict[str, Any]] = []
+    for index in range(_slots.workers):
+        pid, generation, requests, started = _slots.get(index)
+        stats.append(
+            {
+                "index": index,
+                "pid": pid,
+                "current": index == _worker_index,
+                "restarts": max(generation - 1, 0),
+                "requests": requests,
+                "uptime": round(time.time() - started, 1) if started else 0,
+                "memory": read_memory(pid) if pid else None,
+            }
+        )
+    return stats
+
+
+class CountRequests:
+    """统计工作进程处理的 HTTP 请求数"""
+
+    def __init__(self, app: Any, slots: WorkerSlots, index: int):
+        self.app = app
+        self.slots = slots
+        self.index = index
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            self.slots.add_request(self.index)
+        await self.app(scope, receive, send)
+
+
+def preload_memes(preview_keys: list[str]):
+    """
+    导入所有表情并预先解码模板图片和字体
+    :params
+      * ``preview_keys``: 需要生成预览的表情，生成过程中会解码模板图片、加载字体
+    """
+    from pil_utils import Text2Image
+
+    from .manager import get_meme, get_memes
+
+    start = time.time()
+    for meme in get_memes():
+        meme.load()
+    Text2Image.from_text("表情包生成器", 32).to_image()
+    for key in preview_keys:
+        try:
+            get_meme(key).generate_preview()
+        except Exception as e:
+            logger.warning(f"Failed to preload meme {key}: {e}")
+    logger.info(f"Preloaded {len(get_memes())} memes in {time.time() - start:.2f}s")
+
+
+class PreforkServer:
+    def __init__(
+        self,
+        app: Any,
+        *,
+        host: str,
+        port: int,
+        workers: int,
+        max_requests: int = 0,
+        log_config: Optional[dict[str, Any]] = None,
+    ):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.max_requests = max_requests
+        self.log_config = log_config
+        self.slots = WorkerSlots(workers)
+        self._children: dict[int, int] = {}
+        """进程号到工作进程序号的映射"""
+        self._spawned: dict[int, float] = {}
+        self._stopping = False
+
+    def _bind(self) -> socket.socket:
+        family = socket.AF_INET6 if ":" in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+        return sock
+
+    def _run_worker(self, index: int, sock: socket.socket):
+        import uvicorn
+
+        global _worker_index
+        _worker_index = index
+        random.seed()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, signal.SIG_DFL)
+
+        limit = None
+        if self.max_requests > 0:
+            limit = self.max_requests + random.randint(0, self.max_requests // 10)
+        config = uvicorn.Config(
+            CountRequests(self.app, self.slots, index),
+            log_config=self.log_config,
+            limit_max_requests=limit,
+        )
+        uvicorn.Server(config).run(sockets=[sock])
+
+    def _spawn(self, index: int, sock: socket.socket):
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                self.slots.reset(index, os.getpid())
+                self._run_worker(index, sock)
+            except BaseException as e:
+                logger.opt(exception=e).error(f"Worker {index} crashed")
+                code = 1
+            finally:
+                os._exit(code)
+        self._children[pid] = index
+        self._spawned[index] = time.time()
+
+    def _stop(self, signum: int, frame: Any):
+        self._stopping = True
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self):
+        global _slots
+        _slots = self.slots
+        sock = self._bind()
+        logger.info(
+            f"Listening on http://{self.host}:{self.port} "
+            f"with {self.workers} workers (master pid {os.getpid()})"
+        )
+
+        # fork 前冻结所有已有对象，垃圾回收不再扫描它们，共享的内存页不会被写入
+        gc.collect()
+        gc.freeze()
+
+        signal.signal(signal.SIGINT, self._stop)
+        signal.signal(signal.SIGTERM, self._stop)
+        for index in range(self.workers):
+            self._spawn(index, sock)
+
+        while self._children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            if (index := self._children.pop(pid, None)) is None:
+                continue
+            if self._stopping:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            if code != 0:
+                logger.warning(f"Worker {index} (pid {pid}) exited with code {code}")
+                # 启动后立即退出时稍作等待，避免反复 fork
+                if time.time() - self._spawned[index] < 1:
+                    time.sleep(1)
+            else:
+                logger.info(f"Worker {index} (pid {pid}) recycled")
+            self._spawn(index, sock)
+        sock.close()
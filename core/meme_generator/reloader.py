@@ -0,0 +1,171 @@
+"""表情热重载
+
+监视表情目录，表情模块的代码或图片变化后只重新导入发生变化的模块，无需重启服务：
+
+* 已安装 ``watchfiles`` 时等待文件系统事件，否则每隔 ``hot_reload_interval`` 秒轮询
+* 以模块为单位比较文件的大小和修改时间，只重新导入发生变化的模块，移除被删除的模块
+* 重新导入失败时保留原有的表情，修复后会再次尝试
+* 重新导入后清除这些表情的结果缓存和模板图片缓存，并重启渲染进程池
+* 存在静态缓存时更新其中这些表情的清单并删除预览图，下次启动时不会读到旧的清单
+
+替换注册表前已经取得表情对象的请求继续使用旧的表情完成制作。
+"""
+
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+
+from .cache import result_cache
+from .config import meme_config
+from .executor import render_executor
+from .fast_loader import get_fast_loader
+from .log import logger
+from .manager import MemeSource, reload_source, unload_source
+from .manifest import iter_meme_sources, module_files
+from .utils import template_cache
+
+try:
+    import watchfiles
+except ImportError:
+    watchfiles = None
+
+Fingerprint = frozenset[tuple[str, int, int]]
+ReloadCallback = Callable[[list[str]], None]
+
+
+def _fingerprint(source: MemeSource) -> Fingerprint:
+    root, files = module_files(source)
+    fingerprint: set[tuple[str, int, int]] = set()
+    for file in files:
+        try:
+            stat = file.stat()
+        except OSError:
+            continue  # 扫描过程中被删除
+        relpath = file.relative_to(root).as_posix()
+        fingerprint.add((relpath, stat.st_size, stat.st_mtime_ns))
+    return frozenset(fingerprint)
+
+
+class MemeReloader:
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self.callbacks: list[ReloadCallback] = []
+        self._fingerprints: dict[MemeSource, Fingerprint] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def on_reload(self, callback: ReloadCallback):
+        """注册重新加载后的回调，参数为新增、更新或移除的表情名"""
+        self.callbacks.append(callback)
+
+    def scan(self) -> dict[MemeSource, Fingerprint]:
+        fingerprints: dict[MemeSource, Fingerprint] = {}
+        for source in iter_meme_sources():
+            try:
+                fingerprints[source] = _fingerprint(source)
+            except OSError:
+                continue
+        return fingerprints
+
+    def snapshot(self):
+        """记录当前的文件状态，之后的变化才会触发重新加载"""
+        with self._lock:
+            self._fingerprints = self.scan()
+
+    def check(self) -> list[str]:
+        """
+        检查表情文件并重新加载发生变化的模块
+        :return
+          * 新增、更新或移除的表情名
+        """
+        with self._lock:
+            fingerprints = self.scan()
+            changed = [
+                source
+                for source, fingerprint in fingerprints.items()
+                if self._fingerprints.get(source) != fingerprint
+            ]
+            removed = [
+                source for source in self._fingerprints if source not in fingerprints
+            ]
+            if not changed and not removed:
+                return []
+
+            keys: set[str] = set()
+            reloaded: dict[MemeSource, bool] = {}
+            for source in removed:
+                logger.info(f"Unloading meme module {source.module}")
+                keys.update(unload_source(source))
+                reloaded[source] = False
+                self._fingerprints.pop(source)
+            for source in changed:
+                logger.info(f"Reloading meme module {source.module}")
+                # 导入失败时保留原有的表情，文件再次变化时重试
+                self._fingerprints[source] = fingerprints[source]
+                if (source_keys := reload_source(source)) is not None:
+                    keys.update(source_keys)
+                    reloaded[source] = True
+
+            for source in reloaded:
+                template_cache.invalidate(module_files(source)[0])
+            if result_cache:
+                for key in keys:
+                    result_cache.invalidate(key)
+            if reloaded:
+                render_executor.reload_sources(reloaded)
+                try:
+                    get_fast_loader().update_sources(reloaded)
+                except Exception as e:
+                    logger.opt(exception=e).error("Failed to update static cache")
+
+        result = sorted(keys)
+        if result:
+            logger.info(f"Reloaded memes: {', '.join(result)}")
+        for callback in self.callbacks:
+            try:
+                callback(result)
+            except Exception as e:
+                logger.opt(exception=e).error("Hot reload callback failed")
+        return result
+
+    def _watch_paths(self) -> list[Path]:
+        paths = [Path(path).resolve() for path in meme_config.meme.meme_dirs]
+        if meme_config.meme.load_builtin_memes:
+            paths.append(Path(__file__).parent / "memes")
+        return [path for path in paths if path.exists()]
+
+    def _run(self):
+        if watchfiles is not None and (paths := self._watch_paths()):
+            for _ in watchfiles.watch(*paths, stop_event=self._stop):
+                self._check()
+            return
+        while not self._stop.wait(self.interval):
+            self._check()
+
+    def _check(self):
+        try:
+            self.check()
+        except Exception as e:
+            logger.opt(exception=e).error("Failed to reload memes")
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self.snapshot()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="meme-reloader", daemon=True
+        )
+        self._thread.start()
+        mode = "watchfiles" if watchfiles is not None else f"polling {self.interval}s"
+        logger.info(f"Hot reload enabled ({mode})")
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+meme_reloader = MemeReloader(interval=meme_config.server.hot_reload_interval)
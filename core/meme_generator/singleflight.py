@@ -0,0 +1,67 @@
+"""合并相同的并发制作请求
+
+同一表情被大量转发时，短时间内会收到许多表情名、图片、文字和参数都相同的请求。
+以结果缓存的键标识请求内容，内容相同的请求等待第一个请求的制作结果，
+不会重复占用渲染线程 / 进程。只合并制作结果只取决于输入的表情（``Meme.cacheable``）。
+"""
+
+import asyncio
+from collections.abc import Awaitable, Hashable
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+from .config import meme_config
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    calls: int = 0
+    executions: int = 0
+    coalesced: int = 0
+    inflight: int = 0
+
+
+class SingleFlight:
+    """只在事件循环所在的线程中使用"""
+
+    def __init__(self):
+        self.stats = SingleFlightStats()
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+    def _done(self, key: Hashable, future: asyncio.Future[Any]):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+            self.stats.inflight = len(self._inflight)
+        # 所有等待者都已取消时避免 "exception was never retrieved" 警告
+        if not future.cancelled():
+            future.exception()
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        执行 ``func``，已有相同 ``key`` 的调用正在执行时等待其结果
+        单个请求被取消（如客户端断开）不会影响其他等待同一结果的请求
+        """
+        self.stats.calls += 1
+        if (future := self._inflight.get(key)) is None:
+            future = asyncio.ensure_future(func())
+            self._inflight[key] = future
+            future.add_done_callback(lambda future: self._done(key, future))
+            self.stats.executions += 1
+            self.stats.inflight = len(self._inflight)
+        else:
+            self.stats.coalesced += 1
+        return await asyncio.shield(future)
+
+    def dump_stats(self) -> dict[str, Any]:
+        stats = asdict(self.stats)
+        stats["ratio"] = (
+            round(self.stats.coalesced / self.stats.calls, 4) if self.stats.calls else 0
+        )
+        return stats
+
+
+render_flight: Optional[SingleFlight] = (
+    SingleFlight() if meme_config.server.coalesce_renders else None
+)
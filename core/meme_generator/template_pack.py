@@ -0,0 +1,270 @@
+"""预解码的模板图片包
+
+把一个表情 ``images`` 目录下的所有模板图片解码为原始像素，连同索引写入一个文件。
+运行时通过 mmap 直接在文件缓冲区上创建 PIL 图片，无需解压 PNG / GIF，
+多个工作进程共享同一份页缓存。
+
+文件格式::
+
+    MAGIC (8 字节) | 版本 (uint32) | 索引长度 (uint32) | 索引 (JSON) | 对齐 | 像素数据
+
+索引中记录每个源文件的修改时间和大小，源文件被修改后自动回退到直接解码。
+图片包由 ``tools/pack_templates.py`` 生成，默认存放在缓存目录下的 ``template_packs`` 中。
+"""
+
+import json
+import mmap
+import numbers
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from PIL import Image
+from PIL.Image import Image as IMG
+
+from .dirs import get_cache_dir
+from .log import logger
+
+MAGIC = b"MEMEPACK"
+VERSION = 1
+HEADER = struct.Struct("<8sII")
+ALIGNMENT = 64
+PACK_SUFFIX = ".pack"
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".webp")
+
+# 可以直接映射到文件缓冲区、不需要复制的模式
+_MAP_MODES = ("L", "P", "RGBA")
+
+
+def default_pack_dir() -> Path:
+    return get_cache_dir() / "template_packs"
+
+
+def _normalize_frame(frame: IMG) -> IMG:
+    if frame.mode in ("L", "P", "RGB", "RGBA"):
+        return frame
+    return frame.convert("RGBA")
+
+
+def _dump_info(info: dict[str, Any]) -> list[tuple[str, str, Any]]:
+    """保存 ``Image.info`` 中的基本类型值，如透明色、icc_profile 等，保存图片时会用到"""
+    def plain(value: Any) -> Any:
+        if isinstance(value, (int, str)):
+            return value
+        if isinstance(value, numbers.Real):
+            # 如 jpg 的 dpi 为 IFDRational
+            return float(value)
+        raise TypeError
+
+    values = []
+    for key, value in info.items():
+        try:
+            if isinstance(value, bytes):
+                values.append((key, "bytes", value.hex()))
+            elif isinstance(value, tuple):
+                values.append((key, "tuple", [plain(v) for v in value]))
+            else:
+                values.append((key, "value", plain(value)))
+        except TypeError:
+            continue
+    return values
+
+
+def _load_info(values: list[tuple[str, str, Any]]) -> dict[str, Any]:
+    info: dict[str, Any] = {}
+    for key, kind, value in values:
+        if kind == "bytes":
+            value = bytes.fromhex(value)
+        elif kind == "tuple":
+            value = tuple(value)
+        info[key] = value
+    return info
+
+
+def _decode(path: Path) -> tuple[list[IMG], float]:
+    image = Image.open(path)
+    n_frames = getattr(image, "n_frames", 1)
+    frames: list[IMG] = []
+    total_duration = 0
+    for i in range(n_frames):
+        image.seek(i)
+        total_duration += image.info.get("duration", 20)
+        frames.append(image.copy())
+    image.seek(0)
+    if "transparency" in image.info:
+        frames[0].info["transparency"] = image.info["transparency"]
+    duration = total_duration / n_frames / 1000 if n_frames > 1 else 0
+    return frames, duration
+
+
+def write_pack(images_dir: Path, output: Path) -> int:
+    """
+    把 ``images_dir`` 下的模板图片打包到 ``output``
+    :return
+      * 打包的图片文件数
+    """
+    entries: dict[str, Any] = {}
+    chunks: list[bytes] = []
+    offset = 0
+    for path in sorted(images_dir.rglob("*")):
+        if not path.is_file() or path.suffix.lower() not in IMAGE_SUFFIXES:
+            continue
+        try:
+            frames, duration = _decode(path)
+        except Exception as e:
+            logger.warning(f"Failed to decode {path}: {e}")
+            continue
+        stat = path.stat()
+        frame_infos = []
+        for frame in frames:
+            frame = _normalize_frame(frame)
+            data = frame.tobytes()
+            info: dict[str, Any] = {
+                "offset": offset,
+                "length": len(data),
+                "mode": frame.mode,
+                "size": frame.size,
+            }
+            if frame.mode == "P":
+                info["palette_mode"] = frame.palette.mode if frame.palette else "RGB"
+                info["palette"] = bytes(frame.getpalette(None) or []).hex()  # type: ignore
+            info["info"] = _dump_info(frame.info)
+            frame_infos.append(info)
+            padding = -len(data) % ALIGNMENT
+            chunks.append(data + b"\0" * padding)
+            offset += len(data) + padding
+        entries[path.relative_to(images_dir).as_posix()] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "duration": duration,
+            "frames": frame_infos,
+        }
+
+    if not entries:
+        return 0
+
+    index = json.dumps(
+        {"root": str(images_dir.resolve()), "entries": entries},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    header_size = HEADER.size + len(index)
+    header_padding = -header_size % ALIGNMENT
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index)))
+        f.write(index)
+        f.write(b"\0" * header_padding)
+        for chunk in chunks:
+            f.write(chunk)
+    tmp_path.replace(output)
+    return len(entries)
+
+
+def read_pack_index(path: Path) -> Optional[tuple[dict[str, Any], int]]:
+    """读取图片包的索引和像素数据的起始位置，格式不符时返回 ``None``"""
+    try:
+        with open(path, "rb") as f:
+            magic, version, index_size = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                return None
+            index = json.loads(f.read(index_size))
+    except (OSError, struct.error, ValueError):
+        return None
+    header_size = HEADER.size + index_size
+    return index, header_size + (-header_size % ALIGNMENT)
+
+
+class TemplatePack:
+    def __init__(self, path: Path, index: dict[str, Any], data_offset: int):
+        self.path = path
+        self.root = Path(index["root"])
+        self.entries: dict[str, Any] = index["entries"]
+        self.data_offset = data_offset
+        self._buffer: Optional[memoryview] = None
+
+    @property
+    def buffer(self) -> memoryview:
+        if self._buffer is None:
+            with open(self.path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buffer = memoryview(mm)
+        return self._buffer
+
+    def load(self, path: Path) -> Optional[tuple[list[IMG], float]]:
+        try:
+            name = path.relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        if (entry := self.entries.get(name)) is None:
+            return None
+        stat = path.stat()
+        if stat.st_mtime_ns != entry["mtime"] or stat.st_size != entry["size"]:
+            return None
+
+        frames: list[IMG] = []
+        for info in entry["frames"]:
+            start = self.data_offset + info["offset"]
+            data = self.buffer[start : start + info["length"]]
+            mode, size = info["mode"], tuple(info["size"])
+            if mode in _MAP_MODES:
+                # 图片为只读，修改时 Pillow 会自动复制一份
+                frame = Image.frombuffer(mode, size, data, "raw", mode, 0, 1)
+            else:
+                frame = Image.frombytes(mode, size, bytes(data))
+            if mode == "P":
+                frame.putpalette(bytes.fromhex(info["palette"]), info["palette_mode"])
+            frame.info = _load_info(info["info"])
+            frames.append(frame)
+        return frames, entry["duration"]
+
+
+class TemplatePacks:
+    """按模板目录查找图片包"""
+
+    def __init__(self, pack_dir: Path):
+        self.pack_dir = pack_dir
+        self._packs: Optional[dict[Path, TemplatePack]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def packs(self) -> dict[Path, TemplatePack]:
+        if self._packs is None:
+            with self._lock:
+                if self._packs is None:
+                    self._packs = self._scan()
+        return self._packs
+
+    def _scan(self) -> dict[Path, TemplatePack]:
+        packs: dict[Path, TemplatePack] = {}
+        if not self.pack_dir.exists():
+            return packs
+        for path in self.pack_dir.rglob(f"*{PACK_SUFFIX}"):
+            if (result := read_pack_index(path)) is None:
+                logger.warning(f"Ignoring invalid template pack {path}")
+                continue
+            pack = TemplatePack(path, *result)
+            packs[pack.root] = pack
+        if packs:
+            logger.info(f"Loaded {len(packs)} template packs from {self.pack_dir}")
+        return packs
+
+    def load(self, path: Path) -> Optional[tuple[list[IMG], float]]:
+        """从图片包中读取模板的所有帧和平均帧间隔，图片包中没有时返回 ``None``"""
+        if not self.packs:
+            return None
+        path = path.resolve()
+        for parent in path.parents:
+            if (pack := self.packs.get(parent)) is not None:
+                return pack.load(path)
+        return None
+
+    def reset(self):
+        """重新扫描图片包目录"""
+        with self._lock:
+            self._packs = None
+
+
+template_packs = TemplatePacks(default_pack_dir())
@@ -3,16 +3,21 @@ import hashlib
 import inspect
 import math
 import random
+import threading
 import time
-from collections.abc import Coroutine
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from collections.abc import Coroutine, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
 from enum import Enum
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, TypeVar
 
 import httpx
+import numpy as np
 import skia
 from PIL import Image
 from PIL.Image import Image as IMG
@@ -21,7 +26,10 @@ from pil_utils.typing import ColorType
 from typing_extensions import ParamSpec
 
 from .config import meme_config
-from .exception import MemeFeedback
+from .exception import MemeFeedback, OpenImageFailed, RenderTimeout
+from .frame_pool import frame_pool
+from .gif_writer import GifStream, GifWriter
+from .template_pack import template_packs
 
 if TYPE_CHECKING:
     from .meme import Meme
@@ -49,6 +57,50 @@ def run_sync(call: Callable[P, R]) -> Callable[P, Coroutine[None, None, R]]:
     return _wrapper
 
 
+_render_deadline: ContextVar[Optional[float]] = ContextVar(
+    "_render_deadline", default=None
+)
+
+
+@contextmanager
+def render_deadline(deadline: Optional[float]) -> Iterator[None]:
+    """
+    在当前线程中设置制作期限
+    :params
+      * ``deadline``: ``time.time()`` 形式的截止时间，``None`` 表示不限制
+    """
+    token = _render_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _render_deadline.reset(token)
+
+
+def check_deadline():
+    """在帧循环中调用，超出制作期限时抛出 ``RenderTimeout`` 中止制作"""
+    if (deadline := _render_deadline.get()) is not None and time.time() > deadline:
+        raise RenderTimeout()
+
+
+_gif_stream: ContextVar[Optional[GifStream]] = ContextVar("_gif_stream", default=None)
+
+
+@contextmanager
+def gif_stream(stream: GifStream) -> Iterator[None]:
+    """在当前线程中流式输出 ``save_gif`` 的结果"""
+    token = _gif_stream.set(stream)
+    try:
+        yield
+    finally:
+        _gif_stream.reset(token)
+
+
+def _checked_frames(frames: Iterable[IMG]) -> Iterator[IMG]:
+    for frame in frames:
+        check_deadline()
+        yield frame
+
+
 def is_coroutine_callable(call: Callable[..., Any]) -> bool:
     """检查 call 是否是一个 callable 协程函数"""
     if inspect.isroutine(call):
@@ -59,41 +111,408 @@ def is_coroutine_callable(call: Callable[..., Any]) -> bool:
     return inspect.iscoroutinefunction(func_)
 
 
-def save_gif(frames: list[IMG], duration: float) -> BytesIO:
-    output = BytesIO()
-    frames[0].save(
-        output,
-        format="GIF",
-        save_all=True,
-        append_images=frames[1:],
-        duration=duration * 1000,
-        loop=0,
-        disposal=2,
-        optimize=False,
+@dataclass
+class GifEncodeInfo:
+    source_frames: int
+    """输入帧数"""
+    frames: int
+    """输出帧数"""
+    scale: float
+    """输出尺寸相对输入的缩放比例"""
+    encodes: int
+    """完整编码次数"""
+
+    def headers(self) -> dict[str, str]:
+        return {
+            "X-Gif-Frames": f"{self.frames}/{self.source_frames}",
+            "X-Gif-Scale": f"{self.scale:.3f}",
+            "X-Gif-Encodes": str(self.encodes),
+        }
+
+
+class GifOutput(BytesIO):
+    """``save_gif`` 的输出，附带编码参数"""
+
+    info: GifEncodeInfo
+
+
+GIF_SAMPLE_FRAMES = 8
+GIF_PALETTE_SAMPLE_PIXELS = 1 << 16
+GIF_MAX_ENCODES = 3
+"""``save_gif`` 完整编码的最多次数"""
+
+
+class LazyFrames(Sequence[IMG]):
+    """
+    按需制作的帧序列
+
+    访问第 i 帧时才调用 ``make(i)`` 制作，结果不会保存，逐帧编码时内存占用与帧数无关。
+    抽样的帧（``sample``）会暂存到下一次访问，抽样估算后完整编码时不必重新制作；
+    其余帧被多次访问（如缩放后重新编码）时会重新制作。
+    表情启用了逐帧并行制作（``parallel_frame_memes``）时，遍历时各帧在共用的线程池中制作。
+
+    各帧可能不按顺序制作、被制作多次，``make`` 的结果只能取决于帧序号；
+    依赖制作顺序的帧用 ``render_all`` 按顺序制作一次。
+    """
+
+    def __init__(
+        self,
+        length: int,
+        make: Callable[[Any], IMG],
+        prepare: Optional[Callable[[int], Any]] = None,
+    ):
+        """
+        :params
+          * ``make``: 制作帧的函数，参数为帧序号，指定 ``prepare`` 时为其返回值
+          * ``prepare``: 制作前的准备，如读取输入动图的帧；
+            并行制作时也在当前线程中按顺序执行，只有 ``make`` 在线程池中执行
+        """
+        self.length = length
+        self.make = make
+        self.prepare = prepare
+        self._sampled: dict[int, IMG] = {}
+
+    def __len__(self) -> int:
+        return self.length
+
+    def _task(self, index: int) -> Callable[[], IMG]:
+        """准备第 index 帧，返回制作该帧的函数"""
+        if (frame := self._sampled.pop(index, None)) is not None:
+            return lambda: frame
+        check_deadline()
+        return partial(self.make, self.prepare(index) if self.prepare else index)
+
+    def __getitem__(self, index: int) -> IMG:  # type: ignore[override]
+        if not -self.length <= index < self.length:
+            raise IndexError(index)
+        return self._task(index % self.length)()
+
+    def __iter__(self) -> Iterator[IMG]:
+        tasks = (self._task(index) for index in range(self.length))
+        return frame_pool.imap(tasks, self.length)
+
+    def sample(self, indexes: list[int]) -> list[IMG]:
+        frames = [self[index] for index in indexes]
+        self._sampled.update(zip(indexes, frames))
+        return frames
+
+    def render_all(self) -> list[IMG]:
+        """在当前线程中按顺序制作所有帧并保存，每帧只制作一次"""
+        return [self._task(index)() for index in range(self.length)]
+
+    def select(self, indexes: list[int]) -> "LazyFrames":
+        """按序号选取部分帧，选取的帧同样按需制作"""
+        return LazyFrames(
+            len(indexes), lambda task: task(), lambda i: self._task(indexes[i])
+        )
+
+
+def _sample_frames(frames: Sequence[IMG], n: int) -> list[IMG]:
+    if len(frames) <= n:
+        indexes = list(range(len(frames)))
+    else:
+        step = len(frames) / n
+        indexes = [int(i * step) for i in range(n)]
+    if isinstance(frames, LazyFrames):
+        return frames.sample(indexes)
+    return [frames[index] for index in indexes]
+
+
+def _to_rgba_array(image: IMG) -> np.ndarray:
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    return np.asarray(image)
+
+
+class GifPalette:
+    """
+    gif 全局调色板
+
+    最多 255 种颜色，索引 255 保留为透明色。
+    像素按 RGB 各取高 6 位查表映射到最近的颜色，查找表按需填充并随调色板缓存。
+    """
+
+    TRANSPARENT = 255
+
+    def __init__(self, colors: np.ndarray):
+        self.colors = colors[: self.TRANSPARENT].astype(np.uint8)
+        self.palette = self._build_palette_bytes()
+        self._lut = np.zeros(1 << 18, dtype=np.uint8)
+        self._filled = np.zeros(1 << 18, dtype=bool)
+
+    @classmethod
+    def from_images(
+        cls,
+        images: list[IMG],
+        extra_colors: list[ColorType] = [],
+        sample_pixels: int = GIF_PALETTE_SAMPLE_PIXELS,
+    ) -> "GifPalette":
+        """从图片中抽取像素，用中位切分法生成调色板；``extra_colors`` 会被保留"""
+        pixels = []
+        max_pixels = sample_pixels // max(1, len(images))
+        for image in images:
+            arr = _to_rgba_array(image).reshape(-1, 4)
+            arr = arr[:: max(1, len(arr) // max_pixels)]
+            pixels.append(arr[arr[:, 3] >= 128][:, :3])
+        sample = np.concatenate(pixels) if pixels else np.zeros((0, 3), np.uint8)
+
+        extra = [
+            Image.new("RGB", (1, 1), color).getpixel((0, 0)) for color in extra_colors
+        ]
+        colors = np.array(extra, dtype=np.uint8).reshape(-1, 3)
+        if len(sample):
+            n_colors = cls.TRANSPARENT - len(extra)
+            quantized = Image.fromarray(sample.reshape(-1, 1, 3)).quantize(
+                n_colors, method=Image.Quantize.MEDIANCUT
+            )
+            n_used = len(quantized.getcolors(n_colors) or [])  # type: ignore
+            palette = quantized.getpalette()[: n_used * 3]  # type: ignore
+            palette = np.array(palette, np.uint8).reshape(-1, 3)
+            colors = np.concatenate([colors, palette])
+        if not len(colors):
+            colors = np.zeros((1, 3), np.uint8)
+        return cls(colors)
+
+    @classmethod
+    def from_frames(cls, frames: Sequence[IMG]) -> "GifPalette":
+        """从均匀抽取的部分帧生成自适应调色板"""
+        return cls.from_images(_sample_frames(frames, GIF_SAMPLE_FRAMES))
+
+    def _build_palette_bytes(self) -> bytes:
+        # Pillow 保存时按颜色值对应索引，因此 256 个颜色必须互不相同；
+        # 颜色数不超过 255，最后一个填充色即为透明色
+        colors: list[tuple[int, ...]] = []
+        for color in map(tuple, self.colors.tolist()):
+            if color not in colors:
+                colors.append(color)
+        used = set(colors)
+        candidate = 0
+        while len(colors) < 256:
+            color = (candidate >> 16, (candidate >> 8) & 0xFF, candidate & 0xFF)
+            if color not in used:
+                colors.append(color)
+            candidate += 1
+        self.colors = np.array(colors[: self.TRANSPARENT], np.uint8)
+        return bytes(c for color in colors for c in color)
+
+    def _fill_lut(self, cells: np.ndarray):
+        """计算格子中心到调色板颜色的最近邻，格子编号为 r6 | g6 << 6 | b6 << 12"""
+        centers = np.stack([cells & 0x3F, (cells >> 6) & 0x3F, cells >> 12], axis=1)
+        centers = centers.astype(np.float32) * 4 + 2
+        colors = self.colors.astype(np.float32)
+        norms = (colors**2).sum(axis=1)
+        for start in range(0, len(cells), 16384):
+            end = start + 16384
+            dists = norms - 2 * centers[start:end] @ colors.T
+            self._lut[cells[start:end]] = dists.argmin(axis=1)
+        self._filled[cells] = True
+
+    def quantize(self, image: IMG) -> IMG:
+        """把图片映射到调色板，返回 P 模式图片"""
+        # 小端序下 RGBA 像素视为 uint32 时 r 在低位
+        pixels = _to_rgba_array(image).view(np.uint32)[..., 0]
+        cells = (
+            ((pixels >> 2) & 0x3F) | ((pixels >> 4) & 0xFC0) | ((pixels >> 6) & 0x3F000)
+        )
+        present = np.zeros_like(self._filled)
+        present[cells] = True
+        if len(missing := np.flatnonzero(present & ~self._filled)):
+            self._fill_lut(missing)
+        indexes = self._lut[cells]
+        indexes[pixels < 0x80000000] = self.TRANSPARENT
+        # L 模式的图片设置调色板后即为 P 模式
+        frame = Image.fromarray(indexes)
+        frame.putpalette(self.palette)
+        return frame
+
+
+@lru_cache(maxsize=64)
+def _cached_template_palette(
+    templates: tuple[tuple[Path, int], ...], extra_colors: tuple
+) -> GifPalette:
+    images: list[IMG] = []
+    for path, _ in templates:
+        images.extend(template_cache.get(path)[0])
+    # 模板调色板只生成一次，可以多抽取一些像素
+    return GifPalette.from_images(
+        images, list(extra_colors), sample_pixels=GIF_PALETTE_SAMPLE_PIXELS * 16
+    )
+
+
+def _template_palette(paths: tuple[Path, ...], extra_colors: tuple) -> GifPalette:
+    # 与模板图片缓存一样以修改时间为键，模板被修改（如热重载）后重新生成
+    templates = tuple((path, path.stat().st_mtime_ns) for path in paths)
+    return _cached_template_palette(templates, extra_colors)
+
+
+def template_palette(
+    *paths: Path, extra_colors: list[ColorType] = []
+) -> Callable[[], GifPalette]:
+    """
+    由表情模板图片生成固定调色板
+    适用于输出只包含模板内容（及少量固定颜色的文字）的 gif 表情
+    :params
+      * ``paths``: 模板图片路径
+      * ``extra_colors``: 需要额外保留的颜色，如文字颜色
+    :return
+      * 返回调色板的函数，模板在第一次用到调色板时才解码，结果会被缓存
+    """
+    return partial(_template_palette, tuple(paths), tuple(extra_colors))
+
+
+def _encode_gif(
+    frames: Iterable[IMG],
+    duration: float,
+    write: Callable[[bytes], Any],
+    palette: Optional[GifPalette] = None,
+) -> int:
+    """
+    逐帧编码 gif，每帧写出后即可释放，不需要同时持有所有帧
+    :return
+      * 输出的字节数
+    """
+    nbytes = 0
+
+    def _write(data: bytes):
+        nonlocal nbytes
+        nbytes += len(data)
+        write(data)
+
+    writer = GifWriter(_write, duration)
+    kwargs: dict[str, Any] = {}
+    if palette:
+        kwargs = {"palette": palette.palette, "transparency": palette.TRANSPARENT}
+    for frame in _checked_frames(frames):
+        writer.add_frame(palette.quantize(frame) if palette else frame, **kwargs)
+    writer.close()
+    return nbytes
+
+
+def _estimate_gif_size(
+    sample: list[IMG],
+    n_frames: int,
+    duration: float,
+    palette: Optional[GifPalette] = None,
+) -> float:
+    """用均匀抽取的部分帧的编码大小估算整个 gif 的大小"""
+    nbytes = _encode_gif(sample, duration, lambda data: None, palette)
+    return nbytes * n_frames / len(sample)
+
+
+def _resize_frame(frame: IMG, scale: float) -> IMG:
+    if scale >= 1:
+        return frame
+    return frame.resize(
+        (max(1, int(frame.width * scale)), max(1, int(frame.height * scale)))
     )
 
-    # 没有超出最大大小，直接返回
-    nbytes = output.getbuffer().nbytes
-    if nbytes <= meme_config.gif.gif_max_size * 10**6:
+
+def _reduce_frames(
+    frames: Sequence[IMG], duration: float, info: GifEncodeInfo
+) -> tuple[Sequence[IMG], float]:
+    """帧数超出 ``gif_max_frames`` 时均匀抽帧，未被抽到的帧不会被制作"""
+    gif_max_frames = meme_config.gif.gif_max_frames
+    n_frames = len(frames)
+    if n_frames <= gif_max_frames:
+        return frames, duration
+    ratio = n_frames / gif_max_frames
+    info.frames = gif_max_frames
+    indexes = [int(i * ratio) for i in range(gif_max_frames)]
+    if isinstance(frames, LazyFrames):
+        return frames.select(indexes), duration * ratio
+    return [frames[index] for index in indexes], duration * ratio
+
+
+def save_gif(
+    frames: Sequence[IMG],
+    duration: float,
+    palette: Optional[Callable[[], GifPalette]] = None,
+) -> BytesIO:
+    """
+    保存 gif，超出 ``gif_max_size`` 时按估算结果一次性确定抽帧和缩放参数，
+    最多完整编码 ``GIF_MAX_ENCODES`` 次
+    :params
+      * ``frames``: 帧列表，或按需制作帧的 ``LazyFrames``
+      * ``duration``: 相邻帧之间的时间间隔，单位为秒
+      * ``palette``: 返回固定调色板的函数，如 ``template_palette`` 的结果；
+        仅在 ``gif_palette`` 为 ``global`` 时使用，不指定时由抽样帧生成
+    :return
+      * ``GifOutput``，其 ``info`` 属性记录了实际使用的编码参数；
+        流式制作（``gif_stream``）时数据已逐帧发出，返回的 ``GifOutput`` 为空
+    """
+    check_deadline()
+    n_frames = len(frames)
+    sample: Optional[list[IMG]] = None
+
+    def get_sample() -> list[IMG]:
+        # 帧可能是按需制作的，抽样帧只制作一次，供调色板和大小估算共用
+        nonlocal sample
+        if sample is None:
+            sample = _sample_frames(frames, GIF_SAMPLE_FRAMES)
+        return sample
+
+    global_palette = None
+    if meme_config.gif.gif_palette == "global":
+        global_palette = palette() if palette else GifPalette.from_images(get_sample())
+
+    max_size = meme_config.gif.gif_max_size * 10**6
+    output = GifOutput()
+    info = GifEncodeInfo(
+        source_frames=n_frames, frames=n_frames, scale=1, encodes=0
+    )
+    output.info = info
+
+    # 流式制作时逐帧输出，只有表情最终输出的 gif 会调用 ``save_gif``
+    if (stream := _gif_stream.get()) is not None and not stream.started:
+        # 数据发出后无法再根据实际大小重新编码，抽帧和缩放参数只根据估算的大小确定
+        nbytes = _estimate_gif_size(get_sample(), n_frames, duration, global_palette)
+        if nbytes > max_size:
+            frames, duration = _reduce_frames(frames, duration, info)
+            nbytes = nbytes * info.frames / n_frames
+        if nbytes > max_size:
+            # 没有修正的机会，比整体编码时多留一些余量
+            info.scale = min(0.95, math.sqrt(max_size / nbytes) * 0.9)
+        info.encodes = 1
+        stream.start(info.headers())
+        resized = (_resize_frame(frame, info.scale) for frame in frames)
+        _encode_gif(resized, duration, stream.write, global_palette)
         return output
 
+    # 帧数较多时先用抽样估算大小，明显超出时跳过一次完整编码
+    estimated = None
+    if n_frames >= GIF_SAMPLE_FRAMES * 2:
+        estimated = _estimate_gif_size(
+            get_sample(), n_frames, duration, global_palette
+        )
+    if estimated is None or estimated <= max_size * 1.2:
+        nbytes = _encode_gif(frames, duration, output.write, global_palette)
+        info.encodes += 1
+        # 没有超出最大大小，直接返回
+        if nbytes <= max_size:
+            return output
+    else:
+        nbytes = estimated
+
     # 超出最大大小，帧数超出最大帧数时，缩减帧数
-    n_frames = len(frames)
-    gif_max_frames = meme_config.gif.gif_max_frames
-    if n_frames > gif_max_frames:
-        index = range(n_frames)
-        ratio = n_frames / gif_max_frames
-        index = (int(i * ratio) for i in range(gif_max_frames))
-        new_duration = duration * ratio
-        new_frames = [frames[i] for i in index]
-        return save_gif(new_frames, new_duration)
-
-    # 超出最大大小，帧数没有超出最大帧数时，缩小尺寸
-    new_frames = [
-        frame.resize((int(frame.width * 0.9), int(frame.height * 0.9)))
-        for frame in frames
-    ]
-    return save_gif(new_frames, duration)
+    frames, duration = _reduce_frames(frames, duration, info)
+    nbytes = nbytes * info.frames / n_frames
+
+    # gif 大小与像素数大致成正比，据此估算缩放比例，每次编码后用实际大小修正；
+    # 编码次数达到 ``GIF_MAX_ENCODES`` 后不再修正，最后一次编码多留一些余量
+    scale = 1.0
+    need_encode = info.encodes == 0 or info.frames != n_frames
+    while (need_encode or nbytes > max_size) and info.encodes < GIF_MAX_ENCODES:
+        if nbytes > max_size:
+            margin = 0.85 if info.encodes == GIF_MAX_ENCODES - 1 else 0.95
+            scale *= min(0.95, math.sqrt(max_size / nbytes) * margin)
+        output.seek(0)
+        output.truncate()
+        resized = (_resize_frame(frame, scale) for frame in frames)
+        nbytes = _encode_gif(resized, duration, output.write, global_palette)
+        info.encodes += 1
+        info.scale = scale
+        need_encode = False
+    return output
 
 
 def get_avg_duration(image: IMG) -> float:
@@ -120,6 +539,366 @@ def split_gif(image: IMG) -> list[IMG]:
     return frames
 
 
+class TemplateImage(BuildImage):
+    """
+    模板图片的写时复制视图
+
+    多个请求共享同一份解码后的图片：缩放、裁剪、转换等返回新图片的操作直接读取共享图片，
+    第一次访问 ``image`` 属性（绘制文字、直接修改图片等）时才复制一份。
+    会修改图片本身的操作（``paste``、``alpha_composite``、``draw_*`` 等）
+    不经过共享图片的视图，总是作用于私有副本。
+    """
+
+    def __init__(self, image: IMG):
+        self._shared = image
+        self._image: Optional[IMG] = None
+
+    @property
+    def image(self) -> IMG:
+        if self._image is None:
+            self._image = self._shared.copy()
+        return self._image
+
+    @image.setter
+    def image(self, image: IMG):
+        self._image = image
+
+    def _view(self) -> BuildImage:
+        return BuildImage(self._shared if self._image is None else self._image)
+
+    @property
+    def width(self) -> int:
+        return self._view().width
+
+    @property
+    def height(self) -> int:
+        return self._view().height
+
+    @property
+    def size(self):
+        return self._view().size
+
+    @property
+    def mode(self):
+        return self._view().mode
+
+    def paste(self, *args, **kwargs) -> "TemplateImage":
+        # paste 本身会复制一份图片，结果直接作为私有副本
+        self.image = self._view().paste(*args, **kwargs).image
+        return self
+
+
+def _view_method(name: str):
+    method = getattr(BuildImage, name)
+
+    @wraps(method)
+    def wrapper(self: TemplateImage, *args, **kwargs):
+        return method(self._view(), *args, **kwargs)
+
+    return wrapper
+
+
+# 只有返回新图片、不修改原图的方法可以直接读取共享图片
+for _name in (
+    "copy",
+    "resize",
+    "resize_canvas",
+    "resize_width",
+    "resize_height",
+    "rotate",
+    "square",
+    "circle",
+    "circle_corner",
+    "crop",
+    "convert",
+    "filter",
+    "transpose",
+    "perspective",
+    "gradient_color",
+    "motion_blur",
+    "distort",
+    "color_mask",
+    "save",
+    "save_jpg",
+    "save_png",
+):
+    setattr(TemplateImage, _name, _view_method(_name))
+
+
+TemplateKey = tuple[Path, int, Optional[str]]
+
+
+@dataclass
+class TemplateCacheStats:
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+    items: int = 0
+
+
+class TemplateCache:
+    """解码后的模板图片缓存，以路径、修改时间和转换模式为键，按解码后的字节数淘汰"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.stats = TemplateCacheStats()
+        self._cache: OrderedDict[TemplateKey, tuple[list[IMG], float, int]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _decode(path: Path, mode: Optional[str]) -> tuple[list[IMG], float]:
+        if packed := template_packs.load(path):
+            frames, duration = packed
+        else:
+            image = Image.open(path)
+            if getattr(image, "is_animated", False):
+                frames = split_gif(image)
+                duration = get_avg_duration(image)
+            else:
+                image.load()
+                frames = [image]
+                duration = 0
+        if mode:
+            frames = [frame.convert(mode) for frame in frames]
+        return frames, duration
+
+    def get(self, path: Path, mode: Optional[str] = None) -> tuple[list[IMG], float]:
+        """返回模板图片的所有帧和平均帧间隔，返回的图片不可修改"""
+        key = (path, path.stat().st_mtime_ns, mode)
+        with self._lock:
+            if (value := self._cache.get(key)) is not None:
+                self._cache.move_to_end(key)
+                self.stats.hits += 1
+                return value[0], value[1]
+            self.stats.misses += 1
+
+        frames, duration = self._decode(path, mode)
+        size = sum(
+            frame.width * frame.height * len(frame.getbands()) for frame in frames
+        )
+        if size > self.max_size:
+            return frames, duration
+        with self._lock:
+            # 文件被修改后旧的缓存不会再被用到
+            for old_key in [k for k in self._cache if k[0] == path and k[2] == mode]:
+                self.stats.size -= self._cache.pop(old_key)[2]
+            self._cache[key] = (frames, duration, size)
+            self.stats.size += size
+            while self.stats.size > self.max_size:
+                _, (_, _, evicted) = self._cache.popitem(last=False)
+                self.stats.size -= evicted
+            self.stats.items = len(self._cache)
+        return frames, duration
+
+    def invalidate(self, directory: Path):
+        """清除 ``directory`` 下模板图片的缓存，在表情模块重新加载后调用"""
+        with self._lock:
+            for key in [k for k in self._cache if directory in k[0].parents]:
+                self.stats.size -= self._cache.pop(key)[2]
+            self.stats.items = len(self._cache)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.stats.size = 0
+            self.stats.items = 0
+
+    def dump_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return asdict(self.stats)
+
+
+template_cache = TemplateCache(int(meme_config.cache.template_cache_size * 10**6))
+
+
+class SharedImage:
+    """
+    多个表情共用的输入图片，如批量制作时的图片
+
+    第一次使用时才解码，之后各表情通过写时复制的 ``TemplateImage`` 读取同一份解码结果；
+    动图逐帧读取时会改变读取位置，不能在线程间共享，每次从原始字节重新打开
+    """
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self._image: Optional[IMG] = None
+        self._animated = False
+        self._error: Optional[OpenImageFailed] = None
+        self._lock = threading.Lock()
+
+    def _decode(self):
+        try:
+            image = Image.open(BytesIO(self.data))
+            if getattr(image, "is_animated", False):
+                self._animated = True
+            else:
+                image.load()
+                self._image = image
+        except Exception as e:
+            self._error = OpenImageFailed(str(e))
+
+    def open(self) -> BuildImage:
+        with self._lock:
+            if self._image is None and not self._animated and self._error is None:
+                self._decode()
+        if self._error is not None:
+            raise self._error
+        if self._image is None:
+            return BuildImage.open(BytesIO(self.data))
+        return TemplateImage(self._image)
+
+
+def open_template(path: Path) -> BuildImage:
+    """
+    打开表情模板图片，用于替代 ``BuildImage.open(img_dir / ...)``
+    解码结果在请求间共享，返回的图片可以像普通 ``BuildImage`` 一样修改
+    """
+    frames, _ = template_cache.get(path)
+    if len(frames) > 1:
+        # 动图需要逐帧读取，使用 ``open_template_gif``
+        return BuildImage.open(path)
+    return TemplateImage(frames[0])
+
+
+def open_template_gif(
+    path: Path, mode: Optional[str] = None
+) -> tuple[list[BuildImage], float]:
+    """
+    打开 gif 表情模板
+    :params
+      * ``path``: 模板路径
+      * ``mode``: 转换后的图片模式，转换结果同样会被缓存
+    :return
+      * 帧列表和平均帧间隔（秒）
+    """
+    frames, duration = template_cache.get(path, mode)
+    return [TemplateImage(frame) for frame in frames], duration
+
+
+def _array_core(array: np.ndarray) -> np.ndarray:
+    """``np.broadcast_to`` 等得到的数组中实际存储的部分"""
+    if 0 not in array.strides:
+        return array
+    return array[tuple(slice(None) if s else slice(0, 1) for s in array.strides)]
+
+
+def _compact_array(array: np.ndarray) -> np.ndarray:
+    """把整数数组转为能容纳其取值的 uint16 或 int32，广播得到的数组保持广播"""
+    if array.dtype.kind not in "iu" or array.itemsize <= 2 or array.size == 0:
+        return array
+    core = _array_core(array)
+    low, high = int(core.min()), int(core.max())
+    int32 = np.iinfo(np.int32)
+    if low >= 0 and high <= np.iinfo(np.uint16).max:
+        dtype = np.uint16
+    elif array.itemsize > 4 and int32.min <= low and high <= int32.max:
+        dtype = np.int32
+    else:
+        return array
+    if core is array:
+        return array.astype(dtype)
+    return np.broadcast_to(core.astype(dtype), array.shape)
+
+
+class MapCache:
+    """``cache_map`` 的结果缓存，所有被装饰的函数共用，按数组实际占用的字节数淘汰"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.size = 0
+        self._cache: OrderedDict[Any, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, make: Callable[[], R]) -> R:
+        with self._lock:
+            if (value := self._cache.get(key)) is not None:
+                self._cache.move_to_end(key)
+                return value[0]
+
+        result = make()
+        arrays = result if isinstance(result, tuple) else (result,)
+        size = sum(
+            _array_core(array).nbytes
+            for array in arrays
+            if isinstance(array, np.ndarray)
+        )
+        if size > self.max_size:
+            return result
+        with self._lock:
+            if (old := self._cache.pop(key, None)) is not None:
+                self.size -= old[1]
+            self._cache[key] = (result, size)
+            self.size += size
+            while self.size > self.max_size:
+                _, (_, evicted) = self._cache.popitem(last=False)
+                self.size -= evicted
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.size = 0
+
+
+map_cache = MapCache(int(meme_config.cache.map_cache_size * 10**6))
+
+
+def cache_map(func: Callable[P, R]) -> Callable[P, R]:
+    """
+    缓存位移表、蒙版等逐像素数据的装饰器
+    被装饰的函数以尺寸、帧序号等可哈希的值为参数，返回一个或一组 numpy 数组；
+    结果按参数缓存在 ``map_cache`` 中，总大小受 ``map_cache_size`` 限制。
+    整数数组（如坐标表）按取值范围转为 uint16 或 int32 后缓存，
+    所有数组被设为只读以免被意外修改
+    """
+
+    def freeze(value: Any) -> Any:
+        if isinstance(value, np.ndarray):
+            value = _compact_array(value)
+            value.flags.writeable = False
+        return value
+
+    def make(*args: Any, **kwargs: Any) -> Any:
+        result = func(*args, **kwargs)
+        if isinstance(result, tuple):
+            return tuple(freeze(value) for value in result)
+        return freeze(result)
+
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        key = (func, args, tuple(sorted(kwargs.items())))
+        return map_cache.get(key, partial(make, *args, **kwargs))
+
+    return wrapper  # type: ignore
+
+
+def remap_image(
+    image: IMG,
+    map_x: np.ndarray,
+    map_y: np.ndarray,
+    background: Optional[IMG] = None,
+) -> IMG:
+    """
+    按位移表重映射图片，输出图片 ``(x, y)`` 处的像素取自输入图片的
+    ``(map_x[y, x], map_y[y, x])``
+    :params
+      * ``image``: 输入图片
+      * ``map_x``, ``map_y``: 与输出图片同尺寸的整数坐标表
+      * ``background``: 坐标超出输入图片范围时使用的图片，需与输出图片尺寸相同；
+        不指定时为全零（透明）
+    """
+    src = np.asarray(image)
+    valid = (map_x >= 0) & (map_x < image.width) & (map_y >= 0) & (map_y < image.height)
+    if background is None:
+        out = np.zeros(map_x.shape + src.shape[2:], dtype=src.dtype)
+    else:
+        out = np.array(background.convert(image.mode))
+    out[valid] = src[map_y[valid], map_x[valid]]
+    return Image.fromarray(out, image.mode)
+
+
 class FrameAlignPolicy(Enum):
     """
     要叠加的gif长度大于基准gif时，是否延长基准gif长度以对齐两个gif
@@ -217,85 +996,105 @@ Maker = Callable[[list[BuildImage]], BuildImage]
 GifMaker = Callable[[int], Maker]
 
 
-def merge_gif(imgs: list[BuildImage], func: Maker) -> BytesIO:
+def _frame_inputs(
+    images: list[IMG], frame_idxs: list[list[int]], i: int
+) -> list[BuildImage]:
+    """
+    第 i 帧的输入图片
+    动图定位到对应的帧并复制；静图不随帧变化，使用写时复制视图，不必每帧复制。
+    定位动图的帧会修改输入图片，并行制作时也须在同一线程中按顺序调用
+    """
+    inputs: list[BuildImage] = []
+    gif_idx = 0
+    for image in images:
+        if getattr(image, "is_animated", False):
+            image.seek(frame_idxs[gif_idx][i])
+            gif_idx += 1
+            inputs.append(BuildImage(image.copy()))
+        else:
+            # 视图可能在多个线程中同时复制，先完成延迟加载
+            image.load()
+            inputs.append(TemplateImage(image))
+    return inputs
+
+
+def merge_gif(
+    imgs: list[BuildImage], func: Maker, sequential: bool = False
+) -> BytesIO:
     """
     合并动图
     :params
       * ``imgs``: 输入图片列表
       * ``func``: 图片处理函数，输入imgs，返回处理后的图片
+      * ``sequential``: 帧的制作依赖制作顺序时设为 ``True``，如修改各帧共用的状态、
+        每帧生成随机数；所有帧按顺序制作一次并保存，不按需制作，也不并行制作
     """
     images = [img.image for img in imgs]
     gif_images = [image for image in images if getattr(image, "is_animated", False)]
 
     if len(gif_images) == 1:
-        frames: list[IMG] = []
         frame_num = getattr(gif_images[0], "n_frames", 1)
         duration = get_avg_duration(gif_images[0])
-        for i in range(frame_num):
-            frame_images: list[IMG] = []
-            for image in images:
-                if getattr(image, "is_animated", False):
-                    image.seek(i)
-                frame_images.append(image.copy())
-            frame = func([BuildImage(image) for image in frame_images])
-            frames.append(frame.image)
-        return save_gif(frames, duration)
+        frame_idxs = [list(range(frame_num))]
+    else:
+        gif_infos = [
+            (getattr(image, "n_frames", 1), get_avg_duration(image))
+            for image in gif_images
+        ]
+        duration = min(duration for _, duration in gif_infos)
+        target_gif_idx = [
+            i for i, (_, duration_) in enumerate(gif_infos) if duration_ == duration
+        ][0]
+        target_frame_num = gif_infos[target_gif_idx][0]
+        gif_infos.pop(target_gif_idx)
+        frame_idxs, target_frame_idxs = get_aligned_gif_indexes(
+            gif_infos, target_frame_num, duration, FrameAlignPolicy.extend_loop
+        )
+        frame_idxs.insert(target_gif_idx, target_frame_idxs)
+        frame_num = len(target_frame_idxs)
 
-    gif_infos = [
-        (getattr(image, "n_frames", 1), get_avg_duration(image)) for image in gif_images
-    ]
-    target_duration = min(duration for _, duration in gif_infos)
-    target_gif_idx = [
-        i for i, (_, duration) in enumerate(gif_infos) if duration == target_duration
-    ][0]
-    target_frame_num = gif_infos[target_gif_idx][0]
-    gif_infos.pop(target_gif_idx)
-    frame_idxs, target_frame_idxs = get_aligned_gif_indexes(
-        gif_infos, target_frame_num, target_duration, FrameAlignPolicy.extend_loop
-    )
-    frame_idxs.insert(target_gif_idx, target_frame_idxs)
+    # 帧在编码时逐一制作，不同时保存所有帧
+    def make_frame(inputs: list[BuildImage]) -> IMG:
+        return func(inputs).image
 
-    frames: list[IMG] = []
-    for i in range(len(target_frame_idxs)):
-        frame_images: list[IMG] = []
-        gif_idx = 0
-        for image in images:
-            if getattr(image, "is_animated", False):
-                image.seek(frame_idxs[gif_idx][i])
-                gif_idx += 1
-            frame_images.append(image.copy())
-        frame = func([BuildImage(image) for image in frame_images])
-        frames.append(frame.image)
-
-    return save_gif(frames, target_duration)
+    frames = LazyFrames(
+        frame_num, make_frame, lambda i: _frame_inputs(images, frame_idxs, i)
+    )
+    return save_gif(frames.render_all() if sequential else frames, duration)
 
 
-def make_jpg_or_gif(imgs: list[BuildImage], func: Maker) -> BytesIO:
+def make_jpg_or_gif(
+    imgs: list[BuildImage], func: Maker, sequential: bool = False
+) -> BytesIO:
     """
     制作静图或者动图
     :params
       * ``imgs``: 输入图片列表
       * ``func``: 图片处理函数，输入imgs，返回处理后的图片
+      * ``sequential``: 见 ``merge_gif``
     """
     images = [img.image for img in imgs]
     if all(not getattr(image, "is_animated", False) for image in images):
         return func(imgs).save_jpg()
 
-    return merge_gif(imgs, func)
+    return merge_gif(imgs, func, sequential)
 
 
-def make_png_or_gif(imgs: list[BuildImage], func: Maker) -> BytesIO:
+def make_png_or_gif(
+    imgs: list[BuildImage], func: Maker, sequential: bool = False
+) -> BytesIO:
     """
     制作静图或者动图
     :params
       * ``imgs``: 输入图片列表
       * ``func``: 图片处理函数，输入imgs，返回处理后的图片
+      * ``sequential``: 见 ``merge_gif``
     """
     images = [img.image for img in imgs]
     if all(not getattr(image, "is_animated", False) for image in images):
         return func(imgs).save_png()
 
-    return merge_gif(imgs, func)
+    return merge_gif(imgs, func, sequential)
 
 
 def make_gif_or_combined_gif(
@@ -304,6 +1103,7 @@ def make_gif_or_combined_gif(
     frame_num: int,
     duration: float,
     frame_align: FrameAlignPolicy = FrameAlignPolicy.no_extend,
+    sequential: bool = False,
 ) -> BytesIO:
     """
     使用静图或动图制作gif
@@ -313,10 +1113,19 @@ def make_gif_or_combined_gif(
       * ``frame_num``: 目标gif的帧数
       * ``duration``: 相邻帧之间的时间间隔，单位为秒
       * ``frame_align``: 要叠加的gif长度大于基准gif时，gif长度对齐方式
+      * ``sequential``: 见 ``merge_gif``
     """
+    def make_frame(prepared: tuple[int, list[BuildImage]]) -> IMG:
+        index, inputs = prepared
+        return maker(index)(inputs).image
+
     images = [img.image for img in imgs]
     if all(not getattr(image, "is_animated", False) for image in images):
-        return save_gif([maker(i)(imgs).image for i in range(frame_num)], duration)
+        # 每帧使用各自的视图，并行制作时帧之间不会共享可修改的输入
+        frames = LazyFrames(
+            frame_num, make_frame, lambda i: (i, _frame_inputs(images, [], i))
+        )
+        return save_gif(frames.render_all() if sequential else frames, duration)
 
     gif_infos = [
         (getattr(image, "n_frames", 1), get_avg_duration(image))
@@ -327,19 +1136,12 @@ def make_gif_or_combined_gif(
         gif_infos, frame_num, duration, frame_align
     )
 
-    frames: list[IMG] = []
-    for i, idx in enumerate(frame_idxs_target):
-        frame_images: list[IMG] = []
-        gif_idx = 0
-        for image in images:
-            if getattr(image, "is_animated", False):
-                image.seek(frame_idxs_input[gif_idx][i])
-                gif_idx += 1
-            frame_images.append(image.copy())
-        frame = maker(idx)([BuildImage(image) for image in frame_images])
-        frames.append(frame.image)
+    # 帧在编码时逐一制作，不同时保存所有帧
+    def prepare(i: int) -> tuple[int, list[BuildImage]]:
+        return frame_idxs_target[i], _frame_inputs(images, frame_idxs_input, i)
 
-    return save_gif(frames, duration)
+    frames = LazyFrames(len(frame_idxs_target), make_frame, prepare)
+    return save_gif(frames.render_all() if sequential else frames, duration)
 
 
 def to_skia_image(image: IMG) -> skia.Image:
@@ -0,0 +1,11 @@
+"""渲染进程池预先导入的模块
+
+按清单快速加载时，导入 ``meme_generator`` 只会创建延迟加载的表情，表情模块在第一次
+制作时才导入。forkserver 在 fork 工作进程之前导入本模块，加载所有表情并预热
+``preload_memes`` 中的表情，工作进程以写时复制的方式共享，第一次制作时不必再导入。
+"""
+
+from .config import meme_config
+from .prefork import preload_memes
+
+preload_memes(meme_config.server.preload_memes)
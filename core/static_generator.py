@@ -11,25 +11,42 @@ import time
 import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-import importlib
-import importlib.util
-import pkgutil
+from typing import Any, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 添加项目路径
 sys.path.insert(0, str(Path(__file__).parent))
 
-from meme_generator.config import meme_config
-from meme_generator.manager import _memes, get_memes, get_meme_keys
+# 清单通过静态解析表情模块生成，导入 meme_generator 时不加载表情
+os.environ["MEME_AUTOLOAD"] = "false"
+
+from meme_generator.fast_loader import MANIFEST_VERSION, create_lazy_meme
 from meme_generator.log import logger
+from meme_generator.manager import MemeSource, add_lazy_meme
+from meme_generator.manifest import (
+    extract_manifests,
+    iter_meme_sources,
+    merge_manifests,
+    module_files,
+)
+from meme_generator.manifest_cache import CACHE_FILE, write_manifest_cache
+
+
+# 清单的生成方式依赖这些文件，其中任一文件变化时重新生成所有meme的信息
+SHARED_FILES = ["meme.py", "tags.py", "fast_loader.py", "manifest.py"]
+
+
+def source_id(source: MemeSource) -> str:
+    """模块在缓存元数据中的标识"""
+    return source.module if source.path is None else source.path
 
 
 class StaticMemeGenerator:
     """静态meme信息生成器"""
     
-    def __init__(self, output_dir: str = "static_cache"):
+    def __init__(self, output_dir: str = "static_cache", workers: int = 0):
         self.output_dir = Path(output_dir)
+        self.workers = workers
         self.output_dir.mkdir(exist_ok=True)
         
         # 缓存文件路径
@@ -37,39 +54,89 @@ class StaticMemeGenerator:
         self.meme_info_file = self.output_dir / "meme_info.json"
         self.meme_keywords_file = self.output_dir / "meme_keywords.json"
         self.cache_meta_file = self.output_dir / "cache_meta.json"
+        self.cache_file = self.output_dir / CACHE_FILE
         self.preview_dir = self.output_dir / "previews"
         self.preview_dir.mkdir(exist_ok=True)
     
-    def calculate_directory_hash(self, directory: Path) -> str:
-        """计算目录的哈希值，用于检测变化"""
-        if not directory.exists():
-            return ""
-        
+    def calculate_files_hash(
+        self, root: Path, files: list[Path], old_files: dict[str, Any]
+    ) -> tuple[str, dict[str, Any]]:
+        """
+        按文件内容计算哈希值，用于检测变化
+        大小和修改时间都未变化的文件直接沿用上次的哈希值，
+        git checkout 等只修改时间的操作不会使缓存失效
+        """
         hash_md5 = hashlib.md5()
-        for file_path in sorted(directory.rglob("*.py")):
-            if file_path.is_file():
-                hash_md5.update(str(file_path.relative_to(directory)).encode())
-                hash_md5.update(str(file_path.stat().st_mtime).encode())
-        
-        return hash_md5.hexdigest()
+        files_info = {}
+        for file_path in files:
+            name = file_path.relative_to(root).as_posix()
+            stat = file_path.stat()
+            old = old_files.get(name)
+            if old and old[0] == stat.st_size and old[1] == stat.st_mtime_ns:
+                digest = old[2]
+            else:
+                digest = hashlib.md5(file_path.read_bytes()).hexdigest()
+            files_info[name] = [stat.st_size, stat.st_mtime_ns, digest]
+            hash_md5.update(name.encode())
+            hash_md5.update(digest.encode())
+        return hash_md5.hexdigest(), files_info
     
-    def get_current_state_hash(self) -> Dict[str, str]:
-        """获取当前所有meme目录的状态哈希"""
+    def get_current_state(
+        self, sources: list[MemeSource], cache_meta: dict[str, Any]
+    ) -> dict[str, dict[str, Any]]:
+        """获取每个meme模块以及共用文件的内容哈希"""
+        old_modules = cache_meta.get("modules", {})
         state = {}
         
-        # 内置memes目录
-        builtin_dir = Path(__file__).parent / "meme_generator" / "memes"
-        if builtin_dir.exists():
-            state["builtin"] = self.calculate_directory_hash(builtin_dir)
+        shared_dir = Path(__file__).parent / "meme_generator"
+        state[""] = dict(
+            zip(
+                ("hash", "files"),
+                self.calculate_files_hash(
+                    shared_dir,
+                    [shared_dir / name for name in SHARED_FILES],
+                    cache_meta.get("shared", {}).get("files", {}),
+                ),
+            )
+        )
         
-        # 额外的meme目录
-        for i, meme_dir in enumerate(meme_config.meme.meme_dirs):
-            if Path(meme_dir).exists():
-                state[f"extra_{i}"] = self.calculate_directory_hash(Path(meme_dir))
+        for source in sources:
+            module_id = source_id(source)
+            root, files = module_files(source)
+            old_files = old_modules.get(module_id, {}).get("files", {})
+            module_hash, files_info = self.calculate_files_hash(root, files, old_files)
+            state[module_id] = {"hash": module_hash, "files": files_info}
         
         return state
     
-    def load_cache_meta(self) -> Dict[str, Any]:
+    def get_changed_modules(
+        self,
+        sources: list[MemeSource],
+        cache_meta: dict[str, Any],
+        state: dict[str, dict[str, Any]],
+    ) -> tuple[list[MemeSource], list[str]]:
+        """
+        对比缓存元数据，找出需要重新生成的模块
+        :return
+          * 内容变化或新增的模块，以及已删除的模块标识
+        """
+        old_modules = cache_meta.get("modules", {})
+        if (
+            cache_meta.get("manifest_version") != MANIFEST_VERSION
+            or cache_meta.get("shared", {}).get("hash") != state[""]["hash"]
+        ):
+            changed = list(sources)
+        else:
+            changed = [
+                source
+                for source in sources
+                if old_modules.get(source_id(source), {}).get("hash")
+                != state[source_id(source)]["hash"]
+            ]
+        removed = [module_id for module_id in old_modules if module_id not in state]
+        return changed, removed
+    
+    def load_cache_meta(self) -> dict[str, Any]:
         """加载缓存元数据"""
         if self.cache_meta_file.exists():
             try:
@@ -79,7 +146,7 @@ class StaticMemeGenerator:
                 logger.warning(f"加载缓存元数据失败: {e}")
         return {}
     
-    def save_cache_meta(self, meta: Dict[str, Any]):
+    def save_cache_meta(self, meta: dict[str, Any]):
         """保存缓存元数据"""
         try:
             with open(self.cache_meta_file, 'w', encoding='utf-8') as f:
@@ -87,137 +154,106 @@ class StaticMemeGenerator:
         except Exception as e:
             logger.error(f"保存缓存元数据失败: {e}")
     
-    def is_cache_valid(self) -> bool:
+    def load_meme_info(self) -> dict[str, dict[str, Any]]:
+        """加载上次生成的meme信息"""
+        if self.meme_info_file.exists():
+            try:
+                with open(self.meme_info_file, encoding="utf-8") as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"加载meme信息失败: {e}")
+        return {}
+    
+    def is_cache_valid(self, include_previews: bool = False) -> bool:
         """检查缓存是否有效"""
         if not all([
             self.meme_list_file.exists(),
             self.meme_info_file.exists(),
             self.meme_keywords_file.exists(),
-            self.cache_meta_file.exists()
+            self.cache_meta_file.exists(),
+            self.cache_file.exists(),
         ]):
             return False
         
         cache_meta = self.load_cache_meta()
-        current_state = self.get_current_state_hash()
-        
-        return cache_meta.get("state_hash") == current_state
-    
-    def load_meme_modules(self):
-        """加载所有meme模块"""
-        logger.info("🔄 开始加载meme模块...")
-        
-        # 清空现有的memes
-        _memes.clear()
-        
-        # 加载内置memes
-        if meme_config.meme.load_builtin_memes:
-            builtin_dir = Path(__file__).parent / "meme_generator" / "memes"
-            if builtin_dir.exists():
-                self._load_memes_from_directory(builtin_dir, "meme_generator.memes")
-        
-        # 加载额外的meme目录
-        for meme_dir in meme_config.meme.meme_dirs:
-            if Path(meme_dir).exists():
-                self._load_memes_from_directory(Path(meme_dir))
+        if include_previews and not cache_meta.get("include_previews"):
+            return False
         
-        logger.info(f"✅ 加载完成，共加载 {len(_memes)} 个meme")
+        sources = iter_meme_sources()
+        state = self.get_current_state(sources, cache_meta)
+        changed, removed = self.get_changed_modules(sources, cache_meta, state)
+        return not changed and not removed
     
-    def _load_memes_from_directory(self, dir_path: Path, module_prefix: str = None):
-        """从目录加载memes"""
-        if module_prefix:
-            # 使用importlib加载内置模块
-            for path in dir_path.iterdir():
-                if path.is_dir() and not path.name.startswith("_"):
-                    try:
-                        importlib.import_module(f"{module_prefix}.{path.name}")
-                    except Exception as e:
-                        logger.warning(f"加载模块 {module_prefix}.{path.name} 失败: {e}")
-        else:
-            # 使用pkgutil加载外部模块
-            try:
-                for module_info in pkgutil.iter_modules([str(dir_path)]):
-                    if module_info.name.startswith("_"):
-                        continue
-                    
-                    module_spec = module_info.module_finder.find_spec(module_info.name, None)
-                    if not module_spec or not module_spec.origin or not module_spec.loader:
-                        continue
-                    
-                    try:
-                        module = importlib.util.module_from_spec(module_spec)
-                        module_spec.loader.exec_module(module)
-                    except Exception as e:
-                        logger.warning(f"加载模块 {module_spec.origin} 失败: {e}")
-            except Exception as e:
-                logger.warning(f"扫描目录 {dir_path} 失败: {e}")
-    
-    def generate_meme_list(self) -> List[str]:
+    def load_meme_modules(self, meme_info: dict[str, dict[str, Any]]):
+        """按清单注册延迟加载的meme，生成预览图时才导入对应的模块"""
+        for info in meme_info.values():
+            add_lazy_meme(create_lazy_meme(info))
+
+    def generate_meme_list(self, meme_info: dict[str, dict[str, Any]]) -> list[str]:
         """生成meme列表"""
-        return sorted(get_meme_keys())
+        return sorted(meme_info)
     
-    def generate_meme_info(self) -> Dict[str, Dict[str, Any]]:
-        """生成详细的meme信息"""
-        meme_info = {}
+    def generate_meme_info(
+        self,
+        sources: list[MemeSource],
+        changed: list[MemeSource],
+        cache_meta: dict[str, Any],
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, list[str]], list[MemeSource]]:
+        """
+        生成详细的meme信息，只重新解析变化的模块，不导入meme模块
+        :return
+          * meme信息、每个模块中的meme，以及重新解析的模块
+        """
+        old_info = self.load_meme_info() if cache_meta else {}
+        old_modules = cache_meta.get("modules", {})
+        changed_ids = {source_id(source) for source in changed}
         
-        for meme in get_memes():
-            try:
-                # 基本信息
-                info = {
-                    "key": meme.key,
-                    "keywords": meme.keywords,
-                    "shortcuts": [
-                        {
-                            "key": shortcut.key,
-                            "humanized": shortcut.humanized,
-                            "args": shortcut.args
-                        } for shortcut in meme.shortcuts
-                    ],
-                    "tags": list(meme.tags),
-                    "date_created": meme.date_created.isoformat(),
-                    "date_modified": meme.date_modified.isoformat(),
-                    "params": {
-                        "min_images": meme.params_type.min_images,
-                        "max_images": meme.params_type.max_images,
-                        "min_texts": meme.params_type.min_texts,
-                        "max_texts": meme.params_type.max_texts,
-                        "default_texts": meme.params_type.default_texts,
-                    }
-                }
-                
-                # 参数类型信息
-                if meme.params_type.args_type:
-                    args_type = meme.params_type.args_type
-                    info["args_type"] = {
-                        "parser_options": [
-                            {
-                                "names": option.names,
-                                "help_text": option.help_text,
-                                "default": option.default,
-                                "action": str(option.action) if option.action else None
-                            } for option in args_type.parser_options
-                        ]
-                    }
-                
-                meme_info[meme.key] = info
-                
-            except Exception as e:
-                logger.warning(f"生成meme {meme.key} 信息失败: {e}")
+        def reusable(source: MemeSource) -> Optional[list[dict[str, Any]]]:
+            module_id = source_id(source)
+            if module_id in changed_ids or module_id not in old_modules:
+                return None
+            infos = []
+            for key in old_modules[module_id]["memes"]:
+                # 同名meme被其他模块覆盖时，上次没有保存这个模块的信息
+                info = old_info.get(key)
+                if not info or info["module"] != {
+                    "module": source.module,
+                    "path": source.path,
+                }:
+                    return None
+                infos.append(info)
+            return infos
         
-        return meme_info
+        reused = {source: reusable(source) for source in sources}
+        rebuild = [source for source in sources if reused[source] is None]
+        results = extract_manifests(rebuild, self.workers) if rebuild else {}
+        manifests = [
+            (source, results[source] if source in results else reused[source] or [])
+            for source in sources
+        ]
+        module_memes = {
+            source_id(source): [info["key"] for info in infos]
+            for source, infos in manifests
+        }
+        return merge_manifests(manifests), module_memes, rebuild
     
-    def generate_meme_keywords(self) -> Dict[str, List[str]]:
+    def generate_meme_keywords(
+        self, meme_info: dict[str, dict[str, Any]]
+    ) -> dict[str, list[str]]:
         """生成关键词映射"""
         keyword_map = {}
         
-        for meme in get_memes():
-            for keyword in meme.keywords:
+        for key, info in meme_info.items():
+            for keyword in info["keywords"]:
                 if keyword not in keyword_map:
                     keyword_map[keyword] = []
-                keyword_map[keyword].append(meme.key)
+                keyword_map[keyword].append(key)
         
         return keyword_map
     
-    def generate_previews(self, max_workers: int = 4) -> Dict[str, str]:
+    def generate_previews(
+        self, meme_keys: list[str], max_workers: int = 4
+    ) -> dict[str, str]:
         """生成预览图（并行处理）"""
         logger.info("🖼️  开始生成预览图...")
         preview_info = {}
@@ -247,7 +283,6 @@ class StaticMemeGenerator:
                 return meme_key, None
         
         # 并行生成预览图
-        meme_keys = list(get_meme_keys())
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_key = {
                 executor.submit(generate_single_preview, key): key 
@@ -267,54 +302,124 @@ class StaticMemeGenerator:
         logger.info(f"✅ 预览图生成完成，成功生成 {len(preview_info)} 个预览图")
         return preview_info
     
-    def generate_static_cache(self, include_previews: bool = True):
-        """生成所有静态缓存"""
+    def generate_static_cache(
+        self, include_previews: bool = True, force: bool = False
+    ) -> dict[str, list[str]]:
+        """
+        生成静态缓存，只重新生成内容变化的meme
+        :params
+          * ``include_previews``: 是否生成预览图
+          * ``force``: 忽略已有缓存，重新生成所有meme
+        :return
+          * 重新生成的模块、meme以及删除的meme
+        """
         logger.info("🚀 开始生成静态缓存...")
         start_time = time.time()
         
-        # 加载所有meme模块
-        self.load_meme_modules()
+        cache_meta = {} if force else self.load_cache_meta()
+        sources = iter_meme_sources()
+        state = self.get_current_state(sources, cache_meta)
+        changed, _ = self.get_changed_modules(sources, cache_meta, state)
         
         # 生成各种缓存文件
+        logger.info("📋 生成meme详细信息...")
+        meme_info, module_memes, rebuilt_modules = self.generate_meme_info(
+            sources, changed, cache_meta
+        )
+        rebuilt_ids = {source_id(source) for source in rebuilt_modules}
+        rebuilt = sorted(
+            key
+            for key, info in meme_info.items()
+            if source_id(MemeSource(**info["module"])) in rebuilt_ids
+        )
+        old_keys = set(self.load_meme_info()) if cache_meta else set()
+        removed = sorted(old_keys - set(meme_info))
+
         logger.info("📝 生成meme列表...")
-        meme_list = self.generate_meme_list()
+        meme_list = self.generate_meme_list(meme_info)
         with open(self.meme_list_file, 'w', encoding='utf-8') as f:
             json.dump(meme_list, f, ensure_ascii=False, indent=2)
         
-        logger.info("📋 生成meme详细信息...")
-        meme_info = self.generate_meme_info()
         with open(self.meme_info_file, 'w', encoding='utf-8') as f:
             json.dump(meme_info, f, ensure_ascii=False, indent=2)
         
         logger.info("🔍 生成关键词映射...")
-        meme_keywords = self.generate_meme_keywords()
+        meme_keywords = self.generate_meme_keywords(meme_info)
         with open(self.meme_keywords_file, 'w', encoding='utf-8') as f:
             json.dump(meme_keywords, f, ensure_ascii=False, indent=2)
         
-        # 生成预览图
+        # 沿用未变化的meme的预览图，删除过期的预览图
         preview_info = {}
+        for key, preview_path in cache_meta.get("previews", {}).items():
+            preview_file = self.output_dir / preview_path
+            if key in meme_info and key not in rebuilt and preview_file.exists():
+                preview_info[key] = preview_path
+            else:
+                preview_file.unlink(missing_ok=True)
+        
+        # 生成预览图
         if include_previews:
-            preview_info = self.generate_previews()
+            missing = [key for key in meme_list if key not in preview_info]
+            if missing:
+                self.load_meme_modules({key: meme_info[key] for key in missing})
+                preview_info.update(self.generate_previews(missing))
         
         # 保存缓存元数据
         cache_meta = {
+            "manifest_version": MANIFEST_VERSION,
             "generated_at": datetime.now().isoformat(),
-            "state_hash": self.get_current_state_hash(),
+            "shared": state[""],
+            "modules": {
+                source_id(source): {
+                    **state[source_id(source)],
+                    "memes": module_memes[source_id(source)],
+                }
+                for source in sources
+            },
             "meme_count": len(meme_list),
             "preview_count": len(preview_info),
-            "include_previews": include_previews
+            "include_previews": include_previews,
+            "previews": preview_info,
+            "rebuilt": rebuilt,
+            "removed": removed,
         }
         self.save_cache_meta(cache_meta)
         
+        # 启动时读取的二进制缓存，不包含只在生成时使用的文件哈希
+        write_manifest_cache(
+            self.cache_file,
+            MANIFEST_VERSION,
+            meme_info,
+            meme_keywords,
+            {
+                key: value
+                for key, value in cache_meta.items()
+                if key not in ("shared", "modules")
+            },
+        )
+        
         elapsed_time = time.time() - start_time
         logger.info(f"✅ 静态缓存生成完成！")
         logger.info(f"📊 统计信息:")
         logger.info(f"   - meme数量: {len(meme_list)}")
+        logger.info(
+            f"   - 重新生成: {len(rebuilt_modules)}/{len(sources)} 个模块，"
+            f"{len(rebuilt)} 个meme"
+        )
+        if rebuilt and len(rebuilt) < len(meme_list):
+            logger.info(f"     {', '.join(rebuilt)}")
+        if removed:
+            logger.info(f"   - 删除: {', '.join(removed)}")
         logger.info(f"   - 预览图数量: {len(preview_info)}")
         logger.info(f"   - 生成时间: {elapsed_time:.2f}秒")
         logger.info(f"   - 缓存目录: {self.output_dir.absolute()}")
+        return {
+            "modules": sorted(rebuilt_ids),
+            "rebuilt": rebuilt,
+            "removed": removed,
+        }
     
-    def load_static_cache(self) -> Dict[str, Any]:
+    def load_static_cache(self) -> dict[str, Any]:
         """加载静态缓存"""
         if not self.is_cache_valid():
             logger.warning("静态缓存无效或不存在")
@@ -355,29 +460,42 @@ def main():
     parser.add_argument("--no-previews", action="store_true", help="不生成预览图")
     parser.add_argument("--check-cache", action="store_true", help="检查缓存状态")
     parser.add_argument("--force", action="store_true", help="强制重新生成")
+    parser.add_argument(
+        "--workers", type=int, default=0, help="解析meme模块的进程数，默认为CPU核数"
+    )
     
     args = parser.parse_args()
     
-    generator = StaticMemeGenerator(args.output_dir)
+    generator = StaticMemeGenerator(args.output_dir, args.workers)
     
     if args.check_cache:
         is_valid = generator.is_cache_valid()
         print(f"缓存状态: {'有效' if is_valid else '无效'}")
+        meta = generator.load_cache_meta()
         if is_valid:
-            meta = generator.load_cache_meta()
             print(f"生成时间: {meta.get('generated_at', '未知')}")
             print(f"meme数量: {meta.get('meme_count', '未知')}")
             print(f"预览图数量: {meta.get('preview_count', '未知')}")
+        elif meta:
+            sources = iter_meme_sources()
+            state = generator.get_current_state(sources, meta)
+            changed, removed = generator.get_changed_modules(sources, meta, state)
+            logger.info(f"需要重新生成的模块: {len(changed)}/{len(sources)}")
+            for source in changed[:20]:
+                logger.info(f"  - {source.module}")
+            if removed:
+                logger.info(f"已删除的模块: {len(removed)}")
         return
     
-    if not args.force and generator.is_cache_valid():
+    include_previews = not args.no_previews
+    if not args.force and generator.is_cache_valid(include_previews):
         print("✅ 缓存已是最新，无需重新生成")
         print("使用 --force 参数强制重新生成")
         return
     
-    # 生成静态缓存
-    generator.generate_static_cache(include_previews=not args.no_previews)
+    # 生成静态缓存，只重新生成变化的meme
+    generator.generate_static_cache(include_previews=include_previews, force=args.force)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
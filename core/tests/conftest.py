@@ -0,0 +1,23 @@
+import pytest
+
+from .utils import make_gif, make_png
+
+
+@pytest.fixture
+def png() -> bytes:
+    return make_png()
+
+
+@pytest.fixture
+def gif() -> bytes:
+    return make_gif()
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+
+    from meme_generator.app import app, register_routers
+
+    register_routers()
+    return TestClient(app)
@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from meme_generator.admission import (
+    TEXT_ONLY_COST,
+    AdmissionController,
+    gif_frame_count,
+    image_cost,
+)
+from meme_generator.exception import ServerOverloaded
+
+from .utils import make_gif, make_png
+
+
+@pytest.mark.parametrize(
+    ("workers", "heavy_concurrency", "heavy", "light"),
+    [(8, 0, 4, 4), (5, 0, 2, 3), (8, 6, 6, 2), (4, 10, 3, 1), (2, 0, 1, 1)],
+)
+def test_lanes_share_executor_capacity(workers, heavy_concurrency, heavy, light):
+    controller = AdmissionController(
+        workers, max_queue=4, heavy_cost=10, heavy_concurrency=heavy_concurrency
+    )
+    assert controller.heavy.concurrency == heavy
+    assert controller.light.concurrency == light
+    assert heavy + light == workers
+
+
+def test_estimate_cost():
+    controller = AdmissionController(4, max_queue=4, heavy_cost=10)
+    assert controller.estimate_cost("petpet", []) == TEXT_ONLY_COST
+    gif = make_gif(10, (100, 100))
+    assert gif_frame_count(gif) == 10
+    assert image_cost(gif) == pytest.approx(10 * 100 * 100 / 10**6)
+    assert image_cost(b"not an image") == 0
+
+    png = make_png((1000, 1000))
+    assert controller.estimate_cost("petpet", [png]) == pytest.approx(1)
+    # 静态输入时从输出中学习表情自身的帧数
+    controller.learn("petpet", [png], {"X-Gif-Frames": "5/5"})
+    assert controller.estimate_cost("petpet", [png]) == pytest.approx(5)
+    controller.learn("petpet", [gif], {"X-Gif-Frames": "50/50"})
+    assert controller.estimate_cost("petpet", [png]) == pytest.approx(5)
+
+
+def test_admit_queues_and_rejects():
+    async def main():
+        controller = AdmissionController(2, max_queue=1, heavy_cost=10)
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def render(name: str, cost: float):
+            async with controller.admit(name, cost):
+                order.append(name)
+                await release.wait()
+
+        first = asyncio.create_task(render("light", 1))
+        await asyncio.sleep(0)
+        assert controller.light.stats.active == 1
+        # 轻量通道已满，第二个请求排队，第三个请求被拒绝
+        second = asyncio.create_task(render("queued", 1))
+        await asyncio.sleep(0)
+        assert controller.light.stats.waiting == 1
+        with pytest.raises(ServerOverloaded) as exc_info:
+            await render("rejected", 1)
+        assert exc_info.value.retry_after >= 1
+        # 重量通道不受轻量通道影响
+        heavy = asyncio.create_task(render("heavy", 100))
+        await asyncio.sleep(0)
+        assert order == ["light", "heavy"]
+
+        release.set()
+        await asyncio.gather(first, second, heavy)
+        assert order == ["light", "heavy", "queued"]
+        assert controller.light.stats.active == 0
+        assert controller.light.stats.rejected == 1
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_does_not_leak_slot():
+    async def main():
+        controller = AdmissionController(2, max_queue=4, heavy_cost=10)
+        release = asyncio.Event()
+
+        async def render():
+            async with controller.admit("petpet", 1):
+                await release.wait()
+
+        first = asyncio.create_task(render())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(render())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        await first
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert controller.light.stats.active == 0
+        assert controller.light.stats.waiting == 0
+
+    asyncio.run(main())
+
+
+def test_meme_concurrency():
+    async def main():
+        controller = AdmissionController(
+            4, max_queue=0, heavy_cost=10, meme_concurrency=1
+        )
+        release = asyncio.Event()
+
+        async def render(key: str):
+            async with controller.admit(key, 1):
+                await release.wait()
+
+        first = asyncio.create_task(render("petpet"))
+        await asyncio.sleep(0)
+        with pytest.raises(ServerOverloaded):
+            await render("petpet")
+        other = asyncio.create_task(render("kiss"))
+        await asyncio.sleep(0)
+        assert controller.light.stats.active == 2
+        release.set()
+        await asyncio.gather(first, other)
+
+    asyncio.run(main())
+
+
+def test_overloaded_response(client, monkeypatch):
+    controller = AdmissionController(2, max_queue=0, heavy_cost=10)
+    # 模拟通道已满
+    controller.light.stats.active = controller.light.concurrency
+    monkeypatch.setattr("meme_generator.app.admission_controller", controller)
+    files = [("images", ("a.png", make_png(color=(1, 2, 3))))]
+    response = client.post("/memes/petpet/", files=files)
+    assert response.status_code == 503
+    assert int(response.headers["Retry-After"]) >= 1
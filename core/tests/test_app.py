@@ -0,0 +1,59 @@
+import json
+
+
+def test_texts_from_form(client):
+    texts = ["一", "二", "三", "四"]
+    default = client.post("/memes/wangjingze/")
+    form = client.post("/memes/wangjingze/", data={"texts": texts})
+    assert default.status_code == form.status_code == 200
+    assert form.content != default.content
+
+
+def test_texts_from_query(client):
+    texts = ["一", "二", "三", "四"]
+    form = client.post("/memes/wangjingze/", data={"texts": texts})
+    query = client.post("/memes/wangjingze/", params={"texts": texts})
+    assert query.status_code == 200
+    assert query.content == form.content
+
+
+def test_empty_texts_are_not_replaced_by_defaults(client):
+    response = client.post("/memes/wangjingze/", data={"texts": [""]})
+    assert response.status_code == 542
+
+
+def test_images_and_args(client, png):
+    files = [("images", ("avatar.png", png))]
+    default = client.post("/memes/petpet/", files=files)
+    circle = client.post(
+        "/memes/petpet/", files=files, data={"args": json.dumps({"circle": True})}
+    )
+    assert default.status_code == circle.status_code == 200
+    assert default.headers["content-type"] == "image/gif"
+    assert circle.content != default.content
+
+
+def test_invalid_args(client, png):
+    files = [("images", ("avatar.png", png))]
+    for args in ["not json", json.dumps({"circle": "maybe"})]:
+        response = client.post("/memes/petpet/", files=files, data={"args": args})
+        assert response.status_code == 552
+
+
+def test_image_number_mismatch(client):
+    assert client.post("/memes/petpet/").status_code == 541
+
+
+def test_unknown_meme(client):
+    assert client.post("/memes/no_such_meme/").status_code == 531
+
+
+def test_openapi_documents_form_fields(client):
+    schema = client.get("/openapi.json").json()
+    operation = schema["paths"]["/memes/wangjingze/"]["post"]
+    body = operation["requestBody"]["content"]["multipart/form-data"]["schema"]
+    assert body["properties"]["texts"]["minItems"] == 4
+    assert "args" in body["properties"]
+    assert not [
+        param for param in operation.get("parameters", []) if param["name"] == "texts"
+    ]
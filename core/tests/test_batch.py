@@ -0,0 +1,72 @@
+import json
+import zipfile
+from io import BytesIO
+
+
+def parse_multipart(response) -> dict[int, tuple[dict[str, str], bytes]]:
+    """按任务序号返回 multipart/mixed 中每部分的头和内容"""
+    boundary = response.headers["content-type"].split("boundary=")[1]
+    parts: dict[int, tuple[dict[str, str], bytes]] = {}
+    for part in response.content.split(f"--{boundary}".encode())[1:-1]:
+        head, _, body = part[2:].partition(b"\r\n\r\n")
+        headers = dict(
+            line.split(": ", 1) for line in head.decode("utf-8").split("\r\n")
+        )
+        assert len(body) - 2 == int(headers["Content-Length"])
+        parts[int(headers["X-Job-Index"])] = (headers, body[:-2])
+    return parts
+
+
+def post_batch(client, jobs, images: list[bytes], **params):
+    return client.post(
+        "/memes/batch",
+        params=params,
+        files=[("images", (f"{i}.png", image)) for i, image in enumerate(images)],
+        data={"jobs": json.dumps(jobs)},
+    )
+
+
+def test_batch_multipart(client, png):
+    jobs = [
+        {"key": "petpet", "images": [0]},
+        {"key": "wangjingze", "texts": ["一", "二", "三", "四"]},
+        {"key": "no_such_meme"},
+        {"key": "petpet", "images": [5]},
+        {"key": "petpet", "images": [0], "args": {"circle": "maybe"}},
+    ]
+    response = post_batch(client, jobs, [png])
+    assert response.status_code == 200
+    parts = parse_multipart(response)
+    assert sorted(parts) == [0, 1, 2, 3, 4]
+    status = {index: headers["X-Status-Code"] for index, (headers, _) in parts.items()}
+    assert status == {0: "200", 1: "200", 2: "531", 3: "400", 4: "552"}
+
+    single = client.post("/memes/petpet/", files=[("images", ("0.png", png))])
+    headers, content = parts[0]
+    assert headers["Content-Type"] == "image/gif"
+    assert headers["X-Meme-Key"] == "petpet"
+    assert content == single.content
+
+
+def test_batch_zip(client, png):
+    jobs = [{"key": "petpet", "images": [0]}, {"key": "no_such_meme"}]
+    response = post_batch(client, jobs, [png], format="zip")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    with zipfile.ZipFile(BytesIO(response.content)) as zf:
+        summary = json.loads(zf.read("results.json"))
+        assert summary[0]["status_code"] == 200
+        assert zf.read(summary[0]["filename"])[:6] == b"GIF89a"
+        assert summary[1]["status_code"] == 531
+        assert "detail" in summary[1]
+
+
+def test_batch_invalid_requests(client, png):
+    assert post_batch(client, [], [png]).status_code == 400
+    assert post_batch(client, [{"images": [0]}], [png]).status_code == 400
+    too_many = [{"key": "petpet", "images": [0]}] * 1000
+    assert post_batch(client, too_many, [png]).status_code == 400
+    response = post_batch(client, [{"key": "petpet"}], [png], format="tar")
+    assert response.status_code == 400
+    response = client.post("/memes/batch", data={"jobs": "not json"})
+    assert response.status_code == 400
@@ -0,0 +1,75 @@
+import threading
+
+from meme_generator.cache import ResultCache, make_cache_key
+
+
+def test_cache_key_depends_on_content():
+    key = make_cache_key("petpet", [b"a"], ["text"], {"circle": False})
+    assert key == make_cache_key("petpet", [b"a"], ["text"], {"circle": False})
+    assert key[0] == "petpet"
+    assert key != make_cache_key("petpet", [b"b"], ["text"], {"circle": False})
+    assert key != make_cache_key("petpet", [b"a"], ["other"], {"circle": False})
+    assert key != make_cache_key("petpet", [b"a"], ["text"], {"circle": True})
+
+
+def test_memory_lru_eviction():
+    cache = ResultCache(memory_max_size=10)
+    cache.set(("a", "1"), b"12345")
+    cache.set(("a", "2"), b"12345")
+    assert cache.get(("a", "1")) == b"12345"
+    cache.set(("a", "3"), b"12345")
+    # 最近访问过的 1 保留，2 被淘汰
+    assert cache.get(("a", "2")) is None
+    assert cache.get(("a", "1")) == b"12345"
+    assert cache.stats.memory_size == 10
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 1
+
+
+def test_disk_cache_roundtrip(tmp_path):
+    cache = ResultCache(memory_max_size=0, disk_dir=tmp_path, disk_max_size=100)
+    cache.set(("petpet", "abc"), b"content")
+    assert (tmp_path / "petpet" / "abc").read_bytes() == b"content"
+    assert cache.contains(("petpet", "abc"))
+    assert cache.get(("petpet", "abc")) == b"content"
+    assert cache.stats.disk_hits == 1
+
+    cache.invalidate("petpet")
+    assert cache.get(("petpet", "abc")) is None
+    assert cache.stats.disk_size == 0
+
+
+def test_disk_eviction_keeps_recent_files(tmp_path):
+    cache = ResultCache(memory_max_size=0, disk_dir=tmp_path, disk_max_size=25)
+    for i in range(3):
+        cache.set(("a", str(i)), b"0123456789")
+    assert cache.stats.disk_size <= 25 * 0.9
+    assert (tmp_path / "a" / "2").exists()
+    assert not (tmp_path / "a" / "0").exists()
+
+
+def test_disk_eviction_skips_temporary_files(tmp_path):
+    cache = ResultCache(memory_max_size=0, disk_dir=tmp_path, disk_max_size=25)
+    # 其他线程正在写入的临时文件
+    (tmp_path / "a").mkdir()
+    tmp_file = tmp_path / "a" / "x.1234.tmp"
+    tmp_file.write_bytes(b"0" * 100)
+    for i in range(3):
+        cache.set(("a", str(i)), b"0123456789")
+    assert tmp_file.exists()
+    assert cache.stats.disk_size == 20
+
+
+def test_disk_scan_runs_once(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "old").write_bytes(b"0123456789")
+    cache = ResultCache(memory_max_size=0, disk_dir=tmp_path, disk_max_size=1000)
+    threads = [
+        threading.Thread(target=cache.set, args=(("b", str(i)), b"01234"))
+        for i in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.stats.disk_size == 10 + 8 * 5
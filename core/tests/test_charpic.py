@@ -0,0 +1,103 @@
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+from pil_utils import BuildImage, Text2Image
+
+from meme_generator.manager import get_meme
+from meme_generator.memes.charpic import (
+    GlyphAtlas,
+    font_families,
+    font_size,
+    gray_map,
+)
+
+memes_dir = Path(__file__).parent.parent / "meme_generator" / "memes"
+
+
+@pytest.fixture(scope="module")
+def atlas() -> GlyphAtlas:
+    if (atlas := GlyphAtlas.create()) is None:
+        pytest.skip("No monospace font with an integer line height")
+    return atlas
+
+
+def image_text(atlas: GlyphAtlas, path: Path) -> np.ndarray:
+    """与 charpic 相同，把图片转换为字符索引"""
+    img = BuildImage.open(path).convert("RGBA").resize_width(150).convert("L")
+    img = img.resize((img.width, round(img.height * atlas.advance / atlas.line_height)))
+    char_lut = np.array([atlas.chars.index(c) for c in gray_map])
+    return char_lut[np.asarray(img.image)]
+
+
+def random_text(atlas: GlyphAtlas, rows: int, cols: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, len(atlas.chars), (rows, cols))
+
+
+def render(atlas: GlyphAtlas, text: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """返回图集合成的结果和逐字排版的结果"""
+    lines = ["".join(atlas.chars[i] for i in row) for row in text]
+    expected = Text2Image.from_text(
+        "\n".join(lines), font_size, font_families=font_families
+    ).to_image(bg_color="white")
+    result = atlas.render(text)
+    return (
+        np.asarray(result.convert("L"), dtype=np.float64),
+        np.asarray(expected.convert("L"), dtype=np.float64),
+    )
+
+
+def psnr(a: np.ndarray, b: np.ndarray) -> float:
+    mse = np.mean((a - b) ** 2)
+    return float("inf") if mse == 0 else 10 * np.log10(255**2 / mse)
+
+
+def assert_close(atlas: GlyphAtlas, result: np.ndarray, expected: np.ndarray):
+    assert result.shape == expected.shape
+    # 靠上的几行与逐字排版一致
+    top = atlas.line_height * 3
+    assert psnr(result[:top], expected[:top]) > 45
+    # skia 在整段文字中累加字形位置，靠下的字符有不到半像素的偏移，
+    # 按字符格子平均后的亮度仍然接近
+    assert psnr(result, expected) > 25
+    h, w = atlas.line_height, round(atlas.advance * 2)
+    rows, cols = result.shape[0] // h, result.shape[1] // w
+    cells = [
+        x[: rows * h, : cols * w].reshape(rows, h, cols, w).mean(axis=(1, 3))
+        for x in (result, expected)
+    ]
+    assert np.abs(cells[0] - cells[1]).max() < 8
+    assert abs(result.mean() - expected.mean()) < 0.5
+
+
+def test_atlas_matches_text2image(atlas):
+    path = memes_dir / "bronya_holdsign" / "images" / "0.jpg"
+    assert_close(atlas, *render(atlas, image_text(atlas, path)))
+
+
+@pytest.mark.parametrize(("rows", "cols"), [(1, 10), (5, 40), (60, 150)])
+def test_atlas_random_text(atlas, rows, cols):
+    assert_close(atlas, *render(atlas, random_text(atlas, rows, cols)))
+
+
+@pytest.mark.parametrize("blank_row", [None, 0, 2, 5])
+def test_atlas_blank_width(atlas, blank_row):
+    space = atlas.chars.index(" ")
+    text = random_text(atlas, 6, 30)
+    # 行尾的空格不计入宽度
+    text[:, 20:] = space
+    if blank_row is not None:
+        text[blank_row] = space
+    result, expected = render(atlas, text)
+    assert_close(atlas, result, expected)
+    if blank_row is not None:
+        lh = atlas.line_height
+        assert result[blank_row * lh : (blank_row + 1) * lh].min() == 255
+
+
+def test_charpic(atlas, png):
+    result = get_meme("charpic")(images=[png])
+    image = BuildImage.open(result)
+    assert image.width == math.ceil(150 * atlas.advance)
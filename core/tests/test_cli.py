@@ -0,0 +1,129 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from arclet.alconna import Alconna, command_manager
+
+from meme_generator import cli
+from meme_generator.cli import construct_parser
+from meme_generator.manager import get_memes
+
+
+def full_help() -> str:
+    parser = construct_parser(sorted(get_memes(), key=lambda meme: meme.key))
+    try:
+        return parser.formatter.format_node(["meme", "generate"])
+    finally:
+        command_manager.delete(parser)
+
+
+@pytest.fixture
+def run_cli(monkeypatch, capsys):
+    built: list[list[str]] = []
+    parsers: list[Alconna] = []
+
+    def spy(memes=None):
+        if memes is None:
+            memes = get_memes()
+        built.append(sorted(meme.key for meme in memes))
+        # 同名的命令共用帮助信息，用完后删除以免影响之后构建的命令
+        parsers.append(parser := construct_parser(memes))
+        return parser
+
+    monkeypatch.setattr(cli, "construct_parser", spy)
+    monkeypatch.setattr(cli, "setup_logger", lambda: None)
+
+    def run(*args: str) -> tuple[str, list[list[str]]]:
+        built.clear()
+        monkeypatch.setattr(sys, "argv", ["meme", *args])
+        try:
+            cli.main()
+        finally:
+            while parsers:
+                command_manager.delete(parsers.pop())
+        return capsys.readouterr().out, list(built)
+
+    return run
+
+
+@pytest.fixture
+def help_index(tmp_path, monkeypatch):
+    path = tmp_path / cli.HELP_INDEX_FILE
+    monkeypatch.setattr(cli, "get_cache_file", lambda name: tmp_path / name)
+    return path
+
+
+def test_generate_builds_only_selected_meme(run_cli, tmp_path, monkeypatch, png):
+    image = tmp_path / "avatar.png"
+    image.write_bytes(png)
+    monkeypatch.chdir(tmp_path)
+
+    out, built = run_cli("generate", "petpet", "--images", str(image), "--circle")
+    assert built == [["petpet"]]
+    assert "表情制作成功" in out
+    assert (tmp_path / "result.gif").exists()
+
+    out, built = run_cli("make", "no_such_meme")
+    assert built == []
+    assert '表情 "no_such_meme" 不存在！' in out
+
+
+def test_other_subcommands_build_no_memes(run_cli):
+    out, built = run_cli("info", "petpet")
+    assert built == [[]]
+    assert "表情名：petpet" in out
+
+    out, built = run_cli("list")
+    assert built == [[]]
+    assert len(out.splitlines()) == len(get_memes())
+
+
+def test_generate_help_index(run_cli, help_index):
+    expected = full_help()
+
+    out, built = run_cli("generate", "--help")
+    assert out.strip() == expected.strip()
+    # 首次生成帮助信息时构建所有表情的子命令，之后读取缓存
+    assert len(built) == 1
+    assert len(built[0]) == len(get_memes())
+    assert help_index.exists()
+
+    out, built = run_cli("generate")
+    assert out.strip() == expected.strip()
+    assert built == []
+
+
+def test_generate_help_index_follows_memes(run_cli, help_index, monkeypatch):
+    run_cli("generate", "--help")
+    memes = get_memes()[:3]
+    monkeypatch.setattr(cli, "get_memes", lambda: memes)
+    out, built = run_cli("generate", "-h")
+    assert built == [sorted(meme.key for meme in memes)]
+    assert all(meme.key in out for meme in memes)
+
+    # 缓存文件损坏时重新生成
+    help_index.write_text("not json")
+    rebuilt, built = run_cli("generate", "-h")
+    assert rebuilt == out
+    assert built == [sorted(meme.key for meme in memes)]
+
+
+def test_list_does_not_import_server():
+    code = (
+        "import sys\n"
+        "from meme_generator.cli import main\n"
+        "sys.argv = ['meme', 'list']\n"
+        "main()\n"
+        "print(any(name in sys.modules for name in "
+        "['meme_generator.app', 'meme_generator.download', 'uvicorn']))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines()[-1] == "False"
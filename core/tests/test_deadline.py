@@ -0,0 +1,66 @@
+import asyncio
+import time
+
+import pytest
+from PIL import Image
+
+from meme_generator.config import meme_config
+from meme_generator.exception import RenderTimeout
+from meme_generator.executor import RenderExecutor
+from meme_generator.manager import get_meme
+from meme_generator.utils import LazyFrames, check_deadline, render_deadline, save_gif
+
+from .utils import make_gif
+
+
+def test_check_deadline():
+    check_deadline()
+    with render_deadline(None):
+        check_deadline()
+    with render_deadline(time.time() + 60):
+        check_deadline()
+    with render_deadline(time.time() - 1), pytest.raises(RenderTimeout):
+        check_deadline()
+    # 期限只在 with 块内生效
+    check_deadline()
+
+
+def test_meme_call_with_expired_deadline(png):
+    with pytest.raises(RenderTimeout) as exc_info:
+        get_meme("petpet")(images=[png], deadline=time.time() - 1)
+    assert exc_info.value.status_code == 504
+
+
+def test_gif_aborted_between_frames():
+    made: list[int] = []
+
+    def make(i: int) -> Image.Image:
+        made.append(i)
+        time.sleep(0.01)
+        return Image.new("RGB", (32, 32), (i, 0, 0))
+
+    with render_deadline(time.time() + 0.2), pytest.raises(RenderTimeout):
+        save_gif(LazyFrames(200, make), 0.05)
+    # 超时后不再制作剩余的帧
+    assert 0 < len(made) < 200
+
+
+def test_executor_passes_deadline():
+    executor = RenderExecutor(backend="thread", workers=1)
+    meme = get_meme("petpet")
+    try:
+        with pytest.raises(RenderTimeout):
+            asyncio.run(
+                executor.render(
+                    meme, images=[make_gif(100)], deadline=time.time() + 0.01
+                )
+            )
+    finally:
+        executor.shutdown()
+
+
+def test_timeout_response(client, monkeypatch):
+    monkeypatch.setattr(meme_config.server, "render_timeout", 1e-6)
+    files = [("images", ("a.gif", make_gif(30)))]
+    response = client.post("/memes/petpet/", files=files)
+    assert response.status_code == 504
@@ -0,0 +1,29 @@
+import asyncio
+
+from meme_generator.executor import RenderExecutor, RenderResult
+from meme_generator.manager import get_meme
+
+
+def lazy_meme_count() -> int:
+    from meme_generator.manager import LazyMeme, get_memes
+
+    return sum(isinstance(meme, LazyMeme) for meme in get_memes())
+
+
+def test_thread_backend_renders(png):
+    executor = RenderExecutor(backend="thread", workers=1)
+    try:
+        result = asyncio.run(executor.render(get_meme("petpet"), images=[png]))
+    finally:
+        executor.shutdown()
+    assert isinstance(result, RenderResult)
+    assert result.content[:6] == b"GIF89a"
+
+
+def test_process_workers_preload_memes():
+    executor = RenderExecutor(backend="process", workers=1)
+    try:
+        # 工作进程启动时已加载所有表情，不再有延迟加载的占位对象
+        assert executor.process_pool.submit(lazy_meme_count).result(300) == 0
+    finally:
+        executor.shutdown()
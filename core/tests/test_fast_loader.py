@@ -0,0 +1,57 @@
+import pytest
+
+from meme_generator.exception import NoSuchMeme
+from meme_generator.fast_loader import create_lazy_meme
+from meme_generator.manager import (
+    LazyArgsType,
+    LazyMeme,
+    add_lazy_meme,
+    get_meme,
+    unload_source,
+)
+from meme_generator.manifest import build_manifest
+
+from .utils import ARGS_MEME, WRAPPER_MEME, write_source
+
+
+def test_lazy_meme_loads_module_on_first_use(tmp_path):
+    code = ARGS_MEME.replace('"test_args"', '"test_lazy_args"')
+    source = write_source(tmp_path, "lazy_args_meme", code)
+    info = build_manifest([source], workers=1)["test_lazy_args"]
+    lazy = create_lazy_meme(info)
+    assert lazy.source == source
+    add_lazy_meme(lazy)
+    try:
+        # 清单中的字段不需要导入模块
+        assert lazy.keywords == ["测试"]
+        assert [shortcut.key for shortcut in lazy.shortcuts] == ["圆形测试"]
+        assert not lazy.cacheable
+        args_type = lazy.params_type.args_type
+        assert isinstance(args_type, LazyArgsType)
+        assert args_type.parser_options[0].names == ["--circle", "圆"]
+        assert args_type.default_args["circle"] is False
+
+        # 访问参数模型时导入模块，注册表中的占位对象被替换为实际的表情
+        assert args_type.args_model(circle=True).circle
+        meme = get_meme("test_lazy_args")
+        assert not isinstance(meme, LazyMeme)
+        assert meme.function.__name__ == "test_args"
+        assert lazy.load() is meme
+    finally:
+        unload_source(source)
+
+
+def test_lazy_meme_not_registered_by_module(tmp_path):
+    source = write_source(tmp_path, "wrapper_meme", WRAPPER_MEME)
+    info = build_manifest([source], workers=1)["test_one"]
+    info["key"] = "test_missing"
+    lazy = create_lazy_meme(info)
+    add_lazy_meme(lazy)
+    try:
+        with pytest.raises(NoSuchMeme):
+            get_meme("test_missing")
+        # 失败结果会被记住，不会反复导入模块
+        with pytest.raises(NoSuchMeme):
+            lazy.load()
+    finally:
+        unload_source(source)
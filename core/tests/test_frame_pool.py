@@ -0,0 +1,87 @@
+import threading
+import time
+
+from pil_utils import BuildImage
+
+from meme_generator import frame_pool as frame_pool_module
+from meme_generator.frame_pool import FramePool, _frame_workers, parallel_frames
+from meme_generator.utils import Maker, make_gif_or_combined_gif
+
+
+def slow_task(i: int, threads: set[str]):
+    def task() -> int:
+        threads.add(threading.current_thread().name)
+        time.sleep(0.01)
+        return i
+
+    return task
+
+
+def test_imap_keeps_order_and_releases_workers(monkeypatch):
+    monkeypatch.setattr(frame_pool_module.frame_pool, "memes", {"test"})
+    pool = FramePool(4)
+    threads: set[str] = set()
+    with parallel_frames("test"):
+        results = list(pool.imap((slow_task(i, threads) for i in range(20)), 20))
+    assert results == list(range(20))
+    assert any(name.startswith("meme-frame") for name in threads)
+    assert pool.stats.in_use == 0
+    assert pool.stats.parallel == 1
+    pool.shutdown()
+
+
+def test_imap_releases_workers_when_stopped_early(monkeypatch):
+    monkeypatch.setattr(frame_pool_module.frame_pool, "memes", {"test"})
+    pool = FramePool(4)
+    with parallel_frames("test"):
+        results = pool.imap((slow_task(i, set()) for i in range(20)), 20)
+        next(results)
+        next(results)
+        results.close()
+    assert pool.stats.in_use == 0
+    pool.shutdown()
+
+
+def test_imap_without_workers_is_serial(monkeypatch):
+    monkeypatch.setattr(frame_pool_module.frame_pool, "memes", {"test"})
+    pool = FramePool(0)
+    threads: set[str] = set()
+    with parallel_frames("test"):
+        results = list(pool.imap((slow_task(i, threads) for i in range(5)), 5))
+    assert results == list(range(5))
+    assert threads == {threading.current_thread().name}
+    assert pool.stats.serial == 1
+    assert pool._executor is None
+
+
+def test_frame_workers(monkeypatch):
+    monkeypatch.setattr(frame_pool_module, "cpu_count", lambda: 1)
+    assert _frame_workers(0) == 1
+    assert _frame_workers(-1) == 0
+    assert _frame_workers(3) == 3
+    monkeypatch.setattr(frame_pool_module, "cpu_count", lambda: 8)
+    assert _frame_workers(0) == 7
+
+
+def test_sequential_frames_stay_in_render_thread(monkeypatch):
+    monkeypatch.setattr(frame_pool_module.frame_pool, "memes", {"test"})
+    monkeypatch.setattr(frame_pool_module.frame_pool, "workers", 4)
+    monkeypatch.setattr(frame_pool_module.frame_pool, "per_request", 4)
+
+    def run(sequential: bool) -> set[str]:
+        threads: set[str] = set()
+
+        def maker(i: int) -> Maker:
+            def make(imgs: list[BuildImage]) -> BuildImage:
+                threads.add(threading.current_thread().name)
+                return imgs[0].rotate(i * 9)
+
+            return make
+
+        image = BuildImage.new("RGB", (32, 32), "red")
+        with parallel_frames("test"):
+            make_gif_or_combined_gif([image], maker, 20, 0.05, sequential=sequential)
+        return threads
+
+    assert run(sequential=True) == {threading.current_thread().name}
+    assert len(run(sequential=False)) > 1
@@ -0,0 +1,94 @@
+from io import BytesIO
+
+import numpy as np
+from PIL import Image, ImageSequence
+from pil_utils import BuildImage
+
+from meme_generator.config import meme_config
+from meme_generator.utils import (
+    LazyFrames,
+    Maker,
+    make_gif_or_combined_gif,
+    make_jpg_or_gif,
+)
+
+from .utils import make_gif
+
+
+def noise(seed: int, size: tuple[int, int] = (96, 96)) -> Image.Image:
+    pixels = np.random.default_rng(seed).integers(0, 256, (*size, 3), np.uint8)
+    return Image.fromarray(pixels)
+
+
+def decode(output: BytesIO) -> list[bytes]:
+    image = Image.open(BytesIO(output.getvalue()))
+    return [frame.convert("RGBA").tobytes() for frame in ImageSequence.Iterator(image)]
+
+
+def test_lazy_frames_render_on_demand():
+    calls: list[int] = []
+
+    def make(i: int) -> Image.Image:
+        calls.append(i)
+        return noise(i)
+
+    frames = LazyFrames(10, make)
+    sample = frames.sample([0, 5])
+    assert calls == [0, 5]
+    # 抽样的帧在下一次访问时直接使用
+    assert frames[5] is sample[1]
+    assert calls == [0, 5]
+    frames.select([1, 3])[1]
+    assert calls == [0, 5, 3]
+    assert len(frames.render_all()) == 10
+    assert calls == [0, 5, 3, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+
+def test_sequential_frames_render_once_in_order(monkeypatch):
+    # 超出大小限制，需要抽样估算并缩放
+    monkeypatch.setattr(meme_config.gif, "gif_max_size", 0.05)
+    calls: list[int] = []
+
+    def maker(i: int) -> Maker:
+        def make(imgs: list[BuildImage]) -> BuildImage:
+            calls.append(i)
+            return BuildImage(noise(i))
+
+        return make
+
+    image = BuildImage.new("RGB", (96, 96))
+    output = make_gif_or_combined_gif([image], maker, 40, 0.05, sequential=True)
+    assert calls == list(range(40))
+    assert output.info.scale < 1
+
+    calls.clear()
+    make_gif_or_combined_gif([image], maker, 40, 0.05)
+    assert sorted(set(calls)) == list(range(40))
+    assert calls != list(range(40))
+
+
+def test_sequential_merge_gif_renders_once_in_order(monkeypatch):
+    monkeypatch.setattr(meme_config.gif, "gif_max_size", 0.05)
+    reds: list[int] = []
+
+    def make(imgs: list[BuildImage]) -> BuildImage:
+        # 输入动图第 i 帧的红色分量为 i * 40 % 256
+        reds.append(imgs[0].convert("RGB").image.getpixel((0, 0))[0])
+        return BuildImage(noise(len(reds)))
+
+    gif = BuildImage.open(BytesIO(make_gif(frames=40)))
+    make_jpg_or_gif([gif], make, sequential=True)
+    assert reds == [i * 40 % 256 for i in range(40)]
+
+
+def test_sequential_frames_match_lazy_frames():
+    def maker(i: int) -> Maker:
+        def make(imgs: list[BuildImage]) -> BuildImage:
+            return imgs[0].rotate(i * 9)
+
+        return make
+
+    image = BuildImage(noise(0))
+    lazy = make_gif_or_combined_gif([image], maker, 20, 0.05)
+    sequential = make_gif_or_combined_gif([image], maker, 20, 0.05, sequential=True)
+    assert decode(lazy) == decode(sequential)
@@ -0,0 +1,226 @@
+import asyncio
+import threading
+import time
+from io import BytesIO
+
+import numpy as np
+import pytest
+from PIL import Image, ImageSequence
+
+from meme_generator.app import GifStreamingResponse
+from meme_generator.executor import RenderExecutor, StreamedRender
+from meme_generator.gif_writer import GifStream, GifWriter, StreamClosed
+from meme_generator.manager import get_meme
+from meme_generator.utils import GifPalette
+
+from .utils import make_gif
+
+
+def decode(data: bytes) -> list[np.ndarray]:
+    image = Image.open(BytesIO(data))
+    return [np.asarray(frame.convert("RGB")) for frame in ImageSequence.Iterator(image)]
+
+
+def test_gif_writer_matches_frames():
+    frames = [Image.new("RGB", (20, 10), (i * 60, 0, 255 - i * 60)) for i in range(4)]
+    output = BytesIO()
+    writer = GifWriter(output.write, duration=0.05)
+    for frame in frames:
+        writer.add_frame(frame)
+    writer.close()
+
+    image = Image.open(BytesIO(output.getvalue()))
+    assert image.n_frames == 4
+    assert image.info["duration"] == 50
+    assert image.info["loop"] == 0
+    for frame, decoded in zip(frames, decode(output.getvalue())):
+        assert np.array_equal(np.asarray(frame), decoded)
+
+
+def moving_dot(i: int) -> Image.Image:
+    frame = Image.new("RGBA", (64, 48))
+    frame.paste((255, 0, 0, 255), (4 + i * 8, 10, 14 + i * 8, 20))
+    return frame
+
+
+def pillow_gif(frames: list[Image.Image], duration: float, **kwargs) -> bytes:
+    output = BytesIO()
+    frames[0].save(
+        output,
+        format="GIF",
+        save_all=True,
+        append_images=frames[1:],
+        duration=duration * 1000,
+        loop=0,
+        disposal=2,
+        optimize=False,
+        **kwargs,
+    )
+    return output.getvalue()
+
+
+def test_gif_writer_merges_duplicates_and_crops():
+    frames = [moving_dot(i) for i in [0, 0, 0, 1, 2, 2]] + [Image.new("RGBA", (64, 48))]
+    output = BytesIO()
+    writer = GifWriter(output.write, duration=0.05)
+    for frame in frames:
+        writer.add_frame(frame)
+    writer.close()
+
+    image = Image.open(BytesIO(output.getvalue()))
+    assert image.size == (64, 48)
+    durations = [frame.info["duration"] for frame in ImageSequence.Iterator(image)]
+    assert durations == [150, 50, 100, 50]
+    # 只编码不透明部分，完全透明的帧只有一个像素
+    sizes = [frame.tile[0][1] for frame in ImageSequence.Iterator(image)]
+    assert sizes[:3] == [(4, 10, 14, 20), (12, 10, 22, 20), (20, 10, 30, 20)]
+    assert sizes[3] == (0, 0, 1, 1)
+
+    decoded = [
+        np.asarray(frame.convert("RGBA")) for frame in ImageSequence.Iterator(image)
+    ]
+    for frame, result in zip([frames[0], frames[3], frames[4], frames[6]], decoded):
+        expected = np.asarray(frame)
+        assert np.array_equal(expected[..., 3], result[..., 3])
+        visible = expected[..., 3] > 0
+        assert np.array_equal(expected[visible], result[visible])
+
+
+@pytest.mark.parametrize("use_palette", [False, True], ids=["frame", "global"])
+def test_gif_writer_not_larger_than_pillow(use_palette):
+    rng = np.random.default_rng(0)
+    photo = Image.fromarray(rng.integers(0, 256, (48, 64, 3), dtype=np.uint8))
+    frames: list[Image.Image] = []
+    for i in range(12):
+        frame = moving_dot(i % 6)
+        frame.paste(photo.crop((0, 0, 24, 24)), (36, 20))
+        frames.extend([frame] * (1 + i % 3))
+    kwargs = {}
+    if use_palette:
+        palette = GifPalette.from_images(frames)
+        frames = [palette.quantize(frame) for frame in frames]
+        kwargs = {"palette": palette.palette, "transparency": palette.TRANSPARENT}
+
+    output = BytesIO()
+    writer = GifWriter(output.write, duration=0.05)
+    for frame in frames:
+        writer.add_frame(frame, **kwargs)
+    writer.close()
+    expected = pillow_gif(frames, 0.05, **kwargs)
+    image = Image.open(BytesIO(output.getvalue()))
+    assert image.n_frames == Image.open(BytesIO(expected)).n_frames
+    assert len(output.getvalue()) <= len(expected)
+
+
+def run_producer(stream: GifStream, chunks: int, errors: list[Exception]):
+    def produce():
+        try:
+            stream.start({})
+            for i in range(chunks):
+                stream.write(bytes([i]))
+            stream.finish()
+        except StreamClosed as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=produce)
+    thread.start()
+    return thread
+
+
+def test_stream_applies_backpressure():
+    async def main():
+        stream = GifStream(asyncio.get_running_loop(), max_chunks=4)
+        thread = run_producer(stream, 100, [])
+        assert (await stream.get())[0] == "start"
+        await asyncio.sleep(0.1)
+        # 读取方没有读取时，渲染线程最多写入 max_chunks 块
+        assert stream._queue.qsize() == 4
+        assert thread.is_alive()
+
+        received = [chunk async for chunk in stream.chunks()]
+        await asyncio.to_thread(thread.join)
+        assert received == [bytes([i]) for i in range(100)]
+
+    asyncio.run(main())
+
+
+def test_close_wakes_blocked_producer():
+    async def main():
+        stream = GifStream(asyncio.get_running_loop(), max_chunks=2)
+        errors: list[Exception] = []
+        thread = run_producer(stream, 100, errors)
+        await stream.get()
+        await asyncio.sleep(0.05)
+        stream.close()
+        await asyncio.to_thread(thread.join, 5)
+        assert not thread.is_alive()
+        assert len(errors) == 1
+
+    asyncio.run(main())
+
+
+def test_executor_stops_render_when_client_leaves(png):
+    executor = RenderExecutor(backend="thread", workers=1)
+    meme = get_meme("petpet")
+
+    async def main():
+        result = await executor.render_stream(meme, images=[make_gif(200)])
+        assert isinstance(result, StreamedRender)
+        async for _ in result.chunks:
+            break
+        result.close()
+        # 唯一的渲染线程被释放，可以继续制作
+        start = time.perf_counter()
+        await asyncio.wait_for(executor.render(meme, images=[png]), 30)
+        return time.perf_counter() - start
+
+    try:
+        assert asyncio.run(main()) < 30
+    finally:
+        executor.shutdown()
+
+
+def test_response_closes_when_body_never_starts():
+    closed = asyncio.Event()
+    started = False
+
+    async def body():
+        nonlocal started
+        started = True
+        yield b""
+
+    async def main():
+        async def on_close():
+            closed.set()
+
+        async def receive():
+            await asyncio.sleep(3600)
+
+        async def send(message):
+            # 客户端在响应头发出时已断开
+            raise OSError("disconnected")
+
+        response = GifStreamingResponse(body(), on_close=on_close)
+        scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+        with pytest.raises(Exception):  # noqa: PT011
+            await response(scope, receive, send)
+        assert closed.is_set()
+        assert not started
+
+    asyncio.run(main())
+
+
+def test_stream_response(client, monkeypatch):
+    # 结果缓存命中时不会流式输出
+    monkeypatch.setattr("meme_generator.app.result_cache", None)
+    files = [("images", ("a.gif", make_gif(6)))]
+    buffered = client.post("/memes/petpet/", files=files)
+    streamed = client.post("/memes/petpet/", params={"stream": "true"}, files=files)
+    assert streamed.status_code == 200
+    assert streamed.headers["content-type"] == "image/gif"
+    assert "content-length" not in streamed.headers
+    assert streamed.headers["X-Gif-Frames"] == buffered.headers["X-Gif-Frames"]
+    assert all(
+        np.array_equal(a, b)
+        for a, b in zip(decode(buffered.content), decode(streamed.content))
+    )
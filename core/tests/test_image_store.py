@@ -0,0 +1,66 @@
+import pytest
+
+from meme_generator.cache import ResultCache, hash_bytes
+from meme_generator.image_store import ImageStore, image_store
+
+
+def test_put_and_get(tmp_path, png):
+    store = ImageStore(
+        ResultCache(memory_max_size=0, disk_dir=tmp_path, disk_max_size=10**6),
+        decoded_items=1,
+    )
+    image_id = store.put(png)
+    assert image_id == hash_bytes(png)
+    assert store.contains(image_id)
+    assert (tmp_path / image_id[:2] / image_id).read_bytes() == png
+
+    image = store.get(image_id)
+    assert image is not None
+    assert image.data == png
+    # 解码结果在请求间共用
+    assert store.get(image_id) is image
+
+
+def test_invalid_or_missing_ids(png):
+    store = ImageStore(ResultCache(memory_max_size=10**6), decoded_items=0)
+    assert not store.contains("../../etc/passwd")
+    assert store.get("../../etc/passwd") is None
+    assert store.get("0" * 64) is None
+
+
+def test_decoded_lru(gif, png):
+    store = ImageStore(ResultCache(memory_max_size=10**6), decoded_items=1)
+    first, second = store.put(png), store.put(gif)
+    image = store.get(first)
+    store.get(second)
+    assert store.get(first) is not image
+    assert store.dump_stats()["decoded_items"] == 1
+
+
+@pytest.fixture
+def stored(client):
+    if image_store is None:
+        pytest.skip("image store is disabled")
+    return client
+
+
+def test_upload_and_reference(stored, png):
+    response = stored.post("/images", files={"image": ("avatar.png", png)})
+    assert response.status_code == 200
+    image_id = response.json()["image_id"]
+    assert stored.head(f"/images/{image_id}").status_code == 200
+    assert stored.head(f"/images/{'0' * 64}").status_code == 404
+
+    uploaded = stored.post("/memes/petpet/", files=[("images", ("a.png", png))])
+    referenced = stored.post("/memes/petpet/", data={"image_ids": [image_id]})
+    assert referenced.status_code == 200
+    assert referenced.content == uploaded.content
+
+    missing = stored.post("/memes/petpet/", data={"image_ids": ["0" * 64]})
+    assert missing.status_code == 404
+
+
+def test_upload_rejects_non_images(stored):
+    response = stored.post("/images", files={"image": ("a.txt", b"hello")})
+    assert response.status_code == 400
+    assert stored.post("/images").status_code == 400
@@ -0,0 +1,75 @@
+import pytest
+
+from meme_generator.manager import MemeSource
+from meme_generator.manifest import (
+    build_manifest,
+    extract_manifests,
+    extract_sandboxed,
+    extract_static,
+    merge_manifests,
+)
+
+from .utils import ARGS_MEME, LOOP_MEME, WRAPPER_MEME, write_source
+
+
+@pytest.mark.parametrize(
+    ("name", "code", "keys"),
+    [
+        ("args_meme", ARGS_MEME, ["test_args"]),
+        ("wrapper_meme", WRAPPER_MEME, ["test_one", "test_two"]),
+    ],
+)
+def test_static_manifest_matches_import(tmp_path, name, code, keys):
+    source = write_source(tmp_path, name, code)
+    static = extract_static(source)
+    assert static is not None
+    assert [info["key"] for info in static] == keys
+    assert static == extract_sandboxed(source)
+
+
+def test_static_manifest_does_not_import_dependencies(tmp_path):
+    code = "import not_installed_dependency\n" + WRAPPER_MEME
+    source = write_source(tmp_path, "heavy_meme", code)
+    static = extract_static(source)
+    assert static is not None
+    assert [info["params"]["max_texts"] for info in static] == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "code",
+    [LOOP_MEME, "from .utils import make\n" + WRAPPER_MEME],
+    ids=["loop", "relative_import"],
+)
+def test_not_static(tmp_path, code):
+    assert extract_static(write_source(tmp_path, "dynamic_meme", code)) is None
+
+
+def test_fallback_to_sandbox(tmp_path):
+    loop = write_source(tmp_path, "loop_meme", LOOP_MEME)
+    wrapper = write_source(tmp_path, "wrapper_meme", WRAPPER_MEME)
+    manifests = extract_manifests([loop, wrapper], workers=1)
+    assert [info["key"] for info in manifests[loop]] == ["test_loop_a", "test_loop_b"]
+    assert [info["key"] for info in manifests[wrapper]] == ["test_one", "test_two"]
+
+
+def test_merge_keeps_first_source():
+    first = MemeSource("first")
+    second = MemeSource("second")
+    manifest = merge_manifests(
+        [
+            (first, [{"key": "a", "module": "first"}]),
+            (second, [{"key": "a", "module": "second"}, {"key": "b"}]),
+        ]
+    )
+    assert list(manifest) == ["a", "b"]
+    assert manifest["a"]["module"] == "first"
+
+
+def test_builtin_meme_manifest():
+    source = MemeSource("meme_generator.memes.petpet")
+    manifest = build_manifest([source], workers=1)
+    info = manifest["petpet"]
+    assert info["module"] == {"module": source.module, "path": None}
+    assert info["params"]["min_images"] == info["params"]["max_images"] == 1
+    assert info["args_type"]["default_args"]["circle"] is False
+    assert manifest == {info["key"]: info for info in extract_sandboxed(source)}
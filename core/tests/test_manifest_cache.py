@@ -0,0 +1,121 @@
+import json
+import struct
+from pathlib import Path
+
+from meme_generator.fast_loader import (
+    MANIFEST_VERSION,
+    CachedLazyMeme,
+    FastMemeLoader,
+)
+from meme_generator.manager import (
+    LazyMeme,
+    add_lazy_meme,
+    get_meme,
+    unload_source,
+)
+from meme_generator.manifest import build_manifest
+from meme_generator.manifest_cache import (
+    CACHE_FILE,
+    HEADER,
+    ManifestCache,
+    write_manifest_cache,
+)
+
+from .utils import ARGS_MEME, write_source
+
+
+def write_cache(path: Path) -> dict:
+    meme_info = {
+        key: {"key": key, "module": {"module": f"memes.{key}", "path": None}}
+        for key in ["b", "a"]
+    }
+    write_manifest_cache(path, 2, meme_info, {"关键词": ["a"]}, {"version": "1"})
+    return meme_info
+
+
+def test_manifest_cache_roundtrip(tmp_path):
+    path = tmp_path / "memes.bin"
+    meme_info = write_cache(path)
+    cache = ManifestCache.open(path, 2)
+    assert cache is not None
+    assert cache.keys == ["a", "b"]
+    assert cache.keywords == {"关键词": ["a"]}
+    assert cache.meta == {"version": "1"}
+    assert cache.source("b") == ("memes.b", None)
+    assert cache.get("a") == meme_info["a"]
+    assert cache.get("c") is None
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_manifest_cache_rejects_invalid_files(tmp_path):
+    path = tmp_path / "memes.bin"
+    assert ManifestCache.open(path, 2) is None
+
+    write_cache(path)
+    assert ManifestCache.open(path, 3) is None
+
+    data = bytearray(path.read_bytes())
+    data[-2] ^= 0xFF
+    path.write_bytes(bytes(data))
+    assert ManifestCache.open(path, 2) is None
+
+    path.write_bytes(data[: HEADER.size - 1])
+    assert ManifestCache.open(path, 2) is None
+
+    path.write_bytes(struct.pack("<8sIIII", b"NOTMEME!", 1, 2, 0, 0))
+    assert ManifestCache.open(path, 2) is None
+
+
+def test_cached_lazy_meme_decodes_on_access(tmp_path):
+    code = ARGS_MEME.replace('"test_args"', '"test_cached_args"')
+    source = write_source(tmp_path, "cached_args_meme", code)
+    manifest = build_manifest([source], workers=1)
+    cache_dir = tmp_path / "static_cache"
+    write_manifest_cache(cache_dir / CACHE_FILE, MANIFEST_VERSION, manifest, {}, {})
+    loader = FastMemeLoader(str(cache_dir))
+    assert loader.load_cache()
+    assert loader.cache is not None
+    assert loader.get_meme_list() == ["test_cached_args"]
+
+    lazy = loader.create_lazy_meme("test_cached_args")
+    assert isinstance(lazy, CachedLazyMeme)
+    assert lazy.source == source
+    assert "keywords" not in lazy.__dict__
+    assert lazy.keywords == ["测试"]
+    assert not lazy.cacheable
+    args_type = lazy.params_type.args_type
+    assert args_type is not None
+    assert args_type.parser_options[0].names == ["--circle", "圆"]
+
+    add_lazy_meme(lazy)
+    try:
+        meme = get_meme("test_cached_args")
+        assert not isinstance(meme, LazyMeme)
+        assert meme.keywords == lazy.keywords
+    finally:
+        unload_source(source)
+
+
+def test_fall_back_to_json_cache(tmp_path):
+    source = write_source(tmp_path, "json_args_meme", ARGS_MEME)
+    manifest = build_manifest([source], workers=1)
+    cache_dir = tmp_path / "static_cache"
+    cache_dir.mkdir()
+    files = {
+        "meme_list": list(manifest),
+        "meme_info": manifest,
+        "meme_keywords": {"测试": ["test_args"]},
+        "cache_meta": {"manifest_version": MANIFEST_VERSION},
+    }
+    for name, data in files.items():
+        (cache_dir / f"{name}.json").write_text(json.dumps(data), encoding="utf-8")
+    (cache_dir / CACHE_FILE).write_bytes(b"broken")
+
+    loader = FastMemeLoader(str(cache_dir))
+    assert loader.load_cache()
+    assert loader.cache is None
+    assert loader.search_meme_by_keyword("测试") == ["test_args"]
+    lazy = loader.create_lazy_meme("test_args")
+    assert lazy is not None
+    assert not isinstance(lazy, CachedLazyMeme)
+    assert lazy.keywords == ["测试"]
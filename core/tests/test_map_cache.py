@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from meme_generator import utils
+from meme_generator.utils import MapCache, cache_map
+
+
+@pytest.fixture
+def map_cache(monkeypatch) -> MapCache:
+    cache = MapCache(10_000)
+    monkeypatch.setattr(utils, "map_cache", cache)
+    return cache
+
+
+def test_maps_are_compact_and_read_only(map_cache):
+    calls: list[int] = []
+
+    @cache_map
+    def coordinate_map(width: int, height: int) -> tuple[np.ndarray, np.ndarray]:
+        calls.append(width)
+        x = np.arange(width)[None, :] - 2
+        y = np.arange(height)[:, None]
+        return x + y, np.broadcast_to(y, (height, width))
+
+    map_x, map_y = coordinate_map(20, 10)
+    assert coordinate_map(20, 10)[0] is map_x
+    assert calls == [20]
+    assert map_x.dtype == np.int32
+    assert map_y.dtype == np.uint16
+    assert np.array_equal(map_y, np.broadcast_to(np.arange(10)[:, None], (10, 20)))
+    assert not map_x.flags.writeable
+    assert not map_y.flags.writeable
+    # 广播得到的数组只按实际存储的一列计算
+    assert map_cache.size == 20 * 10 * 4 + 10 * 2
+
+
+def test_evicts_by_size(map_cache):
+    @cache_map
+    def mask(size: int) -> np.ndarray:
+        return np.zeros((size, size), dtype=np.float64)
+
+    mask(20)
+    mask(20)
+    assert map_cache.size == 3200
+    mask(25)
+    mask(16)
+    # 三个结果共 10248 字节，超出上限，最早使用的被淘汰
+    assert map_cache.size == 5000 + 2048
+    assert mask(25) is mask(25)
+    # 超过上限的结果不缓存
+    assert mask(40) is not mask(40)
+    assert map_cache.size <= map_cache.max_size
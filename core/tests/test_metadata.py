@@ -0,0 +1,98 @@
+import gzip
+import json
+import zlib
+
+import pytest
+from fastapi import Request
+
+from meme_generator import app as app_module
+from meme_generator.app import PrecomputedResponse
+
+
+def make_request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [
+                (name.replace("_", "-").encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+@pytest.fixture
+def fake_brotli(monkeypatch):
+    """以 zlib 代替 brotli，只用于检查编码协商"""
+
+    class FakeBrotli:
+        @staticmethod
+        def compress(body: bytes) -> bytes:
+            return zlib.compress(body)
+
+    monkeypatch.setattr(app_module, "brotli", FakeBrotli)
+
+
+def test_metadata_etag(client):
+    response = client.get("/memes/keys")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('"')
+    assert "petpet" in response.json()
+
+    for if_none_match in [etag, f"W/{etag}", f'"other", {etag}', "*"]:
+        cached = client.get("/memes/keys", headers={"If-None-Match": if_none_match})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert not cached.content
+
+    changed = client.get("/memes/keys", headers={"If-None-Match": '"other"'})
+    assert changed.status_code == 200
+    assert changed.content == response.content
+
+
+def test_meme_info_etag(client):
+    response = client.get("/memes/petpet/info")
+    assert response.status_code == 200
+    assert response.json()["key"] == "petpet"
+    etag = response.headers["etag"]
+    cached = client.get("/memes/petpet/info", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    # 另一个表情的 ETag 不同
+    assert client.get("/memes/wangjingze/info").headers["etag"] != etag
+
+
+def test_content_encoding(fake_brotli):
+    content = [{"key": f"meme_{i}", "keywords": ["测试"] * 5} for i in range(50)]
+    precomputed = PrecomputedResponse.from_content(content)
+    assert json.loads(precomputed.body) == content
+    assert set(precomputed.encoded) == {"gzip", "br"}
+
+    response = precomputed.response(make_request(accept_encoding="gzip, br"))
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert zlib.decompress(response.body) == precomputed.body
+
+    response = precomputed.response(make_request(accept_encoding="gzip, br;q=0"))
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(response.body) == precomputed.body
+
+    for accept_encoding in ["identity", "gzip;q=0", "deflate"]:
+        response = precomputed.response(make_request(accept_encoding=accept_encoding))
+        assert "content-encoding" not in response.headers
+        assert response.body == precomputed.body
+    response = precomputed.response(make_request())
+    assert response.body == precomputed.body
+
+    # ETag 与编码无关，压缩结果可重复生成
+    assert precomputed.etag == PrecomputedResponse.from_content(content).etag
+    assert precomputed.encoded == PrecomputedResponse.from_content(content).encoded
+
+
+def test_small_body_not_compressed(fake_brotli):
+    precomputed = PrecomputedResponse.from_content({"version": "1.0"})
+    assert precomputed.encoded == {}
+    response = precomputed.response(make_request(accept_encoding="gzip, br"))
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+    assert response.body == precomputed.body
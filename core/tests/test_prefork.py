@@ -0,0 +1,145 @@
+import asyncio
+import gc
+import json
+import os
+import signal
+import time
+
+import pytest
+import uvicorn
+
+from meme_generator import prefork
+from meme_generator.prefork import (
+    CountRequests,
+    PreforkServer,
+    WorkerSlots,
+    read_memory,
+    worker_stats,
+)
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+
+
+def test_worker_stats(monkeypatch):
+    slots = WorkerSlots(2)
+    monkeypatch.setattr(prefork, "_slots", slots)
+    monkeypatch.setattr(prefork, "_worker_index", 0)
+    slots.reset(0, os.getpid())
+    slots.reset(0, os.getpid())
+    slots.add_request(0)
+
+    # 在子进程中记录的请求数在主进程中可见
+    if (pid := os.fork()) == 0:
+        slots.add_request(0)
+        os._exit(0)
+    os.waitpid(pid, 0)
+
+    stats = worker_stats()
+    assert stats is not None
+    assert [worker["index"] for worker in stats] == [0, 1]
+    assert stats[0]["pid"] == os.getpid()
+    assert stats[0]["current"]
+    assert stats[0]["restarts"] == 1
+    assert stats[0]["requests"] == 2
+    assert stats[0]["uptime"] >= 0
+    assert (stats[0]["memory"] is None) == (read_memory(os.getpid()) is None)
+    # 还未启动的工作进程
+    assert stats[1]["pid"] == 0
+    assert not stats[1]["current"]
+    assert stats[1]["restarts"] == stats[1]["requests"] == 0
+    assert stats[1]["memory"] is None
+
+
+def test_worker_stats_without_prefork(monkeypatch):
+    monkeypatch.setattr(prefork, "_slots", None)
+    assert worker_stats() is None
+
+
+@pytest.mark.skipif(
+    not os.path.exists(f"/proc/{os.getpid()}/smaps_rollup"),
+    reason="requires /proc/<pid>/smaps_rollup",
+)
+def test_read_memory():
+    memory = read_memory(os.getpid())
+    assert memory is not None
+    assert memory["rss"] > 0
+    assert memory["shared"] + memory["private"] == memory["rss"]
+    assert read_memory(2**22 + 1) is None
+
+
+def test_count_requests():
+    calls: list[str] = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["type"])
+
+    slots = WorkerSlots(2)
+    counted = CountRequests(app, slots, 1)
+    for scope_type in ["lifespan", "http", "http", "websocket"]:
+        asyncio.run(counted({"type": scope_type}, None, None))
+    assert calls == ["lifespan", "http", "http", "websocket"]
+    assert slots.get(1)[2] == 2
+    assert slots.get(0)[2] == 0
+
+
+def test_prefork_recycles_workers(tmp_path, monkeypatch):
+    """工作进程在 fork 前冻结的对象上运行，退出后由主进程在同一槽位重新 fork"""
+    workers = 2
+
+    def record(server: uvicorn.Server, sockets) -> int:
+        assert prefork._slots is not None
+        index = prefork._worker_index
+        app = server.config.app
+        assert isinstance(app, CountRequests)
+        assert app.index == index
+        pid, generation, requests, _ = prefork._slots.get(index)  # type: ignore
+        values = {
+            "pid": pid,
+            "requests": requests,
+            "frozen": gc.get_freeze_count(),
+            "limit": server.config.limit_max_requests,
+            "sockets": len(sockets or []),
+        }
+        (tmp_path / f"{index}-{generation}.json").write_text(json.dumps(values))
+        return generation
+
+    def run(server: uvicorn.Server, sockets=None):
+        try:
+            generation = record(server, sockets)
+        except BaseException:
+            # 避免主进程反复重启出错的工作进程
+            os.kill(os.getppid(), signal.SIGTERM)
+            raise
+        if generation == 1:
+            # 正常退出，由主进程回收并重新 fork
+            return
+        if all((tmp_path / f"{i}-2.json").exists() for i in range(workers)):
+            os.kill(os.getppid(), signal.SIGTERM)
+        time.sleep(30)
+
+    monkeypatch.setattr(uvicorn.Server, "run", run)
+    monkeypatch.setattr(prefork, "_slots", None)
+    handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+    server = PreforkServer(
+        object(), host="127.0.0.1", port=0, workers=workers, max_requests=100
+    )
+    try:
+        server.run()
+    finally:
+        gc.unfreeze()
+        for sig, handler in handlers.items():
+            signal.signal(sig, handler)
+
+    assert prefork._slots is server.slots
+    for index in range(workers):
+        first = json.loads((tmp_path / f"{index}-1.json").read_text())
+        second = json.loads((tmp_path / f"{index}-2.json").read_text())
+        assert first["pid"] != second["pid"]
+        assert first["requests"] == second["requests"] == 0
+        assert first["frozen"] > 0
+        assert second["frozen"] > 0
+        assert 100 <= first["limit"] <= 110
+        assert first["sockets"] == 1
+        # 主进程通过共享内存看到重新 fork 的工作进程
+        pid, generation, _, _ = server.slots.get(index)
+        assert (pid, generation) == (second["pid"], 2)
@@ -0,0 +1,186 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from meme_generator import reloader
+from meme_generator.cache import ResultCache
+from meme_generator.config import meme_config
+from meme_generator.exception import NoSuchMeme
+from meme_generator.fast_loader import MANIFEST_VERSION, FastMemeLoader
+from meme_generator.manager import MemeSource, get_meme, load_source, unload_source
+from meme_generator.manifest import build_manifest
+from meme_generator.manifest_cache import (
+    CACHE_FILE,
+    ManifestCache,
+    write_manifest_cache,
+)
+from meme_generator.reloader import MemeReloader
+
+MEME = """
+from datetime import datetime
+
+from meme_generator import add_meme
+
+
+def make(images, texts, args):
+    raise NotImplementedError
+
+
+add_meme(
+    "{key}",
+    make,
+    min_texts=1,
+    max_texts=1,
+    default_texts=["{keyword}"],
+    keywords=["{keyword}"],
+    date_created=datetime(2024, 1, 1),
+    date_modified=datetime(2024, 1, 1),
+)
+"""
+
+
+class FakeExecutor:
+    def __init__(self):
+        self.reloaded: list[dict[MemeSource, bool]] = []
+
+    def reload_sources(self, sources: dict[MemeSource, bool]):
+        self.reloaded.append(dict(sources))
+
+
+def write_file(path: Path, code: str):
+    path.write_text(code, encoding="utf-8")
+    # 保证修改时间变化，不依赖文件系统的时间精度
+    mtime = path.stat().st_mtime_ns + 10**9
+    os.utime(path, ns=(mtime, mtime))
+
+
+def write_meme(path: Path, key: str, keyword: str):
+    write_file(path, MEME.format(key=key, keyword=keyword))
+
+
+@pytest.fixture
+def meme_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(meme_config.meme, "load_builtin_memes", False)
+    monkeypatch.setattr(meme_config.meme, "meme_dirs", [str(tmp_path)])
+    # 不修改实际的静态缓存
+    loader = FastMemeLoader(str(tmp_path / "static_cache"))
+    monkeypatch.setattr(reloader, "get_fast_loader", lambda: loader)
+    sources: list[MemeSource] = []
+    yield tmp_path, sources
+    for source in sources:
+        unload_source(source)
+
+
+def test_reload_changed_modules(meme_dir, monkeypatch):
+    tmp_path, sources = meme_dir
+    cache = ResultCache(memory_max_size=1000)
+    executor = FakeExecutor()
+    monkeypatch.setattr(reloader, "result_cache", cache)
+    monkeypatch.setattr(reloader, "render_executor", executor)
+
+    path = tmp_path / "reload_meme.py"
+    write_meme(path, "test_reload", "旧")
+    source = MemeSource("reload_meme", str(path))
+    sources.append(source)
+    load_source(source)
+    cache.set(("test_reload", "1"), b"old")
+
+    meme_reloader = MemeReloader()
+    calls: list[list[str]] = []
+    meme_reloader.on_reload(calls.append)
+    meme_reloader.snapshot()
+    assert meme_reloader.check() == []
+    assert calls == []
+
+    write_meme(path, "test_reload", "新")
+    assert meme_reloader.check() == ["test_reload"]
+    assert get_meme("test_reload").keywords == ["新"]
+    assert calls == [["test_reload"]]
+    assert cache.get(("test_reload", "1")) is None
+    assert executor.reloaded == [{source: True}]
+
+    # 导入失败时保留原有的表情，修复后重新导入
+    write_file(path, "raise RuntimeError('broken')")
+    assert meme_reloader.check() == []
+    assert get_meme("test_reload").keywords == ["新"]
+    write_meme(path, "test_reload", "修复")
+    assert meme_reloader.check() == ["test_reload"]
+    assert get_meme("test_reload").keywords == ["修复"]
+
+    # 新增和删除模块
+    new_path = tmp_path / "new_meme.py"
+    write_meme(new_path, "test_new", "新增")
+    sources.append(MemeSource("new_meme", str(new_path)))
+    path.unlink()
+    assert meme_reloader.check() == ["test_new", "test_reload"]
+    assert get_meme("test_new").keywords == ["新增"]
+    with pytest.raises(NoSuchMeme):
+        get_meme("test_reload")
+    assert executor.reloaded[-1] == {source: False, sources[1]: True}
+
+
+def test_failing_callback_does_not_stop_reload(meme_dir, monkeypatch):
+    tmp_path, sources = meme_dir
+    monkeypatch.setattr(reloader, "render_executor", FakeExecutor())
+    meme_reloader = MemeReloader()
+    meme_reloader.snapshot()
+
+    def fail(keys: list[str]):
+        raise RuntimeError("callback failed")
+
+    calls: list[list[str]] = []
+    meme_reloader.on_reload(fail)
+    meme_reloader.on_reload(calls.append)
+    path = tmp_path / "callback_meme.py"
+    write_meme(path, "test_callback", "回调")
+    sources.append(MemeSource("callback_meme", str(path)))
+    assert meme_reloader.check() == ["test_callback"]
+    assert calls == [["test_callback"]]
+
+
+def test_reload_updates_static_cache(meme_dir, monkeypatch):
+    tmp_path, sources = meme_dir
+    monkeypatch.setattr(reloader, "render_executor", FakeExecutor())
+    path = tmp_path / "cached_meme.py"
+    write_meme(path, "test_cached", "旧")
+    source = MemeSource("cached_meme", str(path))
+    sources.append(source)
+    load_source(source)
+
+    cache_dir = tmp_path / "static_cache"
+    (cache_dir / "previews").mkdir(parents=True)
+    preview = cache_dir / "previews" / "test_cached.png"
+    preview.write_bytes(b"preview")
+    meme_info = build_manifest([source], workers=1)
+    meta = {
+        "manifest_version": MANIFEST_VERSION,
+        "previews": {"test_cached": "previews/test_cached.png"},
+    }
+    keywords = {"旧": ["test_cached"]}
+    write_manifest_cache(
+        cache_dir / CACHE_FILE, MANIFEST_VERSION, meme_info, keywords, meta
+    )
+
+    meme_reloader = MemeReloader()
+    meme_reloader.snapshot()
+    write_meme(path, "test_cached", "新")
+    assert meme_reloader.check() == ["test_cached"]
+
+    cache = ManifestCache.open(cache_dir / CACHE_FILE, MANIFEST_VERSION)
+    assert cache is not None
+    info = cache.get("test_cached")
+    assert info is not None
+    assert info["keywords"] == ["新"]
+    assert cache.keywords == {"新": ["test_cached"]}
+    # 预览图已过期，等待重新生成
+    assert not preview.exists()
+    assert cache.meta["previews"] == {}
+    assert not (cache_dir / "cache_meta.json").exists()
+
+    path.unlink()
+    assert meme_reloader.check() == ["test_cached"]
+    cache = ManifestCache.open(cache_dir / CACHE_FILE, MANIFEST_VERSION)
+    assert cache is not None
+    assert cache.keys == []
+    assert cache.keywords == {}
@@ -0,0 +1,114 @@
+from io import BytesIO
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from meme_generator import utils
+from meme_generator.config import meme_config
+from meme_generator.gif_writer import GifWriter
+from meme_generator.utils import GIF_MAX_ENCODES, GifPalette, save_gif
+
+
+def noise_frames(n: int, size: tuple[int, int] = (160, 120)) -> list[Image.Image]:
+    rng = np.random.default_rng(0)
+    return [
+        Image.fromarray(rng.integers(0, 256, (size[1], size[0], 3), np.uint8))
+        for _ in range(n)
+    ]
+
+
+@pytest.mark.parametrize("n_frames", [6, 40])
+@pytest.mark.parametrize("gif_palette", ["frame", "global"])
+def test_output_fits_max_size(monkeypatch, n_frames, gif_palette):
+    monkeypatch.setattr(meme_config.gif, "gif_max_size", 0.1)
+    monkeypatch.setattr(meme_config.gif, "gif_max_frames", 30)
+    monkeypatch.setattr(meme_config.gif, "gif_palette", gif_palette)
+    output = save_gif(noise_frames(n_frames), 0.05)
+
+    info = output.info
+    assert len(output.getvalue()) <= 0.1 * 10**6
+    assert 1 <= info.encodes <= GIF_MAX_ENCODES
+    assert info.scale < 1
+    assert info.frames == min(n_frames, 30)
+    image = Image.open(BytesIO(output.getvalue()))
+    assert image.n_frames == info.frames
+    assert image.width == int(160 * info.scale)
+
+
+def test_encodes_are_bounded(monkeypatch):
+    monkeypatch.setattr(meme_config.gif, "gif_max_size", 0.1)
+    encode_gif = utils._encode_gif
+    encodes: list[int] = []
+
+    def oversized(frames, duration, write, palette=None) -> int:
+        frames = list(frames)
+        encodes.append(len(frames))
+        encode_gif(frames, duration, write, palette)
+        # 无论如何缩放都超出大小
+        return 10**9
+
+    monkeypatch.setattr(utils, "_encode_gif", oversized)
+    output = save_gif(noise_frames(20, (64, 48)), 0.05)
+    assert output.info.encodes == GIF_MAX_ENCODES
+    # 抽样估算一次，完整编码不超过 GIF_MAX_ENCODES 次
+    assert encodes.count(20) == GIF_MAX_ENCODES
+    assert len(encodes) == GIF_MAX_ENCODES + 1
+
+
+def test_small_gif_encoded_once():
+    output = save_gif(noise_frames(20, (32, 32)), 0.05)
+    assert output.info.encodes == 1
+    assert output.info.scale == 1
+
+
+def palette_image() -> tuple[Image.Image, np.ndarray]:
+    """由 100 种颜色组成的图片，颜色各通道为 8 的倍数，互相落在不同的查找表格子中"""
+    rng = np.random.default_rng(1)
+    colors = rng.integers(0, 32, (100, 3)) * 8
+    pixels = np.dstack(
+        [colors[rng.integers(0, 100, (24, 32))], np.full((24, 32), 255)]
+    ).astype(np.uint8)
+    pixels[:4] = 0
+    return Image.fromarray(pixels), pixels
+
+
+def test_palette_round_trip():
+    image, pixels = palette_image()
+    palette = GifPalette.from_images([image])
+    assert len(palette.palette) == 768
+
+    frame = palette.quantize(image)
+    assert frame.mode == "P"
+    indexes = np.asarray(frame)
+    assert (indexes[:4] == palette.TRANSPARENT).all()
+    assert np.array_equal(palette.colors[indexes[4:]], pixels[4:, :, :3])
+    # 每种颜色和透明像素各占一个格子
+    filled = palette._filled.sum()
+    assert 0 < filled <= 101
+    # 查找表已填充，再次映射结果相同
+    assert np.array_equal(np.asarray(palette.quantize(image)), indexes)
+    assert palette._filled.sum() == filled
+
+    output = BytesIO()
+    writer = GifWriter(output.write, duration=0.05)
+    kwargs = {"palette": palette.palette, "transparency": palette.TRANSPARENT}
+    flipped = image.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
+    writer.add_frame(frame, **kwargs)
+    writer.add_frame(palette.quantize(flipped), **kwargs)
+    writer.close()
+    decoded = Image.open(BytesIO(output.getvalue()))
+    assert decoded.n_frames == 2
+    for index, expected in enumerate([pixels, pixels[:, ::-1]]):
+        decoded.seek(index)
+        result = np.asarray(decoded.convert("RGBA"))
+        # 透明像素的 RGB 为调色板中的填充色
+        assert np.array_equal(result[..., 3], expected[..., 3])
+        assert np.array_equal(result[4:], expected[4:])
+
+
+def test_palette_keeps_extra_colors():
+    image, _ = palette_image()
+    palette = GifPalette.from_images([image], extra_colors=[(1, 2, 3), "white"])
+    assert palette.colors[:2].tolist() == [[1, 2, 3], [255, 255, 255]]
+    assert len({tuple(color) for color in palette.colors.tolist()}) == 255
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from meme_generator import app
+from meme_generator.executor import RenderResult
+from meme_generator.manager import get_meme
+from meme_generator.singleflight import SingleFlight
+
+
+def test_coalesce_identical_calls():
+    async def main():
+        flight = SingleFlight()
+        calls: list[str] = []
+        release = asyncio.Event()
+
+        async def render(key: str) -> str:
+            calls.append(key)
+            await release.wait()
+            return key.upper()
+
+        tasks = [
+            asyncio.create_task(flight.do(key, lambda key=key: render(key)))
+            for key in ["a", "a", "a", "b"]
+        ]
+        await asyncio.sleep(0)
+        assert flight.stats.inflight == 2
+        release.set()
+        assert await asyncio.gather(*tasks) == ["A", "A", "A", "B"]
+        assert sorted(calls) == ["a", "b"]
+        stats = flight.dump_stats()
+        assert stats["calls"] == 4
+        assert stats["executions"] == 2
+        assert stats["coalesced"] == 2
+        assert stats["inflight"] == 0
+        assert stats["ratio"] == 0.5
+
+        # 完成后相同的调用重新执行
+        assert await flight.do("a", lambda: render("a")) == "A"
+        assert calls.count("a") == 2
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_does_not_cancel_others():
+    async def main():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def render() -> int:
+            await release.wait()
+            return 1
+
+        first = asyncio.create_task(flight.do("key", render))
+        second = asyncio.create_task(flight.do("key", render))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        assert await second == 1
+        assert first.cancelled()
+        assert flight.stats.executions == 1
+
+    asyncio.run(main())
+
+
+def test_error_is_shared_and_not_kept():
+    async def main():
+        flight = SingleFlight()
+        release = asyncio.Event()
+        executions = 0
+
+        async def render() -> int:
+            nonlocal executions
+            executions += 1
+            await release.wait()
+            raise ValueError("failed")
+
+        tasks = [asyncio.create_task(flight.do("key", render)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        assert executions == 1
+        assert flight.stats.inflight == 0
+
+        with pytest.raises(ValueError, match="failed"):
+            await flight.do("key", render)
+        assert executions == 2
+
+    asyncio.run(main())
+
+
+def test_render_meme_coalesces_cacheable_memes(monkeypatch, png):
+    flight = SingleFlight()
+    monkeypatch.setattr(app, "render_flight", flight)
+    monkeypatch.setattr(app, "result_cache", None)
+    monkeypatch.setattr(app, "admission_controller", None)
+    renders: list[str] = []
+
+    async def render(meme, **kwargs) -> RenderResult:
+        renders.append(meme.key)
+        await asyncio.sleep(0.01)
+        return RenderResult(content=meme.key.encode())
+
+    monkeypatch.setattr(app.render_executor, "render", render)
+
+    async def main():
+        petpet = get_meme("petpet")
+        results = await asyncio.gather(
+            *(app.render_meme(petpet, [png], [], {}) for _ in range(3))
+        )
+        assert [result.content for result in results] == [b"petpet"] * 3
+        assert renders == ["petpet"]
+
+        # 含随机因素的表情每次单独制作
+        dont_touch = get_meme("dont_touch")
+        assert not dont_touch.cacheable
+        await asyncio.gather(
+            *(app.render_meme(dont_touch, [png], [], {}) for _ in range(2))
+        )
+        assert renders == ["petpet", "dont_touch", "dont_touch"]
+
+    asyncio.run(main())
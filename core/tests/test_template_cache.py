@@ -0,0 +1,51 @@
+import os
+
+from PIL import Image
+from pil_utils import BuildImage
+
+from meme_generator.manager import get_meme
+from meme_generator.utils import TemplateImage, template_cache, template_palette
+
+
+def test_template_image_copy_on_write():
+    shared = Image.new("RGBA", (10, 10), (0, 0, 0, 0))
+    red = Image.new("RGBA", (4, 4), (255, 0, 0, 255))
+
+    image = TemplateImage(shared)
+    image.alpha_composite(red, (2, 2))
+    image.paste(red, (6, 6))
+    image.draw_rectangle((0, 0, 1, 1), fill=(0, 255, 0, 255))
+    assert shared.getextrema() == ((0, 0),) * 4
+    assert image.image.getpixel((3, 3)) == (255, 0, 0, 255)
+    assert image.image.getpixel((7, 7)) == (255, 0, 0, 255)
+    assert image.image.getpixel((0, 0)) == (0, 255, 0, 255)
+
+    # 不修改原图的操作读取共享图片
+    resized = TemplateImage(shared).resize((5, 5))
+    assert isinstance(resized, BuildImage)
+    assert resized.size == (5, 5)
+
+
+def test_template_not_modified_by_previous_render():
+    meme = get_meme("atri_pillow")
+    args = {"mode": "yes"}
+    template_cache.clear()
+    meme(texts=["AAAA"], args=args)
+    after_other_text = meme(texts=["BBBB"], args=args).getvalue()
+    template_cache.clear()
+    fresh = meme(texts=["BBBB"], args=args).getvalue()
+    assert after_other_text == fresh
+
+
+def test_template_palette_follows_file_changes(tmp_path):
+    path = tmp_path / "template.png"
+    Image.new("RGB", (8, 8), (255, 0, 0)).save(path)
+    palette = template_palette(path)
+    first = palette()
+    assert palette() is first
+    assert first.colors[0].tolist() == [255, 0, 0]
+
+    Image.new("RGB", (8, 8), (0, 0, 255)).save(path)
+    mtime = path.stat().st_mtime_ns + 10**9
+    os.utime(path, ns=(mtime, mtime))
+    assert palette().colors[0].tolist() == [0, 0, 255]
@@ -0,0 +1,125 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from meme_generator import utils
+from meme_generator.template_pack import TemplatePacks, write_pack
+from meme_generator.utils import TemplateCache
+
+
+@pytest.fixture
+def images_dir(tmp_path) -> Path:
+    images_dir = tmp_path / "memes" / "test_meme" / "images"
+    (images_dir / "sub").mkdir(parents=True)
+    rng = np.random.default_rng(0)
+
+    def noise(bands: int, size=(24, 16)) -> Image.Image:
+        pixels = rng.integers(0, 256, (size[1], size[0], bands), np.uint8)
+        return Image.fromarray(pixels.squeeze())
+
+    noise(4).save(images_dir / "0.png")
+    noise(1).save(images_dir / "sub" / "1.png")
+    noise(3).save(images_dir / "2.jpg", quality=90)
+    noise(2).save(images_dir / "3.png")
+    frames = [noise(3).quantize(16) for _ in range(3)]
+    frames[0].save(
+        images_dir / "4.gif",
+        save_all=True,
+        append_images=frames[1:],
+        duration=[40, 60, 80],
+        transparency=0,
+        disposal=2,
+        loop=0,
+    )
+    (images_dir / "readme.txt").write_text("not an image")
+    return images_dir
+
+
+def decode(path: Path) -> tuple[list[Image.Image], float]:
+    return TemplateCache._decode(path, None)
+
+
+def pixels(image: Image.Image) -> np.ndarray:
+    return np.asarray(image.convert("RGBA"))
+
+
+def test_pack_round_trip(tmp_path, monkeypatch, images_dir):
+    pack_dir = tmp_path / "packs"
+    assert write_pack(images_dir, pack_dir / "test_meme.pack") == 5
+    packs = TemplatePacks(pack_dir)
+    monkeypatch.setattr(utils, "template_packs", TemplatePacks(tmp_path / "empty"))
+
+    for path in sorted(images_dir.rglob("*.*")):
+        if path.suffix == ".txt":
+            assert packs.load(path) is None
+            continue
+        packed = packs.load(path)
+        assert packed is not None, path
+        frames, duration = packed
+        expected_frames, expected_duration = decode(path)
+        assert duration == pytest.approx(expected_duration)
+        assert len(frames) == len(expected_frames)
+        for frame, expected in zip(frames, expected_frames):
+            assert frame.size == expected.size
+            if expected.mode in ("L", "P", "RGB", "RGBA"):
+                assert frame.mode == expected.mode
+            assert frame.info.get("transparency") == expected.info.get("transparency")
+            assert np.array_equal(pixels(frame), pixels(expected))
+
+    gif_frames, gif_duration = packs.load(images_dir / "4.gif")  # type: ignore
+    assert gif_duration == pytest.approx(0.06)
+    assert gif_frames[0].mode == "P"
+    # 映射到文件缓冲区的图片只读，修改时复制
+    assert gif_frames[0].readonly
+    original = gif_frames[0].getpixel((0, 0))
+    gif_frames[0].putpixel((0, 0), 15 - original)  # type: ignore
+    assert gif_frames[0].getpixel((0, 0)) == 15 - original  # type: ignore
+    reloaded, _ = packs.load(images_dir / "4.gif")  # type: ignore
+    assert reloaded[0].getpixel((0, 0)) == original
+
+
+def test_template_cache_reads_pack(tmp_path, monkeypatch, images_dir):
+    pack_dir = tmp_path / "packs"
+    write_pack(images_dir, pack_dir / "test_meme.pack")
+    path = images_dir / "0.png"
+    expected, _ = decode(path)
+
+    monkeypatch.setattr(utils, "template_packs", TemplatePacks(pack_dir))
+    frames, _ = TemplateCache(10**6).get(path, "RGB")
+    assert frames[0].mode == "RGB"
+    assert np.array_equal(pixels(frames[0]), pixels(expected[0].convert("RGB")))
+
+
+def test_modified_source_falls_back(tmp_path, images_dir):
+    pack_dir = tmp_path / "packs"
+    write_pack(images_dir, pack_dir / "test_meme.pack")
+    packs = TemplatePacks(pack_dir)
+    path = images_dir / "0.png"
+    assert packs.load(path) is not None
+
+    Image.new("RGBA", (8, 8), "red").save(path)
+    mtime = path.stat().st_mtime_ns + 10**9
+    os.utime(path, ns=(mtime, mtime))
+    assert packs.load(path) is None
+    assert packs.load(images_dir / "sub" / "1.png") is not None
+    # 不在图片包目录下的文件
+    other = tmp_path / "other.png"
+    Image.new("RGB", (4, 4)).save(other)
+    assert packs.load(other) is None
+
+
+def test_invalid_pack_ignored(tmp_path, images_dir):
+    pack_dir = tmp_path / "packs"
+    pack_dir.mkdir()
+    (pack_dir / "broken.pack").write_bytes(b"NOTAPACK" + b"\0" * 32)
+    packs = TemplatePacks(pack_dir)
+    assert packs.packs == {}
+    assert packs.load(images_dir / "0.png") is None
+
+    write_pack(images_dir, pack_dir / "test_meme.pack")
+    assert packs.load(images_dir / "0.png") is None
+    packs.reset()
+    assert packs.load(images_dir / "0.png") is not None
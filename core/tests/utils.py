@@ -0,0 +1,131 @@
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image
+
+from meme_generator.manager import MemeSource
+
+
+def make_png(size: tuple[int, int] = (64, 64), color=(255, 0, 0)) -> bytes:
+    output = BytesIO()
+    Image.new("RGB", size, color).save(output, format="PNG")
+    return output.getvalue()
+
+
+def make_gif(frames: int = 4, size: tuple[int, int] = (64, 64)) -> bytes:
+    images = [
+        Image.new("RGB", size, (i * 40 % 256, 100, 200)) for i in range(frames)
+    ]
+    output = BytesIO()
+    images[0].save(
+        output, format="GIF", save_all=True, append_images=images[1:], duration=50
+    )
+    return output.getvalue()
+
+
+# 测试表情清单用的表情模块
+ARGS_MEME = """
+from datetime import datetime
+
+from arclet.alconna import store_true
+from pydantic import Field
+
+from meme_generator import MemeArgsModel, MemeArgsType, ParserOption, add_meme
+from meme_generator.meme import CommandShortcut
+from meme_generator.tags import MemeTags
+
+help_text = "是否将图片变为圆形"
+
+
+class Model(MemeArgsModel):
+    circle: bool = Field(False, description=help_text)
+
+
+args_type = MemeArgsType(
+    args_model=Model,
+    args_examples=[Model(circle=False), Model(circle=True)],
+    parser_options=[
+        ParserOption(
+            names=["--circle", "圆"],
+            default=False,
+            action=store_true,
+            help_text=help_text,
+        ),
+    ],
+)
+
+
+def test_args(images, texts, args: Model):
+    raise NotImplementedError
+
+
+add_meme(
+    "test_args",
+    test_args,
+    min_images=1,
+    max_images=1,
+    args_type=args_type,
+    keywords=["测试"],
+    shortcuts=[CommandShortcut(key="圆形测试", args=["--circle"])],
+    tags=MemeTags.arona,
+    date_created=datetime(2024, 1, 1),
+    date_modified=datetime(2024, 2, 1),
+    cacheable=False,
+)
+"""
+
+WRAPPER_MEME = """
+from datetime import datetime
+
+from meme_generator import add_meme
+
+
+def add_text_meme(key: str, keywords: list[str], pieces: tuple[int, ...], **kwargs):
+    def text_func(images, texts, args):
+        raise NotImplementedError
+
+    text_num = len(pieces)
+    add_meme(
+        key,
+        text_func,
+        min_texts=text_num,
+        max_texts=text_num,
+        default_texts=[str(piece) for piece in pieces],
+        keywords=keywords,
+        date_created=datetime(2024, 1, 1),
+        date_modified=datetime(2024, 1, 1),
+    )
+
+
+add_text_meme("test_one", ["一"], (1,))
+add_text_meme("test_two", ["二"], (1, 2))
+"""
+
+LOOP_MEME = """
+from datetime import datetime
+
+from meme_generator import add_meme
+
+
+def make(images, texts, args):
+    raise NotImplementedError
+
+
+for key in ["test_loop_a", "test_loop_b"]:
+    add_meme(
+        key,
+        make,
+        min_texts=1,
+        max_texts=1,
+        default_texts=[key],
+        keywords=[key],
+        date_created=datetime(2024, 1, 1),
+        date_modified=datetime(2024, 1, 1),
+    )
+"""
+
+
+def write_source(tmp_path: Path, name: str, code: str) -> MemeSource:
+    path = tmp_path / f"{name}.py"
+    path.write_text(code, encoding="utf-8")
+    return MemeSource(name, str(path))
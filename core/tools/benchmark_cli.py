@@ -0,0 +1,55 @@
+"""命令行启动耗时基准测试
+
+在子进程中运行常用的 ``meme`` 命令，统计从启动解释器到命令结束的耗时。
+``generate`` 使用不存在的图片路径，只测量解析命令的开销，不制作表情。
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+COMMANDS = [
+    ["--help"],
+    ["list"],
+    ["info", "petpet"],
+    ["generate", "--help"],
+    ["generate", "petpet", "--help"],
+    ["generate", "petpet", "--images", "__missing__.png"],
+]
+
+SCRIPT = "import sys; from meme_generator.cli import main; sys.argv[0] = 'meme'; main()"
+
+
+def measure(command: list[str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", SCRIPT, *command],
+        env=dict(os.environ),
+        capture_output=True,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="命令行启动耗时基准测试")
+    parser.add_argument("-n", "--rounds", type=int, default=5, help="测试轮数")
+    args = parser.parse_args()
+
+    # 预热一次，生成字节码和帮助信息缓存
+    for command in COMMANDS:
+        measure(command)
+
+    for command in COMMANDS:
+        samples = [measure(command) for _ in range(args.rounds)]
+        print(  # noqa: T201
+            f"meme {' '.join(command):<45} "
+            f"{statistics.median(samples) * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""gif 输出基准测试
+
+在子进程中分别以整体编码（``render``）和流式输出（``render_stream``）制作同一个 gif 表情，
+统计收到第一块数据的耗时、总耗时和制作期间常驻内存峰值相对制作前的增量
+（每 2 毫秒读取一次 ``/proc/self/statm``，仅支持 Linux）。
+输入为生成的动图，帧数可通过 ``--frames`` 指定多个值，以观察内存随帧数的变化。
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from PIL import Image, ImageDraw
+
+SCRIPT = """
+import asyncio, json, os, threading, time
+from meme_generator.executor import RenderResult, render_executor
+from meme_generator.manager import get_meme
+
+meme = get_meme({key!r}).load()
+data = open({path!r}, "rb").read()
+warmup = open({warmup!r}, "rb").read()
+page_size = os.sysconf("SC_PAGE_SIZE")
+
+def rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * page_size
+
+peak = 0
+done = threading.Event()
+
+def sample():
+    global peak
+    while not done.wait(0.002):
+        peak = max(peak, rss())
+
+async def main():
+    # 用两帧的小图预热，加载模板和字体
+    await render_executor.render(meme, images=[warmup])
+    before = rss()
+    sampler = threading.Thread(target=sample)
+    sampler.start()
+    start = time.perf_counter()
+    first = None
+    size = 0
+    if {stream}:
+        result = await render_executor.render_stream(meme, images=[data])
+        if isinstance(result, RenderResult):
+            first = time.perf_counter()
+            size = len(result.content)
+        else:
+            async for chunk in result.chunks:
+                first = first or time.perf_counter()
+                size += len(chunk)
+    else:
+        result = await render_executor.render(meme, images=[data])
+        first = time.perf_counter()
+        size = len(result.content)
+    end = time.perf_counter()
+    done.set()
+    sampler.join()
+    print(json.dumps({{
+        "first": first - start,
+        "total": end - start,
+        "size": size,
+        "rss": max(peak - before, 0) / 10**6,
+    }}))
+
+asyncio.run(main())
+render_executor.shutdown()
+"""
+
+
+def make_gif(path: str, frames: int, size: int):
+    images: list[Image.Image] = []
+    for i in range(frames):
+        image = Image.new("RGB", (size, size), (i * 5 % 256, 120, 200))
+        draw = ImageDraw.Draw(image)
+        offset = i * (size - 100) // max(frames - 1, 1)
+        draw.ellipse((offset, offset, offset + 100, offset + 100), fill=(255, 200, 0))
+        images.append(image)
+    images[0].save(path, save_all=True, append_images=images[1:], duration=40, loop=0)
+
+
+def measure(key: str, path: str, warmup: str, stream: bool) -> dict[str, float]:
+    script = SCRIPT.format(key=key, path=path, warmup=warmup, stream=stream)
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        env=dict(os.environ, RENDER_BACKEND="thread"),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="gif 输出基准测试")
+    parser.add_argument("-m", "--meme", default="forbid", help="表情名，需接受一张图片")
+    parser.add_argument(
+        "-f", "--frames", type=int, nargs="+", default=[25, 50, 100, 200], help="输入帧数"
+    )
+    parser.add_argument("-s", "--size", type=int, default=480, help="输入图片边长")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        warmup = os.path.join(tmpdir, "warmup.gif")
+        make_gif(warmup, 2, 64)
+        for frames in args.frames:
+            path = os.path.join(tmpdir, f"{frames}.gif")
+            make_gif(path, frames, args.size)
+            for name, stream in [("buffered", False), ("stream", True)]:
+                result = measure(args.meme, path, warmup, stream)
+                print(  # noqa: T201
+                    f"{frames:4d} frames {name:>8}: "
+                    f"first byte {result['first'] * 1000:7.1f} ms | "
+                    f"total {result['total'] * 1000:7.1f} ms | "
+                    f"size {result['size'] / 1024:7.1f} KB | "
+                    f"peak rss +{result['rss']:6.1f} MB"
+                )
+
+
+if __name__ == "__main__":
+    main()
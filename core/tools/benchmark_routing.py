@@ -0,0 +1,111 @@
+"""路由开销基准测试
+
+对比「每个表情注册一个路由」与「单一 /memes/{key}/ 分发路由」两种方式的
+路由匹配开销和启动时的注册耗时。端点本身不做任何事，直接返回空响应，
+因此测得的延迟主要来自 Starlette 的路由匹配。
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from fastapi import FastAPI, Response
+
+from meme_generator.manager import get_meme_keys
+
+
+def build_per_meme_app(keys: list[str]) -> FastAPI:
+    app = FastAPI()
+    for key in keys:
+
+        @app.post(f"/memes/{key}/")
+        async def _():
+            return Response()
+
+    return app
+
+
+def build_dispatch_app(keys: list[str]) -> FastAPI:
+    app = FastAPI()
+    routes = set(keys)
+
+    @app.post("/memes/{key}/")
+    async def _(key: str):
+        assert key in routes
+        return Response()
+
+    return app
+
+
+async def call(app: FastAPI, path: str):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 0),
+        "server": ("127.0.0.1", 2233),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def measure(app: FastAPI, keys: list[str], rounds: int) -> list[float]:
+    samples: list[float] = []
+    for _ in range(rounds):
+        for key in keys:
+            start = time.perf_counter()
+            await call(app, f"/memes/{key}/")
+            samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def percentile(samples: list[float], p: float) -> float:
+    return statistics.quantiles(samples, n=100)[int(p) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="路由开销基准测试")
+    parser.add_argument("-n", "--rounds", type=int, default=20, help="测试轮数")
+    args = parser.parse_args()
+
+    keys = sorted(get_meme_keys())
+    print(f"表情数量: {len(keys)}")  # noqa: T201
+
+    for name, builder in [
+        ("per-meme routes", build_per_meme_app),
+        ("dispatch route", build_dispatch_app),
+    ]:
+        start = time.perf_counter()
+        app = builder(keys)
+        build_time = (time.perf_counter() - start) * 1000
+
+        # 预热
+        asyncio.run(measure(app, keys, 1))
+        samples = asyncio.run(measure(app, keys, args.rounds))
+        last_keys = keys[-len(keys) // 10 :]
+        last_samples = asyncio.run(measure(app, last_keys, args.rounds))
+        print(  # noqa: T201
+            f"{name:>16}: register {build_time:8.1f} ms | "
+            f"p50 {percentile(samples, 50):7.1f} us | "
+            f"p99 {percentile(samples, 99):7.1f} us | "
+            f"last 10% p50 {percentile(last_samples, 50):7.1f} us | "
+            f"last 10% p99 {percentile(last_samples, 99):7.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
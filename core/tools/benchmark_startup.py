@@ -0,0 +1,71 @@
+"""启动开销基准测试
+
+分别以直接加载（导入所有表情模块）和延迟加载（只读取 ``static_generator.py``
+生成的清单）两种方式在子进程中导入 ``meme_generator``，统计冷启动耗时和常驻内存。
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SCRIPT = """
+import json, resource, sys, time
+start = time.perf_counter()
+import meme_generator
+from meme_generator.manager import get_meme_keys
+elapsed = time.perf_counter() - start
+if {app}:
+    from meme_generator.app import register_routers
+    register_routers()
+total = time.perf_counter() - start
+modules = sum(name.startswith("meme_generator.memes.") for name in sys.modules)
+print(json.dumps({{
+    "import": elapsed,
+    "total": total,
+    "memes": len(get_meme_keys()),
+    "modules": modules,
+    "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}}))
+"""
+
+
+def measure(lazy: bool, app: bool) -> dict[str, float]:
+    env = dict(os.environ, MEME_FAST_LOADING="true" if lazy else "false")
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(app=app)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="启动开销基准测试")
+    parser.add_argument("-n", "--rounds", type=int, default=5, help="测试轮数")
+    parser.add_argument(
+        "--app", action="store_true", help="同时构建 web 应用（登记路由、生成元数据）"
+    )
+    args = parser.parse_args()
+
+    for name, lazy in [("eager", False), ("lazy", True)]:
+        samples = [measure(lazy, args.app) for _ in range(args.rounds)]
+
+        def median(field: str) -> float:
+            return statistics.median(sample[field] for sample in samples)
+
+        print(  # noqa: T201
+            f"{name:>5}: memes {samples[0]['memes']:4d} | "
+            f"modules {samples[0]['modules']:4d} | "
+            f"import {median('import') * 1000:7.1f} ms | "
+            f"total {median('total') * 1000:7.1f} ms | "
+            f"max rss {median('rss'):6.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""生成预解码的模板图片包
+
+把每个表情 ``images`` 目录下的模板图片解码后打包，运行时通过 mmap 直接读取，
+见 ``meme_generator/template_pack.py``。默认打包内置表情和配置中 ``meme_dirs`` 下的表情，
+源文件未变化的图片包会被跳过。
+"""
+
+import argparse
+import hashlib
+import time
+from pathlib import Path
+
+from meme_generator.config import meme_config
+from meme_generator.template_pack import (
+    IMAGE_SUFFIXES,
+    PACK_SUFFIX,
+    default_pack_dir,
+    read_pack_index,
+    write_pack,
+)
+
+dir_path = Path(__file__).parent
+project_path = dir_path.parent
+memes_path = project_path / "meme_generator" / "memes"
+
+
+def pack_path(pack_dir: Path, images_dir: Path) -> Path:
+    digest = hashlib.md5(str(images_dir.resolve()).encode()).hexdigest()[:8]
+    return pack_dir / f"{images_dir.parent.name}-{digest}{PACK_SUFFIX}"
+
+
+def is_up_to_date(pack: Path, images_dir: Path) -> bool:
+    if (result := read_pack_index(pack)) is None:
+        return False
+    entries = result[0]["entries"]
+    files = {
+        path.relative_to(images_dir).as_posix(): path.stat()
+        for path in images_dir.rglob("*")
+        if path.is_file() and path.suffix.lower() in IMAGE_SUFFIXES
+    }
+    return files.keys() == entries.keys() and all(
+        stat.st_mtime_ns == entries[name]["mtime"]
+        and stat.st_size == entries[name]["size"]
+        for name, stat in files.items()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="生成预解码的模板图片包")
+    parser.add_argument(
+        "dirs", nargs="*", type=Path, help="表情所在目录，默认为内置表情和 meme_dirs"
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, default=default_pack_dir(), help="输出目录"
+    )
+    parser.add_argument("-f", "--force", action="store_true", help="重新生成所有图片包")
+    args = parser.parse_args()
+
+    dirs: list[Path] = args.dirs or [memes_path, *map(Path, meme_config.meme.meme_dirs)]
+    output: Path = args.output
+    packed = skipped = 0
+    total_size = 0
+    start = time.perf_counter()
+    for memes_dir in dirs:
+        for images_dir in sorted(memes_dir.glob("*/images")):
+            pack = pack_path(output, images_dir)
+            if not args.force and is_up_to_date(pack, images_dir):
+                skipped += 1
+            elif write_pack(images_dir, pack):
+                packed += 1
+            else:
+                continue
+            total_size += pack.stat().st_size
+    print(  # noqa: T201
+        f"Packed {packed} memes, {skipped} up to date, "
+        f"{total_size / 10**6:.1f} MB in {output} ({time.perf_counter() - start:.1f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()